@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Compile CLIWOC track data into the memory-mapped track cache.
+
+Reads data/cliwoc_tracks.json (produced by download_cliwoc.py) and writes
+data/cliwoc_tracks.bin: fixed-width position columns, a string table for
+dates, ship names, companies and ports, and the precomputed segment table,
+position grid and date index. The server maps the cache instead of parsing
+the JSON, so worker processes share its pages and start almost instantly.
+
+The cache records the JSON's SHA-256 and is ignored by the server once the
+JSON changes, so re-run this script after every download.
+
+Usage:
+    python scripts/build_track_cache.py
+    python scripts/build_track_cache.py --force    # rebuild even if current
+"""
+
+import sys
+import time
+from pathlib import Path
+
+from download_utils import parse_args
+
+# Add project root to path so we can import the source modules
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+DATA_DIR = PROJECT_ROOT / "data"
+
+
+def main() -> None:
+    args = parse_args("Compile cliwoc_tracks.json into the memory-mapped track cache")
+
+    from chuk_mcp_maritime_archives.core.cliwoc_tracks import (
+        _CACHE_FILENAME,
+        _CACHE_LAYOUT,
+        build_track_cache,
+    )
+    from chuk_mcp_maritime_archives.core.track_cache import file_sha256, open_columnar_cache
+
+    print("=" * 60)
+    print("CLIWOC Track Cache — chuk-mcp-maritime-archives")
+    print("=" * 60)
+
+    source = DATA_DIR / "cliwoc_tracks.json"
+    if not source.exists():
+        print(f"\n{source} not found (run scripts/download_cliwoc.py first)")
+        sys.exit(1)
+
+    cache_path = DATA_DIR / _CACHE_FILENAME
+    if not args.force:
+        current = open_columnar_cache(cache_path, file_sha256(source), _CACHE_LAYOUT)
+        if current is not None:
+            print(f"\n{cache_path.name} is up to date (use --force to rebuild)")
+            return
+
+    print(f"\nCompiling {source.name}...")
+    start = time.perf_counter()
+    path = build_track_cache(DATA_DIR)
+    elapsed = time.perf_counter() - start
+
+    size_mb = path.stat().st_size / (1024 * 1024)
+    print(f"  Saved: {path} ({size_mb:.1f} MB) in {elapsed:.1f}s")
+    print(f"\n{'=' * 60}")
+
+
+if __name__ == "__main__":
+    main()
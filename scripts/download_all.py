@@ -52,6 +52,7 @@ def main() -> None:
         # Downloads from external sources
         "download_das.py",  # VOC voyages/vessels/wrecks from Huygens DAS
         "download_cliwoc.py",  # CLIWOC ship tracks (~261K positions)
+        "build_track_cache.py",  # Memory-mapped cache of the CLIWOC tracks
         "download_crew.py",  # VOC crew from Nationaal Archief (~774K records)
         "download_cargo.py",  # BGB cargo from Huygens/Zenodo
         "download_eic.py",  # EIC from ThreeDecks / curated
@@ -30,7 +30,7 @@ ROUTES_PATH = DATA_DIR / "routes.json"
 OUTPUT_PATH = DATA_DIR / "speed_profiles.json"
 
 # ---------------------------------------------------------------------------
-# Haversine (copied from cliwoc_tracks.py)
+# Haversine kernels (copied from cliwoc_tracks.py)
 # ---------------------------------------------------------------------------
 
 
@@ -46,6 +46,37 @@ def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     return R * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
 
 
+def haversine_legs(lats: list[float], lons: list[float]) -> list[float]:
+    """Distances in km between consecutive points (batched ``haversine_km``).
+
+    Each point's latitude cosine is computed once and shared by both of its
+    legs; results are identical to calling ``haversine_km`` per pair.
+    """
+    radians, sin, sqrt, atan2 = math.radians, math.sin, math.sqrt, math.atan2
+    d = 2 * 6371.0
+    cos_lat = [math.cos(radians(la)) for la in lats]
+    legs = []
+    for lat1, lon1, c1, lat2, lon2, c2 in zip(lats, lons, cos_lat, lats[1:], lons[1:], cos_lat[1:]):
+        a = sin(radians(lat2 - lat1) / 2) ** 2 + c1 * c2 * sin(radians(lon2 - lon1) / 2) ** 2
+        legs.append(d * atan2(sqrt(a), sqrt(1 - a)))
+    return legs
+
+
+def haversine_from(lat: float, lon: float, lats: list[float], lons: list[float]) -> list[float]:
+    """Distances in km from one point to each of many points."""
+    radians, sin, cos, sqrt, atan2 = math.radians, math.sin, math.cos, math.sqrt, math.atan2
+    d = 2 * 6371.0
+    c0 = cos(radians(lat))
+    dists = []
+    for lat2, lon2 in zip(lats, lons):
+        a = (
+            sin(radians(lat2 - lat) / 2) ** 2
+            + c0 * cos(radians(lat2)) * sin(radians(lon2 - lon) / 2) ** 2
+        )
+        dists.append(d * atan2(sqrt(a), sqrt(1 - a)))
+    return dists
+
+
 # ---------------------------------------------------------------------------
 # Route matching — map (voyage_from, voyage_to) to a route_id
 # ---------------------------------------------------------------------------
@@ -284,8 +315,8 @@ def assign_segment(
     """
     best_dist = float("inf")
     best_seg = None
-    for seg_from, seg_to, mid_lat, mid_lon in route_segments:
-        d = haversine_km(lat, lon, mid_lat, mid_lon)
+    dists = haversine_from(lat, lon, [s[2] for s in route_segments], [s[3] for s in route_segments])
+    for (seg_from, seg_to, _, _), d in zip(route_segments, dists):
         if d < best_dist:
             best_dist = d
             best_seg = (seg_from, seg_to)
@@ -402,14 +433,11 @@ def main() -> None:
 
         track_contributed = False
 
-        for i in range(len(positions) - 1):
-            p1 = positions[i]
-            p2 = positions[i + 1]
-
-            lat1, lon1 = p1["lat"], p1["lon"]
-            lat2, lon2 = p2["lat"], p2["lon"]
-
-            daily_km = haversine_km(lat1, lon1, lat2, lon2)
+        lats = [p["lat"] for p in positions]
+        lons = [p["lon"] for p in positions]
+        for i, daily_km in enumerate(haversine_legs(lats, lons)):
+            lat1, lon1 = lats[i], lons[i]
+            lat2, lon2 = lats[i + 1], lons[i + 1]
 
             # Filter: skip data gaps and port stops
             if daily_km > 400:
@@ -33,6 +33,7 @@ DATA_DIR = PROJECT_ROOT / "data"
 # Reference data files to upload
 DATA_FILES = [
     "cliwoc_tracks.json",
+    "cliwoc_tracks.bin",
     "voyages.json",
     "vessels.json",
     "wrecks.json",
@@ -97,7 +98,7 @@ async def upload_all() -> str:
 
         artifact_id = await store.store(
             data=data,
-            mime="application/json",
+            mime="application/octet-stream" if filename.endswith(".bin") else "application/json",
             summary=f"Maritime reference data: {filename}",
             meta={"filename": filename, "size_bytes": len(data)},
             filename=filename,
@@ -31,6 +31,17 @@ class SessionProvider(str, Enum):
     REDIS = "redis"
 
 
+# --- Reference Dataset Readiness -------------------------------------------
+
+
+class DatasetState(str, Enum):
+    PENDING = "pending"
+    LOADING = "loading"
+    READY = "ready"
+    UNAVAILABLE = "unavailable"
+    FAILED = "failed"
+
+
 # --- Environment Variable Names --------------------------------------------
 
 
@@ -46,6 +57,10 @@ class EnvVar:
     AWS_ENDPOINT_URL_S3 = "AWS_ENDPOINT_URL_S3"
     MCP_STDIO = "MCP_STDIO"
     REFERENCE_MANIFEST = "MARITIME_REFERENCE_MANIFEST"
+    BOOTSTRAP_WORKERS = "MARITIME_BOOTSTRAP_WORKERS"
+    WARMUP = "MARITIME_WARMUP"
+    INDEX_SNAPSHOTS = "MARITIME_INDEX_SNAPSHOTS"
+    SEARCH_WORKERS = "MARITIME_SEARCH_WORKERS"
 
 
 class ArtifactScope:
@@ -453,8 +468,41 @@ VOC_CHAMBERS: list[str] = [
 
 MAX_RESULTS: int = 50
 MAX_PAGE_SIZE: int = 500
+QUERY_CACHE_SIZE: int = 256  # ArchiveManager search results kept (LRU)
+QUERY_CACHE_TTL_S: float = 300.0  # seconds a cached search result stays valid
+SEARCH_WORKERS: int = 8  # threads ArchiveManager fans per-archive searches out on
 DEFAULT_ARCHIVE: str = "das"
 
+# Fields a search may be broken down by in count mode ("archive" counts per archive)
+VOYAGE_FACETS: tuple[str, ...] = (
+    "archive",
+    "fate",
+    "departure_port",
+    "destination_port",
+    "ship_type",
+    "company_division",
+    "trade_direction",
+)
+WRECK_FACETS: tuple[str, ...] = (
+    "archive",
+    "region",
+    "loss_cause",
+    "status",
+    "flag",
+    "vessel_type",
+    "ship_type",
+    "gp_quality",
+)
+# Wreck fields ArchiveManager.get_statistics() aggregates from facet counts
+STATISTICS_FACETS: tuple[str, ...] = (
+    "region",
+    "loss_cause",
+    "status",
+    "loss_date",
+    "lives_lost",
+    "cargo_value_guilders",
+)
+
 
 # --- Type Literals ---------------------------------------------------------
 
@@ -554,12 +602,21 @@ class ErrorMessages:
     TIMELINE_NO_EVENTS = "No dated events found for voyage '{}'"
     MUSTER_NOT_FOUND = "Muster record '{}' not found"
     AUDIT_FAILED = "Link audit failed: {}"
+    CURSOR_MISMATCH = (
+        "Cursor belongs to a different search or to data that has since changed. "
+        "Repeat the search without a cursor."
+    )
+    INVALID_FACET = "Unknown facet '{}'. Valid facets: {}"
+    INVALID_SEARCH_MODE = "Unknown mode '{}'. Use 'records' or 'count'"
+    TOO_MANY_IDS = "Too many record IDs ({}). Look up at most {} per call"
 
 
 class SuccessMessages:
     ARCHIVES_LISTED = "{} maritime archives available"
     VOYAGES_FOUND = "Found {} voyages matching criteria"
     WRECKS_FOUND = "Found {} wrecks matching criteria"
+    VOYAGES_COUNTED = "{} voyages match criteria"
+    WRECKS_COUNTED = "{} wrecks match criteria"
     VESSELS_FOUND = "Found {} vessels matching criteria"
     CREW_FOUND = "Found {} crew records"
     CARGO_FOUND = "Found {} cargo entries"
@@ -574,6 +631,7 @@ class SuccessMessages:
     MUSTERS_FOUND = "Found {} muster records"
     WAGES_COMPARED = "Compared wages: {} ({} records) vs {} ({} records)"
     LINKS_AUDITED = "Audited {} cross-archive links ({} wreck, {} CLIWOC)"
+    RECORDS_FOUND = "Found {} of {} records"
     TRACK_TORTUOSITY_COMPUTED = "Tortuosity for voyage {}: R={:.4f}"
     TORTUOSITY_AGGREGATED = "Aggregated tortuosity for {} voyages (min {} positions)"
     WIND_ROSE_COMPUTED = "Wind rose: {} observations with wind data across {} voyages"
@@ -10,9 +10,22 @@ Manages:
 - Aggregate statistics
 """
 
+import asyncio
+import hashlib
+import heapq
+import json
 import logging
+import math
+import os
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import partial
+from itertools import chain, islice, repeat
 from pathlib import Path
 from typing import Any
 
@@ -20,9 +33,18 @@ from ..constants import (
     ARCHIVE_METADATA,
     MAX_PAGE_SIZE,
     NAVIGATION_ERAS,
+    QUERY_CACHE_SIZE,
+    QUERY_CACHE_TTL_S,
+    SEARCH_WORKERS,
+    STATISTICS_FACETS,
+    VOYAGE_FACETS,
+    WRECK_FACETS,
+    EnvVar,
+    ErrorMessages,
 )
-from ..models.responses import decode_cursor, encode_cursor
+from ..models.responses import decode_cursor, decode_cursor_state, encode_cursor
 from .clients import (
+    BaseArchiveClient,
     CargoClient,
     CarreiraClient,
     CrewClient,
@@ -35,12 +57,16 @@ from .clients import (
     UKHOClient,
     WreckClient,
 )
+from .clients.base import crew_order, link_id, voyage_order, wreck_order
 from .cliwoc_tracks import (
     find_track_for_voyage,
     get_track,
     get_track_by_das_number,
+    get_track_summary,
 )
 from .hull_profiles import HULL_PROFILES
+from .query_cache import QueryCache
+from .record_registry import RecordRegistry, RecordSource
 from .voc_routes import estimate_position, get_route as get_route_detail, suggest_route
 
 logger = logging.getLogger(__name__)
@@ -52,6 +78,12 @@ _DEFAULT_DATA_DIR = Path(__file__).resolve().parent.parent.parent.parent / "data
 _FETCH_ALL = 999_999
 
 
+async def _get_track_summary(track_id: str) -> dict | None:
+    """CLIWOC track of a "cliwoc:<voyage ID>" record ID, without positions."""
+    number = track_id.partition(":")[2]
+    return get_track_summary(int(number)) if number.isdigit() else None
+
+
 @dataclass
 class PaginatedResult:
     """Paginated search result with cursor metadata."""
@@ -62,6 +94,30 @@ class PaginatedResult:
     has_more: bool
 
 
+# Record type -> (ID field, date field, client narrative search method)
+_NARRATIVE_FIELDS: dict[str, tuple[str, str, str]] = {
+    "voyage": ("voyage_id", "departure_date", "narrative_voyages"),
+    "wreck": ("wreck_id", "loss_date", "narrative_wrecks"),
+}
+# Narrative hits ranked past the requested page, in pages, so paging on reads the cache
+_NARRATIVE_PAGES_AHEAD = 4
+
+
+def _narrative_rank(kind: str, hit: tuple[float, int, dict, str]) -> tuple:
+    """Total order of a ``kind`` narrative hit: best score, then date, ID and field."""
+    id_field, date_field, _ = _NARRATIVE_FIELDS[kind]
+    score, _, record, field_name = hit
+    return (-score, record.get(date_field) or "9999", record.get(id_field, ""), field_name)
+
+
+def _search_workers_from_env() -> int:
+    """Search pool size from ``MARITIME_SEARCH_WORKERS`` (default ``SEARCH_WORKERS``)."""
+    try:
+        return max(1, int(os.environ.get(EnvVar.SEARCH_WORKERS, SEARCH_WORKERS)))
+    except ValueError:
+        return SEARCH_WORKERS
+
+
 # Map archive IDs to CLIWOC nationality codes
 _ARCHIVE_NATIONALITY = {
     "das": "NL",
@@ -80,7 +136,13 @@ class ArchiveManager:
     local JSON data files produced by the download scripts.
     """
 
-    def __init__(self, data_dir: Path | None = None) -> None:
+    def __init__(
+        self,
+        data_dir: Path | None = None,
+        cache_size: int = QUERY_CACHE_SIZE,
+        cache_ttl: float = QUERY_CACHE_TTL_S,
+        search_workers: int | None = None,
+    ) -> None:
         self._archives = dict(ARCHIVE_METADATA)
         self._hull_profiles = dict(HULL_PROFILES)
 
@@ -127,6 +189,120 @@ class ArchiveManager:
             "dss": self._dss_client,
         }
 
+        # Every data source client, keyed by archive ID (used by preload())
+        self._clients: dict[str, BaseArchiveClient] = {
+            "das": self._das_client,
+            "voc_crew": self._crew_client,
+            "voc_cargo": self._cargo_client,
+            "maarer": self._wreck_client,
+            "eic": self._eic_client,
+            "carreira": self._carreira_client,
+            "galleon": self._galleon_client,
+            "soic": self._soic_client,
+            "ukho": self._ukho_client,
+            "noaa": self._noaa_client,
+            "dss": self._dss_client,
+        }
+
+        # Record ID prefix -> owning client and kind, for lookups by ID
+        sources = {
+            "das_vessel": RecordSource("vessel", "das", self._das_client.get_vessel_by_id),
+            "maarer": RecordSource("wreck", "maarer", self._wreck_client.get_by_id),
+            "voc_crew": RecordSource("crew", "voc_crew", self._crew_client.get_by_id),
+            "dss": RecordSource("crew", "dss", self._dss_client.get_crew_by_id),
+            "dss_muster": RecordSource("muster", "dss", self._dss_client.get_muster_by_id),
+            "voc_cargo": RecordSource("cargo", "voc_cargo", self._cargo_client.get_by_id),
+            "cliwoc": RecordSource("track", "cliwoc", _get_track_summary),
+        }
+        for archive_id, client in self._voyage_clients.items():
+            sources[archive_id] = RecordSource("voyage", archive_id, client.get_by_id)
+        for archive_id, client in self._wreck_clients.items():
+            if client is not self._wreck_client:
+                sources[f"{archive_id}_wreck"] = RecordSource(
+                    "wreck", archive_id, client.get_wreck_by_id
+                )
+        self._records = RecordRegistry(sources)
+
+        # Recent search results: pages, match counts and full result lists
+        self._query_cache = QueryCache(cache_size, cache_ttl)
+
+        # Linked voyage ID -> wreck across the wreck clients (merged on first use)
+        self._wreck_links: dict[str, dict] | None = None
+
+        # Thread pool the per-archive searches fan out on (created on first use)
+        self._search_workers = search_workers or _search_workers_from_env()
+        self._search_pool: ThreadPoolExecutor | None = None
+        self._search_pool_lock = threading.Lock()
+
+    # --- Preloading ---------------------------------------------------------
+
+    def preload(
+        self,
+        parallel: bool = True,
+        max_workers: int | None = None,
+    ) -> dict[str, dict[str, float]]:
+        """
+        Load and index every archive client's data files now.
+
+        Clients otherwise read their files on first query, so the first
+        cross-archive search parses each archive's files in turn. A client
+        whose files fail to load is logged and skipped; it retries on its
+        next query.
+
+        Args:
+            parallel: Load the clients concurrently on a thread pool
+            max_workers: Pool size (default: one thread per client)
+
+        Returns:
+            Seconds spent per data file, keyed by archive ID then filename
+        """
+        start = time.perf_counter()
+        timings: dict[str, dict[str, float]] = {}
+        self.clear_query_cache()
+
+        def _collect(archive_id: str, load: Any) -> None:
+            try:
+                timings[archive_id] = load()
+            except Exception:
+                logger.exception("Preload of archive %s failed", archive_id)
+                return
+            files = ", ".join(f"{f} {t:.3f}s" for f, t in timings[archive_id].items())
+            logger.info("Preloaded %s (%s)", archive_id, files or "no files")
+
+        if parallel:
+            with ThreadPoolExecutor(
+                max_workers=max_workers or len(self._clients),
+                thread_name_prefix="archive-preload",
+            ) as pool:
+                futures = {aid: pool.submit(c.preload) for aid, c in self._clients.items()}
+            for archive_id, future in futures.items():
+                _collect(archive_id, future.result)
+        else:
+            for archive_id, client in self._clients.items():
+                _collect(archive_id, client.preload)
+
+        # Merge the voyage -> wreck link indexes the clients have just built
+        self._wreck_links = None
+        try:
+            self._voyage_wreck_links()
+        except Exception:
+            logger.exception("Merging voyage-wreck links failed")
+
+        logger.info(
+            "Preloaded %d/%d archives in %.3fs (%s)",
+            len(timings),
+            len(self._clients),
+            time.perf_counter() - start,
+            "parallel" if parallel else "serial",
+        )
+        return timings
+
+    def warm(self) -> threading.Thread:
+        """Run ``preload(parallel=True)`` on a background daemon thread."""
+        thread = threading.Thread(target=self.preload, name="archive-warm", daemon=True)
+        thread.start()
+        return thread
+
     # --- Pagination Helper --------------------------------------------------
 
     @staticmethod
@@ -150,6 +326,180 @@ class ArchiveManager:
             has_more=has_more,
         )
 
+    async def _search_page(
+        self,
+        clients: dict[str, Any],
+        stream: str,
+        count: str,
+        order: Callable[[dict], Any] | None,
+        search_kwargs: dict[str, Any],
+        max_results: int,
+        cursor: str | None,
+    ) -> PaginatedResult:
+        """A page of a search over ``clients``, resumed from a keyset cursor.
+
+        Each client's ``stream`` method (``iter_voyages``, ...) yields
+        (position, record) pairs after a given position. A lone client is
+        read in file order; several are merged by ``order`` on their
+        presorted streams. The next cursor records the last position read
+        from each archive, so the following page resumes there at the cost
+        of one page, plus a fingerprint of the query and the data version;
+        a cursor presented with other filters or changed data is rejected.
+        Plain offset cursors are still honoured by skipping.
+        """
+        page_size = min(max_results, MAX_PAGE_SIZE)
+        query = self._fingerprint([stream, sorted(clients), self._normalize(search_kwargs)])
+        version = self._data_version(clients.values())
+        page_key = ("page", query, version, cursor or "", page_size)
+        cached = self._query_cache.get(page_key)
+        if cached is not None:
+            return cached
+
+        state = decode_cursor_state(cursor)
+        offset = int(state.get("o", 0))
+        positions: dict[str, int] = {}
+        if "q" in state:
+            if state["q"] != query or state.get("v") != version:
+                raise ValueError(ErrorMessages.CURSOR_MISMATCH)
+            positions = {a: int(p) for a, p in state.get("p", {}).items()}
+
+        # A plain offset cursor skips its offset, noting the positions passed
+        skip = 0 if "q" in state else offset
+
+        def head(client: Any, after: int) -> list[tuple[int, dict]]:
+            found = getattr(client, stream)(sort=order is not None, after=after, **search_kwargs)
+            return list(islice(found, skip + page_size))
+
+        # Each archive's head of the page and, unless cached (counting reads
+        # every match), its match count run concurrently on the search pool
+        count_key = ("count", query, version)
+        total_count = self._query_cache.get(count_key)
+        calls = [self._in_pool(head, c, positions.get(a, -1)) for a, c in clients.items()]
+        if total_count is None:
+            calls += [self._in_pool(getattr(c, count), **search_kwargs) for c in clients.values()]
+        results = await asyncio.gather(*calls)
+        if total_count is None:
+            total_count = sum(results[len(clients) :])
+            self._query_cache.put(count_key, total_count)
+
+        streams = [zip(repeat(archive), rows) for archive, rows in zip(clients, results)]
+        if order is None:
+            merged: Iterator[tuple[str, tuple[int, dict]]] = chain.from_iterable(streams)
+        else:
+            merged = heapq.merge(*streams, key=lambda item: order(item[1][1]))
+        page = []
+        for i, (archive, (position, record)) in enumerate(islice(merged, skip + page_size)):
+            positions[archive] = position
+            if i >= skip:
+                page.append(record)
+        next_offset = offset + len(page)
+        has_more = next_offset < total_count
+        next_cursor = (
+            encode_cursor(next_offset, p=positions, q=query, v=version) if has_more else None
+        )
+        result = PaginatedResult(
+            items=page,
+            total_count=total_count,
+            next_cursor=next_cursor,
+            has_more=has_more,
+        )
+        self._query_cache.put(page_key, result)
+        return result
+
+    async def _search_counts(
+        self,
+        clients: dict[str, Any],
+        count: str,
+        facet: str,
+        search_kwargs: dict[str, Any],
+        facets: Iterable[str],
+        valid: tuple[str, ...],
+    ) -> dict[str, Any]:
+        """Total matches of a search over ``clients`` and its facet histograms.
+
+        Each client's ``count`` method (``count_voyages``, ...) and, for
+        record-field facets, its ``facet`` method run concurrently on the
+        search pool; neither builds a record, and both use the bitmap
+        indexes where the filters allow. The "archive" facet is made of the
+        per-archive totals. Facet values are given as strings, most
+        frequent first. Raises ValueError for a facet not in ``valid``.
+        """
+        fields = list(dict.fromkeys(facets))
+        for field in fields:
+            if field not in valid:
+                raise ValueError(ErrorMessages.INVALID_FACET.format(field, ", ".join(valid)))
+        record_fields = tuple(f for f in fields if f != "archive")
+
+        query = self._fingerprint([count, sorted(clients), self._normalize(search_kwargs), fields])
+        version = self._data_version(clients.values())
+        key = ("counts", query, version)
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            return cached
+
+        calls = [self._in_pool(getattr(c, count), **search_kwargs) for c in clients.values()]
+        if record_fields:
+            calls += [
+                self._in_pool(getattr(c, facet), record_fields, **search_kwargs)
+                for c in clients.values()
+            ]
+        results = await asyncio.gather(*calls)
+        totals = dict(zip(clients, results[: len(clients)]))
+
+        merged: dict[str, Counter] = {field: Counter() for field in record_fields}
+        for per_client in results[len(clients) :]:
+            for field, counts in per_client.items():
+                for value, n in counts.items():
+                    merged[field][str(value)] += n
+        merged["archive"] = Counter({a: n for a, n in totals.items() if n})
+
+        result = {
+            "total_count": sum(totals.values()),
+            "facets": {
+                field: dict(sorted(merged[field].items(), key=lambda kv: (-kv[1], kv[0])))
+                for field in fields
+            },
+        }
+        self._query_cache.put(key, result)
+        return result
+
+    def _in_pool(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> asyncio.Future:
+        """Run a blocking client call on the search thread pool, off the event loop."""
+        if self._search_pool is None:
+            with self._search_pool_lock:
+                if self._search_pool is None:
+                    self._search_pool = ThreadPoolExecutor(
+                        max_workers=self._search_workers,
+                        thread_name_prefix="archive-search",
+                    )
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self._search_pool, partial(fn, *args, **kwargs))
+
+    @staticmethod
+    def _fingerprint(value: Any) -> str:
+        """Short stable hash of a JSON-serialisable value (for cursors and cache keys)."""
+        encoded = json.dumps(value, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()[:16]
+
+    @staticmethod
+    def _normalize(kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Query arguments without the unset ones, so equivalent calls share a key."""
+        return {k: v for k, v in kwargs.items() if v is not None and v != ""}
+
+    def _data_version(self, clients: Iterable[BaseArchiveClient]) -> str:
+        """Combined ``data_version()`` of the given clients."""
+        return self._fingerprint([c.data_version() for c in clients])
+
+    # --- Query Cache --------------------------------------------------------
+
+    def query_cache_stats(self) -> dict[str, Any]:
+        """Size, bounds and hit/miss/eviction counters of the query result cache."""
+        return self._query_cache.stats()
+
+    def clear_query_cache(self) -> None:
+        """Drop every cached search result (done on preload, which may reload data)."""
+        self._query_cache.clear()
+
     # --- Archive Registry ---------------------------------------------------
 
     def list_archives(self) -> list[dict]:
@@ -194,28 +544,91 @@ class ArchiveManager:
             destination_port=destination_port,
             route=route,
             fate=fate,
-            max_results=_FETCH_ALL,
         )
 
         if archive and archive in self._voyage_clients:
-            results = await self._voyage_clients[archive].search(**search_kwargs)
+            clients = {archive: self._voyage_clients[archive]}
+            order = None
         elif archive:
-            results = []
+            return self._paginate([], max_results, cursor)
         else:
-            # Query all voyage archives and merge results
-            results = []
-            for client in self._voyage_clients.values():
-                results.extend(await client.search(**search_kwargs))
-            # Deterministic sort for stable pagination across archives
-            results.sort(key=lambda v: (v.get("departure_date") or "9999", v.get("voyage_id", "")))
+            # Merge every archive's presorted stream: a page reads only the
+            # records up to its end instead of sorting every match
+            clients, order = self._voyage_clients, voyage_order
+        return await self._search_page(
+            clients, "iter_voyages", "count_voyages", order, search_kwargs, max_results, cursor
+        )
 
-        return self._paginate(results, max_results, cursor)
+    async def count_voyages(
+        self,
+        ship_name: str | None = None,
+        captain: str | None = None,
+        date_range: str | None = None,
+        departure_port: str | None = None,
+        destination_port: str | None = None,
+        route: str | None = None,
+        fate: str | None = None,
+        archive: str | None = None,
+        facets: Iterable[str] = (),
+    ) -> dict[str, Any]:
+        """Count voyages matching a search, optionally broken down by ``facets``.
+
+        Takes the filters of ``search_voyages`` and returns
+        ``{"total_count": n, "facets": {field: {value: count}}}`` without
+        building any voyage record. Facets are those in ``VOYAGE_FACETS``.
+        """
+        search_kwargs = {
+            "ship_name": ship_name,
+            "captain": captain,
+            "date_range": date_range,
+            "departure_port": departure_port,
+            "destination_port": destination_port,
+            "route": route,
+            "fate": fate,
+        }
+        if archive:
+            clients = {a: c for a, c in self._voyage_clients.items() if a == archive}
+        else:
+            clients = self._voyage_clients
+        return await self._search_counts(
+            clients, "count_voyages", "facet_voyages", search_kwargs, facets, VOYAGE_FACETS
+        )
+
+    async def _get_by_id(self, record_id: str, kind: str, default: str) -> dict | None:
+        """Record of ``kind`` from the client its ID prefix names (``default`` if none)."""
+        source = self._records.route(record_id, default)
+        if source is None or source.kind != kind:
+            return None
+        return await source.get(record_id)
 
     async def get_voyage(self, voyage_id: str) -> dict | None:
         """Get full voyage details, routing to the correct archive client."""
-        prefix = voyage_id.split(":")[0] if ":" in voyage_id else "das"
-        client = self._voyage_clients.get(prefix, self._das_client)
-        return await client.get_by_id(voyage_id)
+        return await self._get_by_id(voyage_id, "voyage", "das")
+
+    async def get_records(self, record_ids: list[str]) -> list[dict]:
+        """
+        Look up records of any kind by ID, in the order given.
+
+        Each ID is routed to the client owning its prefix (voyage, wreck,
+        vessel, crew, muster, cargo or CLIWOC track -- see
+        ``core/record_registry.py``). An ID without a prefix is looked up in
+        every archive and only resolved if exactly one holds it. Repeated
+        IDs are looked up once.
+
+        Returns:
+            One dict per ID: ``id``, ``kind``, ``archive`` and ``record``
+            (None if not found), plus ``candidates`` for an unprefixed ID
+            several archives hold
+
+        Raises:
+            ValueError: If more than ``MAX_PAGE_SIZE`` IDs are given
+        """
+        if len(record_ids) > MAX_PAGE_SIZE:
+            raise ValueError(ErrorMessages.TOO_MANY_IDS.format(len(record_ids), MAX_PAGE_SIZE))
+        resolved = {}
+        for record_id in dict.fromkeys(record_ids):
+            resolved[record_id] = await self._records.resolve(record_id)
+        return [resolved[record_id] for record_id in record_ids]
 
     # --- Cross-Archive Linking ----------------------------------------------
 
@@ -380,22 +793,29 @@ class ArchiveManager:
 
         return results
 
-    async def _find_wreck_for_voyage(self, voyage_id: str) -> dict | None:
-        """Find a wreck record linked to a voyage, checking the appropriate client."""
-        prefix = voyage_id.split(":")[0] if ":" in voyage_id else "das"
-        # Normalise to prefixed form for consistent matching
-        normalised = voyage_id if ":" in voyage_id else f"{prefix}:{voyage_id}"
+    def _link_clients(self) -> list[Any]:
+        """Wreck clients whose records link to voyages (MAARER first)."""
+        return [c for c in self._wreck_clients.values() if hasattr(c, "_get_voyage_wreck_index")]
 
-        # For DAS voyages, check the MAARER wreck client
-        if prefix == "das":
-            return await self._wreck_client.get_by_voyage_id(normalised)
+    def _voyage_wreck_links(self) -> dict[str, list[dict]]:
+        """Prefixed voyage ID -> linked wrecks, merged from every wreck client's link index.
 
-        # For other archives, the archive client handles its own wrecks
-        client = self._voyage_clients.get(prefix)
-        if client and hasattr(client, "get_wreck_by_voyage_id"):
-            return await client.get_wreck_by_voyage_id(voyage_id)
+        Built once (and again after ``preload()``); bare DAS IDs are stored
+        prefixed, so look up ``link_id(voyage_id, "das")``.
+        """
+        links = self._wreck_links
+        if links is None:
+            links = {}
+            for client in self._link_clients():
+                for voyage_id, wrecks in client._get_voyage_wreck_index().items():
+                    links.setdefault(voyage_id, []).extend(wrecks)
+            self._wreck_links = links
+        return links
 
-        return None
+    async def _find_wreck_for_voyage(self, voyage_id: str) -> dict | None:
+        """Find a wreck record linked to a voyage (bare IDs are DAS voyages)."""
+        wrecks = self._voyage_wreck_links().get(link_id(voyage_id, "das"))
+        return wrecks[0] if wrecks else None
 
     # --- Link Audit ---------------------------------------------------------
 
@@ -408,29 +828,13 @@ class ArchiveManager:
         entity resolution pipeline.
         """
         # --- Wreck links audit ---
-        wreck_ground_truth = 0
+        links = self._voyage_wreck_links()
+        wreck_ground_truth = sum(len(wrecks) for wrecks in links.values())
         wreck_matched = 0
-        for client in self._wreck_clients.values():
-            if hasattr(client, "_get_wrecks"):
-                for w in client._get_wrecks():
-                    if w.get("voyage_id"):
-                        wreck_ground_truth += 1
-                        # Verify the linked voyage exists
-                        v = await self.get_voyage(w["voyage_id"])
-                        if v:
-                            wreck_matched += 1
-            elif hasattr(client, "get_by_voyage_id"):
-                # WreckClient (MAARER): check via wreck data
-                try:
-                    wrecks = client._load_json(client.WRECKS_FILE)
-                    for w in wrecks:
-                        if w.get("voyage_id"):
-                            wreck_ground_truth += 1
-                            v = await self.get_voyage(w["voyage_id"])
-                            if v:
-                                wreck_matched += 1
-                except Exception:
-                    pass
+        for voyage_id, wrecks in links.items():
+            # Verify the linked voyage exists, once for all its wrecks
+            if await self.get_voyage(voyage_id):
+                wreck_matched += len(wrecks)
 
         wreck_precision = 1.0 if wreck_matched > 0 else 0.0
         wreck_recall = wreck_matched / wreck_ground_truth if wreck_ground_truth > 0 else 0.0
@@ -741,50 +1145,65 @@ class ArchiveManager:
             flag=flag,
             vessel_type=vessel_type,
             gp_quality=gp_quality,
-            max_results=_FETCH_ALL,
         )
 
         if archive and archive in self._wreck_clients:
-            client = self._wreck_clients[archive]
-            if hasattr(client, "search_wrecks"):
-                results = await client.search_wrecks(**search_kwargs)
-            else:
-                results = await client.search(**search_kwargs)
+            clients = {archive: self._wreck_clients[archive]}
+            order = None
         elif archive:
-            results = []
+            return self._paginate([], max_results, cursor)
         else:
-            # Query all wreck archives and merge results
-            results = []
-            for client in self._wreck_clients.values():
-                if hasattr(client, "search_wrecks"):
-                    results.extend(await client.search_wrecks(**search_kwargs))
-                else:
-                    results.extend(await client.search(**search_kwargs))
-            # Deterministic sort for stable pagination across archives
-            results.sort(key=lambda w: (w.get("loss_date") or "9999", w.get("wreck_id", "")))
+            # Merge every archive's presorted stream (see search_voyages)
+            clients, order = self._wreck_clients, wreck_order
+        return await self._search_page(
+            clients, "iter_wrecks", "count_wrecks", order, search_kwargs, max_results, cursor
+        )
 
-        return self._paginate(results, max_results, cursor)
+    async def count_wrecks(
+        self,
+        ship_name: str | None = None,
+        date_range: str | None = None,
+        region: str | None = None,
+        cause: str | None = None,
+        status: str | None = None,
+        min_depth_m: float | None = None,
+        max_depth_m: float | None = None,
+        min_cargo_value: float | None = None,
+        flag: str | None = None,
+        vessel_type: str | None = None,
+        gp_quality: int | None = None,
+        archive: str | None = None,
+        facets: Iterable[str] = (),
+    ) -> dict[str, Any]:
+        """Count wrecks matching a search, optionally broken down by ``facets``.
+
+        Takes the filters of ``search_wrecks``; see ``count_voyages``.
+        Facets are those in ``WRECK_FACETS``.
+        """
+        search_kwargs = {
+            "ship_name": ship_name,
+            "date_range": date_range,
+            "region": region,
+            "cause": cause,
+            "status": status,
+            "min_depth_m": min_depth_m,
+            "max_depth_m": max_depth_m,
+            "min_cargo_value": min_cargo_value,
+            "flag": flag,
+            "vessel_type": vessel_type,
+            "gp_quality": gp_quality,
+        }
+        if archive:
+            clients = {a: c for a, c in self._wreck_clients.items() if a == archive}
+        else:
+            clients = self._wreck_clients
+        return await self._search_counts(
+            clients, "count_wrecks", "facet_wrecks", search_kwargs, facets, WRECK_FACETS
+        )
 
     async def get_wreck(self, wreck_id: str) -> dict | None:
-        """Get full wreck record, routing to the correct archive client."""
-        # Determine which client handles this wreck ID
-        if wreck_id.startswith("maarer:"):
-            return await self._wreck_client.get_by_id(wreck_id)
-
-        # Check compound prefixes: eic_wreck:, carreira_wreck:, etc.
-        for prefix, client in [
-            ("eic_wreck:", self._eic_client),
-            ("carreira_wreck:", self._carreira_client),
-            ("galleon_wreck:", self._galleon_client),
-            ("soic_wreck:", self._soic_client),
-            ("ukho_wreck:", self._ukho_client),
-            ("noaa_wreck:", self._noaa_client),
-        ]:
-            if wreck_id.startswith(prefix):
-                return await client.get_wreck_by_id(wreck_id)
-
-        # Default to MAARER
-        return await self._wreck_client.get_by_id(wreck_id)
+        """Get full wreck record, routing to the correct archive client (MAARER if unprefixed)."""
+        return await self._get_by_id(wreck_id, "wreck", "maarer")
 
     # --- Narrative Search ---------------------------------------------------
 
@@ -826,20 +1245,6 @@ class ArchiveManager:
         end = min(len(text), start + max_len)
         return text[start:end].strip()
 
-    @staticmethod
-    def _count_matches(text_lower: str, terms_lower: list[str]) -> int:
-        """Count total occurrences of all terms in lowered text."""
-        count = 0
-        for term in terms_lower:
-            start = 0
-            while True:
-                pos = text_lower.find(term, start)
-                if pos == -1:
-                    break
-                count += 1
-                start = pos + len(term)
-        return count
-
     async def search_narratives(
         self,
         query: str,
@@ -847,92 +1252,115 @@ class ArchiveManager:
         archive: str | None = None,
         max_results: int = 50,
         cursor: str | None = None,
+        variants: bool = False,
     ) -> PaginatedResult:
         """
         Search free-text narrative fields across all archives.
 
-        Scans voyage ``particulars`` and wreck ``particulars`` / ``loss_location``
-        fields for matching terms.  All query terms must be present (AND logic).
-        Quoted phrases are matched exactly.
+        Searches voyage ``particulars`` and wreck ``particulars`` /
+        ``loss_location`` fields for matching terms through each client's
+        inverted text index.  All query terms must be present (AND logic).
+        Quoted phrases are matched as consecutive words.  Hits are ranked by
+        BM25 score; the merged ranking of every archive's best hits is cached
+        per query, a few pages past the one requested, so later pages are
+        slices of it.  Terms match as spelled unless ``variants`` is set:
+        then a word also matches whole words that differ from it only in
+        diacritics or the historical spellings of each archive's language,
+        and if no archive matches the query, words fall back to those within
+        a small edit distance.
         """
         terms = self._parse_query_terms(query)
         if not terms:
             return PaginatedResult(items=[], total_count=0, next_cursor=None, has_more=False)
 
-        terms_lower = [t.lower() for t in terms]
-        hits: list[dict] = []
+        page_size = min(max_results, MAX_PAGE_SIZE)
+        offset = decode_cursor(cursor)
+        cache_key = (
+            "narratives",
+            self._fingerprint([query, record_type, archive, variants]),
+            self._data_version([*self._voyage_clients.values(), *self._wreck_clients.values()]),
+        )
+        end = offset + page_size
+        cached = self._query_cache.get(cache_key)
+        if cached is None or len(cached[1]) < min(end, cached[0]):
+            limit = end + page_size * _NARRATIVE_PAGES_AHEAD
+            cached = await self._rank_narratives(terms, record_type, archive, variants, limit)
+            self._query_cache.put(cache_key, cached)
+        total_count, ranked = cached
+        page = ranked[offset:end]
+
+        items = [
+            {
+                "record_id": record_id,
+                "record_type": kind,
+                "archive": arc_id,
+                "ship_name": record.get("ship_name", "Unknown"),
+                "date": record.get(_NARRATIVE_FIELDS[kind][1]),
+                "field": field_name,
+                "snippet": self._extract_snippet(record.get(field_name) or "", terms),
+                "match_count": occurrences,
+                "score": round(-neg_score, 4),
+            }
+            for (neg_score, _, record_id, field_name), kind, arc_id, occurrences, record in page
+        ]
+        next_offset = offset + len(items)
+        has_more = next_offset < total_count
+        return PaginatedResult(
+            items=items,
+            total_count=total_count,
+            next_cursor=encode_cursor(next_offset) if has_more else None,
+            has_more=has_more,
+        )
 
-        # --- Scan voyages ---
-        if record_type in (None, "voyage"):
-            voyage_clients = (
-                {archive: self._voyage_clients[archive]}
-                if archive and archive in self._voyage_clients
-                else (
-                    {} if archive and archive not in self._voyage_clients else self._voyage_clients
-                )
-            )
-            for arc_id, client in voyage_clients.items():
-                voyages = await client.search(max_results=_FETCH_ALL)
-                for v in voyages:
-                    text = v.get("particulars") or ""
-                    if not text:
-                        continue
-                    text_lower = text.lower()
-                    # All terms must be present (AND logic)
-                    if not all(t in text_lower for t in terms_lower):
-                        continue
-                    match_count = self._count_matches(text_lower, terms_lower)
-                    hits.append(
-                        {
-                            "record_id": v.get("voyage_id", ""),
-                            "record_type": "voyage",
-                            "archive": arc_id,
-                            "ship_name": v.get("ship_name", "Unknown"),
-                            "date": v.get("departure_date"),
-                            "field": "particulars",
-                            "snippet": self._extract_snippet(text, terms),
-                            "match_count": match_count,
-                        }
+    async def _rank_narratives(
+        self,
+        terms: list[str],
+        record_type: str | None,
+        archive: str | None,
+        variants: bool,
+        limit: int,
+    ) -> tuple[int, list[tuple]]:
+        """The number of narrative hits of ``terms`` and the best ``limit`` of them.
+
+        Hits are ordered by best score, then date, ID and field: a total
+        order, so hits with tied scores fall the same way on every page and
+        pages are slices of one ranking. Each archive keeps its best
+        ``limit`` under that order, and those runs are merged. With
+        ``variants``, a query no archive matches is searched again with
+        near misses, so one archive's near miss never joins another's
+        exact hits.
+        """
+        sources: list[tuple[str, str, Any]] = []
+        for kind, clients in (("voyage", self._voyage_clients), ("wreck", self._wreck_clients)):
+            if record_type not in (None, kind):
+                continue
+            for arc_id, client in clients.items():
+                if not archive or archive == arc_id:
+                    sources.append((kind, arc_id, client))
+
+        # Each archive's index is searched concurrently on the search pool
+        for fuzzy in (False, True) if variants else (False,):
+            found = await asyncio.gather(
+                *(
+                    self._in_pool(
+                        getattr(client, _NARRATIVE_FIELDS[kind][2]),
+                        terms,
+                        limit,
+                        variants,
+                        key=partial(_narrative_rank, kind),
+                        fuzzy=fuzzy,
                     )
-
-        # --- Scan wrecks ---
-        if record_type in (None, "wreck"):
-            wreck_clients = (
-                {archive: self._wreck_clients[archive]}
-                if archive and archive in self._wreck_clients
-                else ({} if archive and archive not in self._wreck_clients else self._wreck_clients)
+                    for kind, _, client in sources
+                )
             )
-            for arc_id, client in wreck_clients.items():
-                if hasattr(client, "search_wrecks"):
-                    wrecks = await client.search_wrecks(max_results=_FETCH_ALL)
-                else:
-                    wrecks = await client.search(max_results=_FETCH_ALL)
-                for w in wrecks:
-                    # Check both narrative fields
-                    for field_name in ("particulars", "loss_location"):
-                        text = w.get(field_name) or ""
-                        if not text:
-                            continue
-                        text_lower = text.lower()
-                        if not all(t in text_lower for t in terms_lower):
-                            continue
-                        match_count = self._count_matches(text_lower, terms_lower)
-                        hits.append(
-                            {
-                                "record_id": w.get("wreck_id", ""),
-                                "record_type": "wreck",
-                                "archive": arc_id,
-                                "ship_name": w.get("ship_name", "Unknown"),
-                                "date": w.get("loss_date"),
-                                "field": field_name,
-                                "snippet": self._extract_snippet(text, terms),
-                                "match_count": match_count,
-                            }
-                        )
-
-        # Sort by relevance (match count desc), then date
-        hits.sort(key=lambda h: (-h["match_count"], h.get("date") or "9999"))
-        return self._paginate(hits, max_results, cursor)
+            if any(total for total, _ in found):
+                break
+        runs = [
+            [(_narrative_rank(kind, hit), kind, arc_id, hit[1], hit[2]) for hit in best]
+            for (kind, arc_id, _), (_, best) in zip(sources, found)
+        ]
+        ranked = list(islice(heapq.merge(*runs, key=lambda hit: hit[0]), limit))
+        return sum(total for total, _ in found), ranked
 
     # --- Vessel Operations --------------------------------------------------
 
@@ -950,19 +1378,27 @@ class ArchiveManager:
         cursor: str | None = None,
     ) -> PaginatedResult:
         """Search vessel records from local DAS data."""
-        results = await self._das_client.search_vessels(
-            name=name,
-            ship_type=ship_type,
-            chamber=chamber,
-            min_tonnage=min_tonnage,
-            max_tonnage=max_tonnage,
-            max_results=_FETCH_ALL,
+        search_kwargs = {
+            "name": name,
+            "ship_type": ship_type,
+            "chamber": chamber,
+            "min_tonnage": min_tonnage,
+            "max_tonnage": max_tonnage,
+        }
+        cache_key = (
+            "vessels",
+            self._fingerprint(self._normalize(search_kwargs)),
+            self._das_client.data_version(),
         )
+        results = self._query_cache.get(cache_key)
+        if results is None:
+            results = await self._das_client.search_vessels(**search_kwargs, max_results=_FETCH_ALL)
+            self._query_cache.put(cache_key, results)
         return self._paginate(results, max_results, cursor)
 
     async def get_vessel(self, vessel_id: str) -> dict | None:
         """Get full vessel specification."""
-        return await self._das_client.get_vessel_by_id(vessel_id)
+        return await self._get_by_id(vessel_id, "vessel", "das_vessel")
 
     # --- Crew Operations ----------------------------------------------------
 
@@ -988,32 +1424,23 @@ class ArchiveManager:
             origin=origin,
             date_range=date_range,
             fate=fate,
-            max_results=_FETCH_ALL,
         )
 
         if archive and archive in self._crew_clients:
-            results = await self._crew_clients[archive].search(**search_kwargs)
+            clients = {archive: self._crew_clients[archive]}
+            order = None
         elif archive:
-            results = []
+            return self._paginate([], max_results, cursor)
         else:
-            # Query all crew archives and merge results
-            results = []
-            for client in self._crew_clients.values():
-                results.extend(await client.search(**search_kwargs))
-            results.sort(
-                key=lambda c: (
-                    c.get("embarkation_date") or c.get("muster_date") or "9999",
-                    c.get("crew_id", ""),
-                )
-            )
-
-        return self._paginate(results, max_results, cursor)
+            # Merge every archive's presorted stream (see search_voyages)
+            clients, order = self._crew_clients, crew_order
+        return await self._search_page(
+            clients, "iter_crew", "count_crew", order, search_kwargs, max_results, cursor
+        )
 
     async def get_crew_member(self, crew_id: str) -> dict | None:
-        """Get full crew member record, routing to the correct archive."""
-        if crew_id.startswith("dss:"):
-            return await self._dss_client.get_crew_by_id(crew_id)
-        return await self._crew_client.get_by_id(crew_id)
+        """Get full crew member record, routing to the correct archive (VOC if unprefixed)."""
+        return await self._get_by_id(crew_id, "crew", "voc_crew")
 
     # --- Muster Operations --------------------------------------------------
 
@@ -1044,7 +1471,7 @@ class ArchiveManager:
 
     async def get_muster(self, muster_id: str) -> dict | None:
         """Get full muster record details."""
-        return await self._dss_client.get_muster_by_id(muster_id)
+        return await self._get_by_id(muster_id, "muster", "dss_muster")
 
     async def compare_wages(
         self,
@@ -1261,48 +1688,59 @@ class ArchiveManager:
         date_range: str | None = None,
         group_by: str | None = None,
     ) -> dict:
-        """Get aggregate statistics across archives."""
-        wrecks = (await self.search_wrecks(max_results=10000)).items
+        """Get aggregate statistics across archives.
 
-        if date_range:
-            wrecks = self._filter_by_date_range(wrecks, date_range, "loss_date")
+        Built from the wreck facet counts of ``_search_counts`` over every
+        matching wreck -- bitmap popcounts for region, cause and status, a
+        single scan for the dates and totals -- so no record list is
+        materialised and nothing is capped at a page size.
+        """
+        counts = await self._search_counts(
+            self._wreck_clients,
+            "count_wrecks",
+            "facet_wrecks",
+            {"date_range": date_range},
+            STATISTICS_FACETS,
+            STATISTICS_FACETS,
+        )
+        total_losses = counts["total_count"]
+        facets = counts["facets"]
+
+        def with_missing(histogram: dict[str, int], missing: str) -> dict[str, int]:
+            # Facet counts leave out wrecks without a value; file them under ``missing``
+            histogram = dict(histogram)
+            if unset := total_losses - sum(histogram.values()):
+                histogram[missing] = histogram.get(missing, 0) + unset
+            return histogram
+
+        def total(field: str) -> int | float:
+            value = 0.0
+            for v, n in facets[field].items():
+                try:
+                    number = float(v)
+                except ValueError:
+                    continue  # "unknown", "" and the like add nothing
+                if math.isfinite(number):
+                    value += number * n
+            return int(value) if value.is_integer() else value
 
-        losses_by_region: dict[str, int] = {}
-        losses_by_cause: dict[str, int] = {}
-        losses_by_status: dict[str, int] = {}
         losses_by_decade: dict[str, int] = {}
-        total_lives_lost = 0
-        total_cargo_value = 0
-
-        for w in wrecks:
-            region = w.get("region", "other")
-            losses_by_region[region] = losses_by_region.get(region, 0) + 1
-
-            cause = w.get("loss_cause", "unknown")
-            losses_by_cause[cause] = losses_by_cause.get(cause, 0) + 1
-
-            status = w.get("status", "unknown")
-            losses_by_status[status] = losses_by_status.get(status, 0) + 1
-
-            loss_date = w.get("loss_date", "")
-            if loss_date and len(loss_date) >= 4:
+        for loss_date, n in facets["loss_date"].items():
+            if len(loss_date) >= 4:
                 decade = f"{loss_date[:3]}0s"
-                losses_by_decade[decade] = losses_by_decade.get(decade, 0) + 1
-
-            total_lives_lost += w.get("lives_lost", 0) or 0
-            total_cargo_value += w.get("cargo_value_guilders", 0) or 0
+                losses_by_decade[decade] = losses_by_decade.get(decade, 0) + n
 
         return {
             "archives_included": [archive] if archive else list(self._wreck_clients.keys()),
             "date_range": date_range or "all",
             "summary": {
-                "total_losses": len(wrecks),
-                "lives_lost_total": total_lives_lost,
-                "cargo_value_guilders_total": total_cargo_value,
+                "total_losses": total_losses,
+                "lives_lost_total": total("lives_lost"),
+                "cargo_value_guilders_total": total("cargo_value_guilders"),
             },
-            "losses_by_region": losses_by_region,
-            "losses_by_cause": losses_by_cause,
-            "losses_by_status": losses_by_status,
+            "losses_by_region": with_missing(facets["region"], "other"),
+            "losses_by_cause": with_missing(facets["loss_cause"], "unknown"),
+            "losses_by_status": with_missing(facets["status"], "unknown"),
             "losses_by_decade": dict(sorted(losses_by_decade.items())),
         }
 
@@ -1379,58 +1817,6 @@ class ArchiveManager:
 
     _DEMOGRAPHICS_GROUP_BY = {"rank", "origin", "fate", "decade", "ship_name"}
 
-    @staticmethod
-    def _crew_group_key(record: dict, group_by: str) -> str:
-        """Extract the grouping value from a crew record."""
-        if group_by == "rank":
-            return record.get("rank") or "unknown"
-        if group_by == "origin":
-            return record.get("origin") or "unknown"
-        if group_by == "fate":
-            return record.get("service_end_reason") or "unknown"
-        if group_by == "decade":
-            date = record.get("embarkation_date") or ""
-            if len(date) >= 4:
-                try:
-                    year = int(date[:4])
-                    return f"{year // 10 * 10}s"
-                except ValueError:
-                    pass
-            return "unknown"
-        if group_by == "ship_name":
-            return record.get("ship_name") or "unknown"
-        return "unknown"
-
-    def _apply_crew_filters(
-        self,
-        records: list[dict],
-        *,
-        date_range: str | None = None,
-        rank: str | None = None,
-        origin: str | None = None,
-        fate: str | None = None,
-        ship_name: str | None = None,
-    ) -> list[dict]:
-        """Apply optional filters to crew records."""
-        if rank:
-            records = [r for r in records if self._contains(r.get("rank"), rank)]
-        if origin:
-            records = [r for r in records if self._contains(r.get("origin"), origin)]
-        if fate:
-            records = [r for r in records if r.get("service_end_reason") == fate]
-        if ship_name:
-            records = [r for r in records if self._contains(r.get("ship_name"), ship_name)]
-        if date_range:
-            records = self._filter_by_date_range(records, date_range, "embarkation_date")
-        return records
-
-    @staticmethod
-    def _contains(haystack: str | None, needle: str) -> bool:
-        """Case-insensitive substring match."""
-        if not haystack:
-            return False
-        return needle.lower() in haystack.lower()
-
     def crew_demographics(
         self,
         group_by: str = "rank",
@@ -1449,28 +1835,31 @@ class ArchiveManager:
                 f"Valid: {', '.join(sorted(self._DEMOGRAPHICS_GROUP_BY))}"
             )
 
-        all_records = self._crew_client.all_records()
-        total_records = len(all_records)
-        filtered = self._apply_crew_filters(
-            all_records,
+        store = self._crew_client.store()
+        total_records = len(store)
+        rows = store.select(
             date_range=date_range,
             rank=rank,
             origin=origin,
             fate=fate,
             ship_name=ship_name,
         )
-        total_filtered = len(filtered)
+        total_filtered = len(rows)
 
-        # Group
+        # Group: count (group, fate) code pairs, then fold codes into labels.
+        # Counter keeps first-seen order, so groups and fates keep row order.
+        group_codes, group_labels = store.group_labels(group_by)
+        fate_codes, fate_labels = store.group_labels("fate")
+        pairs = Counter(zip(map(group_codes.__getitem__, rows), map(fate_codes.__getitem__, rows)))
         groups: dict[str, dict] = {}
-        for rec in filtered:
-            key = self._crew_group_key(rec, group_by)
+        for (group_code, fate_code), n in pairs.items():
+            key = group_labels[group_code]
             if key not in groups:
                 groups[key] = {"count": 0, "fate_distribution": {}}
-            groups[key]["count"] += 1
-            fate_val = rec.get("service_end_reason") or "unknown"
+            groups[key]["count"] += n
+            fate_val = fate_labels[fate_code]
             groups[key]["fate_distribution"][fate_val] = (
-                groups[key]["fate_distribution"].get(fate_val, 0) + 1
+                groups[key]["fate_distribution"].get(fate_val, 0) + n
             )
 
         # Sort descending by count
@@ -1520,12 +1909,12 @@ class ArchiveManager:
         origin: str | None = None,
     ) -> dict:
         """Reconstruct career(s) for individuals matching a name."""
-        all_records = self._crew_client.all_records()
+        store = self._crew_client.store()
 
-        # Filter by name substring
-        matches = [r for r in all_records if self._contains(r.get("name"), name)]
+        # Filter by name substring; only the matching rows become dicts
+        matches = store.records(store.select(name=name))
         if origin:
-            matches = [r for r in matches if r.get("origin", "").lower() == origin.lower()]
+            matches = [r for r in matches if (r.get("origin") or "").lower() == origin.lower()]
 
         total_matches = len(matches)
 
@@ -1618,14 +2007,9 @@ class ArchiveManager:
                 f"Valid: {', '.join(sorted(self._DEMOGRAPHICS_GROUP_BY))}"
             )
 
-        all_records = self._crew_client.all_records()
-        total_records = len(all_records)
-        filtered = self._apply_crew_filters(
-            all_records,
-            date_range=date_range,
-            rank=rank,
-            origin=origin,
-        )
+        store = self._crew_client.store()
+        total_records = len(store)
+        rows = store.select(date_range=date_range, rank=rank, origin=origin)
 
         # Only records with known fate
         known_fate_map = {
@@ -1636,13 +2020,20 @@ class ArchiveManager:
             "deserted": "deserted",
             "discharged": "discharged",
         }
-        with_fate = [r for r in filtered if r.get("service_end_reason") in known_fate_map]
-        total_with_known_fate = len(with_fate)
+        group_codes, group_labels = store.group_labels(group_by)
+        fate_codes, fate_labels = store.group_labels("fate")
+        pairs = Counter(zip(map(group_codes.__getitem__, rows), map(fate_codes.__getitem__, rows)))
+        total_with_known_fate = sum(
+            n for (_, fate_code), n in pairs.items() if fate_labels[fate_code] in known_fate_map
+        )
 
         # Group
         groups: dict[str, dict[str, int]] = {}
-        for rec in with_fate:
-            key = self._crew_group_key(rec, group_by)
+        for (group_code, fate_code), n in pairs.items():
+            fate_val = fate_labels[fate_code]
+            if fate_val not in known_fate_map:
+                continue
+            key = group_labels[group_code]
             if key not in groups:
                 groups[key] = {
                     "total": 0,
@@ -1652,9 +2043,8 @@ class ArchiveManager:
                     "deserted": 0,
                     "discharged": 0,
                 }
-            groups[key]["total"] += 1
-            category = known_fate_map[rec["service_end_reason"]]
-            groups[key][category] += 1
+            groups[key]["total"] += n
+            groups[key][known_fate_map[fate_val]] += n
 
         # Sort descending by total
         sorted_groups = sorted(groups.items(), key=lambda x: x[1]["total"], reverse=True)
@@ -1715,22 +2105,4 @@ class ArchiveManager:
         self, records: list[dict], date_range: str, date_field: str
     ) -> list[dict]:
         """Filter records by date range (YYYY/YYYY or YYYY-MM-DD/YYYY-MM-DD)."""
-        parts = date_range.split("/")
-        if len(parts) != 2:
-            return records
-
-        start_str, end_str = parts
-        start_year = int(start_str[:4]) if len(start_str) >= 4 else 0
-        end_year = int(end_str[:4]) if len(end_str) >= 4 else 9999
-
-        filtered = []
-        for r in records:
-            date_val = r.get(date_field, "")
-            if date_val and len(date_val) >= 4:
-                try:
-                    record_year = int(date_val[:4])
-                except ValueError:
-                    continue
-                if start_year <= record_year <= end_year:
-                    filtered.append(r)
-        return filtered
+        return BaseArchiveClient._filter_by_date_range(records, date_range, date_field)
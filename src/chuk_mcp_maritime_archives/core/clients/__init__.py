@@ -1,6 +1,6 @@
 """Archive data source clients."""
 
-from .base import BaseArchiveClient
+from .base import BaseArchiveClient, VoyageArchiveClient, WreckArchiveClient
 from .cargo_client import CargoClient
 from .carreira_client import CarreiraClient
 from .crew_client import CrewClient
@@ -25,5 +25,7 @@ __all__ = [
     "NOAAClient",
     "SOICClient",
     "UKHOClient",
+    "VoyageArchiveClient",
+    "WreckArchiveClient",
     "WreckClient",
 ]
@@ -2,22 +2,133 @@
 Base class for archive data source clients.
 
 All archive clients share:
-- Lazy-loaded JSON data from the local data directory
-- In-memory search with keyword filters
+- Lazy-loaded JSON data from the local data directory (thread-safe, read
+  incrementally, and loadable ahead of the first query with ``preload()``)
+- Index snapshots: records plus lookup indexes saved beside the data files
+  and restored on later starts while the files are unchanged
+- In-memory search with keyword filters, compiled by ``_select()`` into
+  one single-pass predicate chain over pre-lowered field values, with
+  substring filters narrowed first by lazily built trigram indexes and date
+  filters resolved by bisecting a sorted date index; filters on the
+  categorical fields a client declares are ANDed as bitmaps, which also
+  give facet counts (``_facet_counts()``)
+- Lazily filtered iteration (``_iter_rows()``) in file order or presorted
+  in the cross-archive order of voyages, wrecks and crew, for heap merging,
+  resumable after the position of the last record read
+- Full-text search of narrative fields through a positional inverted
+  index with BM25 ranking (``_text_search()``), optionally matching whole
+  words across diacritics and the spelling variants of the archive's
+  language, or by near misses
 - Detail retrieval by record ID
 """
 
-import json
+import heapq
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Callable, Iterator, Sequence
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
+
+from ..index_snapshot import (
+    SNAPSHOT_SUFFIX,
+    load_snapshot,
+    save_snapshot,
+    snapshots_enabled,
+    source_hashes,
+)
+from ..json_stream import JSON_LINES_SUFFIXES, iter_json_records, share_keys
+from .bitmap_index import BitmapIndex, bitmap_rows
+from .date_index import DateIndex, date_key, range_keys, year_keys
+from .spelling import normalizer
+from .text_index import TextIndex, tokenize
+from .trigram_index import TrigramIndex
 
 logger = logging.getLogger(__name__)
 
 # Default data directory relative to the project root
 _DEFAULT_DATA_DIR = Path(__file__).resolve().parent.parent.parent.parent.parent / "data"
 
+# Rows sampled per predicate to estimate its selectivity in _select()
+_SELECTIVITY_SAMPLE = 256
+
+# A compiled filter: takes a row index, returns whether the row is kept
+Predicate = Callable[[int], bool]
+
+
+# Cross-archive result orders: clients iterate their records in these
+# orders so ArchiveManager can merge archives without re-sorting
+
+
+def voyage_order(record: dict) -> tuple[str, str]:
+    """Sort key of a voyage: (departure date, "9999" if unknown; voyage ID)."""
+    return (record.get("departure_date") or "9999", record.get("voyage_id", ""))
+
+
+def wreck_order(record: dict) -> tuple[str, str]:
+    """Sort key of a wreck: (loss date, "9999" if unknown; wreck ID)."""
+    return (record.get("loss_date") or "9999", record.get("wreck_id", ""))
+
+
+# Free-text fields searched by ArchiveManager.search_narratives()
+VOYAGE_NARRATIVE_FIELDS: tuple[str, ...] = ("particulars",)
+WRECK_NARRATIVE_FIELDS: tuple[str, ...] = ("particulars", "loss_location")
+
+
+def link_id(voyage_id: str, archive: str) -> str:
+    """``voyage_id`` with its archive prefix, ``archive`` if it has none ("0372.1" -> "das:0372.1")."""
+    return voyage_id if ":" in voyage_id else f"{archive}:{voyage_id}"
+
+
+def voyage_links(records: list[dict], archive: str) -> dict[str, list[dict]]:
+    """Records by linked ``voyage_id`` (see ``link_id``), in file order."""
+    links: dict[str, list[dict]] = {}
+    for record in records:
+        if voyage_id := record.get("voyage_id"):
+            links.setdefault(link_id(voyage_id, archive), []).append(record)
+    return links
+
+
+def crew_order(record: dict) -> tuple[str, str]:
+    """Sort key of a crew record: (embarkation or muster date, "9999" if unknown; crew ID)."""
+    date = record.get("embarkation_date") or record.get("muster_date") or "9999"
+    return (date, record.get("crew_id", ""))
+
+
+def _equals(records: list[dict], field: str, value: Any) -> Predicate:
+    return lambda row: records[row].get(field) == value
+
+
+def _at_least(records: list[dict], field: str, bound: float) -> Predicate:
+    return lambda row: (records[row].get(field) or 0) >= bound
+
+
+def _at_most(records: list[dict], field: str, bound: float) -> Predicate:
+    def keep(row: int) -> bool:
+        value = records[row].get(field)
+        return value is not None and value <= bound
+
+    return keep
+
+
+def _key_between(keys: list[int | None], lo: int, hi: int) -> Predicate:
+    def keep(row: int) -> bool:
+        key = keys[row]
+        return key is not None and lo <= key <= hi
+
+    return keep
+
+
+def _contains_any(lowered: list[list[str]], needle: str) -> Predicate:
+    if len(lowered) == 1:
+        (column,) = lowered
+        return lambda row: needle in column[row]
+    return lambda row: any(needle in column[row] for column in lowered)
+
 
 class BaseArchiveClient(ABC):
     """
@@ -27,31 +138,182 @@ class BaseArchiveClient(ABC):
     JSON data files produced by the download scripts.
     """
 
+    # Data files read by this client, loaded together by preload()
+    DATA_FILES: tuple[str, ...] = ()
+
+    # Index attributes saved with the records in the index snapshot; bump
+    # INDEX_VERSION whenever the records or these indexes change shape
+    INDEX_ATTRS: tuple[str, ...] = ()
+    INDEX_VERSION = 3
+
+    # Low-cardinality fields, per data file, given bitmap indexes: their
+    # equality and substring filters become bitwise ANDs, and they can be
+    # counted per value with _facet_counts()
+    CATEGORICAL_FIELDS: ClassVar[dict[str, tuple[str, ...]]] = {}
+
+    # Language of the archive's narratives: narrative search with variants
+    # matches words across the spelling variants of those with
+    # spelling.ORTHOGRAPHY_RULES, and across diacritics for all
+    ORTHOGRAPHY: str | None = None
+
     def __init__(self, data_dir: Path | None = None) -> None:
         self._data_dir = data_dir or _DEFAULT_DATA_DIR
         self._loaded: dict[str, list[dict]] = {}
+        self._load_lock = threading.Lock()
+        self._source_hashes: dict[str, str] | None = None
+        self._snapshot_checked = False
+        self._from_snapshot = False
+        self._columns: dict[tuple[str, str], tuple[list[dict], Any]] = {}
 
     def _load_json(self, filename: str) -> list[dict]:
-        """Load a JSON data file, caching the result in memory."""
+        """Load a JSON data file, caching the result in memory.
+
+        Restores the client's index snapshot first if it is current, so a
+        fresh process skips the JSON parse. Thread-safe: concurrent callers
+        wait for a single load of the file.
+        """
         if filename in self._loaded:
             return self._loaded[filename]
 
+        with self._load_lock:
+            if filename not in self._loaded:
+                self._restore_snapshot()
+            if filename not in self._loaded:
+                self._loaded[filename] = self._read_json(filename)
+        return self._loaded[filename]
+
+    def _read_json(self, filename: str) -> list[dict]:
+        """Read a JSON data file without caching it ([] if missing or not a list)."""
+        return list(share_keys(self._iter_json(filename)))
+
+    def _data_path(self, filename: str) -> Path | None:
+        """Path of a data file, or of its JSON Lines sibling; None if neither exists."""
         path = Path(self._data_dir) / filename
-        if not path.exists():
+        if path.exists():
+            return path
+        for suffix in JSON_LINES_SUFFIXES:
+            if path.with_suffix(suffix).exists():
+                return path.with_suffix(suffix)
+        return None
+
+    def _iter_json(self, filename: str) -> Iterator[dict]:
+        """Stream the records of a data file one at a time.
+
+        Reads ``filename`` incrementally (see ``core.json_stream``), falling
+        back to a JSON Lines sibling (``crew.jsonl`` for ``crew.json``).
+        Yields nothing if neither exists.
+        """
+        path = self._data_path(filename)
+        if path is None:
+            path = Path(self._data_dir) / filename
             logger.warning("Data file not found: %s (run scripts/download_das.py)", path)
-            self._loaded[filename] = []
-            return []
+            return
+
+        start = time.perf_counter()
+        count = 0
+        for count, record in enumerate(iter_json_records(path), 1):
+            yield record
+        logger.info(
+            "Loaded %d records from %s in %.3fs",
+            count,
+            path.name,
+            time.perf_counter() - start,
+        )
+
+    # --- Index snapshots ----------------------------------------------------
+
+    def _snapshot_path(self) -> Path:
+        return Path(self._data_dir) / (Path(self.DATA_FILES[0]).stem + SNAPSHOT_SUFFIX)
 
-        with open(path) as f:
-            data = json.load(f)
+    def _snapshot_sources(self) -> dict[str, str] | None:
+        """Hashes of the data files (computed once), or None if any is missing."""
+        if self._source_hashes is None and self.DATA_FILES:
+            paths = [self._data_path(f) for f in self.DATA_FILES]
+            if None not in paths:
+                self._source_hashes = source_hashes(paths)
+        return self._source_hashes
 
-        if not isinstance(data, list):
-            logger.warning("Expected list in %s, got %s", path, type(data).__name__)
-            data = []
+    def _load_snapshot(self) -> Any | None:
+        """Data of the client's index snapshot, or None if absent or stale."""
+        if not snapshots_enabled():
+            return None
+        sources = self._snapshot_sources()
+        if sources is None:
+            return None
+        return load_snapshot(self._snapshot_path(), sources, self.INDEX_VERSION)
 
-        self._loaded[filename] = data
-        logger.info("Loaded %d records from %s", len(data), path.name)
-        return data
+    def _save_snapshot(self, data: Any) -> None:
+        if not snapshots_enabled():
+            return
+        sources = self._snapshot_sources()
+        if sources is not None:
+            save_snapshot(self._snapshot_path(), sources, self.INDEX_VERSION, data)
+
+    def _restore_snapshot(self) -> bool:
+        """Restore records and ``INDEX_ATTRS`` from the snapshot (once, under the lock)."""
+        if self._snapshot_checked:
+            return self._from_snapshot
+        self._snapshot_checked = True
+
+        data = self._load_snapshot()
+        if not (isinstance(data, tuple) and len(data) == 2):
+            return False
+        files, indexes = data
+        if not (
+            isinstance(files, dict)
+            and isinstance(indexes, dict)
+            and files.keys() == set(self.DATA_FILES)
+            and indexes.keys() == set(self.INDEX_ATTRS)
+        ):
+            return False
+        # Indexes first: readers check _loaded without taking the lock
+        for attr, value in indexes.items():
+            setattr(self, attr, value)
+        self._loaded.update(files)
+        self._from_snapshot = True
+        logger.info("Restored %s from index snapshot", ", ".join(self.DATA_FILES))
+        return True
+
+    def _build_indexes(self) -> None:
+        """Build lookup indexes ahead of the first query (override if any)."""
+
+    def preload(self) -> dict[str, float]:
+        """Load every data file and build the indexes now, not on first query.
+
+        Uses the index snapshot when it is current; otherwise parses the
+        data files, builds the indexes and writes a snapshot for the next
+        start.
+
+        Returns:
+            Seconds spent per data file (already-loaded files cost ~0)
+        """
+        timings = {}
+        for filename in self.DATA_FILES:
+            start = time.perf_counter()
+            self._load_json(filename)
+            timings[filename] = time.perf_counter() - start
+        self._build_indexes()
+
+        with self._load_lock:
+            if not self._from_snapshot and all(f in self._loaded for f in self.DATA_FILES):
+                self._save_snapshot(
+                    (
+                        {f: self._loaded[f] for f in self.DATA_FILES},
+                        {attr: getattr(self, attr) for attr in self.INDEX_ATTRS},
+                    )
+                )
+                self._from_snapshot = True  # what is in memory now matches the snapshot
+        return timings
+
+    def data_version(self) -> str:
+        """Fingerprint of the data files on disk: name, size and mtime of each."""
+        parts = []
+        for filename in self.DATA_FILES:
+            path = self._data_path(filename)
+            if path is not None:
+                stat = path.stat()
+                parts.append(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}")
+        return ";".join(parts)
 
     @abstractmethod
     async def search(self, **kwargs: Any) -> list[dict]:
@@ -63,37 +325,520 @@ class BaseArchiveClient(ABC):
         """Retrieve a single record by ID. Returns record dict or None."""
         ...
 
-    def _filter_by_date_range(
-        self, records: list[dict], date_range: str, date_field: str
+    # --- Query compilation --------------------------------------------------
+
+    def _select(
+        self,
+        filename: str,
+        *,
+        max_results: int | None = None,
+        contains: dict[str, str | None] | None = None,
+        contains_any: dict[tuple[str, ...], str | None] | None = None,
+        equals: dict[str, Any] | None = None,
+        at_least: dict[str, float | None] | None = None,
+        at_most: dict[str, float | None] | None = None,
+        date_range: tuple[str, str | None] | None = None,
+        years: tuple[str, int | None, int | None] | None = None,
     ) -> list[dict]:
+        """Records of a data file matching every filter, in file order.
+
+        Filters left as None (or empty strings) are skipped:
+
+        - ``contains``: field -> case-insensitive substring (``_contains``)
+        - ``contains_any``: fields -> substring found in any of the fields
+        - ``equals``: field -> exact value
+        - ``at_least``: field -> minimum, a missing value counting as 0
+        - ``at_most``: field -> maximum, a missing value never matching
+        - ``date_range``: (date field, range string such as ``YYYY/YYYY``
+          or ``YYYY-MM-DD/YYYY-MM-DD``, matched to the precision given)
+        - ``years``: (date field, first year, last year)
+
+        The filters are compiled into one predicate chain, ordered most
+        selective first by trying each on a sample of rows, and applied
+        in a single pass that stops once ``max_results`` rows are found.
+        Substring tests run against field values lowered once per file.
+        Substring needles of three or more characters first narrow the
+        scan to the candidate rows of the field's trigram index, and a
+        narrow date range to the rows bisected from its date index.
+        Equality and substring filters on ``CATEGORICAL_FIELDS`` are
+        resolved exactly by ANDing the fields' bitmaps instead.
+        """
+        if max_results is not None and max_results <= 0:
+            return []
+        records = self._load_json(filename)
+        plan = self._compile_filters(
+            filename,
+            contains=contains or {},
+            contains_any=contains_any or {},
+            equals=equals or {},
+            at_least=at_least or {},
+            at_most=at_most or {},
+            date_range=date_range,
+            years=years,
+        )
+        return [records[row] for row in self._match_rows(len(records), *plan, max_results)]
+
+    def _facet_counts(
+        self, filename: str, fields: tuple[str, ...], **filters: Any
+    ) -> dict[str, dict[Any, int]]:
+        """Matching records per value of each of ``fields`` (None values left out).
+
+        ``filters`` are those of ``_select()``. When every filter resolves
+        to bitmaps, the counts of a categorical field are popcounts of its
+        value bitmaps ANDed with the query's; otherwise matches are counted
+        from the scanned rows.
+        """
+        records = self._load_json(filename)
+        predicates, hits, mask = self._compile_filters(filename, **filters)
+        facets: dict[str, dict[Any, int]] = {}
+        rows: Sequence[int] | None = None
+        for field in fields:
+            index = self._bitmap_index(filename, field)
+            if index is not None and not predicates and not hits:
+                facets[field] = index.counts(mask)
+                continue
+            if rows is None:
+                rows = self._match_rows(len(records), predicates, hits, mask, None)
+            counts = Counter(records[row].get(field) for row in rows)
+            counts.pop(None, None)
+            facets[field] = dict(counts)
+        return facets
+
+    def _count(self, filename: str, **filters: Any) -> int:
+        """Number of records matching ``filters`` (those of ``_select()``)."""
+        records = self._load_json(filename)
+        predicates, hits, mask = self._compile_filters(filename, **filters)
+        if not predicates and not hits:
+            return len(records) if mask is None else mask.bit_count()
+        return len(self._match_rows(len(records), predicates, hits, mask, None))
+
+    def _iter_rows(
+        self,
+        filename: str,
+        order: Callable[[dict], Any] | None = None,
+        *,
+        after: int = -1,
+        **filters: Any,
+    ) -> Iterator[tuple[int, dict]]:
+        """Records matching ``filters`` (those of ``_select()``) with their positions, lazily.
+
+        Without ``order`` records come in file order and a record's
+        position is its row. With it they are sorted by ``order`` (ties in
+        file order) through a cached ordering of the file, or by sorting
+        just the index hits when an index narrows the query, and a
+        position is the record's place in that ordering. Only records
+        after position ``after`` are produced, so reading the next N
+        matches of a query costs about N row tests wherever it resumes.
+        """
+        records = self._load_json(filename)
+        predicates, hits, mask = self._compile_filters(filename, **filters)
+        if mask is not None:
+            hits = [*hits, bitmap_rows(mask)]
+        rows = self._intersect_hits(hits, len(records))
+        positions: Sequence[int] = rows
+        row_at: Sequence[int] = range(len(records))
+        if order is not None:
+            row_at, rank = self._sort_order(filename, order)
+            positions = sorted(map(rank.__getitem__, rows)) if hits else rows
+        predicates = self._order_by_selectivity(predicates, rows)
+        for position in positions[bisect_right(positions, after) :]:
+            row = row_at[position]
+            for keep in predicates:
+                if not keep(row):
+                    break
+            else:
+                yield position, records[row]
+
+    def _sort_order(self, filename: str, order: Callable[[dict], Any]) -> tuple[array, array]:
+        """Rows of a data file sorted by ``order``, and each row's position in it."""
+
+        def build(records: list[dict]) -> tuple[array, array]:
+            ordered = array("l", sorted(range(len(records)), key=lambda r: order(records[r])))
+            rank = array("l", bytes(ordered.itemsize * len(ordered)))
+            for position, row in enumerate(ordered):
+                rank[row] = position
+            return ordered, rank
+
+        return self._field_column(filename, f"order:{order.__qualname__}", build)
+
+    def _match_rows(
+        self,
+        count: int,
+        predicates: list[Predicate],
+        hits: list[Sequence[int]],
+        mask: int | None,
+        max_results: int | None,
+    ) -> Sequence[int]:
+        """Rows passing a compiled filter plan, in order, up to ``max_results``."""
+        if mask is not None:
+            hits = [*hits, bitmap_rows(mask)]
+        rows = self._intersect_hits(hits, count)
+        if not predicates:
+            return rows[:max_results]
+        predicates = self._order_by_selectivity(predicates, rows)
+
+        matched = []
+        for row in rows:
+            for keep in predicates:
+                if not keep(row):
+                    break
+            else:
+                matched.append(row)
+                if len(matched) == max_results:
+                    break
+        return matched
+
+    def _compile_filters(
+        self,
+        filename: str,
+        *,
+        contains: dict[str, str | None] | None = None,
+        contains_any: dict[tuple[str, ...], str | None] | None = None,
+        equals: dict[str, Any] | None = None,
+        at_least: dict[str, float | None] | None = None,
+        at_most: dict[str, float | None] | None = None,
+        date_range: tuple[str, str | None] | None = None,
+        years: tuple[str, int | None, int | None] | None = None,
+    ) -> tuple[list[Predicate], list[Sequence[int]], int | None]:
+        """Compile the filters given to ``_select()`` into a plan.
+
+        Returns row-index predicates; index hits, sorted candidate rows
+        (one list per filter an index could narrow) that every match is
+        among; and the AND of the bitmaps of the categorical filters, or
+        None if there were none. Filters resolved by bitmaps need no
+        predicate.
+        """
+        records = self._load_json(filename)
+        predicates: list[Predicate] = []
+        hits: list[Sequence[int]] = []
+        mask: int | None = None
+
+        def narrow(bitmap: int) -> None:
+            nonlocal mask
+            mask = bitmap if mask is None else mask & bitmap
+
+        for field, value in (equals or {}).items():
+            if value is not None and value != "":
+                bitmaps = self._bitmap_index(filename, field)
+                if bitmaps is not None:
+                    narrow(bitmaps.equal(value))
+                else:
+                    predicates.append(_equals(records, field, value))
+        for field, bound in (at_least or {}).items():
+            if bound is not None:
+                predicates.append(_at_least(records, field, bound))
+        for field, bound in (at_most or {}).items():
+            if bound is not None:
+                predicates.append(_at_most(records, field, bound))
+
+        date_filters: list[tuple[str, int, int]] = []
+        if date_range and date_range[1]:
+            bounds = range_keys(date_range[1])
+            if bounds is not None:
+                date_filters.append((date_range[0], *bounds))
+        if years and (years[1] is not None or years[2] is not None):
+            date_filters.append((years[0], *year_keys(years[1], years[2])))
+        for field, lo, hi in date_filters:
+            predicates.append(_key_between(self._date_column(filename, field), lo, hi))
+            rows = self._date_index(filename, field).narrow_rows(lo, hi, len(records))
+            if rows is not None:
+                hits.append(rows)
+
+        text_filters = []
+        for field, needle in (contains or {}).items():
+            if needle:
+                bitmaps = self._bitmap_index(filename, field)
+                if bitmaps is not None:
+                    narrow(bitmaps.containing(needle.lower()))
+                else:
+                    text_filters.append(((field,), needle))
+        for fields, needle in text_filters + list((contains_any or {}).items()):
+            if needle:
+                needle = needle.lower()
+                columns = [self._lowered_column(filename, f) for f in fields]
+                predicates.append(_contains_any(columns, needle))
+                candidates = [self._trigram_index(filename, f).candidates(needle) for f in fields]
+                if len(candidates) == 1 and candidates[0] is not None:
+                    hits.append(candidates[0])
+                elif candidates and None not in candidates:
+                    hits.append(sorted(set().union(*candidates)))
+        return predicates, hits, mask
+
+    @staticmethod
+    def _intersect_hits(hits: list[Sequence[int]], count: int) -> Sequence[int]:
+        """Sorted rows present in every index hit (all rows if there are none)."""
+        if not hits:
+            return range(count)
+        hits = sorted(hits, key=len)
+        if len(hits) == 1:
+            return hits[0]
+        rows = set(hits[0])
+        for other in hits[1:]:
+            if not rows:
+                break
+            rows.intersection_update(other)
+        return sorted(rows)
+
+    @staticmethod
+    def _order_by_selectivity(predicates: list[Predicate], rows: Sequence[int]) -> list[Predicate]:
+        """Predicates sorted by the share of sampled rows they keep, lowest first.
+
+        Ties keep the compile order, which puts cheap equality and range
+        tests ahead of substring tests.
+        """
+        if len(predicates) < 2 or not rows:
+            return predicates
+        sample = rows[:: max(1, len(rows) // _SELECTIVITY_SAMPLE)]
+        kept = [sum(map(keep, sample)) for keep in predicates]
+        order = sorted(range(len(predicates)), key=kept.__getitem__)
+        return [predicates[i] for i in order]
+
+    def _field_column(self, filename: str, key: str, build: Callable[[list[dict]], Any]) -> Any:
+        """Per-row derived values of a data file, built once and cached.
+
+        Rebuilt if the file's record list has been replaced since.
+        """
+        records = self._load_json(filename)
+        cached = self._columns.get((filename, key))
+        if cached is None or cached[0] is not records:
+            cached = (records, build(records))
+            self._columns[(filename, key)] = cached
+        return cached[1]
+
+    def _lowered_column(self, filename: str, field: str) -> list[str]:
+        """Lowercased values of ``field`` for every record ("" if missing)."""
+        return self._field_column(
+            filename,
+            field,
+            lambda records: [str(v).lower() if (v := r.get(field)) else "" for r in records],
+        )
+
+    def _bitmap_index(self, filename: str, field: str) -> BitmapIndex | None:
+        """Bitmap index of a ``CATEGORICAL_FIELDS`` field (built on first use), else None.
+
+        Also None if the field turns out to have too many distinct values.
+        """
+        if field not in self.CATEGORICAL_FIELDS.get(filename, ()):
+            return None
+        return self._field_column(
+            filename,
+            f"bitmap:{field}",
+            lambda records: BitmapIndex.build([r.get(field) for r in records]),
+        )
+
+    def _date_column(self, filename: str, field: str) -> list[int | None]:
+        """``YYYYMMDD`` key of ``field`` for every record (None if missing or malformed)."""
+        return self._field_column(
+            filename,
+            f"date:{field}",
+            lambda records: [date_key(r.get(field)) for r in records],
+        )
+
+    def _date_index(self, filename: str, field: str) -> DateIndex:
+        """Records of a data file sorted by the date in ``field`` (built on first use)."""
+        return self._field_column(
+            filename,
+            f"date_index:{field}",
+            lambda records: DateIndex(self._date_column(filename, field)),
+        )
+
+    def _trigram_index(self, filename: str, field: str) -> TrigramIndex:
+        """Trigram index over the lowercased values of ``field`` (built on first use)."""
+        return self._field_column(
+            filename,
+            f"trigram:{field}",
+            lambda records: TrigramIndex(self._lowered_column(filename, field)),
+        )
+
+    def _text_index(self, filename: str, fields: tuple[str, ...]) -> TextIndex:
+        """Inverted index over ``fields`` of every record (built on first use).
+
+        Document ``row * len(fields) + i`` is field ``fields[i]`` of record
+        ``row``. Variant forms are those of the client's ``ORTHOGRAPHY``.
+        """
+
+        def build(records: list[dict]) -> TextIndex:
+            documents = [str(v) if (v := r.get(f)) else "" for r in records for f in fields]
+            return TextIndex(documents, normalizer(self.ORTHOGRAPHY))
+
+        return self._field_column(filename, f"text:{','.join(fields)}", build)
+
+    def _text_search(
+        self,
+        filename: str,
+        fields: tuple[str, ...],
+        terms: list[str],
+        limit: int | None = None,
+        variants: bool = False,
+        key: Callable[[tuple[float, int, dict, str]], Any] | None = None,
+        fuzzy: bool = False,
+    ) -> tuple[int, list[tuple[float, int, dict, str]]]:
+        """Record fields holding every query term (word or phrase), best BM25 score first.
+
+        Returns the number of matching (record, field) pairs and the best
+        ``limit`` of them (all if None) as (score, term occurrences, record,
+        field name). With ``key`` they are the ``limit`` smallest by ``key``
+        of those tuples, in that order. ``variants`` also matches words
+        whole in their spelling-variant form, and ``fuzzy`` a word matching
+        nothing to its near misses (see ``TextIndex``).
+        """
+        records = self._load_json(filename)
+        index = self._text_index(filename, fields)
+        words = [w for w in map(tokenize, terms) if w]
+        if not words:
+            return 0, []
+        width = len(fields)
+        if key is None:
+            total, best = index.search(words, limit, variants, fuzzy)
+            return total, [
+                (score, occurrences, records[doc // width], fields[doc % width])
+                for score, doc, occurrences in best
+            ]
+        total, hits = index.hits(words, variants, fuzzy)
+        found = (
+            (score, occurrences, records[doc // width], fields[doc % width])
+            for score, doc, occurrences in hits
+        )
+        if limit is None:
+            return total, sorted(found, key=key)
+        return total, heapq.nsmallest(limit, found, key=key)
+
+    @staticmethod
+    def _filter_by_date_range(records: list[dict], date_range: str, date_field: str) -> list[dict]:
         """
         Filter records by date range string.
 
-        Accepts formats: ``YYYY/YYYY`` or ``YYYY-MM-DD/YYYY-MM-DD``.
+        Accepts formats: ``YYYY/YYYY``, ``YYYY-MM/YYYY-MM`` or
+        ``YYYY-MM-DD/YYYY-MM-DD``, each bound matched to the precision given
+        (see ``core/clients/date_index.py``).
         """
-        parts = date_range.split("/")
-        if len(parts) != 2:
+        bounds = range_keys(date_range)
+        if bounds is None:
             return records
 
-        start_str, end_str = parts
-        start_year = int(start_str[:4]) if len(start_str) >= 4 else 0
-        end_year = int(end_str[:4]) if len(end_str) >= 4 else 9999
-
+        lo, hi = bounds
         filtered = []
         for rec in records:
-            date_val = rec.get(date_field, "")
-            if date_val and len(date_val) >= 4:
-                try:
-                    record_year = int(date_val[:4])
-                except ValueError:
-                    continue
-                if start_year <= record_year <= end_year:
-                    filtered.append(rec)
+            key = date_key(rec.get(date_field))
+            if key is not None and lo <= key <= hi:
+                filtered.append(rec)
         return filtered
 
+    @staticmethod
+    def _record_year(date_val: str | int | None) -> int | None:
+        """Year from the first four characters of a record date, or None."""
+        if isinstance(date_val, int):
+            return date_val
+        if date_val and len(date_val) >= 4:
+            try:
+                return int(date_val[:4])
+            except ValueError:
+                return None
+        return None
+
     @staticmethod
     def _contains(haystack: str | None, needle: str) -> bool:
         """Case-insensitive substring match."""
         if not haystack:
             return False
         return needle.lower() in haystack.lower()
+
+
+class VoyageArchiveClient(BaseArchiveClient):
+    """
+    Base for clients holding voyage records.
+
+    Runs the voyage queries the manager fans out -- streams, counts, facets
+    and narrative search -- over ``VOYAGES_FILE`` with the ``_select()``
+    filters the client's ``_voyage_filters()`` builds from its search keywords.
+    """
+
+    VOYAGES_FILE: ClassVar[str]
+
+    @abstractmethod
+    def _voyage_filters(self, **kwargs: Any) -> dict[str, Any]:
+        """``_select()`` filters for the voyage search keywords."""
+        ...
+
+    def iter_voyages(
+        self, *, sort: bool = True, after: int = -1, **kwargs: Any
+    ) -> Iterator[tuple[int, dict]]:
+        """(position, record) matches of the voyage search keywords, lazily (``_iter_rows()``).
+
+        In ``voyage_order``, or in file order if ``sort`` is False; resumes after
+        position ``after``.
+        """
+        order = voyage_order if sort else None
+        filters = self._voyage_filters(**kwargs)
+        return self._iter_rows(self.VOYAGES_FILE, order, after=after, **filters)
+
+    def count_voyages(self, **kwargs: Any) -> int:
+        """Number of voyages matching the voyage search keywords."""
+        return self._count(self.VOYAGES_FILE, **self._voyage_filters(**kwargs))
+
+    def facet_voyages(self, fields: tuple[str, ...], **kwargs: Any) -> dict[str, dict[Any, int]]:
+        """Matching voyages per value of each of ``fields``; see ``_facet_counts()``."""
+        return self._facet_counts(self.VOYAGES_FILE, fields, **self._voyage_filters(**kwargs))
+
+    def narrative_voyages(
+        self,
+        terms: list[str],
+        limit: int | None = None,
+        variants: bool = False,
+        key: Callable[[tuple[float, int, dict, str]], Any] | None = None,
+        fuzzy: bool = False,
+    ) -> tuple[int, list[tuple[float, int, dict, str]]]:
+        """Voyages whose narrative fields hold every term, best first; see ``_text_search``."""
+        return self._text_search(
+            self.VOYAGES_FILE, VOYAGE_NARRATIVE_FIELDS, terms, limit, variants, key, fuzzy
+        )
+
+
+class WreckArchiveClient(BaseArchiveClient):
+    """
+    Base for clients holding wreck records.
+
+    Runs the wreck queries the manager fans out -- streams, counts, facets
+    and narrative search -- over ``WRECKS_FILE`` with the ``_select()``
+    filters the client's ``_wreck_filters()`` builds from its search keywords.
+    """
+
+    WRECKS_FILE: ClassVar[str]
+
+    @abstractmethod
+    def _wreck_filters(self, **kwargs: Any) -> dict[str, Any]:
+        """``_select()`` filters for the wreck search keywords."""
+        ...
+
+    def iter_wrecks(
+        self, *, sort: bool = True, after: int = -1, **kwargs: Any
+    ) -> Iterator[tuple[int, dict]]:
+        """(position, record) matches of the wreck search keywords, lazily (``_iter_rows()``).
+
+        In ``wreck_order``, or in file order if ``sort`` is False; resumes after
+        position ``after``.
+        """
+        order = wreck_order if sort else None
+        filters = self._wreck_filters(**kwargs)
+        return self._iter_rows(self.WRECKS_FILE, order, after=after, **filters)
+
+    def count_wrecks(self, **kwargs: Any) -> int:
+        """Number of wrecks matching the wreck search keywords."""
+        return self._count(self.WRECKS_FILE, **self._wreck_filters(**kwargs))
+
+    def facet_wrecks(self, fields: tuple[str, ...], **kwargs: Any) -> dict[str, dict[Any, int]]:
+        """Matching wrecks per value of each of ``fields``; see ``_facet_counts()``."""
+        return self._facet_counts(self.WRECKS_FILE, fields, **self._wreck_filters(**kwargs))
+
+    def narrative_wrecks(
+        self,
+        terms: list[str],
+        limit: int | None = None,
+        variants: bool = False,
+        key: Callable[[tuple[float, int, dict, str]], Any] | None = None,
+        fuzzy: bool = False,
+    ) -> tuple[int, list[tuple[float, int, dict, str]]]:
+        """Wrecks whose narrative fields hold every term, best first; see ``_text_search``."""
+        return self._text_search(
+            self.WRECKS_FILE, WRECK_NARRATIVE_FIELDS, terms, limit, variants, key, fuzzy
+        )
@@ -0,0 +1,100 @@
+"""
+Bitmap indexes for low-cardinality (categorical) record fields.
+
+For each distinct value of a field -- a wreck's region, loss cause,
+status, flag -- the index holds a Python ``int`` whose bit ``i`` is set
+when record ``i`` has that value. Filters on several such fields become
+bitwise ANDs of these integers, a substring filter on one is the OR of
+the bitmaps of the values containing the needle, and the number of
+matches per value (facet counts) is a popcount of each bitmap ANDed with
+the query's bitmap.
+
+Fields with too many distinct values are not indexed: ``build()``
+returns None and callers fall back to testing each record.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Sequence
+from itertools import compress
+from typing import Any
+
+# Most distinct values a field may have and still be indexed
+MAX_VALUES = 1024
+
+_BITS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def bitmap_rows(bitmap: int) -> list[int]:
+    """Rows (set bit positions) of a bitmap, in ascending order."""
+    # bin() is lowest bit last; reversing it and mapping "0"/"1" to
+    # zero/one bytes lets compress() pick the set positions at C speed
+    bits = bin(bitmap)[:1:-1].encode("ascii").translate(_BITS)
+    return list(compress(range(len(bits)), bits))
+
+
+class BitmapIndex:
+    """Value -> bitmap of the rows holding it, for one field."""
+
+    __slots__ = ("_bitmaps", "_counts", "_rows")
+
+    def __init__(self, bitmaps: dict[Any, int], rows: int) -> None:
+        self._bitmaps = bitmaps
+        self._counts = {value: bitmap.bit_count() for value, bitmap in bitmaps.items()}
+        self._rows = rows
+
+    @classmethod
+    def build(cls, values: Sequence[Any]) -> BitmapIndex | None:
+        """Index a column of field values, or None if it is not categorical."""
+        positions: dict[Any, list[int]] = {}
+        for row, value in enumerate(values):
+            if value is None:
+                continue
+            if not isinstance(value, Hashable):
+                return None
+            rows = positions.get(value)
+            if rows is None:
+                if len(positions) == MAX_VALUES:
+                    return None
+                positions[value] = [row]
+            else:
+                rows.append(row)
+
+        size = (len(values) + 7) // 8
+        bitmaps = {}
+        for value, rows in positions.items():
+            bits = bytearray(size)
+            for row in rows:
+                bits[row >> 3] |= 1 << (row & 7)
+            bitmaps[value] = int.from_bytes(bits, "little")
+        return cls(bitmaps, len(values))
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def all_rows(self) -> int:
+        """Bitmap with every row set."""
+        return (1 << self._rows) - 1
+
+    def equal(self, value: Any) -> int:
+        """Bitmap of the rows whose value equals ``value``."""
+        return self._bitmaps.get(value, 0)
+
+    def containing(self, needle: str) -> int:
+        """Bitmap of the rows whose value contains ``needle`` (lowercased)."""
+        bitmap = 0
+        for value, rows in self._bitmaps.items():
+            if needle in str(value).lower():
+                bitmap |= rows
+        return bitmap
+
+    def counts(self, mask: int | None = None) -> dict[Any, int]:
+        """Rows per value, within ``mask`` if given; values with none are left out."""
+        if mask is None:
+            return dict(self._counts)
+        counts = {}
+        for value, rows in self._bitmaps.items():
+            count = (rows & mask).bit_count()
+            if count:
+                counts[value] = count
+        return counts
@@ -27,9 +27,20 @@ class CargoClient(BaseArchiveClient):
     """
 
     CARGO_FILE = "cargo.json"
+    DATA_FILES = (CARGO_FILE,)
+    INDEX_ATTRS = ("_cargo_index",)
 
     def __init__(self, data_dir: Path | None = None) -> None:
         super().__init__(data_dir)
+        self._cargo_index: dict[str, dict] | None = None
+
+    def _get_cargo_index(self) -> dict[str, dict]:
+        if self._cargo_index is None:
+            self._cargo_index = {c["cargo_id"]: c for c in self._load_json(self.CARGO_FILE)}
+        return self._cargo_index
+
+    def _build_indexes(self) -> None:
+        self._get_cargo_index()
 
     async def search(
         self,
@@ -44,32 +55,18 @@ class CargoClient(BaseArchiveClient):
         **kwargs: Any,
     ) -> list[dict]:
         """Search cargo records from local data."""
-        records = self._load_json(self.CARGO_FILE)
-        if not records:
-            return []
-
-        if voyage_id:
-            records = [c for c in records if c.get("voyage_id") == voyage_id]
-        if commodity:
-            records = [c for c in records if self._contains(c.get("commodity"), commodity)]
-        if origin:
-            records = [c for c in records if self._contains(c.get("origin"), origin)]
-        if destination:
-            records = [c for c in records if self._contains(c.get("destination"), destination)]
-        if min_value is not None:
-            records = [c for c in records if (c.get("value_guilders") or 0) >= min_value]
-        if date_range:
-            records = self._filter_by_date_range(records, date_range, "date")
-
-        return records[:max_results]
+        return self._select(
+            self.CARGO_FILE,
+            max_results=max_results,
+            contains={"commodity": commodity, "origin": origin, "destination": destination},
+            equals={"voyage_id": voyage_id},
+            at_least={"value_guilders": min_value},
+            date_range=("date", date_range),
+        )
 
     async def get_by_id(self, record_id: str) -> dict | None:
         """Retrieve a single cargo record by ID."""
-        records = self._load_json(self.CARGO_FILE)
-        for c in records:
-            if c.get("cargo_id") == record_id:
-                return c
-        return None
+        return self._get_cargo_index().get(record_id)
 
     async def get_manifest(self, voyage_id: str) -> list[dict]:
         """Retrieve the full cargo manifest for a single voyage."""
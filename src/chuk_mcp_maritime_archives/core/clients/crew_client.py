@@ -3,16 +3,22 @@ VOC Crew client — searches the VOC Opvarenden (crew) database.
 
 The dataset contains up to 774,200 personnel records from the Nationaal
 Archief, downloaded via ``scripts/download_crew.py``.  Because the full
-dataset is large, this client builds lazy indexes on first access to
-keep common lookups fast (O(1) for voyage_id, O(tokens) for name).
+dataset is large, this client encodes it into a columnar ``CrewStore``
+on first access rather than keeping the record dicts: filters compare
+integer codes, voyage_id and crew_id lookups are indexed, and record
+dicts are only built for the rows a search returns. The built store is
+saved as an index snapshot (``crew.idx``) and restored on later starts.
 """
 
 import logging
-from collections import defaultdict
+import time
+from bisect import bisect_right
+from collections.abc import Iterator, Sequence
 from pathlib import Path
 from typing import Any
 
 from .base import BaseArchiveClient
+from .crew_store import CrewStore
 
 logger = logging.getLogger(__name__)
 
@@ -21,42 +27,64 @@ class CrewClient(BaseArchiveClient):
     """
     Client for the VOC Opvarenden (crew) database.
 
-    Builds in-memory indexes on first search to accelerate lookups
-    across 774K+ records.
+    Builds a columnar store on first search to keep 774K+ records
+    compact and fast to filter.
     """
 
     CREW_FILE = "crew.json"
+    DATA_FILES = (CREW_FILE,)
 
     def __init__(self, data_dir: Path | None = None) -> None:
         super().__init__(data_dir)
-        self._voyage_index: dict[str, list[dict]] | None = None
-        self._id_index: dict[str, dict] | None = None
-
-    def _ensure_indexes(self, records: list[dict]) -> None:
-        """Build voyage and ID indexes lazily on first access."""
-        if self._voyage_index is not None:
-            return
-
-        voyage_idx: dict[str, list[dict]] = defaultdict(list)
-        id_idx: dict[str, dict] = {}
-
-        for rec in records:
-            vid = rec.get("voyage_id")
-            if vid:
-                voyage_idx[vid].append(rec)
-            cid = rec.get("crew_id")
-            if cid:
-                id_idx[cid] = rec
+        self._store: CrewStore | None = None
+
+    def store(self) -> CrewStore:
+        """Return the crew store, building it from ``crew.json`` on first use.
+
+        Thread-safe. Restored from the index snapshot when it is current;
+        otherwise ``crew.json`` is streamed into the store a batch at a
+        time, so the full record list is never held in memory, and the
+        result is snapshotted for the next start.
+        """
+        if self._store is not None:
+            return self._store
+
+        with self._load_lock:
+            if self._store is None:
+                self._store = self._restore_store() or self._build_store()
+        return self._store
+
+    def _restore_store(self) -> CrewStore | None:
+        data = self._load_snapshot()
+        if data is None:
+            return None
+        try:
+            store = CrewStore.from_snapshot(data)
+        except ValueError as e:
+            logger.warning("Ignoring crew store snapshot: %s", e)
+            return None
+        logger.info("Crew store restored from index snapshot: %d records", len(store))
+        return store
 
-        self._voyage_index = dict(voyage_idx)
-        self._id_index = id_idx
+    def _build_store(self) -> CrewStore:
+        start = time.perf_counter()
+        store = CrewStore.from_records(self._iter_json(self.CREW_FILE))
         logger.info(
-            "Crew indexes built: %d voyage keys, %d ID keys",
-            len(self._voyage_index),
-            len(self._id_index),
+            "Crew store built: %d records in %.3fs",
+            len(store),
+            time.perf_counter() - start,
         )
+        if len(store):
+            self._save_snapshot(store.to_snapshot())
+        return store
 
-    async def search(
+    def preload(self) -> dict[str, float]:
+        """Build (or restore) the crew store now rather than on the first query."""
+        start = time.perf_counter()
+        self.store()
+        return {self.CREW_FILE: time.perf_counter() - start}
+
+    def _crew_filters(
         self,
         *,
         name: str | None = None,
@@ -66,58 +94,59 @@ class CrewClient(BaseArchiveClient):
         origin: str | None = None,
         date_range: str | None = None,
         fate: str | None = None,
-        max_results: int = 100,
         **kwargs: Any,
-    ) -> list[dict]:
-        """Search crew records with indexed lookups for large datasets."""
-        all_records = self._load_json(self.CREW_FILE)
-        if not all_records:
-            return []
-
-        self._ensure_indexes(all_records)
-
-        # Start from narrowest index available
-        if voyage_id and self._voyage_index is not None:
-            records = self._voyage_index.get(voyage_id, [])
-        else:
-            records = all_records
-
-        if name:
-            records = [c for c in records if self._contains(c.get("name"), name)]
-        if rank:
-            records = [c for c in records if self._contains(c.get("rank"), rank)]
-        if ship_name:
-            records = [c for c in records if self._contains(c.get("ship_name"), ship_name)]
-        if voyage_id and self._voyage_index is None:
-            records = [c for c in records if c.get("voyage_id") == voyage_id]
-        if origin:
-            records = [c for c in records if self._contains(c.get("origin"), origin)]
-        if fate:
-            records = [c for c in records if c.get("service_end_reason") == fate]
-        if date_range:
-            records = self._filter_by_date_range(records, date_range, "embarkation_date")
-
-        return records[:max_results]
+    ) -> dict[str, Any]:
+        """``CrewStore.select()`` filters for the crew search keywords."""
+        return {
+            "name": name,
+            "rank": rank,
+            "ship_name": ship_name,
+            "voyage_id": voyage_id,
+            "origin": origin,
+            "fate": fate,
+            "date_range": date_range,
+        }
+
+    async def search(self, *, max_results: int = 100, **kwargs: Any) -> list[dict]:
+        """Search crew records, building dicts only for the rows returned."""
+        store = self.store()
+        rows = store.select(**self._crew_filters(**kwargs), limit=max(max_results, 0))
+        return store.records(rows)
+
+    def iter_crew(
+        self, *, sort: bool = True, after: int = -1, **kwargs: Any
+    ) -> Iterator[tuple[int, dict]]:
+        """(position, record) matches of the ``search`` keywords, dicts built lazily.
+
+        In ``crew_order``, a position being the record's place in it, or in
+        row order if ``sort`` is False; resumes after position ``after``.
+        """
+        store = self.store()
+        filters = self._crew_filters(**kwargs)
+        if not sort:
+            for chunk in store.select_chunks(after=after, **filters):
+                for row in chunk:
+                    yield row, store.record(row)
+            return
+        ordered, rank = store.sort_order()
+        rows = store.select(**filters)
+        positions: Sequence[int] = range(len(store))
+        if len(rows) < len(store):
+            positions = sorted(map(rank.__getitem__, rows))
+        for position in positions[bisect_right(positions, after) :]:
+            yield position, store.record(ordered[position])
+
+    def count_crew(self, **kwargs: Any) -> int:
+        """Number of crew matching the keywords of ``search``."""
+        return len(self.store().select(**self._crew_filters(**kwargs)))
 
     def all_records(self) -> list[dict]:
-        """Return all crew records for bulk analytics (demographics, survival)."""
-        records = self._load_json(self.CREW_FILE)
-        if records:
-            self._ensure_indexes(records)
-        return records or []
+        """Return all crew records as dicts (builds every row; prefer ``store()``)."""
+        store = self.store()
+        return store.records(range(len(store)))
 
     async def get_by_id(self, record_id: str) -> dict | None:
-        """Retrieve a single crew record by ID using the index."""
-        records = self._load_json(self.CREW_FILE)
-        if not records:
-            return None
-
-        self._ensure_indexes(records)
-
-        if self._id_index is not None:
-            return self._id_index.get(record_id)
-
-        for c in records:
-            if c.get("crew_id") == record_id:
-                return c
-        return None
+        """Retrieve a single crew record by ID using the store's ID index."""
+        store = self.store()
+        row = store.row_for_id(record_id)
+        return store.record(row) if row is not None else None
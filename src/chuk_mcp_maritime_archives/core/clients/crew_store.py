@@ -0,0 +1,507 @@
+"""
+Compact columnar store for VOC Opvarenden crew records.
+
+Held as Python dicts, the 774K crew records cost well over a gigabyte. The
+store keeps one row per record in typed arrays instead:
+
+- dictionary-encoded (categorical) columns for the repetitive text fields
+  -- name, rank, ship name, voyage ID, origin and service-end reason --
+  each a table of distinct values plus one integer code per row
+- crew IDs of the usual ``voc_crew:NNNNNN`` form as integers
+- embarkation dates as day ordinals, with the year kept separately for
+  partial dates and decade grouping; ``date_range`` filters use a sorted
+  date index built on first use
+- each row's key order ("shape"), so a rebuilt record is identical to the
+  one read from ``crew.json``
+
+The store and its lookups can be saved as an index snapshot
+(``to_snapshot`` / ``from_snapshot``) so later starts skip the build.
+
+Filters test each distinct value once and then compare integer codes, and
+record dicts are only built for the rows a query actually returns.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import date
+from itertools import compress, islice
+from typing import Any
+
+from .base import BaseArchiveClient
+from .date_index import DateIndex, date_key, range_keys
+
+_ID_PREFIX = "voc_crew:"
+_DATE_FIELD = "embarkation_date"
+_CATEGORICAL_FIELDS = ("name", "rank", "ship_name", "voyage_id", "origin", "service_end_reason")
+_KNOWN_FIELDS = frozenset({*_CATEGORICAL_FIELDS, "crew_id", _DATE_FIELD})
+_NUMBERS = (int, float, complex)
+_NO_YEAR = -32768  # array("h") sentinel: date missing or without a leading year
+_NO_DATE_KEY = -(2**31)  # array("i") sentinel: date without a date_index key
+_BUILD_BATCH = 16384
+_SELECT_CHUNK = 65536
+# Array byte layout a snapshot's raw bytes depend on
+_LAYOUT = (sys.byteorder, array("l").itemsize, array("q").itemsize, array("h").itemsize)
+
+# group_by dimension -> categorical column (see ArchiveManager.crew_demographics)
+_GROUP_FIELDS = {
+    "rank": "rank",
+    "origin": "origin",
+    "fate": "service_end_reason",
+    "ship_name": "ship_name",
+}
+
+
+def _lookup_key(value: Any) -> Any:
+    # Keep True, 1 and 1.0 (equal, same hash) as distinct table entries
+    return (value.__class__, value) if isinstance(value, _NUMBERS) else value
+
+
+def _id_number(crew_id: Any) -> int:
+    """N for a crew ID that is exactly ``f"voc_crew:{N:06d}"``, else -1."""
+    if crew_id.__class__ is not str or not crew_id.startswith(_ID_PREFIX):
+        return -1
+    digits = crew_id[len(_ID_PREFIX) :]
+    try:
+        num = int(digits)
+    except ValueError:
+        return -1
+    return num if 0 <= num < 10**18 and f"{num:06d}" == digits else -1
+
+
+def _array(typecode: str, data: bytes) -> array:
+    out = array(typecode)
+    out.frombytes(data)
+    return out
+
+
+def _parse_date(value: str) -> tuple[int, int]:
+    """(day ordinal or 0, year or ``_NO_YEAR``) for an embarkation date string.
+
+    The ordinal is only set for dates that round-trip as ``YYYY-MM-DD``;
+    the year is read by ``BaseArchiveClient._record_year``.
+    """
+    ordinal = 0
+    if len(value) == 10:
+        try:
+            day = date.fromisoformat(value)
+        except ValueError:
+            pass
+        else:
+            if day.isoformat() == value:
+                ordinal = day.toordinal()
+    year = BaseArchiveClient._record_year(value)
+    if year is None or not _NO_YEAR < year <= 32767:
+        year = _NO_YEAR
+    return ordinal, year
+
+
+class _Categorical:
+    """A dictionary-encoded column: distinct values plus a code per row."""
+
+    __slots__ = ("_lookup", "codes", "values")
+
+    def __init__(self) -> None:
+        self.values: list[Any] = []
+        self.codes = array("l")
+        self._lookup: dict[Any, int] = {}
+
+    def extend(self, batch: list[Any]) -> None:
+        """Append one code per value, adding unseen values to the table."""
+        # dict.fromkeys and map keep this at C speed: only the distinct
+        # values of the batch are visited in Python
+        lookup, values = self._lookup, self.values
+        keys = batch
+        firsts: dict[Any, Any] = dict.fromkeys(batch)
+        if any(isinstance(k, _NUMBERS) for k in firsts):
+            keys = list(map(_lookup_key, batch))
+            firsts = {}
+            for key, value in zip(keys, batch):
+                firsts.setdefault(key, value)
+            for key, value in firsts.items():
+                if key not in lookup:
+                    lookup[key] = len(values)
+                    values.append(value)
+        else:
+            for key in firsts:
+                if key not in lookup:
+                    lookup[key] = len(values)
+                    values.append(key)
+        self.codes.fromlist(list(map(lookup.__getitem__, keys)))
+
+    @classmethod
+    def restore(cls, values: list[Any], codes: bytes) -> _Categorical:
+        """Rebuild a column from its value table and raw code bytes."""
+        column = cls()
+        column.values = values
+        column.codes = _array("l", codes)
+        column._lookup = {_lookup_key(value): code for code, value in enumerate(values)}
+        return column
+
+    def code_of(self, value: Any) -> int | None:
+        """Code of ``value``, or None if no row holds it."""
+        return self._lookup.get(_lookup_key(value))
+
+    def codes_where(self, needle: str) -> set[int]:
+        """Codes whose value contains ``needle`` (``BaseArchiveClient._contains``)."""
+        contains = BaseArchiveClient._contains
+        return {code for code, value in enumerate(self.values) if contains(value, needle)}
+
+
+class CrewStore:
+    """Columnar crew records with code-level filtering and lazy row dicts."""
+
+    def __init__(self) -> None:
+        self._columns = {field: _Categorical() for field in _CATEGORICAL_FIELDS}
+        self._shapes = _Categorical()  # each row's keys in order, to rebuild it exactly
+        self._id_nums = array("q")  # N of "voc_crew:NNNNNN", else -1
+        self._id_raw: dict[int, Any] = {}  # row -> crew_id not of that form
+        self._ordinals = array("l")  # day ordinal of an ISO date, else 0
+        self._years = array("h")  # leading year of the date, for decade grouping
+        self._date_raw: dict[int, Any] = {}  # row -> date that is not plain ISO
+        self._extras: dict[int, dict[str, Any]] = {}  # row -> fields outside the schema
+        self._voyage_order: array | None = None
+        self._voyage_offsets: array | None = None
+        self._id_sorted: tuple[array, array, dict[Any, int]] | None = None
+        self._decades: dict[int, str] | None = None
+        self._date_keys: array | None = None
+        self._date_index: DateIndex | None = None
+        self._sort_order: tuple[array, array] | None = None
+
+    @classmethod
+    def from_records(
+        cls, records: Iterable[dict[str, Any]], batch_size: int = _BUILD_BATCH
+    ) -> CrewStore:
+        """Encode crew record dicts (as read from ``crew.json``) into a store.
+
+        ``records`` is consumed ``batch_size`` records at a time, so a
+        streamed source (``BaseArchiveClient._iter_json``) never has more
+        than one batch of dicts alive at once.
+        """
+        store = cls()
+        dates: dict[str, tuple[int, int]] = {}  # dates repeat: parse each once
+        it = iter(records)
+        while batch := list(islice(it, batch_size)):
+            store._append(batch, dates)
+        return store
+
+    def _append(self, records: list[dict[str, Any]], dates: dict[str, tuple[int, int]]) -> None:
+        offset = len(self)
+        for field, column in self._columns.items():
+            column.extend([rec.get(field) for rec in records])
+        self._shapes.extend(list(map(tuple, records)))
+
+        ids = [rec.get("crew_id") for rec in records]
+        nums = list(map(_id_number, ids))
+        self._id_nums.fromlist(nums)
+        for row in compress(range(len(nums)), [n < 0 for n in nums]):
+            if ids[row] is not None:
+                self._id_raw[offset + row] = ids[row]
+
+        values = [rec.get(_DATE_FIELD) for rec in records]
+        for value in {v for v in values if v.__class__ is str} - dates.keys():
+            dates[value] = _parse_date(value)
+        parsed = [dates[v] if v.__class__ is str else (0, _NO_YEAR) for v in values]
+        self._ordinals.fromlist([p[0] for p in parsed])
+        self._years.fromlist([p[1] for p in parsed])
+        for row, (ordinal, _) in enumerate(parsed):
+            if not ordinal and values[row] is not None:
+                self._date_raw[offset + row] = values[row]
+
+        known = _KNOWN_FIELDS
+        odd = {code for code, keys in enumerate(self._shapes.values) if not known.issuperset(keys)}
+        if odd:
+            for row, code in enumerate(self._shapes.codes[offset:]):
+                if code in odd:
+                    rec = records[row]
+                    self._extras[offset + row] = {k: v for k, v in rec.items() if k not in known}
+
+    def __len__(self) -> int:
+        return len(self._id_nums)
+
+    # --- Rows ---------------------------------------------------------------
+
+    def _crew_id(self, row: int) -> Any:
+        num = self._id_nums[row]
+        return f"{_ID_PREFIX}{num:06d}" if num >= 0 else self._id_raw.get(row)
+
+    def _date(self, row: int) -> Any:
+        ordinal = self._ordinals[row]
+        return date.fromordinal(ordinal).isoformat() if ordinal else self._date_raw.get(row)
+
+    def record(self, row: int) -> dict[str, Any]:
+        """Rebuild the record dict for one row (a new dict on every call)."""
+        columns = self._columns
+        out: dict[str, Any] = {}
+        for key in self._shapes.values[self._shapes.codes[row]]:
+            column = columns.get(key)
+            if column is not None:
+                out[key] = column.values[column.codes[row]]
+            elif key == "crew_id":
+                out[key] = self._crew_id(row)
+            elif key == _DATE_FIELD:
+                out[key] = self._date(row)
+            else:
+                out[key] = self._extras[row][key]
+        return out
+
+    def records(self, rows: Iterable[int]) -> list[dict[str, Any]]:
+        """Rebuild the record dicts for the given rows, in order."""
+        return [self.record(row) for row in rows]
+
+    def year(self, row: int) -> int | None:
+        """Embarkation year of a row (the date's leading four digits)."""
+        year = self._years[row]
+        return None if year == _NO_YEAR else year
+
+    def ordinal(self, row: int) -> int | None:
+        """Embarkation day ordinal of a row, or None if not a full ISO date."""
+        return self._ordinals[row] or None
+
+    # --- Lookups ------------------------------------------------------------
+
+    def row_for_id(self, crew_id: str) -> int | None:
+        """Row holding ``crew_id`` (the last one, if the ID repeats)."""
+        if self._id_sorted is None:
+            self._build_id_index()
+        assert self._id_sorted is not None
+        sorted_nums, order, raw = self._id_sorted
+
+        row = raw.get(crew_id)
+        if row is not None:
+            return row
+        num = _id_number(crew_id)
+        pos = bisect_right(sorted_nums, num) - 1
+        if num >= 0 and pos >= 0 and sorted_nums[pos] == num:
+            return order[pos]
+        return None
+
+    def _build_id_index(self) -> None:
+        nums = self._id_nums
+        order = array(
+            "l", sorted((r for r in range(len(nums)) if nums[r] >= 0), key=nums.__getitem__)
+        )
+        raw = {value: row for row, value in self._id_raw.items() if value}
+        self._id_sorted = (array("q", (nums[r] for r in order)), order, raw)
+
+    def rows_for_voyage(self, voyage_id: str) -> Sequence[int]:
+        """Rows whose ``voyage_id`` equals ``voyage_id``, in row order."""
+        if self._voyage_order is None:
+            self._build_voyage_index()
+        assert self._voyage_order is not None and self._voyage_offsets is not None
+        code = self._columns["voyage_id"].code_of(voyage_id)
+        if code is None:
+            return ()
+        return self._voyage_order[self._voyage_offsets[code] : self._voyage_offsets[code + 1]]
+
+    def date_lookup(self) -> tuple[array, DateIndex]:
+        """Per-row ``YYYYMMDD`` embarkation date keys and their sorted index.
+
+        Built on the first ``date_range`` query. Partial dates keep the
+        precision they have (see ``core/clients/date_index.py``).
+        """
+        if self._date_index is None:
+            self._build_date_index()
+        assert self._date_keys is not None and self._date_index is not None
+        return self._date_keys, self._date_index
+
+    def _build_date_index(self) -> None:
+        by_ordinal = {
+            o: date_key(date.fromordinal(o).isoformat()) for o in set(self._ordinals) if o
+        }
+        keys: list[int | None] = []
+        for row, ordinal in enumerate(self._ordinals):
+            if ordinal:
+                keys.append(by_ordinal[ordinal])
+            else:
+                raw = self._date_raw.get(row)
+                keys.append(date_key(raw) if isinstance(raw, (str, int)) else None)
+        self._date_keys = array("i", [_NO_DATE_KEY if k is None else k for k in keys])
+        self._date_index = DateIndex(keys)
+
+    def sort_order(self) -> tuple[array, array]:
+        """Rows in ``crew_order`` (embarkation date, then crew ID) and each row's position.
+
+        Built on first use, for the cross-archive crew merge.
+        """
+        if self._sort_order is None:
+            iso = {o: date.fromordinal(o).isoformat() for o in set(self._ordinals) if o}
+
+            def key(row: int) -> tuple[Any, Any]:
+                ordinal = self._ordinals[row]
+                when = iso[ordinal] if ordinal else self._date_raw.get(row)
+                return (when or "9999", self._crew_id(row) or "")
+
+            ordered = array("l", sorted(range(len(self)), key=key))
+            rank = array("l", bytes(ordered.itemsize * len(ordered)))
+            for position, row in enumerate(ordered):
+                rank[row] = position
+            self._sort_order = ordered, rank
+        return self._sort_order
+
+    def _build_voyage_index(self) -> None:
+        column = self._columns["voyage_id"]
+        codes = column.codes
+        order = array("l", sorted(range(len(codes)), key=codes.__getitem__))
+        offsets = array("l", [0] * (len(column.values) + 1))
+        for code in codes:
+            offsets[code + 1] += 1
+        for i in range(len(column.values)):
+            offsets[i + 1] += offsets[i]
+        self._voyage_order, self._voyage_offsets = order, offsets
+
+    def build_indexes(self) -> None:
+        """Build the crew_id and voyage_id lookups now rather than on first use."""
+        if self._id_sorted is None:
+            self._build_id_index()
+        if self._voyage_order is None:
+            self._build_voyage_index()
+
+    # --- Snapshots ----------------------------------------------------------
+
+    def to_snapshot(self) -> dict[str, Any]:
+        """The store, indexes included, as plain marshallable data.
+
+        Arrays are saved as raw bytes; see ``core.index_snapshot``.
+        """
+        self.build_indexes()
+        assert self._id_sorted is not None
+        sorted_nums, order, raw = self._id_sorted
+        return {
+            "layout": _LAYOUT,
+            "columns": {
+                field: (column.values, column.codes.tobytes())
+                for field, column in self._columns.items()
+            },
+            "shapes": (self._shapes.values, self._shapes.codes.tobytes()),
+            "id_nums": self._id_nums.tobytes(),
+            "id_raw": self._id_raw,
+            "ordinals": self._ordinals.tobytes(),
+            "years": self._years.tobytes(),
+            "date_raw": self._date_raw,
+            "extras": self._extras,
+            "id_sorted": (sorted_nums.tobytes(), order.tobytes(), raw),
+            "voyage_index": (self._voyage_order.tobytes(), self._voyage_offsets.tobytes()),
+        }
+
+    @classmethod
+    def from_snapshot(cls, data: dict[str, Any]) -> CrewStore:
+        """Rebuild a store saved by ``to_snapshot``.
+
+        Raises:
+            ValueError: If ``data`` was saved with another array layout or
+                is not a store snapshot
+        """
+        try:
+            if data["layout"] != _LAYOUT or data["columns"].keys() != set(_CATEGORICAL_FIELDS):
+                raise ValueError("crew store snapshot layout mismatch")
+            store = cls()
+            for field, (values, codes) in data["columns"].items():
+                store._columns[field] = _Categorical.restore(values, codes)
+            store._shapes = _Categorical.restore(*data["shapes"])
+            store._id_nums = _array("q", data["id_nums"])
+            store._id_raw = data["id_raw"]
+            store._ordinals = _array("l", data["ordinals"])
+            store._years = _array("h", data["years"])
+            store._date_raw = data["date_raw"]
+            store._extras = data["extras"]
+            sorted_nums, order, raw = data["id_sorted"]
+            store._id_sorted = (_array("q", sorted_nums), _array("l", order), raw)
+            voyage_order, voyage_offsets = data["voyage_index"]
+            store._voyage_order = _array("l", voyage_order)
+            store._voyage_offsets = _array("l", voyage_offsets)
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"not a crew store snapshot: {e}") from None
+        arrays = [c.codes for c in (store._shapes, *store._columns.values())]
+        if any(len(a) != len(store) for a in (*arrays, store._ordinals, store._years)):
+            raise ValueError("crew store snapshot columns differ in length")
+        return store
+
+    def select(self, *, limit: int | None = None, **filters: Any) -> list[int]:
+        """Rows matching every given filter, in row order (see ``select_chunks``).
+
+        Stops after ``limit`` rows.
+        """
+        if limit is not None and limit <= 0:
+            return []
+        selected: list[int] = []
+        for chunk in self.select_chunks(**filters):
+            selected.extend(chunk)
+            if limit is not None and len(selected) >= limit:
+                return selected[:limit]
+        return selected
+
+    def select_chunks(
+        self,
+        *,
+        name: str | None = None,
+        rank: str | None = None,
+        ship_name: str | None = None,
+        voyage_id: str | None = None,
+        origin: str | None = None,
+        fate: str | None = None,
+        date_range: str | None = None,
+        after: int = -1,
+    ) -> Iterator[list[int]]:
+        """Rows after row ``after`` matching every given filter, lazily in row order.
+
+        Filters match ``CrewClient.search``: case-insensitive substring for
+        name, rank, ship name and origin; equality for voyage ID and fate;
+        date bounds for ``date_range``, resolved through the date index
+        when the range is narrow.
+        """
+        rows: Sequence[int] = self.rows_for_voyage(voyage_id) if voyage_id else range(len(self))
+
+        tests: list[tuple[array, Any]] = []
+        for field, needle in (
+            ("name", name),
+            ("rank", rank),
+            ("ship_name", ship_name),
+            ("origin", origin),
+        ):
+            if needle:
+                column = self._columns[field]
+                tests.append((column.codes, column.codes_where(needle).__contains__))
+        if fate:
+            code = self._columns["service_end_reason"].code_of(fate)
+            if code is None:
+                return
+            tests.append((self._columns["service_end_reason"].codes, code.__eq__))
+        bounds = range_keys(date_range) if date_range else None
+        if bounds is not None:
+            lo, hi = bounds
+            keys, index = self.date_lookup()
+            tests.append((keys, range(lo, hi + 1).__contains__))
+            narrow = index.narrow_rows(lo, hi, len(rows))
+            if narrow is not None:
+                rows = narrow if not voyage_id else sorted(set(narrow).intersection(rows))
+        rows = rows[bisect_right(rows, after) :]
+
+        # Filter a chunk at a time with C-level map/compress, so a limited
+        # search stops early without paying per-row Python overhead
+        for start in range(0, len(rows), _SELECT_CHUNK):
+            chunk = rows[start : start + _SELECT_CHUNK]
+            for codes, keep in tests:
+                chunk = list(compress(chunk, map(keep, map(codes.__getitem__, chunk))))
+            if chunk:
+                yield list(chunk)
+
+    # --- Aggregation ---------------------------------------------------------
+
+    def group_labels(self, group_by: str) -> tuple[Sequence[int], Any]:
+        """Per-row group codes and a code -> group key mapping.
+
+        Keys match ``ArchiveManager``'s crew grouping: the field value, the
+        decade (``"1690s"``) for ``"decade"``, and ``"unknown"`` when empty.
+        """
+        if group_by == "decade":
+            if self._decades is None:
+                decades = {y: f"{y // 10 * 10}s" for y in set(self._years)}
+                decades[_NO_YEAR] = "unknown"
+                self._decades = decades
+            return self._years, self._decades
+        column = self._columns[_GROUP_FIELDS[group_by]]
+        return column.codes, [value or "unknown" for value in column.values]
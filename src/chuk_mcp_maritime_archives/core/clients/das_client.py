@@ -10,12 +10,12 @@ import logging
 from pathlib import Path
 from typing import Any
 
-from .base import BaseArchiveClient
+from .base import VoyageArchiveClient
 
 logger = logging.getLogger(__name__)
 
 
-class DASClient(BaseArchiveClient):
+class DASClient(VoyageArchiveClient):
     """
     Client for the Dutch Asiatic Shipping (DAS) database.
 
@@ -26,6 +26,9 @@ class DASClient(BaseArchiveClient):
 
     VOYAGES_FILE = "voyages.json"
     VESSELS_FILE = "vessels.json"
+    DATA_FILES = (VOYAGES_FILE, VESSELS_FILE)
+    INDEX_ATTRS = ("_voyage_index", "_vessel_index", "_voyage_vessel_index")
+    ORTHOGRAPHY = "nl"
 
     def __init__(self, data_dir: Path | None = None) -> None:
         super().__init__(data_dir)
@@ -49,6 +52,45 @@ class DASClient(BaseArchiveClient):
             self._vessel_index = {v["vessel_id"]: v for v in self._get_vessels()}
         return self._vessel_index
 
+    def _get_voyage_vessel_index(self) -> dict[str, dict]:
+        if self._voyage_vessel_index is None:
+            index = {}
+            for v in self._get_vessels():
+                for vid in v.get("voyage_ids", []):
+                    index[vid] = v
+            self._voyage_vessel_index = index
+        return self._voyage_vessel_index
+
+    def _build_indexes(self) -> None:
+        self._get_voyage_index()
+        self._get_vessel_index()
+        self._get_voyage_vessel_index()
+
+    def _voyage_filters(
+        self,
+        *,
+        ship_name: str | None = None,
+        captain: str | None = None,
+        date_range: str | None = None,
+        departure_port: str | None = None,
+        destination_port: str | None = None,
+        route: str | None = None,
+        fate: str | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """``_select()`` filters for the voyage search keywords."""
+        return {
+            "contains": {
+                "ship_name": ship_name,
+                "captain": captain,
+                "departure_port": departure_port,
+                "destination_port": destination_port,
+            },
+            "contains_any": {("departure_port", "destination_port", "particulars"): route},
+            "equals": {"fate": fate},
+            "date_range": ("departure_date", date_range),
+        }
+
     async def search(
         self,
         *,
@@ -63,35 +105,16 @@ class DASClient(BaseArchiveClient):
         **kwargs: Any,
     ) -> list[dict]:
         """Search DAS voyage records from local data."""
-        results = list(self._get_voyages())
-
-        if ship_name:
-            results = [v for v in results if self._contains(v.get("ship_name"), ship_name)]
-        if captain:
-            results = [v for v in results if self._contains(v.get("captain"), captain)]
-        if fate:
-            results = [v for v in results if v.get("fate") == fate]
-        if departure_port:
-            results = [
-                v for v in results if self._contains(v.get("departure_port"), departure_port)
-            ]
-        if destination_port:
-            results = [
-                v for v in results if self._contains(v.get("destination_port"), destination_port)
-            ]
-        if route:
-            route_lower = route.lower()
-            results = [
-                v
-                for v in results
-                if route_lower in (v.get("departure_port") or "").lower()
-                or route_lower in (v.get("destination_port") or "").lower()
-                or route_lower in (v.get("particulars") or "").lower()
-            ]
-        if date_range:
-            results = self._filter_by_date_range(results, date_range, "departure_date")
-
-        return results[:max_results]
+        filters = self._voyage_filters(
+            ship_name=ship_name,
+            captain=captain,
+            date_range=date_range,
+            departure_port=departure_port,
+            destination_port=destination_port,
+            route=route,
+            fate=fate,
+        )
+        return self._select(self.VOYAGES_FILE, max_results=max_results, **filters)
 
     async def get_by_id(self, record_id: str) -> dict | None:
         """Retrieve a single voyage by its DAS voyage ID."""
@@ -115,37 +138,22 @@ class DASClient(BaseArchiveClient):
         max_results: int = 50,
     ) -> list[dict]:
         """Search DAS vessel records from local data."""
-        results = list(self._get_vessels())
-
-        if name:
-            results = [v for v in results if self._contains(v.get("name"), name)]
-        if ship_type:
-            results = [v for v in results if v.get("type") == ship_type]
-        if chamber:
-            results = [v for v in results if self._contains(v.get("chamber"), chamber)]
-        if shipyard:
-            results = [v for v in results if self._contains(v.get("yard"), shipyard)]
-        if min_tonnage is not None:
-            results = [v for v in results if (v.get("tonnage") or 0) >= min_tonnage]
-        if max_tonnage is not None:
-            results = [
-                v for v in results if v.get("tonnage") is not None and v["tonnage"] <= max_tonnage
-            ]
-        if built_range:
-            results = self._filter_by_date_range(results, built_range, "built_year")
-
-        return results[:max_results]
+        return self._select(
+            self.VESSELS_FILE,
+            max_results=max_results,
+            contains={"name": name, "chamber": chamber, "yard": shipyard},
+            equals={"type": ship_type},
+            at_least={"tonnage": min_tonnage},
+            at_most={"tonnage": max_tonnage},
+            date_range=("built_year", built_range),
+        )
 
     def get_vessel_for_voyage(self, voyage_id: str) -> dict | None:
         """Find vessel whose voyage_ids array contains this voyage_id."""
-        if self._voyage_vessel_index is None:
-            self._voyage_vessel_index = {}
-            for v in self._get_vessels():
-                for vid in v.get("voyage_ids", []):
-                    self._voyage_vessel_index[vid] = v
-        result = self._voyage_vessel_index.get(voyage_id)
+        index = self._get_voyage_vessel_index()
+        result = index.get(voyage_id)
         if result is None and ":" not in voyage_id:
-            result = self._voyage_vessel_index.get(f"das:{voyage_id}")
+            result = index.get(f"das:{voyage_id}")
         return result
 
     async def get_vessel_by_id(self, vessel_id: str) -> dict | None:
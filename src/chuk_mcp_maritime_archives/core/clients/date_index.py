@@ -0,0 +1,116 @@
+"""
+Sorted date index for ``date_range`` filters.
+
+Record dates are reduced to integer keys ``YYYYMMDD``. A date given only
+to the year or month ("1628", "1628-10") gets 0 for the missing parts, so
+it sorts at the start of its year or month; an integer (``built_year``) is
+a year. The index keeps the keys in sorted order alongside their record
+offsets, so the rows of a date range are found with two bisects.
+
+Range bounds keep the precision they are given: ``1700/1750`` covers the
+whole of both years, ``1700-03-15/1750-06`` runs from that day to the end
+of June 1750. A bound given only to the year matches exactly the records
+the year-only filter always matched.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+
+# Key of the last possible day of a year, relative to year * 10000
+_YEAR_END = 1299
+_MONTH_END = 99
+MIN_KEY = 0
+MAX_KEY = 9999 * 10000 + _YEAR_END
+# A range narrows a scan to its rows only if it keeps at most 1/_NARROW_RATIO
+# of them; testing each row's key is cheaper than sorting a wide range
+_NARROW_RATIO = 4
+
+
+def _part(value: str, start: int, most: int) -> int:
+    """Month or day at ``value[start:start + 2]`` after a "-", else 0 (also if > most)."""
+    digits = value[start : start + 2]
+    if value[start - 1 : start] == "-" and len(digits) == 2 and digits.isdigit():
+        number = int(digits)
+        return number if number <= most else 0
+    return 0
+
+
+def date_key(value: str | int | None) -> int | None:
+    """``YYYYMMDD`` key of a record date, or None if it has no leading year."""
+    if isinstance(value, int):
+        return value * 10000
+    if not value or len(value) < 4:
+        return None
+    try:
+        year = int(value[:4])
+    except ValueError:
+        return None
+    month = _part(value, 5, 12)
+    return year * 10000 + (month * 100 + _part(value, 8, 31) if month else 0)
+
+
+def _bound_key(value: str, end: bool) -> int:
+    if len(value) < 4:
+        return MAX_KEY if end else MIN_KEY
+    key = int(value[:4]) * 10000
+    month = _part(value, 5, 12)
+    if not month:
+        return key + _YEAR_END if end else key
+    day = _part(value, 8, 31)
+    return key + month * 100 + (day or (_MONTH_END if end else 0))
+
+
+def range_keys(date_range: str) -> tuple[int, int] | None:
+    """Inclusive (start, end) keys of a ``start/end`` range string, or None if malformed.
+
+    Either side may be empty for an open range. A year that is not a
+    number raises ValueError, as the year-only filter did.
+    """
+    parts = date_range.split("/")
+    if len(parts) != 2:
+        return None
+    return _bound_key(parts[0], end=False), _bound_key(parts[1], end=True)
+
+
+def year_keys(first: int | None, last: int | None) -> tuple[int, int]:
+    """Inclusive keys covering whole years ``first`` to ``last`` (open if None)."""
+    return (
+        first * 10000 if first is not None else MIN_KEY,
+        last * 10000 + _YEAR_END if last is not None else MAX_KEY,
+    )
+
+
+class DateIndex:
+    """Record offsets sorted by date key; rows without a date are left out."""
+
+    __slots__ = ("_keys", "_rows")
+
+    def __init__(self, keys: Sequence[int | None]) -> None:
+        order = sorted((k, row) for row, k in enumerate(keys) if k is not None)
+        self._keys = array("q", [k for k, _ in order])
+        self._rows = array("l", [row for _, row in order])
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _span(self, lo: int, hi: int) -> tuple[int, int]:
+        return bisect_left(self._keys, lo), bisect_right(self._keys, hi)
+
+    def count_between(self, lo: int, hi: int) -> int:
+        """Number of rows with ``lo <= key <= hi``."""
+        start, stop = self._span(lo, hi)
+        return max(stop - start, 0)
+
+    def rows_between(self, lo: int, hi: int) -> list[int]:
+        """Rows with ``lo <= key <= hi``, in row order."""
+        start, stop = self._span(lo, hi)
+        return sorted(self._rows[start:stop])
+
+    def narrow_rows(self, lo: int, hi: int, total: int) -> list[int] | None:
+        """``rows_between(lo, hi)`` if that is a small part of ``total`` rows, else None."""
+        if self.count_between(lo, hi) * _NARROW_RATIO > total:
+            return None
+        return self.rows_between(lo, hi)
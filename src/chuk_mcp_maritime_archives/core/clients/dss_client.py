@@ -17,10 +17,11 @@ Source data:
 
 import logging
 from collections import defaultdict
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
-from .base import BaseArchiveClient
+from .base import BaseArchiveClient, crew_order
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +36,8 @@ class DSSClient(BaseArchiveClient):
 
     MUSTERS_FILE = "dss_musters.json"
     CREWS_FILE = "dss_crews.json"
+    DATA_FILES = (MUSTERS_FILE, CREWS_FILE)
+    INDEX_ATTRS = ("_muster_index", "_voyage_muster_index", "_crew_index")
 
     def __init__(self, data_dir: Path | None = None) -> None:
         super().__init__(data_dir)
@@ -70,6 +73,11 @@ class DSSClient(BaseArchiveClient):
             self._crew_index = {c["crew_id"]: c for c in self._get_crews()}
         return self._crew_index
 
+    def _build_indexes(self) -> None:
+        self._get_muster_index()
+        self._get_voyage_muster_index()
+        self._get_crew_index()
+
     # --- Abstract method implementations (delegate to crew search) ----------
 
     async def search(
@@ -116,30 +124,14 @@ class DSSClient(BaseArchiveClient):
         **kwargs: Any,
     ) -> list[dict]:
         """Search GZMVOC ship-level muster records."""
-        results = list(self._get_musters())
-
-        if ship_name:
-            results = [m for m in results if self._contains(m.get("ship_name"), ship_name)]
-        if captain:
-            results = [m for m in results if self._contains(m.get("captain"), captain)]
-        if location:
-            results = [m for m in results if self._contains(m.get("muster_location"), location)]
-        if das_voyage_id:
-            results = [m for m in results if m.get("das_voyage_id") == das_voyage_id]
-        if year_start is not None:
-            results = [
-                m
-                for m in results
-                if m.get("muster_date") and int(m["muster_date"][:4]) >= year_start
-            ]
-        if year_end is not None:
-            results = [
-                m for m in results if m.get("muster_date") and int(m["muster_date"][:4]) <= year_end
-            ]
-        if date_range:
-            results = self._filter_by_date_range(results, date_range, "muster_date")
-
-        return results[:max_results]
+        return self._select(
+            self.MUSTERS_FILE,
+            max_results=max_results,
+            contains={"ship_name": ship_name, "captain": captain, "muster_location": location},
+            equals={"das_voyage_id": das_voyage_id},
+            date_range=("muster_date", date_range),
+            years=("muster_date", year_start, year_end),
+        )
 
     async def get_muster_by_id(self, muster_id: str) -> dict | None:
         """Retrieve a single muster record by ID."""
@@ -158,7 +150,7 @@ class DSSClient(BaseArchiveClient):
 
     # --- Crew operations (MDB individual records) ---------------------------
 
-    async def search_crews(
+    def _crew_filters(
         self,
         *,
         name: str | None = None,
@@ -169,35 +161,42 @@ class DSSClient(BaseArchiveClient):
         age_min: int | None = None,
         age_max: int | None = None,
         destination: str | None = None,
-        max_results: int = 100,
         **kwargs: Any,
-    ) -> list[dict]:
-        """Search MDB individual crew records from northern Dutch provinces."""
-        results = list(self._get_crews())
-
-        if name:
-            results = [c for c in results if self._contains(c.get("name"), name)]
-        if rank:
-            results = [
-                c
-                for c in results
-                if self._contains(c.get("rank"), rank)
-                or self._contains(c.get("rank_english"), rank)
-            ]
-        if ship_name:
-            results = [c for c in results if self._contains(c.get("ship_name"), ship_name)]
-        if origin:
-            results = [c for c in results if self._contains(c.get("origin"), origin)]
-        if destination:
-            results = [c for c in results if self._contains(c.get("destination"), destination)]
-        if age_min is not None:
-            results = [c for c in results if (c.get("age") or 0) >= age_min]
-        if age_max is not None:
-            results = [c for c in results if c.get("age") is not None and c["age"] <= age_max]
-        if date_range:
-            results = self._filter_by_date_range(results, date_range, "muster_date")
-
-        return results[:max_results]
+    ) -> dict[str, Any]:
+        """``_select()`` filters for the crew search keywords."""
+        return {
+            "contains": {
+                "name": name,
+                "ship_name": ship_name,
+                "origin": origin,
+                "destination": destination,
+            },
+            "contains_any": {("rank", "rank_english"): rank},
+            "at_least": {"age": age_min},
+            "at_most": {"age": age_max},
+            "date_range": ("muster_date", date_range),
+        }
+
+    async def search_crews(self, *, max_results: int = 100, **kwargs: Any) -> list[dict]:
+        """Search MDB crew records (northern Dutch provinces); keywords as ``_crew_filters()``."""
+        filters = self._crew_filters(**kwargs)
+        return self._select(self.CREWS_FILE, max_results=max_results, **filters)
+
+    def iter_crew(
+        self, *, sort: bool = True, after: int = -1, **kwargs: Any
+    ) -> Iterator[tuple[int, dict]]:
+        """(position, record) matches of the ``search_crews`` keywords, lazily (``_iter_rows()``).
+
+        In ``crew_order``, or in file order if ``sort`` is False; resumes after
+        position ``after``.
+        """
+        order = crew_order if sort else None
+        filters = self._crew_filters(**kwargs)
+        return self._iter_rows(self.CREWS_FILE, order, after=after, **filters)
+
+    def count_crew(self, **kwargs: Any) -> int:
+        """Number of crew matching the keywords of ``search_crews``."""
+        return self._count(self.CREWS_FILE, **self._crew_filters(**kwargs))
 
     async def get_crew_by_id(self, crew_id: str) -> dict | None:
         """Retrieve a single MDB crew record by ID."""
@@ -10,14 +10,14 @@ Source data compiled from:
 
 import logging
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
-from .base import BaseArchiveClient
+from .base import VoyageArchiveClient, WreckArchiveClient, link_id, voyage_links
 
 logger = logging.getLogger(__name__)
 
 
-class GalleonClient(BaseArchiveClient):
+class GalleonClient(VoyageArchiveClient, WreckArchiveClient):
     """
     Client for the Spanish Manila Galleon voyage database.
 
@@ -27,11 +27,18 @@ class GalleonClient(BaseArchiveClient):
 
     VOYAGES_FILE = "galleon_voyages.json"
     WRECKS_FILE = "galleon_wrecks.json"
+    DATA_FILES = (VOYAGES_FILE, WRECKS_FILE)
+    INDEX_ATTRS = ("_voyage_index", "_wreck_index", "_voyage_wreck_index")
+    CATEGORICAL_FIELDS: ClassVar[dict[str, tuple[str, ...]]] = {
+        WRECKS_FILE: ("region", "loss_cause", "status")
+    }
+    ORTHOGRAPHY = "es"
 
     def __init__(self, data_dir: Path | None = None) -> None:
         super().__init__(data_dir)
         self._voyage_index: dict[str, dict] | None = None
         self._wreck_index: dict[str, dict] | None = None
+        self._voyage_wreck_index: dict[str, list[dict]] | None = None
 
     def _get_voyages(self) -> list[dict]:
         return self._load_json(self.VOYAGES_FILE)
@@ -49,6 +56,42 @@ class GalleonClient(BaseArchiveClient):
             self._wreck_index = {w["wreck_id"]: w for w in self._get_wrecks()}
         return self._wreck_index
 
+    def _get_voyage_wreck_index(self) -> dict[str, list[dict]]:
+        if self._voyage_wreck_index is None:
+            self._voyage_wreck_index = voyage_links(self._get_wrecks(), "galleon")
+        return self._voyage_wreck_index
+
+    def _build_indexes(self) -> None:
+        self._get_voyage_index()
+        self._get_wreck_index()
+        self._get_voyage_wreck_index()
+
+    def _voyage_filters(
+        self,
+        *,
+        ship_name: str | None = None,
+        captain: str | None = None,
+        date_range: str | None = None,
+        departure_port: str | None = None,
+        destination_port: str | None = None,
+        route: str | None = None,
+        fate: str | None = None,
+        trade_direction: str | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """``_select()`` filters for the voyage search keywords."""
+        return {
+            "contains": {
+                "ship_name": ship_name,
+                "captain": captain,
+                "departure_port": departure_port,
+                "destination_port": destination_port,
+            },
+            "contains_any": {("departure_port", "destination_port", "particulars"): route},
+            "equals": {"fate": fate, "trade_direction": trade_direction},
+            "date_range": ("departure_date", date_range),
+        }
+
     async def search(
         self,
         *,
@@ -64,37 +107,17 @@ class GalleonClient(BaseArchiveClient):
         **kwargs: Any,
     ) -> list[dict]:
         """Search Manila Galleon voyage records from local data."""
-        results = list(self._get_voyages())
-
-        if ship_name:
-            results = [v for v in results if self._contains(v.get("ship_name"), ship_name)]
-        if captain:
-            results = [v for v in results if self._contains(v.get("captain"), captain)]
-        if fate:
-            results = [v for v in results if v.get("fate") == fate]
-        if departure_port:
-            results = [
-                v for v in results if self._contains(v.get("departure_port"), departure_port)
-            ]
-        if destination_port:
-            results = [
-                v for v in results if self._contains(v.get("destination_port"), destination_port)
-            ]
-        if route:
-            route_lower = route.lower()
-            results = [
-                v
-                for v in results
-                if route_lower in (v.get("departure_port") or "").lower()
-                or route_lower in (v.get("destination_port") or "").lower()
-                or route_lower in (v.get("particulars") or "").lower()
-            ]
-        if trade_direction:
-            results = [v for v in results if v.get("trade_direction") == trade_direction]
-        if date_range:
-            results = self._filter_by_date_range(results, date_range, "departure_date")
-
-        return results[:max_results]
+        filters = self._voyage_filters(
+            ship_name=ship_name,
+            captain=captain,
+            date_range=date_range,
+            departure_port=departure_port,
+            destination_port=destination_port,
+            route=route,
+            fate=fate,
+            trade_direction=trade_direction,
+        )
+        return self._select(self.VOYAGES_FILE, max_results=max_results, **filters)
 
     async def get_by_id(self, record_id: str) -> dict | None:
         """Retrieve a single voyage by its Galleon voyage ID."""
@@ -104,6 +127,32 @@ class GalleonClient(BaseArchiveClient):
         prefixed = f"galleon:{record_id}" if not record_id.startswith("galleon:") else record_id
         return index.get(prefixed)
 
+    def _wreck_filters(
+        self,
+        *,
+        ship_name: str | None = None,
+        date_range: str | None = None,
+        region: str | None = None,
+        cause: str | None = None,
+        status: str | None = None,
+        min_depth_m: float | None = None,
+        max_depth_m: float | None = None,
+        min_cargo_value: float | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """``_select()`` filters for the wreck search keywords."""
+        return {
+            "contains": {"ship_name": ship_name},
+            "equals": {
+                "loss_cause": cause,
+                "status": status,
+                "region": region,
+            },
+            "at_least": {"depth_estimate_m": min_depth_m, "cargo_value_guilders": min_cargo_value},
+            "at_most": {"depth_estimate_m": max_depth_m},
+            "date_range": ("loss_date", date_range),
+        }
+
     async def search_wrecks(
         self,
         *,
@@ -119,32 +168,17 @@ class GalleonClient(BaseArchiveClient):
         **kwargs: Any,
     ) -> list[dict]:
         """Search Manila Galleon wreck records from local data."""
-        results = list(self._get_wrecks())
-
-        if ship_name:
-            results = [w for w in results if self._contains(w.get("ship_name"), ship_name)]
-        if cause:
-            results = [w for w in results if w.get("loss_cause") == cause]
-        if status:
-            results = [w for w in results if w.get("status") == status]
-        if region:
-            results = [w for w in results if w.get("region") == region]
-        if min_depth_m is not None:
-            results = [w for w in results if (w.get("depth_estimate_m") or 0) >= min_depth_m]
-        if max_depth_m is not None:
-            results = [
-                w
-                for w in results
-                if w.get("depth_estimate_m") is not None and w["depth_estimate_m"] <= max_depth_m
-            ]
-        if min_cargo_value is not None:
-            results = [
-                w for w in results if (w.get("cargo_value_guilders") or 0) >= min_cargo_value
-            ]
-        if date_range:
-            results = self._filter_by_date_range(results, date_range, "loss_date")
-
-        return results[:max_results]
+        filters = self._wreck_filters(
+            ship_name=ship_name,
+            date_range=date_range,
+            region=region,
+            cause=cause,
+            status=status,
+            min_depth_m=min_depth_m,
+            max_depth_m=max_depth_m,
+            min_cargo_value=min_cargo_value,
+        )
+        return self._select(self.WRECKS_FILE, max_results=max_results, **filters)
 
     async def get_wreck_by_id(self, wreck_id: str) -> dict | None:
         """Retrieve a single wreck record by ID."""
@@ -157,8 +191,6 @@ class GalleonClient(BaseArchiveClient):
         return index.get(prefixed)
 
     async def get_wreck_by_voyage_id(self, voyage_id: str) -> dict | None:
-        """Find wreck record linked to a specific voyage."""
-        for w in self._get_wrecks():
-            if w.get("voyage_id") == voyage_id:
-                return w
-        return None
+        """Find wreck record linked to a specific voyage (bare IDs taken as galleon)."""
+        wrecks = self._get_voyage_wreck_index().get(link_id(voyage_id, "galleon"))
+        return wrecks[0] if wrecks else None
@@ -12,14 +12,14 @@ Source data:
 
 import logging
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
-from .base import BaseArchiveClient
+from .base import WreckArchiveClient
 
 logger = logging.getLogger(__name__)
 
 
-class NOAAClient(BaseArchiveClient):
+class NOAAClient(WreckArchiveClient):
     """
     Client for NOAA AWOIS wreck records.
 
@@ -29,6 +29,12 @@ class NOAAClient(BaseArchiveClient):
     """
 
     WRECKS_FILE = "noaa_wrecks.json"
+    DATA_FILES = (WRECKS_FILE,)
+    INDEX_ATTRS = ("_wreck_index",)
+    CATEGORICAL_FIELDS: ClassVar[dict[str, tuple[str, ...]]] = {
+        WRECKS_FILE: ("region", "loss_cause", "status", "flag", "vessel_type", "gp_quality"),
+    }
+    ORTHOGRAPHY = "en"
 
     def __init__(self, data_dir: Path | None = None) -> None:
         super().__init__(data_dir)
@@ -43,6 +49,9 @@ class NOAAClient(BaseArchiveClient):
             logger.info("NOAA wreck index built: %d wrecks", len(self._wreck_index))
         return self._wreck_index
 
+    def _build_indexes(self) -> None:
+        self._get_wreck_index()
+
     # --- BaseArchiveClient abstract methods (delegate to wreck methods) ------
 
     async def search(self, **kwargs: Any) -> list[dict]:
@@ -55,6 +64,40 @@ class NOAAClient(BaseArchiveClient):
 
     # --- Wreck operations ----------------------------------------------------
 
+    def _wreck_filters(
+        self,
+        *,
+        ship_name: str | None = None,
+        date_range: str | None = None,
+        region: str | None = None,
+        cause: str | None = None,
+        status: str | None = None,
+        min_depth_m: float | None = None,
+        max_depth_m: float | None = None,
+        min_cargo_value: float | None = None,
+        flag: str | None = None,
+        vessel_type: str | None = None,
+        gp_quality: int | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """``_select()`` filters for the wreck search keywords."""
+        return {
+            "contains": {
+                "ship_name": ship_name,
+                "flag": flag,
+                "vessel_type": vessel_type,
+            },
+            "equals": {
+                "loss_cause": cause,
+                "status": status,
+                "region": region,
+                "gp_quality": gp_quality,
+            },
+            "at_least": {"depth_estimate_m": min_depth_m, "cargo_value_guilders": min_cargo_value},
+            "at_most": {"depth_estimate_m": max_depth_m},
+            "date_range": ("loss_date", date_range),
+        }
+
     async def search_wrecks(
         self,
         *,
@@ -73,38 +116,20 @@ class NOAAClient(BaseArchiveClient):
         **kwargs: Any,
     ) -> list[dict]:
         """Search NOAA wreck records from local data."""
-        results = list(self._get_wrecks())
-
-        if ship_name:
-            results = [w for w in results if self._contains(w.get("ship_name"), ship_name)]
-        if cause:
-            results = [w for w in results if w.get("loss_cause") == cause]
-        if status:
-            results = [w for w in results if w.get("status") == status]
-        if region:
-            results = [w for w in results if w.get("region") == region]
-        if min_depth_m is not None:
-            results = [w for w in results if (w.get("depth_estimate_m") or 0) >= min_depth_m]
-        if max_depth_m is not None:
-            results = [
-                w
-                for w in results
-                if w.get("depth_estimate_m") is not None and w["depth_estimate_m"] <= max_depth_m
-            ]
-        if min_cargo_value is not None:
-            results = [
-                w for w in results if (w.get("cargo_value_guilders") or 0) >= min_cargo_value
-            ]
-        if flag:
-            results = [w for w in results if self._contains(w.get("flag"), flag)]
-        if vessel_type:
-            results = [w for w in results if self._contains(w.get("vessel_type"), vessel_type)]
-        if gp_quality is not None:
-            results = [w for w in results if w.get("gp_quality") == gp_quality]
-        if date_range:
-            results = self._filter_by_date_range(results, date_range, "loss_date")
-
-        return results[:max_results]
+        filters = self._wreck_filters(
+            ship_name=ship_name,
+            date_range=date_range,
+            region=region,
+            cause=cause,
+            status=status,
+            min_depth_m=min_depth_m,
+            max_depth_m=max_depth_m,
+            min_cargo_value=min_cargo_value,
+            flag=flag,
+            vessel_type=vessel_type,
+            gp_quality=gp_quality,
+        )
+        return self._select(self.WRECKS_FILE, max_results=max_results, **filters)
 
     async def get_wreck_by_id(self, wreck_id: str) -> dict | None:
         """Retrieve a single wreck record by ID using index."""
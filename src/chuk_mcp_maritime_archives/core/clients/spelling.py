@@ -0,0 +1,89 @@
+"""
+Spelling normalisation for variant-tolerant narrative search.
+
+Narratives in the Dutch, Portuguese, Spanish and Swedish archives mix
+historical and modern spellings of the same words ("Caap"/"Kaap",
+"Reyna"/"Reina", "Sebastiam"/"Sebastião"). A token's variant form is the
+token folded -- lowercased, with diacritics stripped and ligatures spelled
+out -- and then rewritten by the orthographic rules of the archive's
+language, in order, so variants of a word share one form.
+
+The form is only compared whole, token against query word; it is not
+meant to be read, and substring matching stays on the spelling as written.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from collections.abc import Callable
+from functools import cache
+
+# Letters NFKD does not decompose
+_LIGATURES = str.maketrans(
+    {"ß": "ss", "æ": "ae", "œ": "oe", "ø": "o", "đ": "d", "ð": "d", "þ": "th", "ł": "l"}
+)
+
+# Language code -> (pattern, replacement) rewrites applied to each folded token
+ORTHOGRAPHY_RULES: dict[str, tuple[tuple[str, str], ...]] = {
+    # Dutch: ij/y, initial c/k before back vowels, doubled vowels, gh, final
+    # -dt, and the silent e of short English a-e words ("Cape" -> "kap", as "Kaap")
+    "nl": (
+        (r"ij", "y"),
+        (r"ck", "k"),
+        (r"^c(?=[aou])", "k"),
+        (r"ae|aa", "a"),
+        (r"oo", "o"),
+        (r"ee", "e"),
+        (r"uy", "ui"),
+        (r"gh", "g"),
+        (r"dt$", "t"),
+        (r"^([^aeiou]a[^aeiouwy])e$", r"\1"),
+    ),
+    # Portuguese: Latinate ph/th, y as i, doubled consonants, -am for -ão, final z
+    "pt": (
+        (r"ph", "f"),
+        (r"th", "t"),
+        (r"y", "i"),
+        (r"ss", "s"),
+        (r"ll", "l"),
+        (r"am$", "ao"),
+        (r"z$", "s"),
+    ),
+    # Spanish: Latinate ph/th, y between letters as i, v/b, x/j before vowels
+    "es": (
+        (r"ph", "f"),
+        (r"th", "t"),
+        (r"(?<=\w)y(?=\w)", "i"),
+        (r"v", "b"),
+        (r"x(?=[aeiou])", "j"),
+    ),
+    # Swedish: pre-1906 hv/qv/fv and w
+    "sv": (
+        (r"w", "v"),
+        (r"hv", "v"),
+        (r"qv", "kv"),
+        (r"fv", "v"),
+        (r"ph", "f"),
+    ),
+}
+
+
+def fold(text: str) -> str:
+    """``text`` lowercased, without diacritics and with ligatures spelled out."""
+    decomposed = unicodedata.normalize("NFKD", text.lower().translate(_LIGATURES))
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+@cache
+def normalizer(language: str | None) -> Callable[[str], str]:
+    """Variant form of a token: folded, then rewritten by the rules of ``language`` (if any)."""
+    rules = [(re.compile(p), r) for p, r in ORTHOGRAPHY_RULES.get(language or "", ())]
+
+    def normalize(token: str) -> str:
+        form = fold(token)
+        for pattern, replacement in rules:
+            form = pattern.sub(replacement, form)
+        return form
+
+    return normalize
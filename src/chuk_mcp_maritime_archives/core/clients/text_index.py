@@ -0,0 +1,286 @@
+"""
+Positional inverted index for full-text narrative search.
+
+Documents -- the narrative fields of a data file's records -- are split
+into lowercase word tokens. For every distinct token the index keeps the
+sorted documents holding it and, per document, the token's positions,
+plus the length of every document in tokens, so a query is answered from
+the postings alone:
+
+- A query term is a word or a quoted phrase, itself tokenized. Terms keep
+  the substring semantics of the plain-text scan: a one-word term matches
+  every token containing it, while a phrase's first word matches tokens
+  ending with it, its last word tokens starting with it and the words in
+  between whole tokens, all at consecutive positions.
+- Every term must match (AND); documents are intersected rarest term first.
+- Matches are ranked by Okapi BM25 over each term's frequency in the
+  document, its document frequency and the document's length, and the
+  best ``limit`` are kept with a heap.
+
+Expanding a word to the tokens containing it scans the vocabulary -- far
+smaller than the text -- and is cached per word.
+
+An index given a ``variant`` function (``spelling.normalizer()``) can
+also match, on request, the tokens whose variant form equals the query
+word's -- whole tokens only, as substrings of folded text match unrelated
+words. Searches with ``fuzzy`` match a word that no token contains to the
+tokens within a small edit distance of it. Both lookups go through maps
+of the vocabulary (by variant form, by padded trigram) built on first use.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+from array import array
+from collections.abc import Callable, Iterator, Sequence
+
+from ..entity_resolution import levenshtein_distance
+
+# BM25 term-frequency saturation and document-length normalisation
+K1 = 1.2
+B = 0.75
+# Most cached vocabulary expansions; the cache is emptied when full
+_EXPANSIONS = 4096
+# Shortest word matched fuzzily, and the length from which two edits are allowed
+FUZZY_MIN_LENGTH = 4
+FUZZY_TWO_EDITS_LENGTH = 8
+_GRAM = 3
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens of ``text``."""
+    return _TOKEN.findall(text.lower())
+
+
+def _padded_grams(token: str) -> set[str]:
+    """Trigrams of ``token`` between boundary marks, so short tokens have some."""
+    padded = f"^{token}$"
+    return {padded[i : i + _GRAM] for i in range(len(padded) - _GRAM + 1)}
+
+
+class TextIndex:
+    """Token -> (documents, per-document position offsets, positions) postings."""
+
+    __slots__ = (
+        "_average",
+        "_documents",
+        "_expansions",
+        "_forms",
+        "_grams",
+        "_lengths",
+        "_postings",
+        "variant",
+    )
+
+    def __init__(
+        self, documents: Sequence[str], variant: Callable[[str], str] | None = None
+    ) -> None:
+        self.variant = variant
+        postings: dict[str, tuple[array, array, array]] = {}
+        lengths = array("l")
+        for doc, text in enumerate(documents):
+            tokens = tokenize(text) if text else []
+            lengths.append(len(tokens))
+            for position, token in enumerate(tokens):
+                entry = postings.get(token)
+                if entry is None:
+                    entry = postings[token] = (array("l"), array("l"), array("l"))
+                docs, starts, positions = entry
+                # Documents are visited in order, so each list stays sorted
+                if not docs or docs[-1] != doc:
+                    docs.append(doc)
+                    starts.append(len(positions))
+                positions.append(position)
+        self._postings = postings
+        self._lengths = lengths
+        self._documents = sum(1 for n in lengths if n)
+        self._average = sum(lengths) / self._documents if self._documents else 0.0
+        self._expansions: dict[tuple[str, str], list[str]] = {}
+        self._forms: dict[str, list[str]] | None = None
+        self._grams: dict[str, list[str]] | None = None
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def _expand(
+        self, word: str, how: str, variants: bool = False, fuzzy: bool = False
+    ) -> list[str]:
+        """Tokens equal to, containing, ending with or starting with ``word``.
+
+        With ``variants``, also the tokens of the same variant form as
+        ``word``; with ``fuzzy``, a word no token matches expands to its
+        near misses.
+        """
+        found = self._matching(word, how)
+        if variants and self.variant is not None:
+            seen = set(found)
+            found = found + [t for t in self._same_form(word, self.variant) if t not in seen]
+        if not found and fuzzy:
+            near = self._expansions.get((word, "near"))
+            if near is None:
+                near = self._remember((word, "near"), self._near(word))
+            return near
+        return found
+
+    def _matching(self, word: str, how: str) -> list[str]:
+        """Tokens equal to, containing, ending with or starting with ``word`` as spelled."""
+        if how == "exact":
+            return [word] if word in self._postings else []
+        key = (word, how)
+        found = self._expansions.get(key)
+        if found is None:
+            if how == "suffix":
+                found = [t for t in self._postings if t.endswith(word)]
+            elif how == "prefix":
+                found = [t for t in self._postings if t.startswith(word)]
+            else:
+                found = [t for t in self._postings if word in t]
+            self._remember(key, found)
+        return found
+
+    def _remember(self, key: tuple[str, str], found: list[str]) -> list[str]:
+        """Cache the expansion ``found`` under ``key``; the cache is emptied when full."""
+        if len(self._expansions) >= _EXPANSIONS:
+            self._expansions.clear()
+        self._expansions[key] = found
+        return found
+
+    def _same_form(self, word: str, variant: Callable[[str], str]) -> list[str]:
+        """Tokens whose variant form is ``word``'s."""
+        if self._forms is None:
+            forms: dict[str, list[str]] = {}
+            for token in self._postings:
+                forms.setdefault(variant(token), []).append(token)
+            self._forms = forms
+        return self._forms.get(variant(word), [])
+
+    def _near(self, word: str) -> list[str]:
+        """Tokens within one edit of ``word`` (two for long words); none for short words."""
+        if len(word) < FUZZY_MIN_LENGTH:
+            return []
+        edits = 2 if len(word) >= FUZZY_TWO_EDITS_LENGTH else 1
+        if self._grams is None:
+            grams: dict[str, list[str]] = {}
+            for token in self._postings:
+                for gram in _padded_grams(token):
+                    grams.setdefault(gram, []).append(token)
+            self._grams = grams
+        # A word has len(word) padded trigrams, and each edit destroys at most three
+        shared: dict[str, int] = {}
+        for gram in _padded_grams(word):
+            for token in self._grams.get(gram, ()):
+                shared[token] = shared.get(token, 0) + 1
+        needed = max(1, len(word) - _GRAM * edits)
+        return [
+            token
+            for token, count in shared.items()
+            if count >= needed
+            and abs(len(token) - len(word)) <= edits
+            and levenshtein_distance(token, word) <= edits
+        ]
+
+    def _positions(self, token: str) -> dict[int, set[int]]:
+        """Document -> positions of ``token``."""
+        docs, starts, positions = self._postings[token]
+        ends = list(starts[1:]) + [len(positions)]
+        return {doc: set(positions[s:e]) for doc, s, e in zip(docs, starts, ends)}
+
+    def _frequencies(self, words: list[str], variants: bool, fuzzy: bool) -> dict[int, int]:
+        """Document -> occurrences of one query term (a word or phrase)."""
+        if len(words) == 1:
+            counts: dict[int, int] = {}
+            for token in self._expand(words[0], "infix", variants, fuzzy):
+                docs, starts, positions = self._postings[token]
+                ends = list(starts[1:]) + [len(positions)]
+                for doc, s, e in zip(docs, starts, ends):
+                    counts[doc] = counts.get(doc, 0) + e - s
+            return counts
+
+        last = len(words) - 1
+        slots: list[dict[int, set[int]]] = []
+        for i, word in enumerate(words):
+            how = "suffix" if i == 0 else "prefix" if i == last else "exact"
+            slot: dict[int, set[int]] = {}
+            for token in self._expand(word, how, variants, fuzzy):
+                for doc, at in self._positions(token).items():
+                    slot.setdefault(doc, set()).update(at)
+            if not slot:
+                return {}
+            slots.append(slot)
+
+        counts = {}
+        candidates = set.intersection(*(set(slot) for slot in slots))
+        for doc in candidates:
+            count = sum(
+                1
+                for start in slots[0][doc]
+                if all(start + i in slot[doc] for i, slot in enumerate(slots[1:], 1))
+            )
+            if count:
+                counts[doc] = count
+        return counts
+
+    def hits(
+        self, terms: Sequence[Sequence[str]], variants: bool = False, fuzzy: bool = False
+    ) -> tuple[int, Iterator[tuple[float, int, int]]]:
+        """Documents holding every term (each a list of words), unordered.
+
+        Returns the number of matching documents and a lazy stream of them
+        as (score, document, term occurrences), for callers ranking by more
+        than the score. ``variants`` and ``fuzzy`` widen each word's tokens
+        (see ``_expand()``).
+        """
+        terms = [words for words in terms if words]
+        if not terms:
+            return 0, iter(())
+        per_term = sorted(
+            (self._frequencies(list(words), variants, fuzzy) for words in terms), key=len
+        )
+        matched = set(per_term[0])
+        for counts in per_term[1:]:
+            if not matched:
+                break
+            matched.intersection_update(counts)
+        if not matched:
+            return 0, iter(())
+
+        weights = [
+            math.log(1 + (self._documents - len(c) + 0.5) / (len(c) + 0.5)) for c in per_term
+        ]
+        lengths = self._lengths
+        average = self._average
+
+        def scored(doc: int) -> tuple[float, int, int]:
+            norm = K1 * (1 - B + B * lengths[doc] / average)
+            score = 0.0
+            occurrences = 0
+            for weight, counts in zip(weights, per_term):
+                tf = counts[doc]
+                occurrences += tf
+                score += weight * tf * (K1 + 1) / (tf + norm)
+            return score, doc, occurrences
+
+        return len(matched), map(scored, sorted(matched))
+
+    def search(
+        self,
+        terms: Sequence[Sequence[str]],
+        limit: int | None = None,
+        variants: bool = False,
+        fuzzy: bool = False,
+    ) -> tuple[int, list[tuple[float, int, int]]]:
+        """Documents holding every term (each a list of words), best BM25 score first.
+
+        Returns the number of matching documents and the best ``limit`` of
+        them (all if None) as (score, document, term occurrences).
+        """
+        total, ranked = self.hits(terms, variants, fuzzy)
+        if limit is None:
+            best = sorted(ranked, key=lambda hit: -hit[0])
+        else:
+            best = heapq.nsmallest(limit, ranked, key=lambda hit: -hit[0])
+        return total, best
@@ -0,0 +1,82 @@
+"""
+Trigram inverted index for case-insensitive substring filters.
+
+Built from a column of lowercased field values (one per record), the
+index maps every three-character sequence to the sorted rows whose value
+contains it. A substring query intersects the posting lists of the
+needle's trigrams, shortest first, and returns the surviving rows as
+candidates: every row that contains the needle is among them, but a row
+can hold all the trigrams without the needle itself, so callers still
+verify each candidate.
+
+Needles shorter than three characters have no trigrams and cannot be
+narrowed; ``candidates()`` returns None for them.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
+
+GRAM = 3
+# Probe the longer posting list by bisection when it is at least this many
+# times longer than the running result; otherwise intersect as sets
+_BISECT_RATIO = 32
+
+
+def trigrams(text: str) -> set[str]:
+    """Distinct three-character substrings of ``text``."""
+    return {text[i : i + GRAM] for i in range(len(text) - GRAM + 1)}
+
+
+class TrigramIndex:
+    """Trigram -> sorted row postings over a column of lowercased values."""
+
+    __slots__ = ("_postings", "_rows")
+
+    def __init__(self, lowered: Sequence[str]) -> None:
+        postings: dict[str, list[int]] = {}
+        for row, text in enumerate(lowered):
+            if len(text) < GRAM:
+                continue
+            for gram in trigrams(text):
+                rows = postings.get(gram)
+                if rows is None:
+                    postings[gram] = [row]
+                else:
+                    rows.append(row)
+        # Rows are appended in order, so every posting list is already sorted
+        self._postings = {gram: array("l", rows) for gram, rows in postings.items()}
+        self._rows = len(lowered)
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def candidates(self, needle: str) -> list[int] | None:
+        """Sorted rows that may contain ``needle`` (lowercased), or None if too short."""
+        grams = trigrams(needle)
+        if not grams:
+            return None
+        postings = []
+        for gram in grams:
+            rows = self._postings.get(gram)
+            if rows is None:
+                return []
+            postings.append(rows)
+        postings.sort(key=len)
+
+        result: list[int] = list(postings[0])
+        for rows in postings[1:]:
+            if not result:
+                break
+            if len(rows) >= _BISECT_RATIO * len(result):
+                result = [row for row in result if _has(rows, row)]
+            else:
+                result = sorted(set(result).intersection(rows))
+        return result
+
+
+def _has(rows: array, row: int) -> bool:
+    i = bisect_left(rows, row)
+    return i < len(rows) and rows[i] == row
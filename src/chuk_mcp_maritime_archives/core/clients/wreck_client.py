@@ -7,14 +7,14 @@ which extracts wreck/loss records from the DAS voyage Particulars field.
 
 import logging
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
-from .base import BaseArchiveClient
+from .base import WreckArchiveClient, link_id, voyage_links
 
 logger = logging.getLogger(__name__)
 
 
-class WreckClient(BaseArchiveClient):
+class WreckClient(WreckArchiveClient):
     """
     Client for the wreck/loss database.
 
@@ -24,10 +24,17 @@ class WreckClient(BaseArchiveClient):
     """
 
     WRECKS_FILE = "wrecks.json"
+    DATA_FILES = (WRECKS_FILE,)
+    INDEX_ATTRS = ("_wreck_index", "_voyage_wreck_index")
+    CATEGORICAL_FIELDS: ClassVar[dict[str, tuple[str, ...]]] = {
+        WRECKS_FILE: ("region", "loss_cause", "status")
+    }
+    ORTHOGRAPHY = "nl"
 
     def __init__(self, data_dir: Path | None = None) -> None:
         super().__init__(data_dir)
         self._wreck_index: dict[str, dict] | None = None
+        self._voyage_wreck_index: dict[str, list[dict]] | None = None
 
     def _get_wrecks(self) -> list[dict]:
         return self._load_json(self.WRECKS_FILE)
@@ -37,6 +44,41 @@ class WreckClient(BaseArchiveClient):
             self._wreck_index = {w["wreck_id"]: w for w in self._get_wrecks()}
         return self._wreck_index
 
+    def _get_voyage_wreck_index(self) -> dict[str, list[dict]]:
+        if self._voyage_wreck_index is None:
+            self._voyage_wreck_index = voyage_links(self._get_wrecks(), "das")
+        return self._voyage_wreck_index
+
+    def _build_indexes(self) -> None:
+        self._get_wreck_index()
+        self._get_voyage_wreck_index()
+
+    def _wreck_filters(
+        self,
+        *,
+        ship_name: str | None = None,
+        date_range: str | None = None,
+        region: str | None = None,
+        cause: str | None = None,
+        status: str | None = None,
+        min_depth_m: float | None = None,
+        max_depth_m: float | None = None,
+        min_cargo_value: float | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """``_select()`` filters for the wreck search keywords."""
+        return {
+            "contains": {"ship_name": ship_name},
+            "equals": {
+                "loss_cause": cause,
+                "status": status,
+                "region": region,
+            },
+            "at_least": {"depth_estimate_m": min_depth_m, "cargo_value_guilders": min_cargo_value},
+            "at_most": {"depth_estimate_m": max_depth_m},
+            "date_range": ("loss_date", date_range),
+        }
+
     async def search(
         self,
         *,
@@ -52,45 +94,22 @@ class WreckClient(BaseArchiveClient):
         **kwargs: Any,
     ) -> list[dict]:
         """Search wreck records from local data."""
-        results = list(self._get_wrecks())
-
-        if ship_name:
-            results = [w for w in results if self._contains(w.get("ship_name"), ship_name)]
-        if cause:
-            results = [w for w in results if w.get("loss_cause") == cause]
-        if status:
-            results = [w for w in results if w.get("status") == status]
-        if region:
-            results = [w for w in results if w.get("region") == region]
-        if min_depth_m is not None:
-            results = [w for w in results if (w.get("depth_estimate_m") or 0) >= min_depth_m]
-        if max_depth_m is not None:
-            results = [
-                w
-                for w in results
-                if w.get("depth_estimate_m") is not None and w["depth_estimate_m"] <= max_depth_m
-            ]
-        if min_cargo_value is not None:
-            results = [
-                w for w in results if (w.get("cargo_value_guilders") or 0) >= min_cargo_value
-            ]
-        if date_range:
-            results = self._filter_by_date_range(results, date_range, "loss_date")
-
-        return results[:max_results]
+        filters = self._wreck_filters(
+            ship_name=ship_name,
+            date_range=date_range,
+            region=region,
+            cause=cause,
+            status=status,
+            min_depth_m=min_depth_m,
+            max_depth_m=max_depth_m,
+            min_cargo_value=min_cargo_value,
+        )
+        return self._select(self.WRECKS_FILE, max_results=max_results, **filters)
 
     async def get_by_voyage_id(self, voyage_id: str) -> dict | None:
-        """Find wreck record linked to a specific voyage."""
-        for w in self._get_wrecks():
-            if w.get("voyage_id") == voyage_id:
-                return w
-        # Support unprefixed IDs (e.g. "0372.1" matching "das:0372.1")
-        if ":" not in voyage_id:
-            prefixed = f"das:{voyage_id}"
-            for w in self._get_wrecks():
-                if w.get("voyage_id") == prefixed:
-                    return w
-        return None
+        """Find wreck record linked to a specific voyage (bare IDs taken as DAS)."""
+        wrecks = self._get_voyage_wreck_index().get(link_id(voyage_id, "das"))
+        return wrecks[0] if wrecks else None
 
     async def get_by_id(self, record_id: str) -> dict | None:
         """Retrieve a single wreck record by ID."""
@@ -17,12 +17,24 @@ from __future__ import annotations
 import json
 import logging
 import math
+import multiprocessing
+import os
 import random
 import statistics
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
+from itertools import count, pairwise
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, overload
+
+from ..constants import EnvVar
+from .track_cache import MappedCache, file_sha256, open_columnar_cache, write_columnar_cache
 
 logger = logging.getLogger(__name__)
 
@@ -36,46 +48,591 @@ _SHIP_NAME_INDEX: dict[str, list[dict[str, Any]]] = {}  # upper(ship_name) -> [t
 _METADATA: dict[str, Any] = {}
 _FUZZY_INDEX: Any = None  # ShipNameIndex, built lazily
 
+# Serialises _load_tracks(); the containers above are filled in place so
+# references imported elsewhere stay valid once the data arrives.
+_LOAD_LOCK = threading.Lock()
+
 
 # ---------------------------------------------------------------------------
-# Data loading
+# Segment table
 # ---------------------------------------------------------------------------
 
 
-def _load_tracks(data_dir: Path | None = None) -> None:
-    """Load CLIWOC track data from JSON file."""
-    global _TRACKS, _TRACK_INDEX, _DAS_INDEX, _SHIP_NAME_INDEX, _METADATA
-    if _TRACKS:
-        return
+class _SegmentTable:
+    """Columnar table of consecutive-position segments across all tracks.
 
-    path = (data_dir or _DEFAULT_DATA_DIR) / "cliwoc_tracks.json"
-    if not path.exists():
-        logger.warning("CLIWOC tracks not found: %s (run scripts/download_cliwoc.py)", path)
-        return
+    Holds one row per consecutive position pair that has coordinates for
+    both positions, parseable dates and a positive day gap -- everything the
+    speed analytics need, computed once at load time. Rows are stored in
+    track order, so iterating selected rows reproduces the per-track loop.
+
+    Missing wind values are stored as -1 and missing logged distances as 0.0.
+    Per-track columns (``voyage_id``, ``nationality``, ``year_start``,
+    ``year_end``) are indexed by track position in ``_TRACKS``.
+    """
+
+    def __init__(self) -> None:
+        self.track = array("i")  # index into _TRACKS
+        self.pos = array("i")  # index of the second position within the track
+        self.mid_lat = array("d")
+        self.mid_lon = array("d")
+        self.ordinal = array("i")  # date ordinal of the second position
+        self.year = array("h")
+        self.month = array("b")
+        self.km_day = array("d")  # rounded to 0.1 km/day, as reported
+        self.raw_km_day = array("d")  # unrounded, used for speed bounds
+        self.eastbound = array("b")
+        self.wind_force = array("b")
+        self.wind_dir = array("h")
+        self.wind_sector = array("b")  # index into _COMPASS_SECTORS
+        self.anchored = array("b")
+        self.logged_dist = array("d")
+        # Per-track columns
+        self.voyage_id: list[int] = []
+        self.nationality: list[str | None] = []
+        self.year_start = array("h")  # missing -> 9999
+        self.year_end = array("h")  # missing -> 0
+
+    def __len__(self) -> int:
+        return len(self.track)
+
+
+_SEGMENTS = _SegmentTable()  # built by _load_tracks()
+
+
+# ---------------------------------------------------------------------------
+# Position grid
+# ---------------------------------------------------------------------------
+
+# Cell edge in degrees. A power of two keeps ``floor(coord / size) * size``
+# exact, so cell bounds never disagree with the cell a coordinate lands in.
+_GRID_CELL_DEG = 2.0
+
+
+class _PositionGrid:
+    """Lat/lon cell index over every track position with coordinates.
+
+    Positions are stored cell by cell in flat columns, ordered by track and
+    position within each cell; ``cells`` maps an ``(ilat, ilon)`` cell key
+    (``floor(coord / _GRID_CELL_DEG)``) to its ``(start, stop)`` row slice.
+    Bounding-box and radius queries only visit rows of candidate cells.
+    """
+
+    def __init__(self) -> None:
+        self.track = array("i")  # index into _TRACKS
+        self.pos = array("i")  # index of the position within the track
+        self.lat = array("d")
+        self.lon = array("d")
+        self.cells: dict[tuple[int, int], tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.track)
+
+
+_GRID = _PositionGrid()  # built by _load_tracks()
+
+
+def _grid_cell(coord: float) -> int:
+    return math.floor(coord / _GRID_CELL_DEG)
+
+
+def _build_position_grid(tracks: list[dict[str, Any]]) -> _PositionGrid:
+    """Bucket every position with coordinates into ``_GRID_CELL_DEG`` cells."""
+    entries: list[tuple[int, int, int, int, float, float]] = []
+    for t, track in enumerate(tracks):
+        for p, pos in enumerate(track.get("positions", [])):
+            lat, lon = pos.get("lat"), pos.get("lon")
+            if lat is None or lon is None:
+                continue
+            entries.append((_grid_cell(lat), _grid_cell(lon), t, p, lat, lon))
+    entries.sort(key=lambda e: e[:4])
+
+    grid = _PositionGrid()
+    start = 0
+    for row, (ci, cj, t, p, lat, lon) in enumerate(entries):
+        if row and entries[row - 1][:2] != (ci, cj):
+            grid.cells[entries[row - 1][:2]] = (start, row)
+            start = row
+        grid.track.append(t)
+        grid.pos.append(p)
+        grid.lat.append(lat)
+        grid.lon.append(lon)
+    if entries:
+        grid.cells[entries[-1][:2]] = (start, len(entries))
+    return grid
+
+
+def _grid_tracks_in_bbox(
+    lat_min: float | None,
+    lat_max: float | None,
+    lon_min: float | None,
+    lon_max: float | None,
+) -> set[int]:
+    """Indices of tracks with at least one position inside a bounding box.
+
+    Same semantics as ``_track_in_bbox``. Cells wholly inside the box match
+    without testing their positions; cells crossing its edge are tested row
+    by row.
+    """
+    size = _GRID_CELL_DEG
+    found: set[int] = set()
+    for (ci, cj), (start, stop) in _GRID.cells.items():
+        lat_lo, lon_lo = ci * size, cj * size
+        lat_hi, lon_hi = lat_lo + size, lon_lo + size
+        if (
+            (lat_min is not None and lat_hi <= lat_min)
+            or (lat_max is not None and lat_lo > lat_max)
+            or (lon_min is not None and lon_hi <= lon_min)
+            or (lon_max is not None and lon_lo > lon_max)
+        ):
+            continue
+        if (
+            (lat_min is None or lat_lo >= lat_min)
+            and (lat_max is None or lat_hi <= lat_max)
+            and (lon_min is None or lon_lo >= lon_min)
+            and (lon_max is None or lon_hi <= lon_max)
+        ):
+            found.update(_GRID.track[start:stop])
+            continue
+        lats, lons, tracks = _GRID.lat, _GRID.lon, _GRID.track
+        found.update(
+            tracks[i]
+            for i in range(start, stop)
+            if _pos_in_bbox(lats[i], lons[i], lat_min, lat_max, lon_min, lon_max)
+        )
+    return found
+
+
+# ---------------------------------------------------------------------------
+# Date index
+# ---------------------------------------------------------------------------
+
+
+class _DateIndex:
+    """Track positions keyed by date ordinal, for same-day and window lookups.
+
+    Flat columns hold every position with coordinates and a parseable date,
+    ordered by date ordinal and, within a day, by latitude. ``days`` maps an
+    ordinal to its ``(start, stop)`` row slice, so the positions logged on a
+    day inside a latitude band are one bisect away.
+    """
+
+    def __init__(self) -> None:
+        self.track = array("i")  # index into _TRACKS
+        self.pos = array("i")  # index of the position within the track
+        self.ordinal = array("i")
+        self.lat = array("d")
+        self.lon = array("d")
+        self.days: dict[int, tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.track)
+
+
+_DATES = _DateIndex()  # built by _load_tracks()
+
+
+def _build_date_index(tracks: list[dict[str, Any]]) -> _DateIndex:
+    """Index every dated position with coordinates by date ordinal."""
+    entries: list[tuple[int, float, int, int, float]] = []
+    for t, track in enumerate(tracks):
+        for p, pos in enumerate(track.get("positions", [])):
+            lat, lon = pos.get("lat"), pos.get("lon")
+            if lat is None or lon is None:
+                continue
+            d = _parse_date(pos.get("date") or "")
+            if d is None:
+                continue
+            entries.append((d.toordinal(), lat, t, p, lon))
+    entries.sort(key=lambda e: e[:4])
+
+    index = _DateIndex()
+    start = 0
+    for row, (ordinal, lat, t, p, lon) in enumerate(entries):
+        if row and entries[row - 1][0] != ordinal:
+            index.days[entries[row - 1][0]] = (start, row)
+            start = row
+        index.track.append(t)
+        index.pos.append(p)
+        index.ordinal.append(ordinal)
+        index.lat.append(lat)
+        index.lon.append(lon)
+    if entries:
+        index.days[entries[-1][0]] = (start, len(entries))
+    return index
+
+
+def _date_rows_near(ordinal: int, days_window: int, lat: float, radius_km: float) -> list[int]:
+    """Date-index rows near ``lat`` within ``days_window`` days of ``ordinal``.
+
+    Rows come from the latitude band ``radius_km`` either side of ``lat``,
+    a superset of the true matches; callers still measure each row.
+    """
+    dlat = math.degrees(radius_km / 6371.0) + 1e-9  # Earth radius km
+    lats = _DATES.lat
+    rows: list[int] = []
+    for day in range(ordinal - days_window, ordinal + days_window + 1):
+        span = _DATES.days.get(day)
+        if span is None:
+            continue
+        lo = bisect_left(lats, lat - dlat, *span)
+        hi = bisect_right(lats, lat + dlat, lo, span[1])
+        rows.extend(range(lo, hi))
+    return rows
+
+
+# ---------------------------------------------------------------------------
+# Compiled cache
+# ---------------------------------------------------------------------------
+
+_CACHE_FILENAME = "cliwoc_tracks.bin"
+
+# Bump whenever the cached columns or derived tables change shape.
+_CACHE_LAYOUT = 1
+
+# Scalar track fields in output order, as string-table refs ("s") or ints ("i")
+_TRACK_FIELDS = (
+    ("nationality", "s"),
+    ("ship_name", "s"),
+    ("company", "s"),
+    ("das_number", "s"),
+    ("ship_type", "s"),
+    ("voyage_from", "s"),
+    ("voyage_to", "s"),
+    ("start_date", "s"),
+    ("end_date", "s"),
+    ("duration_days", "i"),
+    ("year_start", "i"),
+    ("year_end", "i"),
+    ("position_count", "i"),
+)
+
+# Numeric position fields, stored as doubles with NaN for missing
+_POSITION_FIELDS = ("lat", "lon", "wf", "wd", "ss", "dist", "sst", "at", "slp", "cmg", "anch")
+
+_MISSING_INT = -(2**63)
+
+
+class _PositionColumns:
+    """Position columns of an open cache, shared by every track's view."""
+
+    def __init__(self, cache: MappedCache) -> None:
+        int_fields = set(cache.meta.get("int_fields", ()))
+        self.strings = cache.strings
+        self.date = cache.column("pos.date")
+        self.extra = cache.column("pos.extra")
+        self.numeric = [
+            (name, cache.column(f"pos.{name}"), name in int_fields)
+            for name in _POSITION_FIELDS
+            if f"pos.{name}" in cache
+        ]
+
+    def row(self, i: int) -> dict[str, Any]:
+        pos: dict[str, Any] = {}
+        if (ref := self.date[i]) >= 0:
+            pos["date"] = self.strings[ref]
+        for name, col, is_int in self.numeric:
+            v = col[i]
+            if not math.isnan(v):  # NaN marks a missing value
+                pos[name] = int(v) if is_int else v
+        if (ref := self.extra[i]) >= 0:
+            pos.update(json.loads(self.strings[ref]))
+        return pos
+
+
+class _MappedPositions(Sequence[dict[str, Any]]):
+    """A track's positions served from the cache, built as dicts on access."""
+
+    __slots__ = ("_cols", "_len", "_start")
+
+    def __init__(self, cols: _PositionColumns, start: int, stop: int) -> None:
+        self._cols = cols
+        self._start = start
+        self._len = stop - start
+
+    def __len__(self) -> int:
+        return self._len
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        if isinstance(index, slice):
+            return [self._cols.row(self._start + i) for i in range(*index.indices(self._len))]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("position index out of range")
+        return self._cols.row(self._start + index)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        row = self._cols.row
+        for i in range(self._start, self._start + self._len):
+            yield row(i)
+
+
+def _table_arrays(table: object) -> list[str]:
+    """Names of a table's ``array`` columns."""
+    return [name for name, col in vars(table).items() if isinstance(col, array)]
+
+
+def _compile_track_cache(
+    data: dict[str, Any],
+) -> tuple[dict[str, array], list[str], dict[str, Any]]:
+    """Flatten parsed ``cliwoc_tracks.json`` into cache columns.
+
+    Values that do not fit their column (unknown keys, unexpected types)
+    are kept losslessly as JSON in the per-track or per-position
+    ``extra`` string.
+
+    Returns (columns, strings, meta).
+    """
+    tracks = data.get("tracks", [])
+    strings: list[str] = []
+    string_ids: dict[str, int] = {}
+
+    def ref(value: str) -> int:
+        sid = string_ids.get(value)
+        if sid is None:
+            sid = string_ids[value] = len(strings)
+            strings.append(value)
+        return sid
+
+    columns: dict[str, array] = {
+        "track.voyage_id": array("q"),
+        "track.pos_start": array("q"),
+        "track.pos_stop": array("q"),
+        "track.extra": array("i"),
+        "pos.date": array("i"),
+        "pos.extra": array("i"),
+    }
+    for name, kind in _TRACK_FIELDS:
+        columns[f"track.{name}"] = array("i" if kind == "s" else "q")
+    for name in _POSITION_FIELDS:
+        columns[f"pos.{name}"] = array("d")
+
+    track_known = {"voyage_id", "positions", *(name for name, _ in _TRACK_FIELDS)}
+    pos_known = {"date", *_POSITION_FIELDS}
+    non_int: set[str] = set()
+    n_pos = 0
+    for track in tracks:
+        columns["track.voyage_id"].append(track["voyage_id"])
+        extra = {k: v for k, v in track.items() if k not in track_known}
+        for name, kind in _TRACK_FIELDS:
+            v = track.get(name)
+            if kind == "s" and isinstance(v, str):
+                columns[f"track.{name}"].append(ref(v))
+                continue
+            if kind == "i" and isinstance(v, int) and not isinstance(v, bool):
+                columns[f"track.{name}"].append(v)
+                continue
+            if v is not None:
+                extra[name] = v
+            columns[f"track.{name}"].append(-1 if kind == "s" else _MISSING_INT)
+        columns["track.extra"].append(ref(json.dumps(extra)) if extra else -1)
+
+        columns["track.pos_start"].append(n_pos)
+        for pos in track.get("positions", []):
+            extra = {k: v for k, v in pos.items() if k not in pos_known}
+            d = pos.get("date")
+            if d is not None and not isinstance(d, str):
+                extra["date"] = d
+            columns["pos.date"].append(ref(d) if isinstance(d, str) else -1)
+            for name in _POSITION_FIELDS:
+                v = pos.get(name)
+                if isinstance(v, (int, float)) and not isinstance(v, bool) and not math.isnan(v):
+                    columns[f"pos.{name}"].append(v)
+                    if not isinstance(v, int):
+                        non_int.add(name)
+                    continue
+                if v is not None:
+                    extra[name] = v
+                columns[f"pos.{name}"].append(math.nan)
+            columns["pos.extra"].append(ref(json.dumps(extra)) if extra else -1)
+            n_pos += 1
+        columns["track.pos_stop"].append(n_pos)
+
+    # Derived tables, so loading the cache skips rebuilding them
+    derived = (
+        ("seg", _build_segment_table(tracks)),
+        ("grid", _build_position_grid(tracks)),
+        ("dates", _build_date_index(tracks)),
+    )
+    for prefix, table in derived:
+        for name in _table_arrays(table):
+            columns[f"{prefix}.{name}"] = getattr(table, name)
+    grid = derived[1][1]
+    assert isinstance(grid, _PositionGrid)
+    columns["grid.cell_lat"] = array("i", (k[0] for k in grid.cells))
+    columns["grid.cell_lon"] = array("i", (k[1] for k in grid.cells))
+    columns["grid.cell_start"] = array("i", (v[0] for v in grid.cells.values()))
+    columns["grid.cell_stop"] = array("i", (v[1] for v in grid.cells.values()))
+    dates = derived[2][1]
+    assert isinstance(dates, _DateIndex)
+    columns["dates.day"] = array("i", dates.days)
+    columns["dates.day_start"] = array("i", (v[0] for v in dates.days.values()))
+    columns["dates.day_stop"] = array("i", (v[1] for v in dates.days.values()))
+
+    # Fields no position carries are left out of the file entirely
+    for name in _POSITION_FIELDS:
+        if all(math.isnan(v) for v in columns[f"pos.{name}"]):
+            del columns[f"pos.{name}"]
+
+    meta = {
+        "metadata": {k: v for k, v in data.items() if k != "tracks"},
+        "int_fields": [name for name in _POSITION_FIELDS if name not in non_int],
+    }
+    return columns, strings, meta
+
+
+def _tracks_from_cache(
+    cache: MappedCache,
+) -> tuple[list[dict[str, Any]], dict[str, Any], _SegmentTable, _PositionGrid, _DateIndex]:
+    """Rebuild track dicts and the derived tables from an open cache.
+
+    Returns (tracks, metadata, segments, grid, dates). Track positions are
+    ``_MappedPositions`` views; all numeric columns stay in the mapping.
+    """
+    strings = cache.strings
+    cols = _PositionColumns(cache)
+    field_cols = [(name, kind, cache.column(f"track.{name}")) for name, kind in _TRACK_FIELDS]
+    extra = cache.column("track.extra")
+    starts, stops = cache.column("track.pos_start"), cache.column("track.pos_stop")
+
+    tracks: list[dict[str, Any]] = []
+    for t, voyage_id in enumerate(cache.column("track.voyage_id")):
+        track: dict[str, Any] = {"voyage_id": voyage_id}
+        for name, kind, col in field_cols:
+            v = col[t]
+            if kind == "s" and v >= 0:
+                track[name] = strings[v]
+            elif kind == "i" and v != _MISSING_INT:
+                track[name] = v
+        if extra[t] >= 0:
+            track.update(json.loads(strings[extra[t]]))
+        track["positions"] = _MappedPositions(cols, starts[t], stops[t])
+        tracks.append(track)
+
+    seg, grid, dates = _SegmentTable(), _PositionGrid(), _DateIndex()
+    for prefix, table in (("seg", seg), ("grid", grid), ("dates", dates)):
+        for name in _table_arrays(table):
+            setattr(table, name, cache.column(f"{prefix}.{name}"))
+    seg.voyage_id = [t["voyage_id"] for t in tracks]
+    seg.nationality = [t.get("nationality") for t in tracks]
+    grid.cells = {
+        (ci, cj): (start, stop)
+        for ci, cj, start, stop in zip(
+            cache.column("grid.cell_lat"),
+            cache.column("grid.cell_lon"),
+            cache.column("grid.cell_start"),
+            cache.column("grid.cell_stop"),
+        )
+    }
+    dates.days = {
+        day: (start, stop)
+        for day, start, stop in zip(
+            cache.column("dates.day"),
+            cache.column("dates.day_start"),
+            cache.column("dates.day_stop"),
+        )
+    }
+    return tracks, cache.meta.get("metadata", {}), seg, grid, dates
+
+
+def build_track_cache(data_dir: Path | None = None) -> Path:
+    """Compile ``cliwoc_tracks.json`` into the memory-mapped cache beside it.
 
+    The cache records the JSON's SHA-256; ``_load_tracks`` ignores it once
+    the JSON changes, falling back to the JSON until the cache is rebuilt.
+
+    Returns:
+        Path of the written cache file.
+    """
+    base = data_dir or _DEFAULT_DATA_DIR
+    path = base / "cliwoc_tracks.json"
     with open(path) as f:
         data = json.load(f)
+    columns, strings, meta = _compile_track_cache(data)
+    cache_path = base / _CACHE_FILENAME
+    write_columnar_cache(
+        cache_path,
+        source_sha256=file_sha256(path),
+        layout=_CACHE_LAYOUT,
+        columns=columns,
+        strings=strings,
+        meta=meta,
+    )
+    return cache_path
+
+
+# ---------------------------------------------------------------------------
+# Data loading
+# ---------------------------------------------------------------------------
+
+
+def _load_tracks(data_dir: Path | None = None) -> None:
+    """Load CLIWOC track data, from the compiled cache when it is current.
 
-    _TRACKS = data.get("tracks", [])
-    _TRACK_INDEX = {t["voyage_id"]: t for t in _TRACKS}
-    _METADATA = {k: v for k, v in data.items() if k != "tracks"}
-
-    # Build optional indexes (only populated when CLIWOC 2.1 Full data is present)
-    for t in _TRACKS:
-        das_num = t.get("das_number")
-        if das_num:
-            _DAS_INDEX[str(das_num)] = t
-        ship = t.get("ship_name")
-        if ship:
-            key = ship.upper()
-            if key not in _SHIP_NAME_INDEX:
-                _SHIP_NAME_INDEX[key] = []
-            _SHIP_NAME_INDEX[key].append(t)
+    The cache (built by ``scripts/build_track_cache.py``) is memory-mapped
+    and used if its source hash matches ``cliwoc_tracks.json`` -- or if the
+    JSON is absent. Otherwise the JSON is parsed and the tables rebuilt.
+
+    Safe to call from any thread: concurrent callers wait for the first
+    load, and ``_TRACKS`` is filled last, so a non-empty ``_TRACKS`` means
+    every index and table is ready.
+    """
+    global _SEGMENTS, _GRID, _DATES
+    if _TRACKS:
+        return
+    with _LOAD_LOCK:
+        if _TRACKS:
+            return
+
+        base = data_dir or _DEFAULT_DATA_DIR
+        path = base / "cliwoc_tracks.json"
+        source_hash = file_sha256(path) if path.exists() else None
+        cache = open_columnar_cache(base / _CACHE_FILENAME, source_hash, _CACHE_LAYOUT)
+        if cache is not None:
+            tracks, metadata, _SEGMENTS, _GRID, _DATES = _tracks_from_cache(cache)
+            path = cache.path
+        elif source_hash is None:
+            logger.warning("CLIWOC tracks not found: %s (run scripts/download_cliwoc.py)", path)
+            return
+        else:
+            with open(path) as f:
+                data = json.load(f)
+            tracks = data.get("tracks", [])
+            metadata = {k: v for k, v in data.items() if k != "tracks"}
+            _SEGMENTS = _build_segment_table(tracks)
+            _GRID = _build_position_grid(tracks)
+            _DATES = _build_date_index(tracks)
+
+        _METADATA.update(metadata)
+        _TRACK_INDEX.update((t["voyage_id"], t) for t in tracks)
+
+        # Build optional indexes (only populated when CLIWOC 2.1 Full data is present)
+        for t in tracks:
+            das_num = t.get("das_number")
+            if das_num:
+                _DAS_INDEX[str(das_num)] = t
+            ship = t.get("ship_name")
+            if ship:
+                key = ship.upper()
+                if key not in _SHIP_NAME_INDEX:
+                    _SHIP_NAME_INDEX[key] = []
+                _SHIP_NAME_INDEX[key].append(t)
+
+        _TRACKS.extend(tracks)
 
     logger.info(
-        "Loaded %d CLIWOC tracks (%d positions) from %s",
+        "Loaded %d CLIWOC tracks (%d positions, %d segments, %d grid cells) from %s",
         len(_TRACKS),
         _METADATA.get("total_positions", 0),
+        len(_SEGMENTS),
+        len(_GRID.cells),
         path.name,
     )
 
@@ -116,7 +673,13 @@ def search_tracks(
     has_bbox = any(v is not None for v in (lat_min, lat_max, lon_min, lon_max))
     results = []
 
-    for track in _TRACKS:
+    # Only tracks with a position in the bbox need the remaining checks
+    candidates: Iterable[int] = range(len(_TRACKS))
+    if has_bbox:
+        candidates = sorted(_grid_tracks_in_bbox(lat_min, lat_max, lon_min, lon_max))
+
+    for t in candidates:
+        track = _TRACKS[t]
         if nationality and track.get("nationality") != nationality.upper():
             continue
         if year_start and (track.get("year_start") or 9999) < year_start:
@@ -127,8 +690,6 @@ def search_tracks(
             track_ship = track.get("ship_name", "")
             if not track_ship or ship_name.upper() not in track_ship.upper():
                 continue
-        if has_bbox and not _track_in_bbox(track, lat_min, lat_max, lon_min, lon_max):
-            continue
         # Return summary without positions
         results.append(_track_summary(track))
         if len(results) >= max_results:
@@ -148,7 +709,17 @@ def get_track(voyage_id: int) -> dict[str, Any] | None:
         Full track dict with positions, or None if not found.
     """
     _load_tracks()
-    return _TRACK_INDEX.get(voyage_id)
+    track = _TRACK_INDEX.get(voyage_id)
+    if track is not None and isinstance(track["positions"], _MappedPositions):
+        return {**track, "positions": list(track["positions"])}
+    return track
+
+
+def get_track_summary(voyage_id: int) -> dict[str, Any] | None:
+    """Track metadata of a CLIWOC voyage without its positions, or None if not found."""
+    _load_tracks()
+    track = _TRACK_INDEX.get(voyage_id)
+    return _track_summary(track) if track is not None else None
 
 
 def nearby_tracks(
@@ -157,12 +728,14 @@ def nearby_tracks(
     date: str,
     radius_km: float = 200.0,
     max_results: int = 20,
+    days_window: int = 0,
 ) -> list[dict[str, Any]]:
     """
     Find ships near a given position on a given date.
 
-    Searches all CLIWOC positions for the specified date and returns
-    tracks with positions within the given radius.
+    Looks up the CLIWOC positions logged on the specified date (or within
+    ``days_window`` days of it) and returns tracks with positions within
+    the given radius.
 
     Args:
         lat: Latitude of search point
@@ -170,39 +743,62 @@ def nearby_tracks(
         date: Date to search (YYYY-MM-DD)
         radius_km: Search radius in kilometres (default: 200)
         max_results: Maximum results (default: 20)
+        days_window: Also match positions up to this many days before or
+            after ``date`` (default: 0, exact date only)
 
     Returns:
         List of dicts with track summary + distance_km + matching position.
+        Each track appears once, matched by its position closest in time
+        (earliest logged on ties) that lies within the radius.
     """
     _load_tracks()
-    hits: list[dict[str, Any]] = []
-
-    for track in _TRACKS:
-        # Quick date range filter (normalize for consistent comparison)
-        start = _normalize_date(track.get("start_date"))
-        end = _normalize_date(track.get("end_date"))
-        if start and end:
-            if date < start or date > end:
-                continue
+    day = _parse_date(date)
+    if day is None:
+        return []
+    ordinal = day.toordinal()
+
+    # Positions on the requested day(s) in the latitude band around the
+    # point, ordered by track then closeness in time, measured in one batch
+    keyed: list[tuple[int, int, int, int]] = []
+    for row in _date_rows_near(ordinal, max(0, days_window), lat, radius_km):
+        day_ordinal = _DATES.ordinal[row]
+        keyed.append((_DATES.track[row], abs(day_ordinal - ordinal), _DATES.pos[row], day_ordinal))
+    keyed.sort()
+
+    candidates: list[tuple[dict[str, Any], dict[str, Any]]] = []
+    spans: dict[int, tuple[int, int] | None] = {}
+    for t, _, p, day_ordinal in keyed:
+        track = _TRACKS[t]
+        if t not in spans:
+            # Quick date range filter (normalize for consistent comparison)
+            start = _parse_date(_normalize_date(track.get("start_date")) or "")
+            end = _parse_date(_normalize_date(track.get("end_date")) or "")
+            spans[t] = (start.toordinal(), end.toordinal()) if start and end else None
+        span = spans[t]
+        if span is not None and not span[0] <= day_ordinal <= span[1]:
+            continue
+        candidates.append((track, track["positions"][p]))
 
-        # Check each position for this date
-        for pos in track.get("positions", []):
-            if pos.get("date") != date:
-                continue
-            dist = _haversine_km(lat, lon, pos["lat"], pos["lon"])
-            if dist <= radius_km:
-                hits.append(
-                    {
-                        **_track_summary(track),
-                        "distance_km": round(dist, 1),
-                        "matching_position": {
-                            "date": pos["date"],
-                            "lat": pos["lat"],
-                            "lon": pos["lon"],
-                        },
-                    }
-                )
-                break  # one hit per track
+    dists = _haversine_from(
+        lat, lon, [pos["lat"] for _, pos in candidates], [pos["lon"] for _, pos in candidates]
+    )
+    hits: list[dict[str, Any]] = []
+    seen: set[int] = set()
+    for (track, pos), dist in zip(candidates, dists):
+        if dist > radius_km or id(track) in seen:
+            continue
+        seen.add(id(track))  # one hit per track
+        hits.append(
+            {
+                **_track_summary(track),
+                "distance_km": round(dist, 1),
+                "matching_position": {
+                    "date": pos["date"],
+                    "lat": pos["lat"],
+                    "lon": pos["lon"],
+                },
+            }
+        )
 
     # Sort by distance
     hits.sort(key=lambda h: h["distance_km"])
@@ -346,6 +942,62 @@ def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     return R * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
 
 
+def _haversine_legs(
+    lats: Sequence[float | None], lons: Sequence[float | None]
+) -> list[float | None]:
+    """Great-circle distance in km for each consecutive pair of points.
+
+    Batched form of ``_haversine_km`` for a whole track: each point's latitude
+    cosine is computed once and shared by the two legs it belongs to, and the
+    per-pair function call disappears. Returns ``len(lats) - 1`` values,
+    identical to calling ``_haversine_km`` per pair; legs with a missing
+    coordinate are None.
+    """
+    radians, sin, sqrt, atan2 = math.radians, math.sin, math.sqrt, math.atan2
+    d = 2 * 6371.0  # Earth diameter km
+    cos_lat = [None if la is None else math.cos(radians(la)) for la in lats]
+    legs: list[float | None] = []
+    for lat1, lon1, c1, lat2, lon2, c2 in zip(lats, lons, cos_lat, lats[1:], lons[1:], cos_lat[1:]):
+        if c1 is None or c2 is None or lon1 is None or lon2 is None:
+            legs.append(None)
+            continue
+        a = sin(radians(lat2 - lat1) / 2) ** 2 + c1 * c2 * sin(radians(lon2 - lon1) / 2) ** 2
+        legs.append(d * atan2(sqrt(a), sqrt(1 - a)))
+    return legs
+
+
+def _haversine_from(
+    lat: float, lon: float, lats: Sequence[float], lons: Sequence[float]
+) -> list[float]:
+    """Great-circle distance in km from one point to each of many points."""
+    radians, sin, cos, sqrt, atan2 = math.radians, math.sin, math.cos, math.sqrt, math.atan2
+    d = 2 * 6371.0  # Earth diameter km
+    c0 = cos(radians(lat))
+    dists: list[float] = []
+    for lat2, lon2 in zip(lats, lons):
+        a = (
+            sin(radians(lat2 - lat) / 2) ** 2
+            + c0 * cos(radians(lat2)) * sin(radians(lon2 - lon) / 2) ** 2
+        )
+        dists.append(d * atan2(sqrt(a), sqrt(1 - a)))
+    return dists
+
+
+def _leg_speeds(legs: Sequence[float | None], ordinals: Sequence[int | None]) -> list[float | None]:
+    """Convert leg distances to km/day using the date ordinal of each point.
+
+    Returns None for legs without a distance, without both dates, or with a
+    non-positive day gap.
+    """
+    speeds: list[float | None] = []
+    for dist, o1, o2 in zip(legs, ordinals, ordinals[1:]):
+        if dist is None or o1 is None or o2 is None or o2 <= o1:
+            speeds.append(None)
+        else:
+            speeds.append(dist / (o2 - o1))
+    return speeds
+
+
 def _track_in_bbox(
     track: dict[str, Any],
     lat_min: float | None,
@@ -466,38 +1118,32 @@ def _compute_daily_speeds(
         return []
 
     has_bbox = any(v is not None for v in (lat_min, lat_max, lon_min, lon_max))
+    lats = [p.get("lat") for p in positions]
+    lons = [p.get("lon") for p in positions]
+    dates = [_parse_date(p.get("date", "")) for p in positions]
+    km_days = _leg_speeds(
+        _haversine_legs(lats, lons), [d.toordinal() if d else None for d in dates]
+    )
     speeds: list[dict[str, Any]] = []
 
-    for i in range(1, len(positions)):
+    for i, km_day in enumerate(km_days, start=1):
+        # Missing coordinates, unparseable dates or non-positive day gap
+        if km_day is None:
+            continue
+
         p1, p2 = positions[i - 1], positions[i]
 
         # Skip anchored positions (ship not sailing)
         if exclude_anchored and (p1.get("anch") == 1 or p2.get("anch") == 1):
             continue
 
-        lat1, lon1 = p1.get("lat"), p1.get("lon")
-        lat2, lon2 = p2.get("lat"), p2.get("lon")
-        if lat1 is None or lon1 is None or lat2 is None or lon2 is None:
-            continue
-
         # Use midpoint for position filtering
+        lat1, lon1, lat2, lon2 = lats[i - 1], lons[i - 1], lats[i], lons[i]
         mid_lat = (lat1 + lat2) / 2
         mid_lon = (lon1 + lon2) / 2
         if has_bbox and not _pos_in_bbox(mid_lat, mid_lon, lat_min, lat_max, lon_min, lon_max):
             continue
 
-        d1 = _parse_date(p1.get("date", ""))
-        d2 = _parse_date(p2.get("date", ""))
-        if d1 is None or d2 is None:
-            continue
-
-        days = (d2 - d1).days
-        if days <= 0:
-            continue
-
-        dist = _haversine_km(lat1, lon1, lat2, lon2)
-        km_day = dist / days
-
         if km_day < min_speed or km_day > max_speed:
             continue
 
@@ -517,33 +1163,6 @@ def _compute_daily_speeds(
     return speeds
 
 
-def _group_key(obs: dict[str, Any], group_by: str, track: dict[str, Any]) -> str | None:
-    """Compute a group key for an observation."""
-    if group_by == "decade":
-        d = _parse_date(obs["date"])
-        if d is None:
-            return None
-        return str((d.year // 10) * 10)
-    if group_by == "year":
-        d = _parse_date(obs["date"])
-        if d is None:
-            return None
-        return str(d.year)
-    if group_by == "month":
-        d = _parse_date(obs["date"])
-        if d is None:
-            return None
-        return str(d.month)
-    if group_by == "direction":
-        return obs.get("direction")
-    if group_by == "nationality":
-        return track.get("nationality")
-    if group_by == "beaufort":
-        wf = obs.get("wind_force")
-        return str(wf) if wf is not None else None
-    return None
-
-
 def _compute_group_stats(values: list[float]) -> dict[str, Any]:
     """Compute descriptive statistics for a list of speed values."""
     n = len(values)
@@ -576,6 +1195,163 @@ def _compute_group_stats(values: list[float]) -> dict[str, Any]:
     }
 
 
+def _build_segment_table(tracks: list[dict[str, Any]]) -> _SegmentTable:
+    """Build the columnar segment table from loaded tracks.
+
+    Applies the same validity rules as ``_compute_daily_speeds`` (coordinates
+    present, dates parseable, positive day gap) but none of the query-time
+    filters, which become masks over the table columns.
+    """
+    seg = _SegmentTable()
+    for ti, track in enumerate(tracks):
+        seg.voyage_id.append(track["voyage_id"])
+        seg.nationality.append(track.get("nationality"))
+        seg.year_start.append(track.get("year_start") or 9999)
+        seg.year_end.append(track.get("year_end") or 0)
+
+        positions = track.get("positions", [])
+        if len(positions) < 2:
+            continue
+        lats = [p.get("lat") for p in positions]
+        lons = [p.get("lon") for p in positions]
+        dates = [_parse_date(p.get("date", "")) for p in positions]
+        km_days = _leg_speeds(
+            _haversine_legs(lats, lons), [d.toordinal() if d else None for d in dates]
+        )
+        for pi, km_day in enumerate(km_days, start=1):
+            if km_day is None:
+                continue
+            p1, pos, cur_date = positions[pi - 1], positions[pi], dates[pi]
+            lon1, lon2 = lons[pi - 1], lons[pi]
+            wf = pos.get("wf")
+            wd = pos.get("wd")
+            sector = _wind_dir_to_sector(wd) if wd is not None else None
+
+            seg.track.append(ti)
+            seg.pos.append(pi)
+            seg.mid_lat.append((lats[pi - 1] + lats[pi]) / 2)
+            seg.mid_lon.append((lon1 + lon2) / 2)
+            seg.ordinal.append(cur_date.toordinal())
+            seg.year.append(cur_date.year)
+            seg.month.append(cur_date.month)
+            seg.km_day.append(round(km_day, 1))
+            seg.raw_km_day.append(km_day)
+            seg.eastbound.append(_infer_direction(lon1, lon2) == "eastbound")
+            seg.wind_force.append(int(wf) if wf is not None else -1)
+            seg.wind_dir.append(int(wd) if wd is not None else -1)
+            seg.wind_sector.append(_COMPASS_SECTORS.index(sector) if sector else -1)
+            seg.anchored.append(p1.get("anch") == 1 or pos.get("anch") == 1)
+            seg.logged_dist.append(pos.get("dist") or 0.0)
+    return seg
+
+
+def _select_segments(
+    lat_min: float | None = None,
+    lat_max: float | None = None,
+    lon_min: float | None = None,
+    lon_max: float | None = None,
+    nationality: str | None = None,
+    year_start: int | None = None,
+    year_end: int | None = None,
+    direction: str | None = None,
+    month_start: int | None = None,
+    month_end: int | None = None,
+    min_speed: float = 5.0,
+    max_speed: float = 400.0,
+    wind_force_min: int | None = None,
+    wind_force_max: int | None = None,
+    years: frozenset[int] | None = None,
+) -> list[int]:
+    """Return segment-table row numbers matching the analytic filters.
+
+    Track-level filters (nationality, year range, and -- when ``years`` is
+    given -- overlap with the period) are evaluated once per track; the
+    remaining filters are successive masks over the selected rows. Row order
+    matches iterating ``_TRACKS`` and calling ``_compute_daily_speeds``.
+    """
+    seg = _SEGMENTS
+    if years is not None and not years:
+        return []
+    if direction and direction not in ("eastbound", "westbound"):
+        return []
+
+    nat = nationality.upper() if nationality else None
+    yr_min = min(years) if years else None
+    yr_max = max(years) if years else None
+    track_ok = [
+        (not nat or n == nat)
+        and not (year_start and ys < year_start)
+        and not (year_end and ye > year_end)
+        and not (yr_max is not None and ys > yr_max)
+        and not (yr_min is not None and ye < yr_min)
+        for n, ys, ye in zip(seg.nationality, seg.year_start, seg.year_end)
+    ]
+    if not any(track_ok):
+        return []
+
+    rows = [
+        i
+        for i, t, anch, k in zip(count(), seg.track, seg.anchored, seg.raw_km_day)
+        if track_ok[t] and not anch and min_speed <= k <= max_speed
+    ]
+
+    # Bounding box on the segment midpoint
+    mid_lat, mid_lon = seg.mid_lat, seg.mid_lon
+    if lat_min is not None:
+        rows = [i for i in rows if mid_lat[i] >= lat_min]
+    if lat_max is not None:
+        rows = [i for i in rows if mid_lat[i] <= lat_max]
+    if lon_min is not None:
+        rows = [i for i in rows if mid_lon[i] >= lon_min]
+    if lon_max is not None:
+        rows = [i for i in rows if mid_lon[i] <= lon_max]
+
+    if direction:
+        east, want = seg.eastbound, direction == "eastbound"
+        rows = [i for i in rows if east[i] == want]
+    if years is not None:
+        year = seg.year
+        rows = [i for i in rows if year[i] in years]
+    if month_start is not None or month_end is not None:
+        month_ok = [False] + [_month_in_range(m, month_start, month_end) for m in range(1, 13)]
+        month = seg.month
+        rows = [i for i in rows if month_ok[month[i]]]
+    if wind_force_min is not None or wind_force_max is not None:
+        lo = wind_force_min if wind_force_min is not None else 0
+        hi = wind_force_max if wind_force_max is not None else 127
+        wf = seg.wind_force
+        rows = [i for i in rows if wf[i] >= 0 and lo <= wf[i] <= hi]
+    return rows
+
+
+def _segment_direction(row: int) -> str:
+    """Return the sailing direction label for a segment row."""
+    return "eastbound" if _SEGMENTS.eastbound[row] else "westbound"
+
+
+def _segment_group_keys(rows: list[int], group_by: str) -> list[str | None]:
+    """Compute the group key for each segment row (None = ungrouped)."""
+    seg = _SEGMENTS
+    if group_by in ("decade", "year"):
+        year = seg.year
+        labels = {y: str((y // 10) * 10 if group_by == "decade" else y) for y in set(year)}
+        return [labels[year[i]] for i in rows]
+    if group_by == "month":
+        month = seg.month
+        month_labels = [str(m) for m in range(13)]
+        return [month_labels[month[i]] for i in rows]
+    if group_by == "direction":
+        east = seg.eastbound
+        return ["eastbound" if east[i] else "westbound" for i in rows]
+    if group_by == "nationality":
+        track, nat = seg.track, seg.nationality
+        return [nat[track[i]] for i in rows]
+    if group_by == "beaufort":
+        wf = seg.wind_force
+        return [str(wf[i]) if wf[i] >= 0 else None for i in rows]
+    return [None] * len(rows)
+
+
 # ---------------------------------------------------------------------------
 # Track Analytics — Public API
 # ---------------------------------------------------------------------------
@@ -659,53 +1435,34 @@ def aggregate_track_speeds(
     voyage_ids: set[int] = set()
     total_obs = 0
 
-    for track in _TRACKS:
-        # Apply track-level filters
-        if nationality and track.get("nationality") != nationality.upper():
-            continue
-        if year_start and (track.get("year_start") or 9999) < year_start:
-            continue
-        if year_end and (track.get("year_end") or 0) > year_end:
-            continue
-
-        speeds = _compute_daily_speeds(
-            track, lat_min, lat_max, lon_min, lon_max, min_speed, max_speed
-        )
-        if not speeds:
+    seg = _SEGMENTS
+    rows = _select_segments(
+        lat_min,
+        lat_max,
+        lon_min,
+        lon_max,
+        nationality=nationality,
+        year_start=year_start,
+        year_end=year_end,
+        direction=direction,
+        month_start=month_start,
+        month_end=month_end,
+        min_speed=min_speed,
+        max_speed=max_speed,
+        wind_force_min=wind_force_min,
+        wind_force_max=wind_force_max,
+    )
+    km_day, track, vids = seg.km_day, seg.track, seg.voyage_id
+    for i, key in zip(rows, _segment_group_keys(rows, group_by)):
+        if key is None:
             continue
-
-        vid = track["voyage_id"]
-        for obs in speeds:
-            # Apply direction filter
-            if direction and obs.get("direction") != direction:
-                continue
-
-            # Apply month filter
-            if month_start is not None or month_end is not None:
-                d = _parse_date(obs["date"])
-                if d is None or not _month_in_range(d.month, month_start, month_end):
-                    continue
-
-            # Apply wind force filter
-            if wind_force_min is not None or wind_force_max is not None:
-                wf = obs.get("wind_force")
-                if wf is None:
-                    continue
-                if wind_force_min is not None and wf < wind_force_min:
-                    continue
-                if wind_force_max is not None and wf > wind_force_max:
-                    continue
-
-            key = _group_key(obs, group_by, track)
-            if key is None:
-                continue
-
-            if voyage_level:
-                voyage_groups[(vid, key)].append(obs["km_day"])
-            else:
-                groups[key].append(obs["km_day"])
-            voyage_ids.add(vid)
-            total_obs += 1
+        vid = vids[track[i]]
+        if voyage_level:
+            voyage_groups[(vid, key)].append(km_day[i])
+        else:
+            groups[key].append(km_day[i])
+        voyage_ids.add(vid)
+        total_obs += 1
 
     # Reduce voyage-level groups to one mean per voyage per group
     if voyage_level:
@@ -786,47 +1543,30 @@ def compare_speed_groups(
         y2_set = y2_set - excl
 
     def _collect_speeds(years: frozenset[int]) -> list[float]:
-        values: list[float] = []
-        if not years:
-            return values
-        yr_min, yr_max = min(years), max(years)
+        rows = _select_segments(
+            lat_min,
+            lat_max,
+            lon_min,
+            lon_max,
+            nationality=nationality,
+            direction=direction,
+            month_start=month_start,
+            month_end=month_end,
+            min_speed=min_speed,
+            max_speed=max_speed,
+            wind_force_min=wind_force_min,
+            wind_force_max=wind_force_max,
+            years=years,
+        )
+        km_day = _SEGMENTS.km_day
+        if not voyage_level:
+            return [km_day[i] for i in rows]
         # For voyage-level: collect per-voyage, then reduce to means
+        track, vids = _SEGMENTS.track, _SEGMENTS.voyage_id
         per_voyage: dict[int, list[float]] = defaultdict(list)
-        for track in _TRACKS:
-            if nationality and track.get("nationality") != nationality.upper():
-                continue
-            t_start = track.get("year_start") or 9999
-            t_end = track.get("year_end") or 0
-            if t_start > yr_max or t_end < yr_min:
-                continue
-
-            speeds = _compute_daily_speeds(
-                track, lat_min, lat_max, lon_min, lon_max, min_speed, max_speed
-            )
-            for obs in speeds:
-                if direction and obs.get("direction") != direction:
-                    continue
-                d = _parse_date(obs["date"])
-                if d and d.year in years:
-                    if month_start is not None or month_end is not None:
-                        if not _month_in_range(d.month, month_start, month_end):
-                            continue
-                    if wind_force_min is not None or wind_force_max is not None:
-                        wf = obs.get("wind_force")
-                        if wf is None:
-                            continue
-                        if wind_force_min is not None and wf < wind_force_min:
-                            continue
-                        if wind_force_max is not None and wf > wind_force_max:
-                            continue
-                    if voyage_level:
-                        per_voyage[track["voyage_id"]].append(obs["km_day"])
-                    else:
-                        values.append(obs["km_day"])
-        if voyage_level:
-            for voy_speeds in per_voyage.values():
-                values.append(statistics.mean(voy_speeds))
-        return values
+        for i in rows:
+            per_voyage[vids[track[i]]].append(km_day[i])
+        return [statistics.mean(voy_speeds) for voy_speeds in per_voyage.values()]
 
     g1 = _collect_speeds(y1_set)
     g2 = _collect_speeds(y2_set)
@@ -870,6 +1610,157 @@ def compare_speed_groups(
     return result
 
 
+# ---------------------------------------------------------------------------
+# Bootstrap engine
+# ---------------------------------------------------------------------------
+
+# Replicates are drawn in fixed-size blocks, each from its own seeded stream,
+# so results depend only on the seed -- never on how blocks are shared out
+# between workers.
+_BOOTSTRAP_BLOCK = 500
+
+# Upper bound on resampled values materialised per draw; larger samples are
+# drawn a few rows at a time from the same stream.
+_BOOTSTRAP_MAX_CELLS = 1 << 20
+
+# Random bytes drawn at a time for the resample indices of small samples.
+_BOOTSTRAP_BYTES = 1 << 16
+
+
+def _bootstrap_workers_from_env() -> int:
+    """Default bootstrap worker count from ``MARITIME_BOOTSTRAP_WORKERS``."""
+    try:
+        return max(1, int(os.environ.get(EnvVar.BOOTSTRAP_WORKERS, "1")))
+    except ValueError:
+        return 1
+
+
+def _resampler(rng: random.Random, xs: Sequence[float]) -> Callable[[int], Sequence[float]]:
+    """Function drawing the next ``n`` values resampled from ``xs`` with ``rng``.
+
+    Samples of up to 256 values draw their indices in bulk as random bytes,
+    ``_BOOTSTRAP_BYTES`` at a time: ``bytes.translate`` maps each byte to
+    ``byte % len(xs)`` and deletes those at or above the largest multiple
+    of ``len(xs)`` (rejection sampling, so every index is equally likely),
+    and ``itemgetter`` gathers the values -- no Python code runs per draw.
+    Larger samples, whose indices do not fit in a byte, draw with
+    ``rng.choices``. Either way the values depend only on ``rng``'s state,
+    not on how the draws are split into calls.
+    """
+    k = len(xs)
+    if k > 256:
+        return lambda n: rng.choices(xs, k=n)
+
+    table = bytes(b % k for b in range(256))
+    reject = bytes(range(256 // k * k, 256))
+    pending = b""
+
+    def draw(n: int) -> Sequence[float]:
+        nonlocal pending
+        chunks = [pending]
+        drawn = len(pending)
+        while drawn < n:
+            chunks.append(rng.randbytes(_BOOTSTRAP_BYTES).translate(table, reject))
+            drawn += len(chunks[-1])
+        indices = b"".join(chunks)
+        pending = indices[n:]
+        if n == 1:
+            return [xs[indices[0]]]
+        return itemgetter(*indices[:n])(xs)
+
+    return draw
+
+
+def _bootstrap_block_means(
+    samples: Sequence[Sequence[float]],
+    seed: int,
+    first_block: int,
+    last_block: int,
+    n_bootstrap: int,
+) -> list[list[float]]:
+    """Resample means for blocks ``first_block``..``last_block - 1``.
+
+    Block ``b`` holds replicates ``b * _BOOTSTRAP_BLOCK`` onwards (the last
+    block is cut short at ``n_bootstrap``) and draws from
+    ``random.Random(f"{seed}:{b}")``. Within a block each sample, in
+    argument order, is resampled as one row-major ``rows x len(sample)``
+    matrix (see ``_resampler``) which is then summed row by row.
+    """
+    means: list[list[float]] = [[] for _ in samples]
+    for block in range(first_block, last_block):
+        rows = min(_BOOTSTRAP_BLOCK, n_bootstrap - block * _BOOTSTRAP_BLOCK)
+        rng = random.Random(f"{seed}:{block}")
+        for xs, out in zip(samples, means):
+            k = len(xs)
+            draw = _resampler(rng, xs)
+            step = max(1, _BOOTSTRAP_MAX_CELLS // k)
+            for start in range(0, rows, step):
+                n_rows = min(step, rows - start)
+                draws = draw(n_rows * k)
+                out.extend([sum(draws[r * k : (r + 1) * k]) / k for r in range(n_rows)])
+    return means
+
+
+def _bootstrap_means(
+    samples: Sequence[Sequence[float]],
+    n_bootstrap: int,
+    seed: int,
+    workers: int | None = None,
+) -> list[list[float]]:
+    """Bootstrap distribution of the mean for each of ``samples``.
+
+    Returns one list of ``n_bootstrap`` resample means per sample. Resamples
+    for the same replicate index are drawn together, so combining the lists
+    element-wise gives paired replicates of any statistic of the means.
+
+    Args:
+        samples: Non-empty samples to resample with replacement
+        n_bootstrap: Number of bootstrap replicates
+        seed: Random seed; see ``_bootstrap_block_means`` for the stream
+        workers: Processes to split the blocks across. ``None`` reads
+            ``MARITIME_BOOTSTRAP_WORKERS`` (default 1, in-process). The
+            result is identical for every worker count.
+    """
+    n_blocks = -(-n_bootstrap // _BOOTSTRAP_BLOCK)
+    if workers is None:
+        workers = _bootstrap_workers_from_env()
+    workers = min(workers, n_blocks)
+    if workers <= 1:
+        return _bootstrap_block_means(samples, seed, 0, n_blocks, n_bootstrap)
+
+    bounds = [n_blocks * w // workers for w in range(workers + 1)]
+    means: list[list[float]] = [[] for _ in samples]
+    # Spawned, not forked: the server process runs threads a fork would copy mid-state
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = [
+            pool.submit(_bootstrap_block_means, samples, seed, lo, hi, n_bootstrap)
+            for lo, hi in pairwise(bounds)
+        ]
+        for future in futures:
+            for out, part in zip(means, future.result()):
+                out.extend(part)
+    return means
+
+
+def _bootstrap_ci_p(boot: list[float], n_bootstrap: int) -> tuple[float, float, float]:
+    """95% percentile CI and two-tailed p-value (against 0) of a bootstrap.
+
+    Returns (ci_lower, ci_upper, p_value).
+    """
+    boot.sort()
+    ci_lower = boot[max(0, int(0.025 * n_bootstrap) - 1)]
+    ci_upper = boot[min(n_bootstrap - 1, int(0.975 * n_bootstrap))]
+
+    n_le_zero = sum(1 for d in boot if d <= 0)
+    n_ge_zero = sum(1 for d in boot if d >= 0)
+    p_value = 2 * min(n_le_zero, n_ge_zero) / n_bootstrap
+    p_value = min(p_value, 1.0)
+    if p_value == 0.0:
+        p_value = 1.0 / n_bootstrap  # minimum reportable p
+    return ci_lower, ci_upper, p_value
+
+
 def _bootstrap_did(
     pre_east: list[float],
     pre_west: list[float],
@@ -877,6 +1768,7 @@ def _bootstrap_did(
     post_west: list[float],
     n_bootstrap: int = 10000,
     seed: int = 42,
+    workers: int | None = None,
 ) -> tuple[float, float, float, float]:
     """Bootstrap Difference-in-Differences with CI and p-value.
 
@@ -890,27 +1782,11 @@ def _bootstrap_did(
 
     did = (_mean(post_east) - _mean(pre_east)) - (_mean(post_west) - _mean(pre_west))
 
-    rng = random.Random(seed)
-    boot_dids: list[float] = []
-    for _ in range(n_bootstrap):
-        pe = rng.choices(pre_east, k=len(pre_east))
-        pw = rng.choices(pre_west, k=len(pre_west))
-        oe = rng.choices(post_east, k=len(post_east))
-        ow = rng.choices(post_west, k=len(post_west))
-        boot_did = (_mean(oe) - _mean(pe)) - (_mean(ow) - _mean(pw))
-        boot_dids.append(boot_did)
-
-    boot_dids.sort()
-    ci_lower = boot_dids[max(0, int(0.025 * n_bootstrap) - 1)]
-    ci_upper = boot_dids[min(n_bootstrap - 1, int(0.975 * n_bootstrap))]
-
-    # Two-tailed p-value
-    n_le_zero = sum(1 for d in boot_dids if d <= 0)
-    n_ge_zero = sum(1 for d in boot_dids if d >= 0)
-    p_value = 2 * min(n_le_zero, n_ge_zero) / n_bootstrap
-    p_value = min(p_value, 1.0)
-    if p_value == 0.0:
-        p_value = 1.0 / n_bootstrap  # minimum reportable p
+    pe, pw, oe, ow = _bootstrap_means(
+        [pre_east, pre_west, post_east, post_west], n_bootstrap, seed, workers
+    )
+    boot_dids = [(c - a) - (d - b) for a, b, c, d in zip(pe, pw, oe, ow)]
+    ci_lower, ci_upper, p_value = _bootstrap_ci_p(boot_dids, n_bootstrap)
 
     return did, ci_lower, ci_upper, p_value
 
@@ -933,6 +1809,7 @@ def did_speed_test(
     wind_force_min: int | None = None,
     wind_force_max: int | None = None,
     exclude_years: str | None = None,
+    workers: int | None = None,
 ) -> dict[str, Any]:
     """Formal 2×2 Difference-in-Differences test: direction × period.
 
@@ -959,6 +1836,8 @@ def did_speed_test(
         min_speed/max_speed: Speed bounds in km/day
         exclude_years: Years to exclude from both periods, as "YYYY/YYYY"
             range or "YYYY,YYYY,..." list.
+        workers: Processes for the bootstrap (default: MARITIME_BOOTSTRAP_WORKERS
+            or 1). Does not change the result.
 
     Returns:
         Dict with 4-cell summary, marginal diffs, DiD estimate,
@@ -976,58 +1855,34 @@ def did_speed_test(
 
     def _collect_by_direction(years: frozenset[int]) -> tuple[list[float], list[float]]:
         """Collect speeds split by direction for a time period."""
-        east_obs: list[float] = []
-        west_obs: list[float] = []
-        if not years:
+        rows = _select_segments(
+            lat_min,
+            lat_max,
+            lon_min,
+            lon_max,
+            nationality=nationality,
+            month_start=month_start,
+            month_end=month_end,
+            min_speed=min_speed,
+            max_speed=max_speed,
+            wind_force_min=wind_force_min,
+            wind_force_max=wind_force_max,
+            years=years,
+        )
+        km_day, east = _SEGMENTS.km_day, _SEGMENTS.eastbound
+        if not voyage_level:
+            east_obs = [km_day[i] for i in rows if east[i]]
+            west_obs = [km_day[i] for i in rows if not east[i]]
             return east_obs, west_obs
+
+        track, vids = _SEGMENTS.track, _SEGMENTS.voyage_id
         east_voy: dict[int, list[float]] = defaultdict(list)
         west_voy: dict[int, list[float]] = defaultdict(list)
-        yr_min, yr_max = min(years), max(years)
-
-        for track in _TRACKS:
-            if nationality and track.get("nationality") != nationality.upper():
-                continue
-            t_start = track.get("year_start") or 9999
-            t_end = track.get("year_end") or 0
-            if t_start > yr_max or t_end < yr_min:
-                continue
-
-            speeds = _compute_daily_speeds(
-                track, lat_min, lat_max, lon_min, lon_max, min_speed, max_speed
-            )
-            vid = track["voyage_id"]
-            for obs in speeds:
-                d = _parse_date(obs["date"])
-                if not d or d.year not in years:
-                    continue
-                if month_start is not None or month_end is not None:
-                    if not _month_in_range(d.month, month_start, month_end):
-                        continue
-                if wind_force_min is not None or wind_force_max is not None:
-                    wf = obs.get("wind_force")
-                    if wf is None:
-                        continue
-                    if wind_force_min is not None and wf < wind_force_min:
-                        continue
-                    if wind_force_max is not None and wf > wind_force_max:
-                        continue
-                direction = obs.get("direction", "")
-                if direction == "eastbound":
-                    if voyage_level:
-                        east_voy[vid].append(obs["km_day"])
-                    else:
-                        east_obs.append(obs["km_day"])
-                elif direction == "westbound":
-                    if voyage_level:
-                        west_voy[vid].append(obs["km_day"])
-                    else:
-                        west_obs.append(obs["km_day"])
-
-        if voyage_level:
-            for voy_speeds in east_voy.values():
-                east_obs.append(statistics.mean(voy_speeds))
-            for voy_speeds in west_voy.values():
-                west_obs.append(statistics.mean(voy_speeds))
+        for i in rows:
+            voy = east_voy if east[i] else west_voy
+            voy[vids[track[i]]].append(km_day[i])
+        east_obs = [statistics.mean(voy_speeds) for voy_speeds in east_voy.values()]
+        west_obs = [statistics.mean(voy_speeds) for voy_speeds in west_voy.values()]
         return east_obs, west_obs
 
     pre_east, pre_west = _collect_by_direction(y1_set)
@@ -1045,7 +1900,7 @@ def did_speed_test(
     west_diff = ow_mean - pw_mean
 
     did_est, ci_lower, ci_upper, p_value = _bootstrap_did(
-        pre_east, pre_west, post_east, post_west, n_bootstrap, seed
+        pre_east, pre_west, post_east, post_west, n_bootstrap, seed, workers
     )
 
     return {
@@ -1135,6 +1990,7 @@ def _bootstrap_mean_diff(
     group2: list[float],
     n_bootstrap: int = 10000,
     seed: int = 42,
+    workers: int | None = None,
 ) -> tuple[float, float, float, float]:
     """Bootstrap difference in means with CI and p-value.
 
@@ -1148,23 +2004,9 @@ def _bootstrap_mean_diff(
 
     diff = _mean(group2) - _mean(group1)
 
-    rng = random.Random(seed)
-    boot_diffs: list[float] = []
-    for _ in range(n_bootstrap):
-        b1 = rng.choices(group1, k=len(group1))
-        b2 = rng.choices(group2, k=len(group2))
-        boot_diffs.append(_mean(b2) - _mean(b1))
-
-    boot_diffs.sort()
-    ci_lower = boot_diffs[max(0, int(0.025 * n_bootstrap) - 1)]
-    ci_upper = boot_diffs[min(n_bootstrap - 1, int(0.975 * n_bootstrap))]
-
-    n_le_zero = sum(1 for d in boot_diffs if d <= 0)
-    n_ge_zero = sum(1 for d in boot_diffs if d >= 0)
-    p_value = 2 * min(n_le_zero, n_ge_zero) / n_bootstrap
-    p_value = min(p_value, 1.0)
-    if p_value == 0.0:
-        p_value = 1.0 / n_bootstrap
+    b1, b2 = _bootstrap_means([group1, group2], n_bootstrap, seed, workers)
+    boot_diffs = [m2 - m1 for m1, m2 in zip(b1, b2)]
+    ci_lower, ci_upper, p_value = _bootstrap_ci_p(boot_diffs, n_bootstrap)
 
     return diff, ci_lower, ci_upper, p_value
 
@@ -1174,6 +2016,32 @@ def _bootstrap_mean_diff(
 # ---------------------------------------------------------------------------
 
 
+def _path_within_speed_bounds(
+    in_box: list[dict[str, Any]], min_speed: float, max_speed: float
+) -> tuple[float, list[dict[str, Any]]]:
+    """Sum leg distances between consecutive positions within speed bounds.
+
+    Legs with unparseable dates, a non-positive day gap or a km/day outside
+    ``[min_speed, max_speed]`` are skipped. Returns ``(path_km,
+    valid_positions)`` where valid_positions starts with the first position
+    and adds the end point of each accepted leg.
+    """
+    legs = _haversine_legs([p["lat"] for p in in_box], [p["lon"] for p in in_box])
+    ordinals = []
+    for p in in_box:
+        d = _parse_date(p.get("date", ""))
+        ordinals.append(d.toordinal() if d else None)
+
+    path_km = 0.0
+    valid_positions: list[dict[str, Any]] = [in_box[0]]
+    for i, (dist, km_day) in enumerate(zip(legs, _leg_speeds(legs, ordinals)), start=1):
+        if dist is None or km_day is None or km_day < min_speed or km_day > max_speed:
+            continue
+        path_km += dist
+        valid_positions.append(in_box[i])
+    return path_km, valid_positions
+
+
 def compute_track_tortuosity(
     voyage_id: int,
     lat_min: float | None = None,
@@ -1215,23 +2083,7 @@ def compute_track_tortuosity(
         return None
 
     # Compute actual path distance, filtering by speed bounds
-    path_km = 0.0
-    valid_positions: list[dict[str, Any]] = [in_box[0]]
-    for i in range(1, len(in_box)):
-        p1, p2 = in_box[i - 1], in_box[i]
-        d1 = _parse_date(p1.get("date", ""))
-        d2 = _parse_date(p2.get("date", ""))
-        if d1 is None or d2 is None:
-            continue
-        days = (d2 - d1).days
-        if days <= 0:
-            continue
-        dist = _haversine_km(p1["lat"], p1["lon"], p2["lat"], p2["lon"])
-        km_day = dist / days
-        if km_day < min_speed or km_day > max_speed:
-            continue
-        path_km += dist
-        valid_positions.append(p2)
+    path_km, valid_positions = _path_within_speed_bounds(in_box, min_speed, max_speed)
 
     if len(valid_positions) < 2 or path_km <= 0:
         return None
@@ -1290,23 +2142,7 @@ def _compute_voyage_tortuosity(
     if len(in_box) < min_positions:
         return None
 
-    path_km = 0.0
-    valid_positions: list[dict[str, Any]] = [in_box[0]]
-    for i in range(1, len(in_box)):
-        p1, p2 = in_box[i - 1], in_box[i]
-        d1 = _parse_date(p1.get("date", ""))
-        d2 = _parse_date(p2.get("date", ""))
-        if d1 is None or d2 is None:
-            continue
-        days = (d2 - d1).days
-        if days <= 0:
-            continue
-        dist = _haversine_km(p1["lat"], p1["lon"], p2["lat"], p2["lon"])
-        km_day = dist / days
-        if km_day < min_speed or km_day > max_speed:
-            continue
-        path_km += dist
-        valid_positions.append(p2)
+    path_km, valid_positions = _path_within_speed_bounds(in_box, min_speed, max_speed)
 
     if len(valid_positions) < min_positions or path_km <= 0:
         return None
@@ -1405,6 +2241,7 @@ def aggregate_track_tortuosity(
     period2_years: str | None = None,
     n_bootstrap: int = 10000,
     seed: int = 42,
+    workers: int | None = None,
 ) -> dict[str, Any]:
     """Aggregate route tortuosity across matching tracks.
 
@@ -1427,6 +2264,8 @@ def aggregate_track_tortuosity(
             "YYYY/YYYY" range or "YYYY,YYYY,..." year list.
         n_bootstrap: Bootstrap iterations (default: 10000)
         seed: Random seed (default: 42)
+        workers: Processes for the bootstrap (default: MARITIME_BOOTSTRAP_WORKERS
+            or 1). Does not change the result.
 
     Returns:
         Dict with groups, optional comparison, filter metadata.
@@ -1445,7 +2284,14 @@ def aggregate_track_tortuosity(
         p1_set = _parse_period(period1_years)
         p2_set = _parse_period(period2_years)
 
-    for track in _TRACKS:
+    # Tracks without a position in the bbox can never yield a tortuosity
+    in_bbox: set[int] | None = None
+    if any(v is not None for v in (lat_min, lat_max, lon_min, lon_max)):
+        in_bbox = _grid_tracks_in_bbox(lat_min, lat_max, lon_min, lon_max)
+
+    for t, track in enumerate(_TRACKS):
+        if in_bbox is not None and t not in in_bbox:
+            continue
         if nationality and track.get("nationality") != nationality.upper():
             continue
         if year_start and (track.get("year_start") or 9999) < year_start:
@@ -1522,7 +2368,7 @@ def aggregate_track_tortuosity(
     # Period comparison
     if period1_years and period2_years and period1_vals and period2_vals:
         diff, ci_lo, ci_hi, p_val = _bootstrap_mean_diff(
-            period1_vals, period2_vals, n_bootstrap, seed
+            period1_vals, period2_vals, n_bootstrap, seed, workers
         )
         result["comparison"] = {
             "period1_label": period1_years,
@@ -1595,82 +2441,45 @@ def export_speeds(
     _load_tracks()
     voyage_level = aggregate_by == "voyage"
 
-    # Collect all matching records first, then paginate
-    all_records: list[dict[str, Any]] = []
-    voyage_accum: dict[int, dict[str, Any]] = {}
-
-    for track in _TRACKS:
-        if nationality and track.get("nationality") != nationality.upper():
-            continue
-        if year_start and (track.get("year_start") or 9999) < year_start:
-            continue
-        if year_end and (track.get("year_end") or 0) > year_end:
-            continue
-
-        speeds = _compute_daily_speeds(
-            track, lat_min, lat_max, lon_min, lon_max, min_speed, max_speed
-        )
-        if not speeds:
-            continue
-
-        vid = track["voyage_id"]
-        nat = track.get("nationality")
-        ship = track.get("ship_name")
-
-        for obs in speeds:
-            if direction and obs.get("direction") != direction:
-                continue
-
-            d = _parse_date(obs["date"])
-            if d is None:
-                continue
-
-            if month_start is not None or month_end is not None:
-                if not _month_in_range(d.month, month_start, month_end):
-                    continue
-
-            if wind_force_min is not None or wind_force_max is not None:
-                wf = obs.get("wind_force")
-                if wf is None:
-                    continue
-                if wind_force_min is not None and wf < wind_force_min:
-                    continue
-                if wind_force_max is not None and wf > wind_force_max:
-                    continue
-
-            if voyage_level:
-                if vid not in voyage_accum:
-                    voyage_accum[vid] = {
-                        "voyage_id": vid,
-                        "nationality": nat,
-                        "ship_name": ship,
-                        "direction": obs.get("direction"),
-                        "year": d.year,
-                        "speeds": [],
-                        "months": [],
-                    }
-                voyage_accum[vid]["speeds"].append(obs["km_day"])
-                voyage_accum[vid]["months"].append(d.month)
-            else:
-                all_records.append(
-                    {
-                        "voyage_id": vid,
-                        "date": obs["date"],
-                        "year": d.year,
-                        "month": d.month,
-                        "day": d.day,
-                        "direction": obs.get("direction"),
-                        "speed_km_day": obs["km_day"],
-                        "nationality": nat,
-                        "ship_name": ship,
-                        "lat": obs.get("lat"),
-                        "lon": obs.get("lon"),
-                        "wind_force": obs.get("wind_force"),
-                        "wind_direction": obs.get("wind_direction"),
-                    }
-                )
+    seg = _SEGMENTS
+    rows = _select_segments(
+        lat_min,
+        lat_max,
+        lon_min,
+        lon_max,
+        nationality=nationality,
+        year_start=year_start,
+        year_end=year_end,
+        direction=direction,
+        month_start=month_start,
+        month_end=month_end,
+        min_speed=min_speed,
+        max_speed=max_speed,
+        wind_force_min=wind_force_min,
+        wind_force_max=wind_force_max,
+    )
 
     if voyage_level:
+        # One record per voyage: collect all matches, then paginate
+        voyage_accum: dict[int, dict[str, Any]] = {}
+        for i in rows:
+            ti = seg.track[i]
+            vid = seg.voyage_id[ti]
+            if vid not in voyage_accum:
+                track = _TRACKS[ti]
+                voyage_accum[vid] = {
+                    "voyage_id": vid,
+                    "nationality": track.get("nationality"),
+                    "ship_name": track.get("ship_name"),
+                    "direction": _segment_direction(i),
+                    "year": seg.year[i],
+                    "speeds": [],
+                    "months": [],
+                }
+            voyage_accum[vid]["speeds"].append(seg.km_day[i])
+            voyage_accum[vid]["months"].append(seg.month[i])
+
+        all_records: list[dict[str, Any]] = []
         for va in voyage_accum.values():
             spds = va["speeds"]
             months = va["months"]
@@ -1693,10 +2502,34 @@ def export_speeds(
                     "n_observations": len(spds),
                 }
             )
+        total_matching = len(all_records)
+        page = all_records[offset : offset + max_results]
+    else:
+        # Observation-level: only materialise records for the requested page
+        total_matching = len(rows)
+        page = []
+        for i in rows[offset : offset + max_results]:
+            track = _TRACKS[seg.track[i]]
+            pos = track["positions"][seg.pos[i]]
+            d = date.fromordinal(seg.ordinal[i])
+            page.append(
+                {
+                    "voyage_id": track["voyage_id"],
+                    "date": pos.get("date", ""),
+                    "year": d.year,
+                    "month": d.month,
+                    "day": d.day,
+                    "direction": _segment_direction(i),
+                    "speed_km_day": seg.km_day[i],
+                    "nationality": track.get("nationality"),
+                    "ship_name": track.get("ship_name"),
+                    "lat": round(seg.mid_lat[i], 2),
+                    "lon": round(seg.mid_lon[i], 2),
+                    "wind_force": pos.get("wf"),
+                    "wind_direction": pos.get("wd"),
+                }
+            )
 
-    total_matching = len(all_records)
-    # Apply pagination: skip offset, take max_results
-    page = all_records[offset : offset + max_results]
     has_more = (offset + max_results) < total_matching
     next_offset = (offset + max_results) if has_more else None
 
@@ -1778,72 +2611,67 @@ def wind_rose(
         p1_set = _parse_period(period1_years)
         p2_set = _parse_period(period2_years)
 
-    for track in _TRACKS:
-        if nationality and track.get("nationality") != nationality.upper():
-            continue
-        if year_start and (track.get("year_start") or 9999) < year_start:
-            continue
-        if year_end and (track.get("year_end") or 0) > year_end:
-            continue
-
-        speeds = _compute_daily_speeds(
-            track, lat_min, lat_max, lon_min, lon_max, min_speed, max_speed
-        )
-        if not speeds:
-            continue
-
-        for obs in speeds:
-            if direction and obs.get("direction") != direction:
-                continue
-            if month_start is not None or month_end is not None:
-                d = _parse_date(obs["date"])
-                if d is None or not _month_in_range(d.month, month_start, month_end):
-                    continue
-
-            # Collect logged vs haversine distances for calibration
-            # CLIWOC Distance field is in nautical miles; convert to km
-            logged = obs.get("logged_dist")
-            if logged is not None and logged > 0:
-                logged_dists.append(logged * 1.852)  # nm -> km
-                haversine_dists.append(obs["km_day"])
-
-            # Determine observation year for period splitting
-            obs_year: int | None = None
-            has_periods = p1_set is not None and p2_set is not None
-            if has_periods:
-                d = _parse_date(obs["date"])
-                if d:
-                    obs_year = d.year
-
-            # Wind direction (available for ~97% of observations)
-            wd = obs.get("wind_direction")
-            sector = _wind_dir_to_sector(wd) if wd is not None else None
-            if sector is not None:
-                total_with_direction += 1
-                all_dir_counts[sector].append(obs["km_day"])
-                if obs_year is not None and p1_set is not None and p2_set is not None:
-                    if obs_year in p1_set:
-                        p1_dir_counts[sector].append(obs["km_day"])
-                    elif obs_year in p2_set:
-                        p2_dir_counts[sector].append(obs["km_day"])
-            else:
-                total_without_direction += 1
-
-            # Beaufort force (available for ~17% of observations)
-            wf = obs.get("wind_force")
-            if wf is None:
-                total_without_wind += 1
-                continue
-
-            total_with_wind += 1
-            voyage_ids.add(track["voyage_id"])
-            all_counts[wf].append(obs["km_day"])
-
+    seg = _SEGMENTS
+    rows = _select_segments(
+        lat_min,
+        lat_max,
+        lon_min,
+        lon_max,
+        nationality=nationality,
+        year_start=year_start,
+        year_end=year_end,
+        direction=direction,
+        month_start=month_start,
+        month_end=month_end,
+        min_speed=min_speed,
+        max_speed=max_speed,
+    )
+    has_periods = p1_set is not None and p2_set is not None
+    km_day, year, logged_col = seg.km_day, seg.year, seg.logged_dist
+    wind_force, wind_sector = seg.wind_force, seg.wind_sector
+
+    for i in rows:
+        spd = km_day[i]
+
+        # Collect logged vs haversine distances for calibration
+        # CLIWOC Distance field is in nautical miles; convert to km
+        logged = logged_col[i]
+        if logged > 0:
+            logged_dists.append(logged * 1.852)  # nm -> km
+            haversine_dists.append(spd)
+
+        # Observation year for period splitting
+        obs_year = year[i] if has_periods else None
+
+        # Wind direction (available for ~97% of observations)
+        si = wind_sector[i]
+        if si >= 0:
+            sector = _COMPASS_SECTORS[si]
+            total_with_direction += 1
+            all_dir_counts[sector].append(spd)
             if obs_year is not None and p1_set is not None and p2_set is not None:
                 if obs_year in p1_set:
-                    p1_counts[wf].append(obs["km_day"])
+                    p1_dir_counts[sector].append(spd)
                 elif obs_year in p2_set:
-                    p2_counts[wf].append(obs["km_day"])
+                    p2_dir_counts[sector].append(spd)
+        else:
+            total_without_direction += 1
+
+        # Beaufort force (available for ~17% of observations)
+        wf = wind_force[i]
+        if wf < 0:
+            total_without_wind += 1
+            continue
+
+        total_with_wind += 1
+        voyage_ids.add(seg.voyage_id[seg.track[i]])
+        all_counts[wf].append(spd)
+
+        if obs_year is not None and p1_set is not None and p2_set is not None:
+            if obs_year in p1_set:
+                p1_counts[wf].append(spd)
+            elif obs_year in p2_set:
+                p2_counts[wf].append(spd)
 
     has_wind = total_with_wind > 0
     has_direction = total_with_direction > 0
@@ -1976,39 +2804,30 @@ def wind_direction_by_year(
 
     # year -> sector -> [speeds]
     year_data: dict[int, dict[str, list[float]]] = defaultdict(lambda: defaultdict(list))
-    total_obs = 0
     total_with_dir = 0
 
-    for track in _TRACKS:
-        if nationality and track.get("nationality") != nationality.upper():
-            continue
-        if year_start and (track.get("year_start") or 9999) < year_start:
-            continue
-        if year_end and (track.get("year_end") or 0) > year_end:
-            continue
-
-        speeds = _compute_daily_speeds(
-            track, lat_min, lat_max, lon_min, lon_max, min_speed, max_speed
-        )
-        if not speeds:
-            continue
-
-        for obs in speeds:
-            if direction and obs.get("direction") != direction:
-                continue
-            d = _parse_date(obs["date"])
-            if d is None:
-                continue
-            if month_start is not None or month_end is not None:
-                if not _month_in_range(d.month, month_start, month_end):
-                    continue
-
-            total_obs += 1
-            wd = obs.get("wind_direction")
-            sector = _wind_dir_to_sector(wd) if wd is not None else None
-            if sector is not None:
-                total_with_dir += 1
-                year_data[d.year][sector].append(obs["km_day"])
+    seg = _SEGMENTS
+    rows = _select_segments(
+        lat_min,
+        lat_max,
+        lon_min,
+        lon_max,
+        nationality=nationality,
+        year_start=year_start,
+        year_end=year_end,
+        direction=direction,
+        month_start=month_start,
+        month_end=month_end,
+        min_speed=min_speed,
+        max_speed=max_speed,
+    )
+    total_obs = len(rows)
+    km_day, year, wind_sector = seg.km_day, seg.year, seg.wind_sector
+    for i in rows:
+        si = wind_sector[i]
+        if si >= 0:
+            total_with_dir += 1
+            year_data[year[i]][_COMPASS_SECTORS[si]].append(km_day[i])
 
     # Build per-year distributions
     years_list: list[dict[str, Any]] = []
@@ -2051,7 +2870,3 @@ def wind_direction_by_year(
         "month_start_filter": month_start,
         "month_end_filter": month_end,
     }
-
-
-# Load on import
-_load_tracks()
@@ -12,6 +12,7 @@ from __future__ import annotations
 import json
 import logging
 import statistics
+import threading
 from datetime import date
 from pathlib import Path
 from typing import Any
@@ -22,20 +23,24 @@ _DEFAULT_DATA_DIR = Path(__file__).resolve().parent.parent.parent.parent / "data
 
 _GALLEON_VOYAGES: list[dict[str, Any]] = []
 
+_LOAD_LOCK = threading.Lock()
+
 
 def _load_galleon(data_dir: Path | None = None) -> None:
-    """Load galleon voyage data from JSON file."""
-    global _GALLEON_VOYAGES
+    """Load galleon voyage data from JSON file (thread-safe; the first caller loads)."""
     if _GALLEON_VOYAGES:
         return
+    with _LOAD_LOCK:
+        if _GALLEON_VOYAGES:
+            return
 
-    path = (data_dir or _DEFAULT_DATA_DIR) / "galleon_voyages.json"
-    if not path.exists():
-        logger.warning("Galleon data file not found: %s", path)
-        return
+        path = (data_dir or _DEFAULT_DATA_DIR) / "galleon_voyages.json"
+        if not path.exists():
+            logger.warning("Galleon data file not found: %s", path)
+            return
 
-    with open(path) as f:
-        _GALLEON_VOYAGES = json.load(f)
+        with open(path) as f:
+            _GALLEON_VOYAGES.extend(json.load(f))
     logger.info("Loaded %d galleon voyages from %s", len(_GALLEON_VOYAGES), path)
 
 
@@ -154,7 +159,3 @@ def galleon_transit_times(
         "year_end_filter": year_end,
         "fate_filter": fate,
     }
-
-
-# Load on import
-_load_galleon()
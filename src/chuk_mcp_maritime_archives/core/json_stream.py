@@ -0,0 +1,130 @@
+"""
+Incremental reading of large JSON record files.
+
+``json.load`` holds the whole file text, the parse tree and the result in
+memory at once. ``iter_json_records`` instead reads a top-level JSON array
+a chunk at a time and yields its elements one by one, so a caller that
+encodes records as they arrive (``CrewStore``) never holds more than a
+chunk of text. Files named ``*.jsonl`` / ``*.ndjson`` are read as JSON
+Lines, one record per non-blank line.
+"""
+
+from __future__ import annotations
+
+import json
+import json.scanner
+import logging
+import re
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+JSON_LINES_SUFFIXES = (".jsonl", ".ndjson")
+
+_CHUNK_SIZE = 1 << 20  # characters read per refill
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_SEPARATOR = re.compile(r"[ \t\n\r]*,[ \t\n\r]*")
+
+# Parser states: before "[", before the first element (or "]"),
+# before a later element, after an element (expecting "," or "]").
+_START, _FIRST, _NEXT, _AFTER = range(4)
+
+
+def iter_json_records(path: Path | str, chunk_size: int = _CHUNK_SIZE) -> Iterator[Any]:
+    """Yield the elements of a JSON array file (or the lines of a JSON Lines file).
+
+    A ``.json`` file whose top-level value is not an array is logged and
+    yields nothing, as the clients have always treated it. Malformed JSON
+    raises ``json.JSONDecodeError``.
+    """
+    path = Path(path)
+    if path.suffix in JSON_LINES_SUFFIXES:
+        yield from _iter_json_lines(path)
+        return
+
+    scan_once = json.scanner.make_scanner(json.JSONDecoder())
+    with open(path, encoding="utf-8") as f:
+        buf, pos, eof = "", 0, False
+        state = _START
+        while True:
+            pos = _WHITESPACE.match(buf, pos).end()
+            if pos == len(buf):
+                if eof:
+                    raise json.JSONDecodeError("Unterminated array", buf, pos)
+                chunk = f.read(chunk_size)
+                buf, pos, eof = buf[pos:] + chunk, 0, not chunk
+                continue
+
+            char = buf[pos]
+            if state == _START:
+                if char != "[":
+                    logger.warning("Expected list in %s, got a non-array JSON value", path)
+                    return
+                pos += 1
+                state = _FIRST
+                continue
+            if state == _AFTER or (state == _FIRST and char == "]"):
+                if char == "]":
+                    return
+                if char != ",":
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buf, pos)
+                pos += 1
+                state = _NEXT
+                continue
+
+            # Decode elements back to back while "," separators follow. A
+            # value only counts once the "," or "]" after it is in the buffer:
+            # until then it may be cut short (a number such as "-0." + "5").
+            while True:
+                try:
+                    value, end = scan_once(buf, pos)
+                except StopIteration as e:
+                    if eof:
+                        raise json.JSONDecodeError("Expecting value", buf, e.value) from None
+                    end = len(buf)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    end = len(buf)
+                sep = _SEPARATOR.match(buf, end)
+                if sep is None:
+                    after = _WHITESPACE.match(buf, end).end()
+                    if not eof and (after == len(buf) or buf[after] != "]"):
+                        chunk = f.read(chunk_size)
+                        buf, pos, eof = buf[pos:] + chunk, 0, not chunk
+                        break
+                    yield value
+                    pos, state = end, _AFTER
+                    break
+                yield value
+                pos, state = sep.end(), _NEXT
+                if pos == len(buf):
+                    break
+
+
+def share_keys(records: Iterable[Any]) -> Iterator[Any]:
+    """Yield records whose dict keys are shared with earlier same-shaped records.
+
+    ``json.load`` reuses one string per distinct key across the whole file;
+    decoding record by record does not, which for a retained list costs a
+    fresh set of key strings per record. Rebuilding each dict over the first
+    key tuple seen for its shape restores the sharing.
+    """
+    shapes: dict[tuple, tuple] = {}
+    for rec in records:
+        if rec.__class__ is dict:
+            keys = tuple(rec)
+            shared = shapes.setdefault(keys, keys)
+            if shared is not keys:
+                rec = dict(zip(shared, rec.values()))
+        yield rec
+
+
+def _iter_json_lines(path: Path) -> Iterator[Any]:
+    loads = json.loads
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
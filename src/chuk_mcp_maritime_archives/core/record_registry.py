@@ -0,0 +1,91 @@
+"""
+Record ID registry: which archive client owns a record ID.
+
+Every record ID carries a prefix naming its archive and kind of record --
+"das:0372.1" a DAS voyage, "eic_wreck:0001" an EIC wreck, "dss_muster:0001"
+a GZMVOC muster, "cliwoc:118" a CLIWOC track. The registry maps each prefix
+to a ``RecordSource``: the kind, the archive and the lookup fetching a
+record from the owning client's ID index. Routing an ID is one dict lookup
+and fetching it one more, whatever the archive.
+
+An ID without a prefix has no owner of its own. ``resolve()`` looks it up
+under every prefix and only accepts it if exactly one archive holds it, so
+"0001" -- an EIC, Carreira, Galleon and SOIC voyage alike -- is reported
+as ambiguous, with the candidates, rather than taken as a DAS voyage.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class RecordSource:
+    """Owner of the records whose IDs carry one prefix."""
+
+    kind: str  # voyage, wreck, vessel, crew, muster, cargo or track
+    archive: str
+    get: Callable[[str], Awaitable[dict | None]]
+
+
+def split_id(record_id: str) -> tuple[str | None, str]:
+    """(prefix, rest) of ``record_id``; the prefix is None if it has none."""
+    prefix, sep, rest = record_id.partition(":")
+    return (prefix, rest) if sep else (None, record_id)
+
+
+class RecordRegistry:
+    """ID prefix -> ``RecordSource`` of every archive record kind."""
+
+    def __init__(self, sources: dict[str, RecordSource]) -> None:
+        self._sources = sources
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    def prefixes(self, kind: str | None = None) -> list[str]:
+        """Registered prefixes, of ``kind`` only if given."""
+        return [p for p, s in self._sources.items() if kind is None or s.kind == kind]
+
+    def route(self, record_id: str, default: str | None = None) -> RecordSource | None:
+        """Source owning ``record_id`` by its prefix (``default``'s if it has none)."""
+        prefix, _ = split_id(record_id)
+        return self._sources.get(prefix if prefix is not None else default or "")
+
+    async def resolve(self, record_id: str) -> dict[str, Any]:
+        """Look up one record ID of any kind.
+
+        Returns a dict with the ``id`` as given, the ``kind``, ``archive``
+        and ``record`` -- all three None if it is not found -- and, for an
+        ID without a prefix held by several archives, the prefixed IDs it
+        matched as ``candidates``.
+        """
+        prefix, _ = split_id(record_id)
+        if prefix is not None:
+            source = self._sources.get(prefix)
+            record = await source.get(record_id) if source is not None else None
+            return _result(record_id, source if record is not None else None, record)
+
+        hits = []
+        for prefix, source in self._sources.items():
+            candidate = f"{prefix}:{record_id}"
+            record = await source.get(candidate)
+            if record is not None:
+                hits.append((candidate, source, record))
+        if len(hits) == 1:
+            return _result(record_id, hits[0][1], hits[0][2])
+        result = _result(record_id, None, None)
+        if hits:
+            result["candidates"] = [candidate for candidate, _, _ in hits]
+        return result
+
+
+def _result(record_id: str, source: RecordSource | None, record: dict | None) -> dict[str, Any]:
+    return {
+        "id": record_id,
+        "kind": source.kind if source else None,
+        "archive": source.archive if source else None,
+        "record": record,
+    }
@@ -1,7 +1,7 @@
 """
 Preload reference data from artifact store to local data/ directory.
 
-Called by server.py before async_server is imported, so that module-level
+Called by server.py before the dataset warm-up starts, so that the lazy
 data loaders (_load_tracks, _load_routes, etc.) find their files.
 
 Falls back silently if the manifest env var is not set, the store is
@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -27,6 +28,8 @@ _PROFILES: list[dict[str, Any]] = []
 # Indexes: route_id -> [profile dicts]
 _PROFILES_BY_ROUTE: dict[str, list[dict[str, Any]]] = {}
 
+_LOAD_LOCK = threading.Lock()
+
 
 # ---------------------------------------------------------------------------
 # Data loading
@@ -34,31 +37,35 @@ _PROFILES_BY_ROUTE: dict[str, list[dict[str, Any]]] = {}
 
 
 def _load_speed_profiles(data_dir: Path | None = None) -> None:
-    """Load speed profile data from JSON file."""
-    global _PROFILES, _PROFILES_BY_ROUTE
+    """Load speed profile data from JSON file (thread-safe; the first caller loads)."""
     if _PROFILES:
         return
-
-    path = (data_dir or _DEFAULT_DATA_DIR) / "speed_profiles.json"
-    if not path.exists():
-        logger.warning(
-            "Speed profiles not found: %s (run scripts/generate_speed_profiles.py)",
-            path,
-        )
-        return
-
-    with open(path) as f:
-        data = json.load(f)
-
-    _PROFILES = data.get("profiles", [])
-
-    # Build route index
-    for profile in _PROFILES:
-        route_id = profile["route_id"]
-        if route_id not in _PROFILES_BY_ROUTE:
-            _PROFILES_BY_ROUTE[route_id] = []
-        _PROFILES_BY_ROUTE[route_id].append(profile)
-
+    with _LOAD_LOCK:
+        if _PROFILES:
+            return
+
+        path = (data_dir or _DEFAULT_DATA_DIR) / "speed_profiles.json"
+        if not path.exists():
+            logger.warning(
+                "Speed profiles not found: %s (run scripts/generate_speed_profiles.py)",
+                path,
+            )
+            return
+
+        with open(path) as f:
+            data = json.load(f)
+
+        profiles = data.get("profiles", [])
+
+        # Build route index
+        for profile in profiles:
+            route_id = profile["route_id"]
+            if route_id not in _PROFILES_BY_ROUTE:
+                _PROFILES_BY_ROUTE[route_id] = []
+            _PROFILES_BY_ROUTE[route_id].append(profile)
+
+        # Filled last: a non-empty _PROFILES means the index is complete
+        _PROFILES.extend(profiles)
     logger.info("Loaded %d speed profiles from %s", len(_PROFILES), path.name)
 
 
@@ -152,7 +159,3 @@ def list_profiled_routes() -> list[str]:
     """Return route IDs that have speed profile data."""
     _load_speed_profiles()
     return sorted(_PROFILES_BY_ROUTE.keys())
-
-
-# Load on import
-_load_speed_profiles()
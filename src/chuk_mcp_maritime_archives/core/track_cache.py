@@ -0,0 +1,192 @@
+"""
+Memory-mapped columnar cache files.
+
+A cache file holds named fixed-width numeric columns plus one string table,
+compiled from a JSON source by a script and validated against that source
+by SHA-256. Columns are served as ``memoryview`` slices of a read-only
+``mmap``, so every process that opens the same file shares its pages and
+opening it costs no parsing.
+
+Layout (all offsets in bytes from the start of the file)::
+
+    magic (8)  header length (4, little-endian)  header JSON
+    padding to 8 bytes, then each column at its recorded 8-byte aligned offset
+
+The header records the source hash, a caller-defined ``layout`` version,
+the native byte order, free-form ``meta`` and, per column, its
+``[offset, typecode, length]``. Strings are stored UTF-8 encoded in one
+blob (``__strings__``) with an offsets column (``__string_offsets__``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import sys
+from array import array
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, overload
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"CHUKCOL1"
+_ALIGN = 8
+
+
+def file_sha256(path: Path) -> str:
+    """Hex SHA-256 of a file's contents, read in 1 MB chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_columnar_cache(
+    path: Path,
+    *,
+    source_sha256: str,
+    layout: int,
+    columns: dict[str, array],
+    strings: Sequence[str] = (),
+    meta: dict[str, Any] | None = None,
+) -> None:
+    """Write columns and strings to ``path`` atomically (temp file + rename)."""
+    blob = bytearray()
+    offsets = array("q", [0])
+    for s in strings:
+        blob += s.encode("utf-8")
+        offsets.append(len(blob))
+
+    payload: list[tuple[str, str, int, bytes]] = [
+        (name, col.typecode, len(col), col.tobytes()) for name, col in columns.items()
+    ]
+    payload.append(("__string_offsets__", "q", len(offsets), offsets.tobytes()))
+    payload.append(("__strings__", "B", len(blob), bytes(blob)))
+
+    def _header(start: int) -> tuple[bytes, list[int]]:
+        positions = []
+        offset = start
+        for _, _, _, data in payload:
+            positions.append(offset)
+            offset += -(-len(data) // _ALIGN) * _ALIGN
+        header = {
+            "source_sha256": source_sha256,
+            "layout": layout,
+            "byteorder": sys.byteorder,
+            "meta": meta or {},
+            "columns": {
+                name: [pos, code, length]
+                for (name, code, length, _), pos in zip(payload, positions)
+            },
+        }
+        return json.dumps(header, ensure_ascii=False).encode("utf-8"), positions
+
+    # Column offsets depend on the header length, which depends on the
+    # offsets; iterate until the header size settles.
+    start = 0
+    while True:
+        header_bytes, positions = _header(start)
+        data_start = -(-(len(_MAGIC) + 4 + len(header_bytes)) // _ALIGN) * _ALIGN
+        if data_start == start:
+            break
+        start = data_start
+
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(_MAGIC)
+        f.write(len(header_bytes).to_bytes(4, "little"))
+        f.write(header_bytes)
+        for (_, _, _, data), pos in zip(payload, positions):
+            f.write(b"\0" * (pos - f.tell()))
+            f.write(data)
+    os.replace(tmp, path)
+
+
+class StringTable(Sequence[str]):
+    """Read-only view of a cache's string table; entries decode on first use."""
+
+    def __init__(self, blob: memoryview, offsets: memoryview) -> None:
+        self._blob = blob
+        self._offsets = offsets
+        self._decoded: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        s = self._decoded.get(index)
+        if s is None:
+            s = str(self._blob[self._offsets[index] : self._offsets[index + 1]], "utf-8")
+            self._decoded[index] = s
+        return s
+
+
+class MappedCache:
+    """An open cache file: header fields, columns and the string table."""
+
+    def __init__(self, path: Path, mm: mmap.mmap, header: dict[str, Any]) -> None:
+        self.path = path
+        self.source_sha256: str = header["source_sha256"]
+        self.layout: int = header["layout"]
+        self.meta: dict[str, Any] = header.get("meta", {})
+        self._mm = mm
+        self._view = memoryview(mm)
+        self._columns: dict[str, list[Any]] = header["columns"]
+        self.strings = StringTable(self.column("__strings__"), self.column("__string_offsets__"))
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._columns
+
+    def column(self, name: str) -> memoryview:
+        """Zero-copy view of a column, typed by its array typecode."""
+        offset, code, length = self._columns[name]
+        size = array(code).itemsize
+        return self._view[offset : offset + length * size].cast(code)
+
+
+def open_columnar_cache(path: Path, source_sha256: str | None, layout: int) -> MappedCache | None:
+    """Map a cache file, or return None if it is missing, corrupt or stale.
+
+    Args:
+        path: Cache file
+        source_sha256: Hash of the current source file, or None to accept
+            the cache without checking it against a source
+        layout: Layout version the caller expects
+    """
+    if not path.exists():
+        return None
+    try:
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if mm[: len(_MAGIC)] != _MAGIC:
+            raise ValueError("bad magic")
+        start = len(_MAGIC) + 4
+        header_len = int.from_bytes(mm[len(_MAGIC) : start], "little")
+        header = json.loads(mm[start : start + header_len].decode("utf-8"))
+        for offset, code, length in header["columns"].values():
+            if offset + length * array(code).itemsize > len(mm):
+                raise ValueError("truncated column")
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning("Ignoring unreadable cache %s: %s", path.name, e)
+        return None
+
+    if header.get("layout") != layout or header.get("byteorder") != sys.byteorder:
+        logger.info("Ignoring cache %s: built for a different layout", path.name)
+        return None
+    if source_sha256 is not None and header.get("source_sha256") != source_sha256:
+        logger.info("Ignoring stale cache %s: source has changed", path.name)
+        return None
+    return MappedCache(path, mm, header)
@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -30,6 +31,8 @@ VOC_GAZETTEER: dict[str, dict[str, Any]] = {}
 # Alias index: lowercase alias/name -> canonical name
 _ALIAS_INDEX: dict[str, str] = {}
 
+_LOAD_LOCK = threading.Lock()
+
 
 # ---------------------------------------------------------------------------
 # Data loading
@@ -37,35 +40,41 @@ _ALIAS_INDEX: dict[str, str] = {}
 
 
 def _load_gazetteer(data_dir: Path | None = None) -> None:
-    """Load gazetteer data from JSON file."""
-    global VOC_GAZETTEER, _ALIAS_INDEX
+    """Load gazetteer data from JSON file (thread-safe; the first caller loads)."""
     if VOC_GAZETTEER:
         return
-
-    path = (data_dir or _DEFAULT_DATA_DIR) / "gazetteer.json"
-    if not path.exists():
-        logger.warning("Gazetteer not found: %s (run scripts/generate_reference.py)", path)
-        return
-
-    with open(path) as f:
-        entries = json.load(f)
-
-    for entry in entries:
-        name = entry.pop("name")
-        VOC_GAZETTEER[name] = entry
-
-    _build_alias_index()
+    with _LOAD_LOCK:
+        if VOC_GAZETTEER:
+            return
+
+        path = (data_dir or _DEFAULT_DATA_DIR) / "gazetteer.json"
+        if not path.exists():
+            logger.warning("Gazetteer not found: %s (run scripts/generate_reference.py)", path)
+            return
+
+        with open(path) as f:
+            entries = json.load(f)
+
+        gazetteer = {}
+        for entry in entries:
+            name = entry.pop("name")
+            gazetteer[name] = entry
+
+        # Publish the alias index first: a non-empty VOC_GAZETTEER means loaded
+        _build_alias_index(gazetteer)
+        VOC_GAZETTEER.update(gazetteer)
     logger.info("Loaded %d gazetteer entries from %s", len(VOC_GAZETTEER), path.name)
 
 
-def _build_alias_index() -> None:
+def _build_alias_index(gazetteer: dict[str, dict[str, Any]]) -> None:
     """Build a lowercase alias -> canonical name lookup table."""
     global _ALIAS_INDEX
-    _ALIAS_INDEX = {}
-    for name, entry in VOC_GAZETTEER.items():
-        _ALIAS_INDEX[name.lower()] = name
+    index = {}
+    for name, entry in gazetteer.items():
+        index[name.lower()] = name
         for alias in entry.get("aliases", []):
-            _ALIAS_INDEX[alias.lower()] = name
+            index[alias.lower()] = name
+    _ALIAS_INDEX = index
 
 
 # ---------------------------------------------------------------------------
@@ -165,7 +174,3 @@ def list_location_types() -> dict[str, int]:
         t = entry.get("type", "unknown")
         counts[t] = counts.get(t, 0) + 1
     return dict(sorted(counts.items()))
-
-
-# Load on import
-_load_gazetteer()
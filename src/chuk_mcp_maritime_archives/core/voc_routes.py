@@ -31,6 +31,7 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -42,6 +43,8 @@ _DEFAULT_DATA_DIR = Path(__file__).resolve().parent.parent.parent.parent / "data
 # Loaded from JSON: {route_id: {name, description, direction, ...waypoints...}}
 VOC_ROUTES: dict[str, dict[str, Any]] = {}
 
+_LOAD_LOCK = threading.Lock()
+
 
 # ---------------------------------------------------------------------------
 # Data loading
@@ -49,23 +52,23 @@ VOC_ROUTES: dict[str, dict[str, Any]] = {}
 
 
 def _load_routes(data_dir: Path | None = None) -> None:
-    """Load route data from JSON file."""
-    global VOC_ROUTES
+    """Load route data from JSON file (thread-safe; the first caller loads)."""
     if VOC_ROUTES:
         return
+    with _LOAD_LOCK:
+        if VOC_ROUTES:
+            return
 
-    path = (data_dir or _DEFAULT_DATA_DIR) / "routes.json"
-    if not path.exists():
-        logger.warning("Routes not found: %s (run scripts/generate_reference.py)", path)
-        return
-
-    with open(path) as f:
-        entries = json.load(f)
+        path = (data_dir or _DEFAULT_DATA_DIR) / "routes.json"
+        if not path.exists():
+            logger.warning("Routes not found: %s (run scripts/generate_reference.py)", path)
+            return
 
-    for entry in entries:
-        route_id = entry.pop("route_id")
-        VOC_ROUTES[route_id] = entry
+        with open(path) as f:
+            entries = json.load(f)
 
+        # One update from a finished dict, so readers never see a partial table
+        VOC_ROUTES.update({entry.pop("route_id"): entry for entry in entries})
     logger.info("Loaded %d routes from %s", len(VOC_ROUTES), path.name)
 
 
@@ -382,7 +385,3 @@ def _build_estimate(
             "Ships sometimes deviated from standard routes due to storms or orders",
         ],
     }
-
-
-# Load on import
-_load_routes()
@@ -0,0 +1,152 @@
+"""
+Background warm-up of the reference datasets.
+
+The reference-data modules load lazily: each ``_load_*`` function takes a
+per-module lock and fills its containers on first use, so a request blocks
+only until the dataset it touches is ready -- never on the others.
+
+``start_warmup()`` is called by ``server.main`` as the transport starts.
+It loads every dataset on its own daemon thread, so by the time most
+requests arrive their data is already in memory. ``dataset_status()``
+reports each dataset's readiness (surfaced by ``maritime_capabilities``).
+
+Set ``MARITIME_WARMUP=0`` to skip the warm-up and load purely on demand.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import os
+import threading
+import time
+from typing import Any
+
+from ..constants import DatasetState, EnvVar
+
+logger = logging.getLogger(__name__)
+
+# dataset -> (module, loader, container whose contents mean "loaded").
+# Smallest first so the quick datasets are never queued behind the tracks.
+_DATASETS: dict[str, tuple[str, str, str]] = {
+    "gazetteer": ("voc_gazetteer", "_load_gazetteer", "VOC_GAZETTEER"),
+    "routes": ("voc_routes", "_load_routes", "VOC_ROUTES"),
+    "speed_profiles": ("speed_profiles", "_load_speed_profiles", "_PROFILES"),
+    "galleon_voyages": ("galleon_analysis", "_load_galleon", "_GALLEON_VOYAGES"),
+    "cliwoc_tracks": ("cliwoc_tracks", "_load_tracks", "_TRACKS"),
+}
+
+# Warm-up bookkeeping: dataset -> {"state", "seconds", "error"}
+_STATUS: dict[str, dict[str, Any]] = {}
+_STATUS_LOCK = threading.Lock()
+_THREADS: dict[str, threading.Thread] = {}
+
+
+def _module(dataset: str) -> Any:
+    return importlib.import_module(f".{_DATASETS[dataset][0]}", __package__)
+
+
+def _is_loaded(dataset: str) -> bool:
+    return bool(getattr(_module(dataset), _DATASETS[dataset][2]))
+
+
+def load_dataset(dataset: str) -> DatasetState:
+    """Load one dataset on the calling thread and record how it went.
+
+    Returns ``READY``, ``UNAVAILABLE`` (the loader found no data file) or
+    ``FAILED``. Already-loaded datasets return ``READY`` immediately.
+    """
+    if dataset not in _DATASETS:
+        raise ValueError(f"Unknown dataset '{dataset}'. Available: {', '.join(_DATASETS)}")
+
+    with _STATUS_LOCK:
+        _STATUS[dataset] = {"state": DatasetState.LOADING, "seconds": None, "error": None}
+
+    error: str | None
+    start = time.perf_counter()
+    try:
+        getattr(_module(dataset), _DATASETS[dataset][1])()
+    except Exception as e:
+        state, error = DatasetState.FAILED, str(e)
+        logger.exception("Warm-up of %s failed", dataset)
+    else:
+        state = DatasetState.READY if _is_loaded(dataset) else DatasetState.UNAVAILABLE
+        error = None
+    elapsed = round(time.perf_counter() - start, 3)
+
+    with _STATUS_LOCK:
+        _STATUS[dataset] = {"state": state, "seconds": elapsed, "error": error}
+    logger.debug("Warm-up of %s: %s in %.3fs", dataset, state.value, elapsed)
+    return state
+
+
+def start_warmup(datasets: list[str] | None = None) -> bool:
+    """Start loading datasets in background daemon threads.
+
+    Datasets still being warmed are skipped and already-loaded ones return
+    at once, so calling this more than once is harmless.
+
+    Args:
+        datasets: Datasets to warm (default: all of them)
+
+    Returns:
+        True if warm-up is running, False if disabled by ``MARITIME_WARMUP``.
+    """
+    if os.environ.get(EnvVar.WARMUP, "1").strip().lower() in ("0", "false", "no", "off"):
+        logger.info("Dataset warm-up disabled; datasets load on first use")
+        return False
+
+    for dataset in datasets or list(_DATASETS):
+        if dataset not in _DATASETS:
+            raise ValueError(f"Unknown dataset '{dataset}'. Available: {', '.join(_DATASETS)}")
+        with _STATUS_LOCK:
+            thread = _THREADS.get(dataset)
+            if thread is not None and thread.is_alive():
+                continue
+            thread = threading.Thread(
+                target=load_dataset,
+                args=(dataset,),
+                name=f"warmup-{dataset}",
+                daemon=True,
+            )
+            _THREADS[dataset] = thread
+        thread.start()
+    return True
+
+
+def wait_for(datasets: list[str] | None = None, timeout: float | None = None) -> bool:
+    """Block until the given warm-up threads finish (or ``timeout`` elapses).
+
+    Returns True if none of them is still running.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    for dataset in datasets or list(_DATASETS):
+        thread = _THREADS.get(dataset)
+        if thread is None:
+            continue
+        thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        if thread.is_alive():
+            return False
+    return True
+
+
+def dataset_status() -> dict[str, dict[str, Any]]:
+    """Readiness of every dataset: ``{name: {"state", "seconds", "error"}}``.
+
+    A dataset loaded on demand by a request (rather than by the warm-up)
+    reports ``ready`` with ``seconds`` of None.
+    """
+    status = {}
+    for dataset in _DATASETS:
+        with _STATUS_LOCK:
+            entry = dict(_STATUS.get(dataset) or {})
+        if not entry:
+            loaded = _is_loaded(dataset)
+            entry = {
+                "state": DatasetState.READY if loaded else DatasetState.PENDING,
+                "seconds": None,
+                "error": None,
+            }
+        entry["state"] = DatasetState(entry["state"]).value
+        status[dataset] = entry
+    return status
@@ -21,6 +21,7 @@ from .maritime import (
 )
 from .responses import (
     decode_cursor,
+    decode_cursor_state,
     encode_cursor,
     ArchiveDetailResponse,
     ArchiveInfo,
@@ -37,6 +38,7 @@ from .responses import (
     CrewInfo,
     CrewSearchResponse,
     CrewSurvivalResponse,
+    DatasetInfo,
     DemographicsGroup,
     ErrorResponse,
     MusterDetailResponse,
@@ -44,6 +46,8 @@ from .responses import (
     MusterSearchResponse,
     GeoJSONExportResponse,
     LinkAuditResponse,
+    RecordBatchResponse,
+    RecordLookup,
     HullProfileListResponse,
     HullProfileResponse,
     LocationDetailResponse,
@@ -79,6 +83,7 @@ from .responses import (
     RouteInfo,
     RouteListResponse,
     RouteWaypointInfo,
+    SearchCountResponse,
     SegmentSpeedInfo,
     SpeedProfileResponse,
     StatisticsResponse,
@@ -102,6 +107,7 @@ from .responses import (
     WreckDetailResponse,
     WreckInfo,
     WreckSearchResponse,
+    build_infos,
     format_response,
 )
 
@@ -121,6 +127,7 @@ __all__ = [
     "Waypoint",
     # Cursor utilities
     "decode_cursor",
+    "decode_cursor_state",
     "encode_cursor",
     # Response models
     "ArchiveDetailResponse",
@@ -138,6 +145,7 @@ __all__ = [
     "CrewInfo",
     "CrewSearchResponse",
     "CrewSurvivalResponse",
+    "DatasetInfo",
     "DemographicsGroup",
     "ErrorResponse",
     "MusterDetailResponse",
@@ -145,6 +153,8 @@ __all__ = [
     "MusterSearchResponse",
     "GeoJSONExportResponse",
     "LinkAuditResponse",
+    "RecordBatchResponse",
+    "RecordLookup",
     "HullProfileListResponse",
     "HullProfileResponse",
     "LocationDetailResponse",
@@ -180,6 +190,7 @@ __all__ = [
     "RouteInfo",
     "RouteListResponse",
     "RouteWaypointInfo",
+    "SearchCountResponse",
     "SegmentSpeedInfo",
     "SpeedProfileResponse",
     "StatisticsResponse",
@@ -203,5 +214,6 @@ __all__ = [
     "WreckInfo",
     "WageComparisonResponse",
     "WreckSearchResponse",
+    "build_infos",
     "format_response",
 ]
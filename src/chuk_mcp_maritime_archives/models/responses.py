@@ -11,28 +11,41 @@ from __future__ import annotations
 
 import base64
 import json
-from typing import Any
+from collections.abc import Iterable, Mapping
+from typing import Any, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
+InfoModel = TypeVar("InfoModel", bound=BaseModel)
+
 
 # ---------------------------------------------------------------------------
 # Cursor utilities
 # ---------------------------------------------------------------------------
 
 
-def encode_cursor(offset: int) -> str:
-    """Encode an integer offset as an opaque cursor string."""
-    return base64.urlsafe_b64encode(json.dumps({"o": offset}).encode()).decode().rstrip("=")
+def encode_cursor(offset: int, **state: Any) -> str:
+    """Encode an integer offset, plus any keyset ``state``, as an opaque cursor string."""
+    payload = {"o": offset, **state}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+def decode_cursor_state(cursor: str | None) -> dict[str, Any]:
+    """Decode an opaque cursor string to its payload. Returns {} for None/empty."""
+    if not cursor:
+        return {}
+    padded = cursor + "=" * (-len(cursor) % 4)
+    payload = json.loads(base64.urlsafe_b64decode(padded))
+    if not isinstance(payload, dict):
+        raise TypeError("Invalid cursor")
+    return payload
 
 
 def decode_cursor(cursor: str | None) -> int:
     """Decode an opaque cursor string to an integer offset. Returns 0 for None/empty."""
     if not cursor:
         return 0
-    padded = cursor + "=" * (-len(cursor) % 4)
-    payload = json.loads(base64.urlsafe_b64decode(padded))
-    return int(payload["o"])
+    return int(decode_cursor_state(cursor)["o"])
 
 
 # ---------------------------------------------------------------------------
@@ -74,6 +87,40 @@ def format_response(
     return response.model_dump_json(indent=2, exclude_none=True)
 
 
+def build_infos(
+    model: type[InfoModel],
+    records: Iterable[dict[str, Any]],
+    fields: list[str] | None = None,
+    sources: Mapping[str, tuple[str, ...]] | None = None,
+) -> list[InfoModel]:
+    """Build the per-record models of a search response, projected to ``fields``.
+
+    Each column of ``model`` is read from the record key of the same name,
+    or from the first truthy key listed for it in ``sources``. With
+    ``fields``, only those columns and the model's required ones (the ID and
+    name, "" when missing) are read and validated; the rest stay None and
+    are left out of the JSON output. Unknown field names are ignored.
+    """
+    sources = sources or {}
+    columns = [
+        (name, sources.get(name, (name,)), info.is_required())
+        for name, info in model.model_fields.items()
+        if not fields or name in fields or info.is_required()
+    ]
+    infos = []
+    for record in records:
+        values: dict[str, Any] = {}
+        for name, keys, required in columns:
+            value = None
+            for key in keys:
+                value = record.get(key)
+                if value:
+                    break
+            values[name] = "" if value is None and required else value
+        infos.append(model.model_validate(values))
+    return infos
+
+
 # ---------------------------------------------------------------------------
 # Error
 # ---------------------------------------------------------------------------
@@ -376,6 +423,41 @@ class LinkAuditResponse(BaseModel):
         return "\n".join(lines)
 
 
+class RecordLookup(BaseModel):
+    """One record of a batch lookup by ID (record is None if not found)."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    id: str
+    kind: str | None = None
+    archive: str | None = None
+    record: dict[str, Any] | None = None
+    candidates: list[str] | None = None
+
+
+class RecordBatchResponse(BaseModel):
+    """Records of any kind looked up by ID, in the order requested."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    found_count: int
+    records: list[RecordLookup]
+    missing: list[str] = Field(default_factory=list)
+    message: str = ""
+
+    def to_text(self) -> str:
+        lines = [self.message, ""]
+        for r in self.records:
+            if r.record is not None:
+                name = r.record.get("ship_name") or r.record.get("name") or ""
+                lines.append(f"  {r.id} [{r.kind}, {r.archive}] {name}".rstrip())
+            elif r.candidates:
+                lines.append(f"  {r.id}: ambiguous, one of {', '.join(r.candidates)}")
+            else:
+                lines.append(f"  {r.id}: not found")
+        return "\n".join(lines)
+
+
 # ---------------------------------------------------------------------------
 # Wreck responses
 # ---------------------------------------------------------------------------
@@ -423,6 +505,29 @@ class WreckSearchResponse(BaseModel):
         return "\n".join(lines)
 
 
+class SearchCountResponse(BaseModel):
+    """Match count of a voyage or wreck search, with optional facet histograms."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    record_type: str
+    total_count: int
+    facets: dict[str, dict[str, int]] = Field(default_factory=dict)
+    archive: str | None = None
+    message: str = ""
+
+    def to_text(self) -> str:
+        lines = [self.message]
+        for field, counts in self.facets.items():
+            lines.append("")
+            lines.append(f"By {field}:")
+            if not counts:
+                lines.append("  (none)")
+            for value, count in counts.items():
+                lines.append(f"  {value}: {count}")
+        return "\n".join(lines)
+
+
 class WreckDetailResponse(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -462,6 +567,7 @@ class NarrativeHit(BaseModel):
     field: str
     snippet: str
     match_count: int = 1
+    score: float | None = None
 
 
 class NarrativeSearchResponse(BaseModel):
@@ -1121,23 +1227,26 @@ class NearbyTracksResponse(BaseModel):
     search_point: dict[str, Any]
     search_date: str
     radius_km: float
+    days_window: int = 0
     track_count: int
     tracks: list[NearbyTrackInfo]
     message: str = ""
 
     def to_text(self) -> str:
+        window = f" ±{self.days_window}d" if self.days_window else ""
         lines = [
             self.message,
             f"Search: {self.search_point.get('lat')}N, {self.search_point.get('lon')}E",
-            f"Date: {self.search_date}  Radius: {self.radius_km}km",
+            f"Date: {self.search_date}{window}  Radius: {self.radius_km}km",
             "",
         ]
         for t in self.tracks:
             nat = f" [{t.nationality}]" if t.nationality else ""
             pos = t.matching_position
+            when = f" on {pos.get('date')}" if self.days_window else ""
             lines.append(
                 f"  Voyage {t.voyage_id}{nat}: "
-                f"{pos.get('lat')}N, {pos.get('lon')}E "
+                f"{pos.get('lat')}N, {pos.get('lon')}E{when} "
                 f"({t.distance_km}km away)"
             )
         return "\n".join(lines)
@@ -2001,6 +2110,15 @@ class ToolInfo(BaseModel):
     description: str
 
 
+class DatasetInfo(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    name: str
+    state: str  # pending, loading, ready, unavailable, failed
+    load_seconds: float | None = None
+    error: str | None = None
+
+
 # ---------------------------------------------------------------------------
 # Galleon Transit Times
 # ---------------------------------------------------------------------------
@@ -2164,6 +2282,7 @@ class CapabilitiesResponse(BaseModel):
     tools: list[ToolInfo]
     ship_types: list[str]
     regions: dict[str, str]
+    datasets: list[DatasetInfo] = Field(default_factory=list)
     message: str = ""
 
     def to_text(self) -> str:
@@ -2177,4 +2296,9 @@ class CapabilitiesResponse(BaseModel):
         lines.append(f"\nTools ({len(self.tools)}):")
         for t in self.tools:
             lines.append(f"  {t.name} [{t.category}]: {t.description}")
+        if self.datasets:
+            lines.append(f"\nDatasets ({len(self.datasets)}):")
+            for d in self.datasets:
+                timing = f" ({d.load_seconds:.2f}s)" if d.load_seconds is not None else ""
+                lines.append(f"  {d.name}: {d.state}{timing}")
         return "\n".join(lines)
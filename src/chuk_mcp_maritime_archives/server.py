@@ -1,8 +1,8 @@
 """
 Synchronous entry point for chuk-mcp-maritime-archives.
 
-Initialises the artifact store and launches the MCP server in
-either stdio or HTTP mode.
+Initialises the artifact store, starts the background dataset warm-up
+and launches the MCP server in either stdio or HTTP mode.
 """
 
 from __future__ import annotations
@@ -91,17 +91,7 @@ def _init_artifact_store() -> bool:
 
 def main() -> None:
     """CLI entry point."""
-    # 1. Initialize artifact store (before data loading)
-    _init_artifact_store()
-
-    # 2. Preload reference data from artifacts if configured
-    from .core.reference_preload import preload_reference_data
-
-    preload_reference_data()
-
-    # 3. Import async_server (triggers module-level data loaders)
-    from .async_server import mcp
-
+    # 1. Parse arguments first so --help and usage errors skip all setup
     parser = argparse.ArgumentParser(
         prog=ServerConfig.NAME,
         description=ServerConfig.DESCRIPTION,
@@ -131,6 +121,24 @@ def main() -> None:
         format="%(asctime)s %(name)s %(levelname)s %(message)s",
     )
 
+    # 2. Initialize artifact store (before data loading)
+    _init_artifact_store()
+
+    # 3. Preload reference data from artifacts if configured
+    from .core.reference_preload import preload_reference_data
+
+    preload_reference_data()
+
+    # 4. Import async_server (registers tools; datasets load lazily)
+    from .async_server import manager, mcp
+
+    # 5. Warm the datasets and archive clients in background threads while
+    #    the transport starts
+    from .core.warmup import start_warmup
+
+    if start_warmup():
+        manager.warm()
+
     if args.mode == "stdio":
         logger.info("Starting %s in stdio mode", ServerConfig.NAME)
         mcp.run(stdio=True)
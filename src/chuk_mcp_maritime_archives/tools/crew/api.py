@@ -8,6 +8,7 @@ from ...models import (
     CrewInfo,
     CrewSearchResponse,
     ErrorResponse,
+    build_infos,
     format_response,
 )
 
@@ -29,6 +30,7 @@ def register_crew_tools(mcp: object, manager: object) -> None:
         archive: str | None = None,
         max_results: int = 100,
         cursor: str | None = None,
+        fields: list[str] | None = None,
         output_mode: str = "json",
     ) -> str:
         """
@@ -52,6 +54,9 @@ def register_crew_tools(mcp: object, manager: object) -> None:
                 or "dss" (MDB northern provinces, 1803-1837)
             max_results: Maximum results per page (default: 100, max: 500)
             cursor: Pagination cursor from a previous result's next_cursor field
+            fields: Record fields to return (default: all; the ID and name are
+                always included) -
+                crew_id, name, rank, rank_english, ship_name, voyage_id
             output_mode: Response format - "json" (default) or "text"
 
         Returns:
@@ -89,17 +94,7 @@ def register_crew_tools(mcp: object, manager: object) -> None:
                     output_mode,
                 )
 
-            crew = [
-                CrewInfo(
-                    crew_id=c.get("crew_id", ""),
-                    name=c.get("name", ""),
-                    rank=c.get("rank"),
-                    rank_english=c.get("rank_english"),
-                    ship_name=c.get("ship_name"),
-                    voyage_id=c.get("voyage_id"),
-                )
-                for c in result.items
-            ]
+            crew = build_infos(CrewInfo, result.items, fields)
 
             return format_response(
                 CrewSearchResponse(
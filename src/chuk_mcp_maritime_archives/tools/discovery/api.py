@@ -3,9 +3,11 @@
 import logging
 
 from ...constants import REGIONS, SHIP_TYPES, ServerConfig
+from ...core.warmup import dataset_status
 from ...models import (
     ArchiveInfo,
     CapabilitiesResponse,
+    DatasetInfo,
     ErrorResponse,
     ToolInfo,
     format_response,
@@ -43,6 +45,9 @@ def register_discovery_tools(mcp: object, manager: object) -> None:
               and description
             - ship_types lists valid values for vessel type filters
             - regions lists valid values for geographic region filters
+            - datasets shows whether each reference dataset (tracks,
+              gazetteer, routes, ...) is loaded; tools on a dataset that is
+              still loading simply wait for it
             - Typical workflow: maritime_capabilities -> maritime_search_voyages
               or maritime_search_wrecks -> detail tools -> export/analysis
         """
@@ -182,6 +187,11 @@ def register_discovery_tools(mcp: object, manager: object) -> None:
                     category="linking",
                     description="Get unified view of a voyage with all linked records",
                 ),
+                ToolInfo(
+                    name="maritime_get_records",
+                    category="linking",
+                    description="Get many records of any kind by ID in one call",
+                ),
                 ToolInfo(
                     name="maritime_get_timeline",
                     category="linking",
@@ -284,6 +294,16 @@ def register_discovery_tools(mcp: object, manager: object) -> None:
                 ),
             ]
 
+            datasets = [
+                DatasetInfo(
+                    name=name,
+                    state=status["state"],
+                    load_seconds=status["seconds"],
+                    error=status["error"],
+                )
+                for name, status in dataset_status().items()
+            ]
+
             return format_response(
                 CapabilitiesResponse(
                     server_name=ServerConfig.NAME,
@@ -292,6 +312,7 @@ def register_discovery_tools(mcp: object, manager: object) -> None:
                     tools=tools,
                     ship_types=list(SHIP_TYPES.keys()),
                     regions=dict(REGIONS),
+                    datasets=datasets,
                     message=(
                         f"{ServerConfig.NAME} v{ServerConfig.VERSION}: "
                         f"{len(archives)} archives, {len(tools)} tools"
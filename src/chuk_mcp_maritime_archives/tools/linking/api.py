@@ -6,6 +6,8 @@ from ...constants import ErrorMessages, SuccessMessages
 from ...models import (
     ErrorResponse,
     LinkAuditResponse,
+    RecordBatchResponse,
+    RecordLookup,
     VoyageFullResponse,
     format_response,
 )
@@ -146,3 +148,61 @@ def register_linking_tools(mcp: object, manager: object) -> None:
                 ),
                 output_mode,
             )
+
+    @mcp.tool  # type: ignore[union-attr]
+    async def maritime_get_records(
+        ids: list[str],
+        output_mode: str = "json",
+    ) -> str:
+        """
+        Get many records of any kind by ID in one call.
+
+        Resolves a mixed list of voyage, wreck, vessel, crew, muster,
+        cargo and CLIWOC track IDs, routing each to its archive by its
+        prefix, and returns the records in the order requested.
+
+        ID prefixes:
+            - Voyages: das:, eic:, carreira:, galleon:, soic:
+            - Wrecks: maarer:, eic_wreck:, carreira_wreck:, galleon_wreck:,
+              soic_wreck:, ukho_wreck:, noaa_wreck:
+            - Vessels: das_vessel:  Crew: voc_crew:, dss:
+            - Musters: dss_muster:  Cargo: voc_cargo:
+            - CLIWOC tracks: cliwoc:<voyage ID> (summary without positions)
+
+        Args:
+            ids: Record IDs (max 500), e.g. ["das:3456", "maarer:VOC-0789"]
+            output_mode: Response format - "json" (default) or "text"
+
+        Returns:
+            JSON or text with one entry per ID: kind, archive and record
+            (null if not found)
+
+        Tips for LLMs:
+            - Use this instead of many maritime_get_voyage / maritime_get_wreck /
+              maritime_get_crew_member calls, e.g. for every ID in a search page
+            - Pass IDs with their prefix. An unprefixed ID is looked up in
+              every archive; if several hold it, its entry lists the prefixed
+              candidates instead of a record
+            - The missing list holds the IDs that resolved to no record
+            - Use maritime_get_track for a CLIWOC track's full positions
+        """
+        try:
+            results = await manager.get_records(ids)  # type: ignore[union-attr]
+            records = [RecordLookup(**r) for r in results]
+            found = sum(1 for r in records if r.record is not None)
+
+            return format_response(
+                RecordBatchResponse(
+                    found_count=found,
+                    records=records,
+                    missing=[r.id for r in records if r.record is None],
+                    message=SuccessMessages.RECORDS_FOUND.format(found, len(records)),
+                ),
+                output_mode,
+            )
+        except Exception as e:
+            logger.exception("Failed to get records")
+            return format_response(
+                ErrorResponse(error=str(e), message="Failed to get records"),
+                output_mode,
+            )
@@ -23,6 +23,7 @@ def register_narrative_tools(mcp: object, manager: object) -> None:
         archive: str | None = None,
         max_results: int = 50,
         cursor: str | None = None,
+        variants: bool = False,
         output_mode: str = "json",
     ) -> str:
         """
@@ -45,6 +46,10 @@ def register_narrative_tools(mcp: object, manager: object) -> None:
             archive: Restrict to a specific archive ID (e.g. "eic", "carreira")
             max_results: Maximum results per page (default: 50, max: 500)
             cursor: Pagination cursor from a previous result's next_cursor
+            variants: Also match whole words in accent-free and historical
+                spellings ("Kaap"/"Cape", "ij"/"y", "Reyna"/"Reina"), and near
+                misses when nothing else matches (default: False, terms match
+                as spelled)
             output_mode: Response format — "json" (default) or "text"
 
         Returns:
@@ -58,7 +63,10 @@ def register_narrative_tools(mcp: object, manager: object) -> None:
               phrase, not "East" and "India" separately
             - Multiple unquoted words use AND logic: "storm cape" finds records
               containing both "storm" AND "cape"
-            - Results are ranked by relevance (number of term occurrences)
+            - Results are ranked by BM25 relevance (score): frequent terms in
+              short texts and rare terms rank higher
+            - Set variants=True to also find historical spellings and
+              accented forms of a word, or near misses of a misspelled one
             - Use record_type="voyage" or "wreck" to narrow results
             - Use archive to limit to one archive (e.g. archive="carreira")
             - Follow up with maritime_get_voyage or maritime_get_wreck for full
@@ -72,6 +80,7 @@ def register_narrative_tools(mcp: object, manager: object) -> None:
                 archive=archive,
                 max_results=max_results,
                 cursor=cursor,
+                variants=variants,
             )
 
             if not result.items:
@@ -90,6 +99,7 @@ def register_narrative_tools(mcp: object, manager: object) -> None:
                     field=h["field"],
                     snippet=h["snippet"],
                     match_count=h["match_count"],
+                    score=h.get("score"),
                 )
                 for h in result.items
             ]
@@ -204,6 +204,7 @@ def register_tracks_tools(mcp: object, manager: object) -> None:
         date: str,
         radius_km: float = 200.0,
         max_results: int = 20,
+        days_window: int = 0,
         output_mode: str = "json",
     ) -> str:
         """
@@ -220,6 +221,8 @@ def register_tracks_tools(mcp: object, manager: object) -> None:
             date: Date to search (YYYY-MM-DD format)
             radius_km: Search radius in kilometres (default: 200)
             max_results: Maximum results (default: 20)
+            days_window: Also match positions up to this many days before
+                or after the date (default: 0, exact date only)
             output_mode: Response format - "json" (default) or "text"
 
         Returns:
@@ -228,8 +231,8 @@ def register_tracks_tools(mcp: object, manager: object) -> None:
         Tips for LLMs:
             - Use with wreck positions to find potential witness ships
             - Increase radius_km if no results (ships were sparse)
-            - Date must be exact YYYY-MM-DD — logbook entries are daily
-            - Try adjacent dates if exact date yields no results
+            - Date must be YYYY-MM-DD — logbook entries are daily
+            - Set days_window (e.g. 3) to include adjacent days in one call
             - Results include distance_km and matching position
             - CLIWOC covers 1662-1855; earlier dates have fewer records
             - Combine with maritime_assess_position for uncertainty context
@@ -241,14 +244,16 @@ def register_tracks_tools(mcp: object, manager: object) -> None:
                 date=date,
                 radius_km=radius_km,
                 max_results=max_results,
+                days_window=days_window,
             )
 
+            window = f" (±{days_window} days)" if days_window > 0 else ""
             if not results:
                 return format_response(
                     ErrorResponse(
                         error=f"No CLIWOC tracks found within {radius_km}km of "
-                        f"({lat}, {lon}) on {date}. Try a larger radius or "
-                        "adjacent dates.",
+                        f"({lat}, {lon}) on {date}{window}. Try a larger radius or "
+                        "a wider days_window.",
                     ),
                     output_mode,
                 )
@@ -274,9 +279,10 @@ def register_tracks_tools(mcp: object, manager: object) -> None:
                     search_point={"lat": lat, "lon": lon},
                     search_date=date,
                     radius_km=radius_km,
+                    days_window=days_window,
                     track_count=len(tracks),
                     tracks=tracks,
-                    message=f"Found {len(tracks)} tracks within {radius_km}km on {date}",
+                    message=f"Found {len(tracks)} tracks within {radius_km}km on {date}{window}",
                 ),
                 output_mode,
             )
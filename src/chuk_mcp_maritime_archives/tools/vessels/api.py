@@ -10,6 +10,7 @@ from ...models import (
     VesselDetailResponse,
     VesselInfo,
     VesselSearchResponse,
+    build_infos,
     format_response,
 )
 
@@ -31,6 +32,7 @@ def register_vessel_tools(mcp: object, manager: object) -> None:
         archive: str | None = None,
         max_results: int = 50,
         cursor: str | None = None,
+        fields: list[str] | None = None,
         output_mode: str = "json",
     ) -> str:
         """
@@ -53,6 +55,9 @@ def register_vessel_tools(mcp: object, manager: object) -> None:
             archive: Restrict to a specific archive (default: all)
             max_results: Maximum results per page (default: 50, max: 500)
             cursor: Pagination cursor from a previous result's next_cursor field
+            fields: Record fields to return (default: all; the ID and name are
+                always included) -
+                vessel_id, name, type, tonnage, built_year, chamber
             output_mode: Response format - "json" (default) or "text"
 
         Returns:
@@ -89,17 +94,9 @@ def register_vessel_tools(mcp: object, manager: object) -> None:
                     output_mode,
                 )
 
-            vessels = [
-                VesselInfo(
-                    vessel_id=v.get("vessel_id", ""),
-                    name=v.get("name", ""),
-                    type=v.get("type") or v.get("ship_type"),
-                    tonnage=v.get("tonnage"),
-                    built_year=v.get("built_year"),
-                    chamber=v.get("chamber"),
-                )
-                for v in result.items
-            ]
+            vessels = build_infos(
+                VesselInfo, result.items, fields, sources={"type": ("type", "ship_type")}
+            )
 
             return format_response(
                 VesselSearchResponse(
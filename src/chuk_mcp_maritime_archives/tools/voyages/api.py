@@ -5,9 +5,11 @@ import logging
 from ...constants import ErrorMessages, SuccessMessages
 from ...models import (
     ErrorResponse,
+    SearchCountResponse,
     VoyageDetailResponse,
     VoyageInfo,
     VoyageSearchResponse,
+    build_infos,
     format_response,
 )
 
@@ -29,6 +31,9 @@ def register_voyage_tools(mcp: object, manager: object) -> None:
         archive: str | None = None,
         max_results: int = 50,
         cursor: str | None = None,
+        mode: str = "records",
+        facets: list[str] | None = None,
+        fields: list[str] | None = None,
         output_mode: str = "json",
     ) -> str:
         """
@@ -56,6 +61,15 @@ def register_voyage_tools(mcp: object, manager: object) -> None:
             archive: Restrict to specific archive - das, eic, carreira, galleon, soic (default: all)
             max_results: Maximum results per page (default: 50, max: 500)
             cursor: Pagination cursor from a previous result's next_cursor field
+            mode: "records" (default) for a page of voyages, or "count" for the
+                total number of matches only
+            facets: Fields to break the match count down by (implies mode="count") -
+                archive, fate, departure_port, destination_port,
+                ship_type, company_division, trade_direction
+            fields: Record fields to return (default: all; the ID and name are
+                always included) -
+                voyage_id, ship_name, ship_type, captain, departure_port,
+                departure_date, destination_port, fate, summary, archive
             output_mode: Response format - "json" (default) or "text"
 
         Returns:
@@ -69,8 +83,35 @@ def register_voyage_tools(mcp: object, manager: object) -> None:
             - If has_more is true, pass next_cursor as cursor to get the next page
             - total_count shows how many records match before pagination
             - Follow up with maritime_get_voyage for full voyage details
+            - Use mode="count" with facets=["archive", "fate"] for totals and
+              breakdowns without paging through records
         """
         try:
+            if mode not in ("records", "count"):
+                raise ValueError(ErrorMessages.INVALID_SEARCH_MODE.format(mode))
+            if mode == "count" or facets:
+                counts = await manager.count_voyages(  # type: ignore[union-attr]
+                    ship_name=ship_name,
+                    captain=captain,
+                    date_range=date_range,
+                    departure_port=departure_port,
+                    destination_port=destination_port,
+                    route=route,
+                    fate=fate,
+                    archive=archive,
+                    facets=facets or [],
+                )
+                return format_response(
+                    SearchCountResponse(
+                        record_type="voyage",
+                        total_count=counts["total_count"],
+                        facets=counts["facets"],
+                        archive=archive,
+                        message=SuccessMessages.VOYAGES_COUNTED.format(counts["total_count"]),
+                    ),
+                    output_mode,
+                )
+
             result = await manager.search_voyages(  # type: ignore[union-attr]
                 ship_name=ship_name,
                 captain=captain,
@@ -90,21 +131,7 @@ def register_voyage_tools(mcp: object, manager: object) -> None:
                     output_mode,
                 )
 
-            voyages = [
-                VoyageInfo(
-                    voyage_id=v.get("voyage_id", ""),
-                    ship_name=v.get("ship_name", ""),
-                    ship_type=v.get("ship_type"),
-                    captain=v.get("captain"),
-                    departure_port=v.get("departure_port"),
-                    departure_date=v.get("departure_date"),
-                    destination_port=v.get("destination_port"),
-                    fate=v.get("fate"),
-                    summary=v.get("summary"),
-                    archive=v.get("archive"),
-                )
-                for v in result.items
-            ]
+            voyages = build_infos(VoyageInfo, result.items, fields)
 
             return format_response(
                 VoyageSearchResponse(
@@ -5,9 +5,11 @@ import logging
 from ...constants import ErrorMessages, SuccessMessages
 from ...models import (
     ErrorResponse,
+    SearchCountResponse,
     WreckDetailResponse,
     WreckInfo,
     WreckSearchResponse,
+    build_infos,
     format_response,
 )
 
@@ -33,6 +35,9 @@ def register_wreck_tools(mcp: object, manager: object) -> None:
         archive: str | None = None,
         max_results: int = 100,
         cursor: str | None = None,
+        mode: str = "records",
+        facets: list[str] | None = None,
+        fields: list[str] | None = None,
         output_mode: str = "json",
     ) -> str:
         """
@@ -67,6 +72,15 @@ def register_wreck_tools(mcp: object, manager: object) -> None:
             archive: Restrict to specific archive - maarer, eic, carreira, galleon, soic, ukho, noaa (default: all)
             max_results: Maximum results per page (default: 100, max: 500)
             cursor: Pagination cursor from a previous result's next_cursor field
+            mode: "records" (default) for a page of wrecks, or "count" for the
+                total number of matches only
+            facets: Fields to break the match count down by (implies mode="count") -
+                archive, region, loss_cause, status, flag,
+                vessel_type, ship_type, gp_quality
+            fields: Record fields to return (default: all; the ID and name are
+                always included) -
+                wreck_id, ship_name, loss_date, loss_cause, region, status,
+                position, archive, flag, vessel_type, depth_estimate_m
             output_mode: Response format - "json" (default) or "text"
 
         Returns:
@@ -81,8 +95,39 @@ def register_wreck_tools(mcp: object, manager: object) -> None:
             - Use flag to filter by nationality (e.g. "UK", "NL", "US")
             - Use vessel_type to filter by ship classification (e.g. "liner", "warship")
             - Use gp_quality=1 to find NOAA wrecks with high-accuracy positions
+            - Use mode="count" with facets=["region", "loss_cause"] for totals and
+              breakdowns without paging through records
         """
         try:
+            if mode not in ("records", "count"):
+                raise ValueError(ErrorMessages.INVALID_SEARCH_MODE.format(mode))
+            if mode == "count" or facets:
+                counts = await manager.count_wrecks(  # type: ignore[union-attr]
+                    ship_name=ship_name,
+                    date_range=date_range,
+                    region=region,
+                    cause=cause,
+                    status=status,
+                    min_depth_m=min_depth_m,
+                    max_depth_m=max_depth_m,
+                    min_cargo_value=min_cargo_value,
+                    flag=flag,
+                    vessel_type=vessel_type,
+                    gp_quality=gp_quality,
+                    archive=archive,
+                    facets=facets or [],
+                )
+                return format_response(
+                    SearchCountResponse(
+                        record_type="wreck",
+                        total_count=counts["total_count"],
+                        facets=counts["facets"],
+                        archive=archive,
+                        message=SuccessMessages.WRECKS_COUNTED.format(counts["total_count"]),
+                    ),
+                    output_mode,
+                )
+
             result = await manager.search_wrecks(  # type: ignore[union-attr]
                 ship_name=ship_name,
                 date_range=date_range,
@@ -106,22 +151,7 @@ def register_wreck_tools(mcp: object, manager: object) -> None:
                     output_mode,
                 )
 
-            wrecks = [
-                WreckInfo(
-                    wreck_id=w.get("wreck_id", ""),
-                    ship_name=w.get("ship_name", ""),
-                    loss_date=w.get("loss_date"),
-                    loss_cause=w.get("loss_cause"),
-                    region=w.get("region"),
-                    status=w.get("status"),
-                    position=w.get("position"),
-                    archive=w.get("archive"),
-                    flag=w.get("flag"),
-                    vessel_type=w.get("vessel_type"),
-                    depth_estimate_m=w.get("depth_estimate_m"),
-                )
-                for w in result.items
-            ]
+            wrecks = build_infos(WreckInfo, result.items, fields)
 
             return format_response(
                 WreckSearchResponse(
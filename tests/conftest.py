@@ -1,13 +1,19 @@
 """Shared fixtures for chuk-mcp-maritime-archives tests."""
 
+import os
 from pathlib import Path
 
 import pytest
 
+from chuk_mcp_maritime_archives.constants import EnvVar
 from chuk_mcp_maritime_archives.core.archive_manager import ArchiveManager
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
+# Keep index snapshots out of the fixtures directory; snapshot tests
+# re-enable them against a tmp_path copy
+os.environ[EnvVar.INDEX_SNAPSHOTS] = "0"
+
 
 # ---------------------------------------------------------------------------
 # Mock MCP server — collects registered tools without a real MCP runtime
@@ -41,6 +47,20 @@ def mock_mcp() -> MockMCPServer:
     return MockMCPServer()
 
 
+# ---------------------------------------------------------------------------
+# Reference datasets load lazily; many tests read the module containers
+# (_TRACKS, VOC_ROUTES, ...) directly, so load them all once up front.
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _load_reference_datasets() -> None:
+    from chuk_mcp_maritime_archives.core.warmup import dataset_status, load_dataset
+
+    for name in dataset_status():
+        load_dataset(name)
+
+
 # ---------------------------------------------------------------------------
 # ArchiveManager fixtures
 # ---------------------------------------------------------------------------
@@ -1,10 +1,16 @@
 """Tests for ArchiveManager backed by local JSON fixture data."""
 
+import asyncio
+import json
+import threading
+from collections import Counter
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from chuk_mcp_maritime_archives.constants import SEARCH_WORKERS, EnvVar
 from chuk_mcp_maritime_archives.core.archive_manager import ArchiveManager
+from chuk_mcp_maritime_archives.models.responses import decode_cursor_state, encode_cursor
 
 
 # ---------------------------------------------------------------------------
@@ -38,6 +44,52 @@ class TestArchiveRegistry:
         assert len(ids) >= 4
 
 
+# ---------------------------------------------------------------------------
+# Preloading
+# ---------------------------------------------------------------------------
+
+
+class TestPreload:
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_preload_all_clients(self, manager: ArchiveManager, parallel: bool):
+        timings = manager.preload(parallel=parallel)
+        assert set(timings) == {
+            "das",
+            "voc_crew",
+            "voc_cargo",
+            "maarer",
+            "eic",
+            "carreira",
+            "galleon",
+            "soic",
+            "ukho",
+            "noaa",
+            "dss",
+        }
+        assert timings["das"].keys() == {"voyages.json", "vessels.json"}
+        assert "wrecks.json" in manager._wreck_client._loaded
+        assert manager._noaa_client._wreck_index is not None
+
+    def test_preload_logs_per_file(self, manager: ArchiveManager, caplog):
+        with caplog.at_level("INFO", logger="chuk_mcp_maritime_archives.core.archive_manager"):
+            manager.preload()
+        assert any("Preloaded das (voyages.json" in r.getMessage() for r in caplog.records)
+        assert any("Preloaded 11/11 archives" in r.getMessage() for r in caplog.records)
+
+    def test_preload_failure_is_isolated(self, manager: ArchiveManager):
+        with patch.object(manager._eic_client, "preload", side_effect=ValueError("bad json")):
+            timings = manager.preload()
+        assert "eic" not in timings
+        assert "das" in timings
+
+    @pytest.mark.asyncio
+    async def test_warm_runs_in_background(self, manager: ArchiveManager):
+        manager.warm().join(timeout=30)
+        assert "voyages.json" in manager._das_client._loaded
+        result = await manager.search_wrecks(max_results=500)
+        assert result.total_count > 0
+
+
 # ---------------------------------------------------------------------------
 # Hull profiles (sync — reads constant data, no file I/O)
 # ---------------------------------------------------------------------------
@@ -359,6 +411,40 @@ class TestStatistics:
         assert stats["summary"]["lives_lost_total"] == 193
         assert stats["summary"]["cargo_value_guilders_total"] == 340600
 
+    @pytest.mark.asyncio
+    async def test_get_statistics_counts_past_page_size(self, tmp_path):
+        wrecks = [
+            {
+                "wreck_id": f"maarer:W{i:04d}",
+                "loss_date": f"{1700 + i % 50}-01-01",
+                "region": "cape" if i % 2 else None,
+                "loss_cause": "storm",
+                "lives_lost": 1,
+            }
+            for i in range(1200)
+        ]
+        (tmp_path / "wrecks.json").write_text(json.dumps(wrecks))
+        stats = await ArchiveManager(data_dir=tmp_path).get_statistics()
+        assert stats["summary"]["total_losses"] == 1200
+        assert stats["summary"]["lives_lost_total"] == 1200
+        assert stats["losses_by_region"] == {"cape": 600, "other": 600}
+        assert stats["losses_by_cause"] == {"storm": 1200}
+        assert stats["losses_by_status"] == {"unknown": 1200}
+        assert sum(stats["losses_by_decade"].values()) == 1200
+
+    @pytest.mark.asyncio
+    async def test_get_statistics_skips_non_numeric_values(self, tmp_path):
+        wrecks = [
+            {"wreck_id": "maarer:W1", "lives_lost": 12, "cargo_value_guilders": 1000.5},
+            {"wreck_id": "maarer:W2", "lives_lost": "unknown", "cargo_value_guilders": ""},
+            {"wreck_id": "maarer:W3", "lives_lost": 3},
+        ]
+        (tmp_path / "wrecks.json").write_text(json.dumps(wrecks))
+        stats = await ArchiveManager(data_dir=tmp_path).get_statistics()
+        assert stats["summary"]["total_losses"] == 3
+        assert stats["summary"]["lives_lost_total"] == 15
+        assert stats["summary"]["cargo_value_guilders_total"] == 1000.5
+
 
 # ---------------------------------------------------------------------------
 # GeoJSON export (async — reads wreck fixture data)
@@ -645,6 +731,193 @@ class TestPaginationIntegration:
         assert len(result.items) <= 500
 
 
+class TestMergedSearch:
+    """Cross-archive searches merge presorted client streams."""
+
+    @staticmethod
+    async def _pages(search, page_size: int, **kwargs) -> tuple[list[dict], int]:
+        items: list[dict] = []
+        cursor = None
+        while True:
+            result = await search(max_results=page_size, cursor=cursor, **kwargs)
+            items.extend(result.items)
+            if not result.has_more:
+                return items, result.total_count
+            cursor = result.next_cursor
+
+    @pytest.mark.asyncio
+    async def test_voyages_match_full_sort(self, manager: ArchiveManager):
+        expected = []
+        for client in manager._voyage_clients.values():
+            expected.extend(await client.search(max_results=999_999))
+        expected.sort(key=lambda v: (v.get("departure_date") or "9999", v.get("voyage_id", "")))
+        items, total = await self._pages(manager.search_voyages, 4)
+        assert items == expected
+        assert total == len(expected)
+
+    @pytest.mark.asyncio
+    async def test_wrecks_match_full_sort(self, manager: ArchiveManager):
+        expected = []
+        for client in manager._wreck_clients.values():
+            search = getattr(client, "search_wrecks", client.search)
+            expected.extend(await search(region="cape", max_results=999_999))
+        expected.sort(key=lambda w: (w.get("loss_date") or "9999", w.get("wreck_id", "")))
+        items, total = await self._pages(manager.search_wrecks, 3, region="cape")
+        assert items == expected
+        assert total == len(expected)
+
+    @pytest.mark.asyncio
+    async def test_crew_match_full_sort(self, manager: ArchiveManager):
+        expected = []
+        for client in manager._crew_clients.values():
+            expected.extend(await client.search(max_results=999_999))
+        expected.sort(
+            key=lambda c: (
+                c.get("embarkation_date") or c.get("muster_date") or "9999",
+                c.get("crew_id", ""),
+            )
+        )
+        items, total = await self._pages(manager.search_crew, 2, archive=None)
+        assert items == expected
+        assert total == len(expected)
+
+    @pytest.mark.asyncio
+    async def test_single_archive_count(self, manager: ArchiveManager):
+        result = await manager.search_voyages(archive="das", max_results=1)
+        every = await manager._das_client.search(max_results=999_999)
+        assert result.items == every[:1]
+        assert result.total_count == len(every)
+
+    @pytest.mark.asyncio
+    async def test_page_past_end(self, manager: ArchiveManager):
+        first = await manager.search_voyages(max_results=500)
+        result = await manager.search_voyages(cursor=encode_cursor(first.total_count + 10))
+        assert result.items == []
+        assert result.total_count == first.total_count
+        assert not result.has_more
+
+
+class TestKeysetCursors:
+    @pytest.mark.asyncio
+    async def test_cursor_records_positions_and_fingerprint(self, manager: ArchiveManager):
+        result = await manager.search_wrecks(max_results=2)
+        state = decode_cursor_state(result.next_cursor)
+        assert state["o"] == 2
+        assert sum(1 for _ in state["p"]) >= 1
+        assert state["q"] and state["v"]
+
+    @pytest.mark.asyncio
+    async def test_cursor_rejected_for_other_filters(self, manager: ArchiveManager):
+        result = await manager.search_wrecks(max_results=2)
+        with pytest.raises(ValueError, match="different search"):
+            await manager.search_wrecks(status="found", max_results=2, cursor=result.next_cursor)
+        with pytest.raises(ValueError):
+            await manager.search_voyages(max_results=2, cursor=result.next_cursor)
+
+    @pytest.mark.asyncio
+    async def test_cursor_rejected_after_data_change(self, manager: ArchiveManager):
+        result = await manager.search_voyages(archive="das", max_results=2)
+        with (
+            patch.object(manager._das_client, "data_version", return_value="changed"),
+            pytest.raises(ValueError, match="changed"),
+        ):
+            await manager.search_voyages(archive="das", max_results=2, cursor=result.next_cursor)
+
+    @pytest.mark.asyncio
+    async def test_single_archive_pages_in_file_order(self, manager: ArchiveManager):
+        every = await manager._wreck_client.search(max_results=999_999)
+        items, total = await TestMergedSearch._pages(manager.search_wrecks, 2, archive="maarer")
+        assert items == every
+        assert total == len(every)
+
+    @pytest.mark.asyncio
+    async def test_offset_cursor_still_accepted(self, manager: ArchiveManager):
+        pages = await manager.search_voyages(max_results=6)
+        result = await manager.search_voyages(max_results=3, cursor=encode_cursor(3))
+        assert result.items == pages.items[3:6]
+        resumed = await manager.search_voyages(max_results=3, cursor=result.next_cursor)
+        following = await manager.search_voyages(max_results=9)
+        assert resumed.items == following.items[6:9]
+
+
+class TestSearchCounts:
+    @pytest.mark.asyncio
+    async def test_total_matches_search(self, manager: ArchiveManager):
+        counts = await manager.count_wrecks(region="cape")
+        result = await manager.search_wrecks(region="cape")
+        assert counts["total_count"] == result.total_count
+        assert counts["facets"] == {}
+
+    @pytest.mark.asyncio
+    async def test_facets_match_records(self, manager: ArchiveManager):
+        counts = await manager.count_wrecks(facets=["archive", "loss_cause", "gp_quality"])
+        records = (await manager.search_wrecks(max_results=500)).items
+        loss_causes = Counter(w["loss_cause"] for w in records if w.get("loss_cause"))
+        assert counts["facets"]["loss_cause"] == dict(loss_causes)
+        assert sum(counts["facets"]["archive"].values()) == counts["total_count"]
+        assert counts["facets"]["gp_quality"]["1"] == sum(
+            1 for w in records if w.get("gp_quality") == 1
+        )
+
+    @pytest.mark.asyncio
+    async def test_facets_most_frequent_first(self, manager: ArchiveManager):
+        counts = await manager.count_voyages(facets=["archive"])
+        values = list(counts["facets"]["archive"].values())
+        assert values == sorted(values, reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_single_archive(self, manager: ArchiveManager):
+        counts = await manager.count_voyages(archive="eic", facets=["archive"])
+        assert counts["facets"]["archive"] == {"eic": counts["total_count"]}
+
+    @pytest.mark.asyncio
+    async def test_unknown_archive(self, manager: ArchiveManager):
+        assert await manager.count_wrecks(archive="nope") == {"total_count": 0, "facets": {}}
+
+    @pytest.mark.asyncio
+    async def test_unknown_facet(self, manager: ArchiveManager):
+        with pytest.raises(ValueError, match="ship_name"):
+            await manager.count_wrecks(facets=["ship_name"])
+
+    @pytest.mark.asyncio
+    async def test_cached(self, manager: ArchiveManager):
+        await manager.count_wrecks(status="found", facets=["region"])
+        hits = manager.query_cache_stats()["hits"]
+        await manager.count_wrecks(status="found", facets=["region"])
+        assert manager.query_cache_stats()["hits"] == hits + 1
+
+
+class TestSearchPool:
+    @pytest.mark.asyncio
+    async def test_client_calls_run_on_search_pool(self, manager: ArchiveManager):
+        threads = []
+        count_wrecks = manager._ukho_client.count_wrecks
+
+        def spy(**kwargs):
+            threads.append(threading.current_thread().name)
+            return count_wrecks(**kwargs)
+
+        with patch.object(manager._ukho_client, "count_wrecks", side_effect=spy):
+            await manager.search_wrecks(max_results=2)
+        assert threads and threads[0].startswith("archive-search")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_searches(self, manager: ArchiveManager):
+        results = await asyncio.gather(
+            manager.search_voyages(max_results=3),
+            manager.search_wrecks(max_results=3),
+            manager.search_narratives(query="cape"),
+        )
+        assert all(r.total_count > 0 for r in results)
+
+    def test_pool_size(self, monkeypatch):
+        assert ArchiveManager(search_workers=3)._search_workers == 3
+        monkeypatch.setenv(EnvVar.SEARCH_WORKERS, "5")
+        assert ArchiveManager()._search_workers == 5
+        monkeypatch.setenv(EnvVar.SEARCH_WORKERS, "many")
+        assert ArchiveManager()._search_workers == SEARCH_WORKERS
+
+
 # ---------------------------------------------------------------------------
 # Narrative search (async — searches free-text fields across all fixtures)
 # ---------------------------------------------------------------------------
@@ -1449,6 +1722,15 @@ class TestCrewCareer:
         assert ind["career_span_years"] is not None
         assert ind["career_span_years"] > 0
 
+    def test_career_origin_filter_skips_null_origin(self, tmp_path):
+        (tmp_path / "crew.json").write_text(
+            '[{"crew_id": "voc_crew:000001", "name": "Jan", "origin": null},'
+            ' {"crew_id": "voc_crew:000002", "name": "Jan", "origin": "Delft"}]'
+        )
+        result = ArchiveManager(data_dir=tmp_path).crew_career(name="Jan", origin="delft")
+        assert result["total_matches"] == 1
+        assert result["individuals"][0]["voyages"][0]["crew_id"] == "voc_crew:000002"
+
 
 # ---------------------------------------------------------------------------
 # Crew survival
@@ -0,0 +1,134 @@
+"""Tests for categorical bitmap indexes and facet counts."""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from chuk_mcp_maritime_archives.core.clients.bitmap_index import (
+    MAX_VALUES,
+    BitmapIndex,
+    bitmap_rows,
+)
+from chuk_mcp_maritime_archives.core.clients.noaa_client import NOAAClient
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+REGIONS = ["cape", "north_sea", None, "cape", "caribbean", "north_sea", "cape"]
+
+
+class TestBitmapRows:
+    def test_rows(self):
+        assert bitmap_rows(0b101001) == [0, 3, 5]
+
+    def test_empty(self):
+        assert bitmap_rows(0) == []
+
+    def test_round_trip(self):
+        rows = sorted(random.Random(5).sample(range(10_000), 300))
+        assert bitmap_rows(sum(1 << r for r in rows)) == rows
+
+
+class TestBitmapIndex:
+    def setup_method(self):
+        self.index = BitmapIndex.build(REGIONS)
+
+    def test_equal(self):
+        assert bitmap_rows(self.index.equal("cape")) == [0, 3, 6]
+        assert self.index.equal("unknown") == 0
+
+    def test_containing(self):
+        assert bitmap_rows(self.index.containing("north")) == [1, 5]
+        assert bitmap_rows(self.index.containing("a")) == [0, 1, 3, 4, 5, 6]
+
+    def test_and(self):
+        other = BitmapIndex.build(["found", "found", "found", "lost", "lost", "found", "lost"])
+        both = self.index.equal("cape") & other.equal("lost")
+        assert bitmap_rows(both) == [3, 6]
+
+    def test_counts(self):
+        assert self.index.counts() == {"cape": 3, "north_sea": 2, "caribbean": 1}
+        assert self.index.counts(0b0000011) == {"cape": 1, "north_sea": 1}
+
+    def test_all_rows(self):
+        assert bitmap_rows(self.index.all_rows()) == list(range(len(REGIONS)))
+
+    def test_too_many_values(self):
+        assert BitmapIndex.build([str(i) for i in range(MAX_VALUES + 1)]) is None
+
+    def test_unhashable_values(self):
+        assert BitmapIndex.build(["a", ["b"]]) is None
+
+
+class TestCategoricalSearch:
+    def setup_method(self):
+        self.client = NOAAClient(data_dir=FIXTURES_DIR)
+        self.wrecks = self.client._get_wrecks()
+
+    @pytest.mark.asyncio
+    async def test_equality_filters_match_scan(self):
+        for cause, status in [("storm", "found"), ("storm", None), (None, "found"), ("x", None)]:
+            expected = [
+                w
+                for w in self.wrecks
+                if (cause is None or w.get("loss_cause") == cause)
+                and (status is None or w.get("status") == status)
+            ]
+            assert await self.client.search_wrecks(cause=cause, status=status) == expected
+
+    @pytest.mark.asyncio
+    async def test_flag_substring_and_gp_quality(self):
+        expected = [
+            w for w in self.wrecks if "us" in (w["flag"] or "").lower() and w["gp_quality"] == 1
+        ]
+        assert await self.client.search_wrecks(flag="us", gp_quality=1) == expected
+
+    @pytest.mark.asyncio
+    async def test_index_built_once(self):
+        await self.client.search_wrecks(region="north_atlantic")
+        index = self.client._bitmap_index(self.client.WRECKS_FILE, "region")
+        assert index is not None
+        await self.client.search_wrecks(region="caribbean")
+        assert self.client._bitmap_index(self.client.WRECKS_FILE, "region") is index
+
+    def test_uncategorical_field_not_indexed(self):
+        assert self.client._bitmap_index(self.client.WRECKS_FILE, "ship_name") is None
+
+
+class TestFacetCounts:
+    def setup_method(self):
+        self.client = NOAAClient(data_dir=FIXTURES_DIR)
+        self.wrecks = self.client._get_wrecks()
+
+    def count(self, field, wrecks):
+        counts = {}
+        for w in wrecks:
+            if w.get(field) is not None:
+                counts[w[field]] = counts.get(w[field], 0) + 1
+        return counts
+
+    def test_unfiltered(self):
+        facets = self.client._facet_counts(self.client.WRECKS_FILE, ("region", "loss_cause"))
+        assert facets == {
+            "region": self.count("region", self.wrecks),
+            "loss_cause": self.count("loss_cause", self.wrecks),
+        }
+
+    def test_bitmap_filters(self):
+        facets = self.client._facet_counts(
+            self.client.WRECKS_FILE, ("region",), equals={"status": "found"}
+        )
+        found = [w for w in self.wrecks if w["status"] == "found"]
+        assert facets == {"region": self.count("region", found)}
+
+    def test_scanned_filters_and_plain_field(self):
+        facets = self.client._facet_counts(
+            self.client.WRECKS_FILE,
+            ("region", "ship_name"),
+            at_least={"depth_estimate_m": 50},
+        )
+        deep = [w for w in self.wrecks if (w.get("depth_estimate_m") or 0) >= 50]
+        assert facets == {
+            "region": self.count("region", deep),
+            "ship_name": self.count("ship_name", deep),
+        }
@@ -1,12 +1,21 @@
 """Tests for archive client classes using local JSON fixture data."""
 
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from pathlib import Path
 
 import pytest
 
-from chuk_mcp_maritime_archives.core.clients.base import BaseArchiveClient
+from chuk_mcp_maritime_archives.core.clients.base import (
+    BaseArchiveClient,
+    VoyageArchiveClient,
+    WreckArchiveClient,
+    crew_order,
+)
 from chuk_mcp_maritime_archives.core.clients.cargo_client import CargoClient
 from chuk_mcp_maritime_archives.core.clients.crew_client import CrewClient
+from chuk_mcp_maritime_archives.core.clients.crew_store import CrewStore
 from chuk_mcp_maritime_archives.core.clients.das_client import DASClient
 from chuk_mcp_maritime_archives.core.clients.wreck_client import WreckClient
 
@@ -35,6 +44,18 @@ class TestContains:
         assert BaseArchiveClient._contains("Ridderschap van Holland", "Holland") is True
 
 
+class TestClientKinds:
+    def test_voyage_queries_only_on_voyage_clients(self):
+        assert isinstance(DASClient(data_dir=FIXTURES_DIR), VoyageArchiveClient)
+        assert not isinstance(DASClient(data_dir=FIXTURES_DIR), WreckArchiveClient)
+        assert not hasattr(CrewClient(data_dir=FIXTURES_DIR), "iter_voyages")
+
+    def test_wreck_queries_only_on_wreck_clients(self):
+        assert isinstance(WreckClient(data_dir=FIXTURES_DIR), WreckArchiveClient)
+        assert not hasattr(WreckClient(data_dir=FIXTURES_DIR), "count_voyages")
+        assert not hasattr(CargoClient(data_dir=FIXTURES_DIR), "count_wrecks")
+
+
 class TestFilterByDateRange:
     def setup_method(self):
         self.client = DASClient(data_dir=FIXTURES_DIR)
@@ -53,6 +74,10 @@ class TestFilterByDateRange:
         result = self.client._filter_by_date_range(self.records, "1600-01-01/1700-12-31", "date")
         assert len(result) == 2
 
+    def test_filter_day_precision(self):
+        result = self.client._filter_by_date_range(self.records, "1620-05-02/1700-03-15", "date")
+        assert [r["name"] for r in result] == ["B"]
+
     def test_filter_invalid_format(self):
         result = self.client._filter_by_date_range(self.records, "invalid", "date")
         assert len(result) == 3  # returns all
@@ -73,6 +98,90 @@ class TestFilterByDateRange:
         assert len(result) == 1
 
 
+class TestSelect:
+    def setup_method(self):
+        self.client = DASClient(data_dir=FIXTURES_DIR)
+        self.client._loaded["rows.json"] = [
+            {"name": "Batavia", "port": "Texel", "tons": 600, "date": "1628-10-28"},
+            {"name": "Amsterdam", "port": None, "tons": None, "date": "1748-11-15"},
+            {"name": "Zeewijk", "port": "Texel", "tons": 800, "date": "1725-11-07"},
+            {"name": "Hollandia", "port": "Texel", "tons": 1000, "date": ""},
+        ]
+
+    def names(self, **filters):
+        return [r["name"] for r in self.client._select("rows.json", **filters)]
+
+    def test_no_filters_returns_all_in_order(self):
+        assert self.names() == ["Batavia", "Amsterdam", "Zeewijk", "Hollandia"]
+
+    def test_none_and_empty_filters_skipped(self):
+        assert len(self.names(contains={"name": None}, equals={"port": ""})) == 4
+
+    def test_contains_is_case_insensitive(self):
+        assert self.names(contains={"name": "WIJK"}) == ["Zeewijk"]
+
+    def test_contains_any(self):
+        assert self.names(contains_any={("name", "port"): "tex"}) == [
+            "Batavia",
+            "Zeewijk",
+            "Hollandia",
+        ]
+
+    def test_numeric_bounds(self):
+        assert self.names(at_least={"tons": 700}) == ["Zeewijk", "Hollandia"]
+        assert self.names(at_most={"tons": 700}) == ["Batavia"]
+
+    def test_date_range_and_years(self):
+        assert self.names(date_range=("date", "1700/1800")) == ["Amsterdam", "Zeewijk"]
+        assert self.names(years=("date", None, 1700)) == ["Batavia"]
+        assert len(self.names(date_range=("date", "invalid"))) == 4
+
+    def test_combined_filters_stop_at_max_results(self):
+        result = self.names(contains={"port": "texel"}, at_least={"tons": 500}, max_results=2)
+        assert result == ["Batavia", "Zeewijk"]
+
+    def test_zero_max_results(self):
+        assert self.names(max_results=0) == []
+
+    def test_lowered_column_rebuilt_for_new_records(self):
+        assert self.names(contains={"name": "batavia"}) == ["Batavia"]
+        self.client._loaded["rows.json"] = [{"name": "Batavia II"}]
+        assert self.names(contains={"name": "batavia"}) == ["Batavia II"]
+
+    def test_integer_year_field(self):
+        self.client._loaded["rows.json"] = [{"name": "A", "built": 1724}, {"name": "B"}]
+        assert self.names(date_range=("built", "1700/1750")) == ["A"]
+
+    def sorted_names(self, **filters):
+        def order(record):
+            return (record["date"] or "9999", record["name"])
+
+        return [r["name"] for _, r in self.client._iter_rows("rows.json", order, **filters)]
+
+    def test_iter_rows_sorted(self):
+        assert self.sorted_names() == ["Batavia", "Zeewijk", "Amsterdam", "Hollandia"]
+        assert self.sorted_names(contains={"port": "texel"}, at_least={"tons": 700}) == [
+            "Zeewijk",
+            "Hollandia",
+        ]
+        assert self.sorted_names(date_range=("date", "1700/1800")) == ["Zeewijk", "Amsterdam"]
+
+    def test_iter_rows_resumes_after_position(self):
+        def order(record):
+            return (record["date"] or "9999", record["name"])
+
+        rows = list(self.client._iter_rows("rows.json", order, contains={"port": "texel"}))
+        assert [p for p, _ in rows] == [0, 1, 3]  # Amsterdam (position 2) has no port
+        resumed = self.client._iter_rows("rows.json", order, after=1, contains={"port": "texel"})
+        assert [r["name"] for _, r in resumed] == ["Hollandia"]
+        in_file_order = self.client._iter_rows("rows.json", after=0)
+        assert [(p, r["name"]) for p, r in in_file_order][:1] == [(1, "Amsterdam")]
+
+    def test_count(self):
+        assert self.client._count("rows.json") == 4
+        assert self.client._count("rows.json", contains={"port": "texel"}) == 3
+
+
 class TestLoadJson:
     def test_load_existing_file(self):
         client = DASClient(data_dir=FIXTURES_DIR)
@@ -96,6 +205,42 @@ class TestLoadJson:
         data = client._load_json("voyages.json")
         assert data == []
 
+    def test_concurrent_loads_share_one_result(self):
+        client = DASClient(data_dir=FIXTURES_DIR)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: client._load_json("vessels.json"), range(16)))
+        assert all(r is results[0] for r in results)
+
+
+class TestPreload:
+    def test_preload_loads_files_and_indexes(self):
+        client = DASClient(data_dir=FIXTURES_DIR)
+        timings = client.preload()
+        assert set(timings) == {"voyages.json", "vessels.json"}
+        assert all(t >= 0 for t in timings.values())
+        assert set(client._loaded) == {"voyages.json", "vessels.json"}
+        assert client._voyage_index is not None
+        assert client._vessel_index is not None
+        assert client._voyage_vessel_index is not None
+
+    def test_preload_builds_crew_store(self):
+        client = CrewClient(data_dir=FIXTURES_DIR)
+        assert list(client.preload()) == ["crew.json"]
+        assert client._store is not None
+        assert client._loaded == {}
+
+    def test_preload_without_indexes(self):
+        client = CargoClient(data_dir=FIXTURES_DIR)
+        assert list(client.preload()) == ["cargo.json"]
+
+    @pytest.mark.asyncio
+    async def test_preload_results_match_lazy(self):
+        lazy = DASClient(data_dir=FIXTURES_DIR)
+        warm = DASClient(data_dir=FIXTURES_DIR)
+        warm.preload()
+        for vid in ("das:3456", "das:1234"):
+            assert await warm.get_by_id(vid) == await lazy.get_by_id(vid)
+
 
 # ---------------------------------------------------------------------------
 # DASClient
@@ -254,6 +399,25 @@ class TestCrewClient:
         results = await self.client.search()
         assert len(results) == 12
 
+    @pytest.mark.asyncio
+    async def test_iter_crew_sorted(self):
+        results = await self.client.search(max_results=100)
+        expected = sorted(results, key=crew_order)
+        assert [r for _, r in self.client.iter_crew()] == expected
+        ridderschap = [r for r in expected if "Ridderschap" in r["ship_name"]]
+        matches = list(self.client.iter_crew(ship_name="Ridderschap"))
+        assert [r for _, r in matches] == ridderschap
+        assert self.client.count_crew(ship_name="Ridderschap") == len(ridderschap)
+        resumed = self.client.iter_crew(ship_name="Ridderschap", after=matches[1][0])
+        assert [r for _, r in resumed] == ridderschap[2:]
+
+    @pytest.mark.asyncio
+    async def test_iter_crew_file_order(self):
+        results = await self.client.search(max_results=100)
+        rows = list(self.client.iter_crew(sort=False, after=4))
+        assert [r for _, r in rows] == results[5:]
+        assert rows[0][0] == 5
+
     @pytest.mark.asyncio
     async def test_search_filters_by_name(self):
         results = await self.client.search(name="Pietersz")
@@ -300,12 +464,13 @@ class TestCrewClient:
         assert len(results) == 1
 
     @pytest.mark.asyncio
-    async def test_search_indexes_cached(self):
-        """Second search uses cached indexes (early return in _ensure_indexes)."""
+    async def test_search_store_cached(self):
+        """Second search reuses the store built by the first."""
         await self.client.search()
-        # Index is now built; second call triggers the early return
+        store = self.client.store()
         results = await self.client.search(name="Pietersz")
         assert len(results) == 3
+        assert self.client.store() is store
 
     @pytest.mark.asyncio
     async def test_get_by_id_success(self):
@@ -333,49 +498,97 @@ class TestCrewClient:
         assert results == []
 
     @pytest.mark.asyncio
-    async def test_ensure_indexes_handles_missing_fields(self):
-        """_ensure_indexes skips records missing voyage_id or crew_id."""
-        client = CrewClient(data_dir=FIXTURES_DIR)
-        records = [
-            {"name": "No IDs at all"},
-            {"crew_id": "c1", "name": "Has crew_id only"},
-            {"voyage_id": "v1", "name": "Has voyage_id only"},
-        ]
-        client._ensure_indexes(records)
-        assert client._id_index is not None
-        assert "c1" in client._id_index
-        assert client._voyage_index is not None
-        assert "v1" in client._voyage_index
-
-    @pytest.mark.asyncio
-    async def test_get_by_id_fallback_scan(self):
-        """get_by_id falls back to linear scan when _id_index is None."""
-        client = CrewClient(data_dir=FIXTURES_DIR)
-        # Load records and build indexes, then force _id_index to None
-        await client.search()
-        client._id_index = None
-        result = await client.get_by_id("voc_crew:445892")
-        assert result is not None
-        assert result["name"] == "Jan Pietersz van der Horst"
+    async def test_search_voyage_id_combined_filters(self):
+        results = await self.client.search(voyage_id="das:5678", rank="matroos")
+        assert results
+        assert all(r["voyage_id"] == "das:5678" for r in results)
+        assert all("matroos" in r["rank"].lower() for r in results)
 
     @pytest.mark.asyncio
-    async def test_get_by_id_fallback_scan_not_found(self):
-        """get_by_id fallback scan returns None if not found."""
-        client = CrewClient(data_dir=FIXTURES_DIR)
-        await client.search()
-        client._id_index = None
-        result = await client.get_by_id("voc_crew:nonexistent")
-        assert result is None
+    async def test_search_returns_fresh_dicts(self):
+        """Records are rebuilt per call, so callers may mutate them."""
+        first = await self.client.get_by_id("voc_crew:445892")
+        first["name"] = "changed"
+        second = await self.client.get_by_id("voc_crew:445892")
+        assert second["name"] == "Jan Pietersz van der Horst"
 
     @pytest.mark.asyncio
-    async def test_search_voyage_id_without_index(self):
-        """voyage_id filter falls back to linear scan without index."""
+    async def test_get_by_id_non_canonical(self):
+        """IDs outside the voc_crew:NNNNNN form are still found."""
         client = CrewClient(data_dir=FIXTURES_DIR)
-        # Preload records & build indexes, then null out voyage index
-        await client.search()
-        client._voyage_index = None
-        results = await client.search(voyage_id="das:5678")
-        assert len(results) == 4
+        client._store = CrewStore.from_records(
+            [{"crew_id": "c1", "name": "A"}, {"crew_id": "voc_crew:7", "name": "B"}]
+        )
+        assert (await client.get_by_id("c1"))["name"] == "A"
+        assert (await client.get_by_id("voc_crew:7"))["name"] == "B"
+        assert await client.get_by_id("voc_crew:000007") is None
+
+
+class TestCrewStore:
+    def test_round_trip_matches_source(self):
+        records = json.loads((FIXTURES_DIR / "crew.json").read_text())
+        store = CrewStore.from_records(records)
+        assert len(store) == len(records)
+        assert store.records(range(len(store))) == records
+        for built, source in zip(store.records(range(len(store))), records):
+            assert list(built) == list(source)
+
+    def test_round_trip_odd_records(self):
+        records = [
+            {"name": "No IDs at all"},
+            {"crew_id": "voc_crew:000001", "embarkation_date": "1700"},
+            {"embarkation_date": "1700-02-30", "voyage_id": "v1", "crew_id": None},
+            {"crew_id": "voc_crew:000002", "rank": True, "extra": [1, 2]},
+            {"crew_id": "voc_crew:000003", "rank": 1, "embarkation_date": ""},
+            {"crew_id": "voc_crew:-00004", "embarkation_date": "1701-03-04"},
+        ]
+        store = CrewStore.from_records(records)
+        rebuilt = store.records(range(len(store)))
+        assert rebuilt == records
+        assert [type(r.get("rank")) for r in rebuilt] == [type(r.get("rank")) for r in records]
+        assert [store.year(i) for i in range(len(store))] == [None, 1700, 1700, None, None, 1701]
+        assert store.ordinal(5) == date(1701, 3, 4).toordinal()
+        assert store.ordinal(2) is None
+
+    def test_select_matches_filters(self):
+        records = json.loads((FIXTURES_DIR / "crew.json").read_text())
+        store = CrewStore.from_records(records)
+        rows = store.select(rank="MATROOS", date_range="1690/1700")
+        expected = [
+            i
+            for i, r in enumerate(records)
+            if "matroos" in (r.get("rank") or "").lower()
+            and 1690 <= int(r["embarkation_date"][:4]) <= 1700
+        ]
+        assert rows == expected
+        assert store.select(fate="no_such_fate") == []
+        assert store.select(limit=2) == [0, 1]
+        assert store.select(limit=0) == []
+
+    def test_rows_for_voyage(self):
+        records = [{"voyage_id": v} for v in ("a", "b", "a", None, "a")]
+        store = CrewStore.from_records(records)
+        assert list(store.rows_for_voyage("a")) == [0, 2, 4]
+        assert list(store.rows_for_voyage("zzz")) == []
+
+    def test_row_for_id_last_duplicate_wins(self):
+        store = CrewStore.from_records(
+            [{"crew_id": "voc_crew:000001"}, {"crew_id": "voc_crew:000001"}, {"crew_id": ""}]
+        )
+        assert store.row_for_id("voc_crew:000001") == 1
+        assert store.row_for_id("") is None
+
+    def test_group_labels(self):
+        store = CrewStore.from_records(
+            [
+                {"rank": "matroos", "embarkation_date": "1694-01-01"},
+                {"rank": None, "embarkation_date": "bad"},
+            ]
+        )
+        codes, labels = store.group_labels("rank")
+        assert [labels[c] for c in codes] == ["matroos", "unknown"]
+        codes, labels = store.group_labels("decade")
+        assert [labels[c] for c in codes] == ["1690s", "unknown"]
 
 
 # ---------------------------------------------------------------------------
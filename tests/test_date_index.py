@@ -0,0 +1,105 @@
+"""Tests for the sorted date index behind date_range filters."""
+
+import random
+
+import pytest
+
+from chuk_mcp_maritime_archives.core.clients.crew_store import CrewStore
+from chuk_mcp_maritime_archives.core.clients.date_index import (
+    MAX_KEY,
+    MIN_KEY,
+    DateIndex,
+    date_key,
+    range_keys,
+    year_keys,
+)
+
+
+class TestDateKey:
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("1628-10-28", 16281028),
+            ("1628-10", 16281000),
+            ("1628", 16280000),
+            (1724, 17240000),
+            ("1628-13-01", 16280000),  # impossible month: year only
+            ("1628/10/28", 16280000),  # unknown separator: year only
+        ],
+    )
+    def test_keys(self, value, expected):
+        assert date_key(value) == expected
+
+    @pytest.mark.parametrize("value", [None, "", "17", "abcd-01-01"])
+    def test_no_key(self, value):
+        assert date_key(value) is None
+
+
+class TestRangeKeys:
+    def test_year_bounds_cover_whole_years(self):
+        assert range_keys("1700/1750") == (17000000, 17501299)
+
+    def test_month_and_day_precision(self):
+        assert range_keys("1700-03/1750-06") == (17000300, 17500699)
+        assert range_keys("1700-03-15/1750-06-30") == (17000315, 17500630)
+
+    def test_open_bounds(self):
+        assert range_keys("/1750") == (MIN_KEY, 17501299)
+        assert range_keys("1700/") == (17000000, MAX_KEY)
+
+    def test_malformed(self):
+        assert range_keys("1700") is None
+        assert range_keys("1700/1750/1800") is None
+
+    def test_year_keys(self):
+        assert year_keys(1700, None) == (17000000, MAX_KEY)
+        assert year_keys(None, 1750) == (MIN_KEY, 17501299)
+
+
+class TestDateIndex:
+    def setup_method(self):
+        self.dates = ["1750-06-01", None, "1628-10-28", "1700", "1700-03-20", "1700-03-10"]
+        self.index = DateIndex([date_key(d) for d in self.dates])
+
+    def test_undated_rows_left_out(self):
+        assert len(self.index) == 5
+
+    def test_rows_between_in_row_order(self):
+        assert self.index.rows_between(*range_keys("1700/1750")) == [0, 3, 4, 5]
+
+    def test_day_precision(self):
+        assert self.index.rows_between(*range_keys("1700-03-15/1750-05-31")) == [4]
+
+    def test_count_between(self):
+        assert self.index.count_between(*range_keys("1600/1699")) == 1
+        assert self.index.count_between(*range_keys("1800/1900")) == 0
+
+    def test_narrow_rows(self):
+        assert self.index.narrow_rows(*range_keys("1600/1699"), total=4) == [2]
+        assert self.index.narrow_rows(*range_keys("1600/1800"), total=6) is None
+
+    def test_matches_scan(self):
+        rng = random.Random(3)
+        keys = [rng.choice([None, rng.randint(1600, 1800) * 10000 + 101]) for _ in range(300)]
+        index = DateIndex(keys)
+        for _ in range(50):
+            lo, hi = sorted(rng.randint(1600, 1800) * 10000 for _ in range(2))
+            expected = [row for row, k in enumerate(keys) if k is not None and lo <= k <= hi]
+            assert index.rows_between(lo, hi) == expected
+
+
+class TestCrewStoreDates:
+    def setup_method(self):
+        dates = ["1694-01-03", "1694-05-12", "1694", "1700-02-01", None, "unknown"]
+        self.store = CrewStore.from_records(
+            [{"crew_id": f"voc_crew:{i:06d}", "embarkation_date": d} for i, d in enumerate(dates)]
+        )
+
+    def test_year_range(self):
+        assert self.store.select(date_range="1694/1694") == [0, 1, 2]
+
+    def test_month_range(self):
+        assert self.store.select(date_range="1694-02/1700-01") == [1]
+
+    def test_narrow_range_with_limit(self):
+        assert self.store.select(date_range="1700-02-01/1700-02-01", limit=5) == [3]
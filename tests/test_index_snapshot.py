@@ -0,0 +1,180 @@
+"""Tests for persisted index snapshots."""
+
+import json
+import logging
+import shutil
+from pathlib import Path
+
+import pytest
+
+from chuk_mcp_maritime_archives.constants import EnvVar
+from chuk_mcp_maritime_archives.core.clients.crew_client import CrewClient
+from chuk_mcp_maritime_archives.core.clients.das_client import DASClient
+from chuk_mcp_maritime_archives.core.clients.ukho_client import UKHOClient
+from chuk_mcp_maritime_archives.core.index_snapshot import (
+    load_snapshot,
+    save_snapshot,
+    snapshots_enabled,
+    source_hashes,
+)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """A writable copy of the fixtures with snapshots enabled."""
+    monkeypatch.setenv(EnvVar.INDEX_SNAPSHOTS, "1")
+    for path in FIXTURES_DIR.glob("*.json"):
+        shutil.copy(path, tmp_path / path.name)
+    return tmp_path
+
+
+def _fail_read(*args, **kwargs):
+    raise AssertionError("data file was parsed")
+
+
+# ---------------------------------------------------------------------------
+# Snapshot files
+# ---------------------------------------------------------------------------
+
+
+class TestSnapshotFile:
+    def test_round_trip(self, tmp_path):
+        source = tmp_path / "data.json"
+        source.write_text("[]")
+        sources = source_hashes([source])
+        data = ([{"a": 1}], {"index": {"x": (1, 2.5, None)}})
+        assert save_snapshot(tmp_path / "data.idx", sources, 1, data)
+        assert load_snapshot(tmp_path / "data.idx", sources, 1) == data
+
+    def test_shared_objects_stay_shared(self, tmp_path):
+        source = tmp_path / "data.json"
+        source.write_text("[]")
+        sources = source_hashes([source])
+        rec = {"id": "a"}
+        save_snapshot(tmp_path / "data.idx", sources, 1, ([rec], {"a": rec}))
+        records, index = load_snapshot(tmp_path / "data.idx", sources, 1)
+        assert index["a"] is records[0]
+
+    def test_missing(self, tmp_path):
+        assert load_snapshot(tmp_path / "data.idx", {}, 1) is None
+
+    def test_missing_source(self, tmp_path):
+        assert source_hashes([tmp_path / "nope.json"]) is None
+
+    def test_stale_sources_or_version(self, tmp_path):
+        source = tmp_path / "data.json"
+        source.write_text("[]")
+        sources = source_hashes([source])
+        save_snapshot(tmp_path / "data.idx", sources, 1, [1])
+        assert load_snapshot(tmp_path / "data.idx", sources, 2) is None
+        source.write_text("[1]")
+        assert load_snapshot(tmp_path / "data.idx", source_hashes([source]), 1) is None
+
+    @pytest.mark.parametrize("content", [b"", b"garbage", b"CHUKIDX1", b"CHUKIDX1\x00\xff"])
+    def test_corrupt(self, tmp_path, content, caplog):
+        (tmp_path / "data.idx").write_bytes(content)
+        with caplog.at_level(logging.WARNING):
+            assert load_snapshot(tmp_path / "data.idx", {}, 1) is None
+        assert "unreadable" in caplog.text
+
+    def test_unmarshallable_data(self, tmp_path):
+        assert not save_snapshot(tmp_path / "data.idx", {}, 1, object())
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.parametrize("value,enabled", [("1", True), ("0", False), ("off", False)])
+    def test_env_switch(self, monkeypatch, value, enabled):
+        monkeypatch.setenv(EnvVar.INDEX_SNAPSHOTS, value)
+        assert snapshots_enabled() is enabled
+
+
+# ---------------------------------------------------------------------------
+# Client integration
+# ---------------------------------------------------------------------------
+
+
+class TestClientSnapshots:
+    @pytest.mark.asyncio
+    async def test_preload_writes_and_restores(self, data_dir, monkeypatch):
+        DASClient(data_dir=data_dir).preload()
+        assert (data_dir / "voyages.idx").exists()
+
+        client = DASClient(data_dir=data_dir)
+        monkeypatch.setattr(client, "_read_json", _fail_read)
+        assert client._get_voyages() == json.loads((data_dir / "voyages.json").read_text())
+        assert client._voyage_index is not None
+        assert client._voyage_index["das:3456"] is next(
+            v for v in client._get_voyages() if v["voyage_id"] == "das:3456"
+        )
+        assert (await client.get_by_id("das:3456"))["voyage_id"] == "das:3456"
+
+    def test_restored_preload_does_not_rewrite(self, data_dir):
+        UKHOClient(data_dir=data_dir).preload()
+        mtime = (data_dir / "ukho_wrecks.idx").stat().st_mtime_ns
+        client = UKHOClient(data_dir=data_dir)
+        client.preload()
+        assert client._from_snapshot
+        assert (data_dir / "ukho_wrecks.idx").stat().st_mtime_ns == mtime
+
+    def test_lazy_load_does_not_write(self, data_dir):
+        UKHOClient(data_dir=data_dir)._get_wrecks()
+        assert not (data_dir / "ukho_wrecks.idx").exists()
+
+    def test_stale_snapshot_rebuilds(self, data_dir):
+        UKHOClient(data_dir=data_dir).preload()
+        wrecks = json.loads((data_dir / "ukho_wrecks.json").read_text())[:1]
+        (data_dir / "ukho_wrecks.json").write_text(json.dumps(wrecks))
+
+        client = UKHOClient(data_dir=data_dir)
+        client.preload()
+        assert client._get_wrecks() == wrecks
+        assert list(client._wreck_index) == [wrecks[0]["wreck_id"]]
+
+    def test_corrupt_snapshot_rebuilds(self, data_dir):
+        (data_dir / "ukho_wrecks.idx").write_bytes(b"CHUKIDX1 not marshal")
+        client = UKHOClient(data_dir=data_dir)
+        client.preload()
+        assert client._get_wrecks() == json.loads((data_dir / "ukho_wrecks.json").read_text())
+        assert load_snapshot(
+            data_dir / "ukho_wrecks.idx", client._snapshot_sources(), client.INDEX_VERSION
+        )
+
+    def test_index_version_bump_rebuilds(self, data_dir, monkeypatch):
+        UKHOClient(data_dir=data_dir).preload()
+        monkeypatch.setattr(UKHOClient, "INDEX_VERSION", UKHOClient.INDEX_VERSION + 1)
+        client = UKHOClient(data_dir=data_dir)
+        client._get_wrecks()
+        assert not client._from_snapshot
+
+    def test_disabled(self, data_dir, monkeypatch):
+        monkeypatch.setenv(EnvVar.INDEX_SNAPSHOTS, "0")
+        UKHOClient(data_dir=data_dir).preload()
+        assert not (data_dir / "ukho_wrecks.idx").exists()
+
+
+class TestCrewStoreSnapshot:
+    @pytest.mark.asyncio
+    async def test_restored_store_matches(self, data_dir, monkeypatch):
+        built = CrewClient(data_dir=data_dir)
+        built.preload()
+        assert (data_dir / "crew.idx").exists()
+
+        restored = CrewClient(data_dir=data_dir)
+        monkeypatch.setattr(restored, "_iter_json", _fail_read)
+        assert restored.all_records() == built.all_records()
+        for kwargs in ({"rank": "matroos"}, {"voyage_id": "das:5678"}, {"date_range": "1700/1720"}):
+            assert await restored.search(**kwargs) == await built.search(**kwargs)
+        crew_id = built.all_records()[0]["crew_id"]
+        assert await restored.get_by_id(crew_id) == await built.get_by_id(crew_id)
+
+    def test_layout_mismatch_rebuilds(self, data_dir, caplog):
+        client = CrewClient(data_dir=data_dir)
+        data = client.store().to_snapshot()
+        data["layout"] = ("middle", 3, 3, 3)
+        client._save_snapshot(data)
+
+        with caplog.at_level(logging.WARNING):
+            store = CrewClient(data_dir=data_dir).store()
+        assert "Ignoring crew store snapshot" in caplog.text
+        assert len(store) == len(client.store())
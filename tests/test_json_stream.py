@@ -0,0 +1,112 @@
+"""Tests for incremental JSON record reading."""
+
+import json
+import logging
+from pathlib import Path
+
+import pytest
+
+from chuk_mcp_maritime_archives.core.clients.crew_client import CrewClient
+from chuk_mcp_maritime_archives.core.clients.das_client import DASClient
+from chuk_mcp_maritime_archives.core.json_stream import iter_json_records, share_keys
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+RECORDS = [
+    {"id": 1, "name": "Batavia ]}, [{", "note": 'quote " and \\ backslash'},
+    {"id": 22, "name": "Zeeuw – Ærø ✓", "tags": ["a", {"b": [1, 2.5e3, None]}]},
+    12345,
+    -0.5,
+    True,
+    None,
+    "plain string",
+    [],
+    {},
+]
+
+
+def _write(path: Path, text: str) -> Path:
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+class TestIterJsonRecords:
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1 << 20])
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_matches_json_load(self, tmp_path, chunk_size, indent):
+        path = _write(
+            tmp_path / "data.json", json.dumps(RECORDS, indent=indent, ensure_ascii=False)
+        )
+        assert list(iter_json_records(path, chunk_size=chunk_size)) == RECORDS
+
+    def test_fixture_files_match_json_load(self):
+        for path in sorted(FIXTURES_DIR.glob("*.json")):
+            expected = json.loads(path.read_text())
+            if isinstance(expected, list):
+                assert list(iter_json_records(path, chunk_size=97)) == expected, path.name
+
+    @pytest.mark.parametrize("text", ["[]", "  [ \n ]  ", "\n[\n]\n"])
+    def test_empty_array(self, tmp_path, text):
+        assert list(iter_json_records(_write(tmp_path / "data.json", text), chunk_size=1)) == []
+
+    def test_non_array_yields_nothing(self, tmp_path, caplog):
+        path = _write(tmp_path / "data.json", '{"records": []}')
+        with caplog.at_level(logging.WARNING):
+            assert list(iter_json_records(path)) == []
+        assert "Expected list" in caplog.text
+
+    @pytest.mark.parametrize(
+        "text",
+        ['[{"a": 1}', '[{"a": 1},', '[{"a": 1} {"b": 2}]', '[{"a": }]', "[1,]", "", "[1, 2"],
+    )
+    def test_malformed_raises(self, tmp_path, text):
+        path = _write(tmp_path / "data.json", text)
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_records(path, chunk_size=3))
+
+    def test_streams_lazily(self, tmp_path):
+        """Records are yielded before the rest of the file is read."""
+        path = _write(tmp_path / "data.json", '[{"a": 1}, {"b": 2}, ' + "x" * 1000)
+        records = iter_json_records(path, chunk_size=16)
+        assert next(records) == {"a": 1}
+        assert next(records) == {"b": 2}
+        with pytest.raises(json.JSONDecodeError):
+            next(records)
+
+    @pytest.mark.parametrize("suffix", [".jsonl", ".ndjson"])
+    def test_json_lines(self, tmp_path, suffix):
+        text = "\n".join(json.dumps(r) for r in RECORDS) + "\n\n"
+        path = _write(tmp_path / f"data{suffix}", text)
+        assert list(iter_json_records(path)) == RECORDS
+
+
+class TestShareKeys:
+    def test_same_shape_shares_key_objects(self):
+        records = [json.loads('{"name": "a", "rank": "b"}') for _ in range(3)]
+        shared = list(share_keys(records))
+        assert shared == records
+        first = list(shared[0])
+        for rec in shared[1:]:
+            assert all(a is b for a, b in zip(first, rec))
+
+    def test_other_values_pass_through(self):
+        assert list(share_keys([1, {"a": 1}, {"b": 2}, "x"])) == [1, {"a": 1}, {"b": 2}, "x"]
+
+
+class TestClientStreaming:
+    def test_read_json_matches_json_load(self):
+        client = DASClient(data_dir=FIXTURES_DIR)
+        expected = json.loads((FIXTURES_DIR / "voyages.json").read_text())
+        assert client._read_json("voyages.json") == expected
+
+    def test_falls_back_to_json_lines(self, tmp_path):
+        records = json.loads((FIXTURES_DIR / "crew.json").read_text())
+        _write(tmp_path / "crew.jsonl", "\n".join(json.dumps(r) for r in records))
+        client = CrewClient(data_dir=tmp_path)
+        assert client.all_records() == records
+
+    def test_missing_file(self, tmp_path, caplog):
+        client = DASClient(data_dir=tmp_path)
+        with caplog.at_level(logging.WARNING):
+            assert client._read_json("voyages.json") == []
+        assert "Data file not found" in caplog.text
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from chuk_mcp_maritime_archives.core.clients.base import link_id, voyage_links
 from chuk_mcp_maritime_archives.core.clients.das_client import DASClient
 from chuk_mcp_maritime_archives.core.clients.wreck_client import WreckClient
 from chuk_mcp_maritime_archives.core.cliwoc_tracks import (
@@ -155,6 +156,72 @@ class TestWreckClientLinking:
         result = await self.client.get_by_voyage_id("das:5678")
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_get_by_voyage_id_unprefixed(self):
+        result = await self.client.get_by_voyage_id("3456")
+        assert result is not None
+        assert result["wreck_id"] == "maarer:VOC-0789"
+
+
+# ---------------------------------------------------------------------------
+# Voyage -> wreck link indexes
+# ---------------------------------------------------------------------------
+
+
+class TestVoyageLinks:
+    def test_link_id(self):
+        assert link_id("0372.1", "das") == "das:0372.1"
+        assert link_id("eic:0001", "das") == "eic:0001"
+
+    def test_voyage_links_keeps_every_wreck(self):
+        records = [
+            {"wreck_id": "a", "voyage_id": "0001"},
+            {"wreck_id": "b", "voyage_id": "das:0001"},
+            {"wreck_id": "c"},
+        ]
+        links = voyage_links(records, "das")
+        assert list(links) == ["das:0001"]
+        assert [w["wreck_id"] for w in links["das:0001"]] == ["a", "b"]
+
+    def test_merged_across_archives(self, manager):
+        links = manager._voyage_wreck_links()
+        for voyage_id in ("das:3456", "eic:0001", "carreira:0002", "galleon:0002", "soic:0002"):
+            assert links[voyage_id][0]["voyage_id"] == voyage_id
+        assert manager._voyage_wreck_links() is links
+
+    @pytest.mark.asyncio
+    async def test_find_wreck_takes_first_of_several(self, manager):
+        first = {"wreck_id": "x:1", "voyage_id": "das:3456"}
+        second = {"wreck_id": "x:2", "voyage_id": "das:3456"}
+        manager._wreck_links = {"das:3456": [first, second]}
+        assert await manager._find_wreck_for_voyage("3456") is first
+
+    def test_preload_rebuilds(self, manager):
+        links = manager._voyage_wreck_links()
+        manager.preload(parallel=False)
+        assert manager._voyage_wreck_links() == links
+
+    @pytest.mark.asyncio
+    async def test_audit_counts_every_linked_wreck(self, manager):
+        linked = [
+            w
+            for client in manager._link_clients()
+            for w in client._get_wrecks()
+            if w.get("voyage_id")
+        ]
+        result = await manager.audit_links()
+        assert result["wreck_links"]["ground_truth_count"] == len(linked)
+
+    @pytest.mark.asyncio
+    async def test_audit_counts_wrecks_sharing_a_voyage(self, manager):
+        manager._wreck_links = {
+            "das:3456": [{"wreck_id": "x:1"}, {"wreck_id": "x:2"}],
+            "das:99999": [{"wreck_id": "x:3"}],
+        }
+        wreck_links = (await manager.audit_links())["wreck_links"]
+        assert wreck_links["ground_truth_count"] == 3
+        assert wreck_links["matched_count"] == 2
+
 
 # ---------------------------------------------------------------------------
 # DASClient.get_vessel_for_voyage
@@ -182,6 +182,12 @@ class TestEICClient:
         result = await self.client.get_wreck_by_voyage_id("eic:9999")
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_get_wreck_by_voyage_id_unprefixed(self):
+        result = await self.client.get_wreck_by_voyage_id("0001")
+        assert result is not None
+        assert result["wreck_id"] == "eic_wreck:0001"
+
     @pytest.mark.asyncio
     async def test_all_records_have_archive_tag(self):
         voyages = await self.client.search()
@@ -0,0 +1,110 @@
+"""Tests for the bounded query result cache and its use by ArchiveManager."""
+
+from unittest.mock import patch
+
+import pytest
+
+from chuk_mcp_maritime_archives.core.archive_manager import ArchiveManager
+from chuk_mcp_maritime_archives.core.query_cache import QueryCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestQueryCache:
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.cache = QueryCache(maxsize=2, ttl=10, clock=self.clock)
+
+    def test_get_put(self):
+        assert self.cache.get("a") is None
+        self.cache.put("a", [1])
+        assert self.cache.get("a") == [1]
+        assert (self.cache.hits, self.cache.misses) == (1, 1)
+
+    def test_lru_eviction(self):
+        self.cache.put("a", 1)
+        self.cache.put("b", 2)
+        self.cache.get("a")  # "b" is now least recently used
+        self.cache.put("c", 3)
+        assert self.cache.get("b") is None
+        assert self.cache.get("a") == 1
+        assert self.cache.evictions == 1
+        assert len(self.cache) == 2
+
+    def test_ttl_expiry(self):
+        self.cache.put("a", 1)
+        self.clock.now = 9.9
+        assert self.cache.get("a") == 1
+        self.clock.now = 10.0
+        assert self.cache.get("a") is None
+        assert len(self.cache) == 0
+
+    def test_clear(self):
+        self.cache.put("a", 1)
+        self.cache.clear()
+        assert self.cache.get("a") is None
+
+    def test_disabled(self):
+        cache = QueryCache(maxsize=0, ttl=10)
+        cache.put("a", 1)
+        assert cache.get("a") is None
+
+    def test_stats(self):
+        self.cache.put("a", 1)
+        self.cache.get("a")
+        stats = self.cache.stats()
+        assert stats["size"] == 1
+        assert stats["maxsize"] == 2
+        assert stats["hits"] == 1
+        assert stats["misses"] == 0
+
+
+class TestManagerQueryCache:
+    @pytest.mark.asyncio
+    async def test_repeated_search_is_served_from_cache(self, manager: ArchiveManager):
+        first = await manager.search_wrecks(region="cape", max_results=2)
+        hits = manager.query_cache_stats()["hits"]
+        again = await manager.search_wrecks(region="cape", max_results=2, status=None)
+        assert again is first
+        assert manager.query_cache_stats()["hits"] == hits + 1
+
+    @pytest.mark.asyncio
+    async def test_next_page_reuses_total_count(self, manager: ArchiveManager):
+        first = await manager.search_voyages(max_results=2)
+        with patch.object(
+            manager._das_client, "count_voyages", side_effect=AssertionError("recounted")
+        ):
+            second = await manager.search_voyages(max_results=2, cursor=first.next_cursor)
+        assert second.total_count == first.total_count
+
+    @pytest.mark.asyncio
+    async def test_narratives_and_vessels_cached(self, manager: ArchiveManager):
+        narratives = await manager.search_narratives(query="Abrolhos", max_results=1)
+        vessels = await manager.search_vessels(max_results=1)
+        misses = manager.query_cache_stats()["misses"]
+        assert (await manager.search_narratives(query="Abrolhos", max_results=1)).items == (
+            narratives.items
+        )
+        assert (await manager.search_vessels(max_results=1)).items == vessels.items
+        assert manager.query_cache_stats()["misses"] == misses
+
+    @pytest.mark.asyncio
+    async def test_data_change_invalidates(self, manager: ArchiveManager):
+        await manager.search_voyages(archive="das", max_results=2)
+        misses = manager.query_cache_stats()["misses"]
+        with patch.object(manager._das_client, "data_version", return_value="changed"):
+            await manager.search_voyages(archive="das", max_results=2)
+        assert manager.query_cache_stats()["misses"] > misses
+
+    @pytest.mark.asyncio
+    async def test_preload_clears_cache(self, manager: ArchiveManager):
+        await manager.search_voyages(max_results=2)
+        assert manager.query_cache_stats()["size"] > 0
+        manager.preload(parallel=False)
+        assert manager.query_cache_stats()["size"] == 0
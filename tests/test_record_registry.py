@@ -0,0 +1,170 @@
+"""Tests for the record ID registry and batch record lookup."""
+
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from chuk_mcp_maritime_archives.core.archive_manager import ArchiveManager
+from chuk_mcp_maritime_archives.core.record_registry import (
+    RecordRegistry,
+    RecordSource,
+    split_id,
+)
+from chuk_mcp_maritime_archives.models import RecordBatchResponse, RecordLookup
+
+from .conftest import MockMCPServer
+
+MIXED_IDS = {
+    "das:3456": ("voyage", "das"),
+    "eic:0001": ("voyage", "eic"),
+    "maarer:VOC-0789": ("wreck", "maarer"),
+    "ukho_wreck:00001": ("wreck", "ukho"),
+    "das_vessel:001": ("vessel", "das"),
+    "voc_crew:445892": ("crew", "voc_crew"),
+    "dss:00001": ("crew", "dss"),
+    "dss_muster:0001": ("muster", "dss"),
+    "voc_cargo:23456": ("cargo", "voc_cargo"),
+    "cliwoc:1": ("track", "cliwoc"),
+}
+
+
+def _registry() -> RecordRegistry:
+    records = {"a:1": {"id": "a:1"}, "b:1": {"id": "b:1"}, "b:2": {"id": "b:2"}}
+
+    async def get(record_id: str) -> dict | None:
+        return records.get(record_id)
+
+    return RecordRegistry(
+        {"a": RecordSource("voyage", "a", get), "b": RecordSource("wreck", "b", get)}
+    )
+
+
+class TestSplitId:
+    def test_prefixed(self):
+        assert split_id("maarer:VOC-0789") == ("maarer", "VOC-0789")
+
+    def test_bare(self):
+        assert split_id("0372.1") == (None, "0372.1")
+
+
+class TestRecordRegistry:
+    def test_route(self):
+        registry = _registry()
+        assert registry.route("b:1").kind == "wreck"
+        assert registry.route("1") is None
+        assert registry.route("1", default="a").kind == "voyage"
+        assert registry.route("c:1") is None
+
+    def test_prefixes(self):
+        assert _registry().prefixes("wreck") == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_resolve_prefixed(self):
+        result = await _registry().resolve("b:2")
+        assert result == {"id": "b:2", "kind": "wreck", "archive": "b", "record": {"id": "b:2"}}
+
+    @pytest.mark.asyncio
+    async def test_resolve_bare_unique(self):
+        result = await _registry().resolve("2")
+        assert result["id"] == "2"
+        assert result["record"] == {"id": "b:2"}
+
+    @pytest.mark.asyncio
+    async def test_resolve_bare_ambiguous(self):
+        result = await _registry().resolve("1")
+        assert result["record"] is None
+        assert result["candidates"] == ["a:1", "b:1"]
+
+    @pytest.mark.asyncio
+    async def test_resolve_missing(self):
+        for record_id in ("a:9", "9", "c:1"):
+            result = await _registry().resolve(record_id)
+            assert result["record"] is None and result["kind"] is None
+            assert "candidates" not in result
+
+
+class TestGetRecords:
+    @pytest.mark.asyncio
+    async def test_mixed_kinds_in_order(self, manager: ArchiveManager):
+        ids = list(MIXED_IDS)[::-1]
+        results = await manager.get_records(ids)
+        assert [r["id"] for r in results] == ids
+        for r in results:
+            assert (r["kind"], r["archive"]) == MIXED_IDS[r["id"]]
+            assert r["record"] is not None
+
+    @pytest.mark.asyncio
+    async def test_track_has_no_positions(self, manager: ArchiveManager):
+        [result] = await manager.get_records(["cliwoc:1"])
+        assert result["record"]["voyage_id"] == 1
+        assert "positions" not in result["record"]
+
+    @pytest.mark.asyncio
+    async def test_bare_ids(self, manager: ArchiveManager):
+        unique, ambiguous = await manager.get_records(["VOC-0789", "0001"])
+        assert unique["record"]["wreck_id"] == "maarer:VOC-0789"
+        assert ambiguous["record"] is None
+        assert {"eic:0001", "carreira:0001", "eic_wreck:0001"} <= set(ambiguous["candidates"])
+
+    @pytest.mark.asyncio
+    async def test_missing_and_repeated(self, manager: ArchiveManager):
+        results = await manager.get_records(["das:3456", "das:99999", "cliwoc:x", "das:3456"])
+        assert [r["record"] is not None for r in results] == [True, False, False, True]
+
+    @pytest.mark.asyncio
+    async def test_too_many_ids(self, manager: ArchiveManager):
+        with pytest.raises(ValueError, match="Too many record IDs"):
+            await manager.get_records([f"das:{i}" for i in range(501)])
+
+    @pytest.mark.asyncio
+    async def test_single_getters_check_kind(self, manager: ArchiveManager):
+        assert await manager.get_wreck("eic_wreck:0001") is not None
+        assert await manager.get_wreck("VOC-0789") is not None
+        assert await manager.get_wreck("eic:0001") is None
+        assert await manager.get_voyage("maarer:VOC-0789") is None
+        assert await manager.get_crew_member("dss:00001") is not None
+
+
+class TestGetRecordsTool:
+    @pytest.fixture(autouse=True)
+    def _register(self, manager: ArchiveManager):
+        from chuk_mcp_maritime_archives.tools.linking.api import register_linking_tools
+
+        self.mcp = MockMCPServer()
+        self.manager = manager
+        register_linking_tools(self.mcp, manager)
+
+    @pytest.mark.asyncio
+    async def test_success(self):
+        fn = self.mcp.get_tool("maritime_get_records")
+        result = await fn(ids=["das:3456", "maarer:VOC-0789", "das:99999"])
+        parsed = json.loads(result)
+        assert parsed["found_count"] == 2
+        assert parsed["missing"] == ["das:99999"]
+        assert [r.get("kind") for r in parsed["records"]] == ["voyage", "wreck", None]
+
+    @pytest.mark.asyncio
+    async def test_text_mode(self):
+        fn = self.mcp.get_tool("maritime_get_records")
+        result = await fn(ids=["das:3456", "0001", "das:99999"], output_mode="text")
+        assert "Found 1 of 3 records" in result
+        assert "das:3456 [voyage, das] Batavia" in result
+        assert "0001: ambiguous" in result
+        assert "das:99999: not found" in result
+
+    @pytest.mark.asyncio
+    async def test_error(self):
+        self.manager.get_records = AsyncMock(side_effect=RuntimeError("boom"))
+        fn = self.mcp.get_tool("maritime_get_records")
+        parsed = json.loads(await fn(ids=["das:3456"]))
+        assert "error" in parsed
+
+
+class TestRecordBatchResponse:
+    def test_round_trip(self):
+        resp = RecordBatchResponse(
+            found_count=1,
+            records=[RecordLookup(id="das:3456", kind="voyage", archive="das", record={})],
+        )
+        assert json.loads(resp.model_dump_json())["records"][0]["kind"] == "voyage"
@@ -1,5 +1,8 @@
 """Tests for response model to_text() methods and format_response edge cases."""
 
+import base64
+from typing import ClassVar
+
 import pytest
 
 from chuk_mcp_maritime_archives.models.responses import (
@@ -24,6 +27,7 @@ from chuk_mcp_maritime_archives.models.responses import (
     HullProfileListResponse,
     HullProfileResponse,
     PositionAssessmentResponse,
+    SearchCountResponse,
     StatisticsResponse,
     SurvivalGroup,
     ToolInfo,
@@ -36,7 +40,9 @@ from chuk_mcp_maritime_archives.models.responses import (
     WreckDetailResponse,
     WreckInfo,
     WreckSearchResponse,
+    build_infos,
     decode_cursor,
+    decode_cursor_state,
     encode_cursor,
     format_response,
 )
@@ -63,6 +69,17 @@ class TestCursorUtilities:
         assert isinstance(cursor, str)
         assert "=" not in cursor  # padding stripped
 
+    def test_keyset_state_roundtrip(self):
+        cursor = encode_cursor(7, p={"das": 12}, q="abc", v="def")
+        assert decode_cursor(cursor) == 7
+        assert decode_cursor_state(cursor) == {"o": 7, "p": {"das": 12}, "q": "abc", "v": "def"}
+        assert decode_cursor_state(None) == {}
+
+    def test_non_object_payload_rejected(self):
+        cursor = base64.urlsafe_b64encode(b"[1, 2]").decode()
+        with pytest.raises(TypeError, match="Invalid cursor"):
+            decode_cursor_state(cursor)
+
 
 class TestArchiveListResponseToText:
     def test_basic(self):
@@ -205,6 +222,25 @@ class TestWreckSearchResponseToText:
         assert "[" not in text
 
 
+class TestSearchCountResponseToText:
+    def test_facets(self):
+        resp = SearchCountResponse(
+            record_type="wreck",
+            total_count=3,
+            facets={"region": {"cape": 2, "pacific": 1}, "flag": {}},
+            message="3 wrecks match criteria",
+        )
+        text = resp.to_text()
+        assert "3 wrecks match criteria" in text
+        assert "By region:" in text
+        assert "cape: 2" in text
+        assert "(none)" in text
+
+    def test_count_only(self):
+        resp = SearchCountResponse(record_type="voyage", total_count=5, message="5 voyages")
+        assert resp.to_text() == "5 voyages"
+
+
 class TestWreckDetailResponseToText:
     def test_with_position(self):
         resp = WreckDetailResponse(
@@ -584,6 +620,39 @@ class TestCapabilitiesResponseToText:
         assert "[voyages]" in text
 
 
+class TestBuildInfos:
+    RECORD: ClassVar[dict[str, str]] = {
+        "voyage_id": "das:1",
+        "ship_name": "Batavia",
+        "captain": "Jacobsz",
+        "fate": "wrecked",
+        "particulars": "not a VoyageInfo column",
+    }
+
+    def test_all_columns(self):
+        (info,) = build_infos(VoyageInfo, [self.RECORD])
+        assert info == VoyageInfo(
+            voyage_id="das:1", ship_name="Batavia", captain="Jacobsz", fate="wrecked"
+        )
+
+    def test_projection_keeps_required(self):
+        (info,) = build_infos(VoyageInfo, [self.RECORD], ["fate", "unknown"])
+        assert info.model_dump(exclude_none=True) == {
+            "voyage_id": "das:1",
+            "ship_name": "Batavia",
+            "fate": "wrecked",
+        }
+
+    def test_missing_required_is_empty(self):
+        (info,) = build_infos(VoyageInfo, [{"voyage_id": "das:2"}], ["fate"])
+        assert info.ship_name == ""
+
+    def test_sources(self):
+        records = [{"vessel_id": "v", "name": "n", "ship_type": "fluit"}]
+        (info,) = build_infos(VesselInfo, records, sources={"type": ("type", "ship_type")})
+        assert info.type == "fluit"
+
+
 class TestFormatResponseEdgeCases:
     def test_text_mode_without_to_text(self):
         """Model without to_text falls back to JSON."""
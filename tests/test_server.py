@@ -4,6 +4,8 @@ import os
 import sys
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 
 class TestInitArtifactStore:
     """Test _init_artifact_store with various environment configurations."""
@@ -152,6 +154,7 @@ class TestMainFunction:
             ),
             patch("chuk_mcp_maritime_archives.server._init_artifact_store"),
             patch("chuk_mcp_maritime_archives.server.preload_reference_data", create=True),
+            patch("chuk_mcp_maritime_archives.core.warmup.start_warmup"),
             patch("sys.argv", ["server", "stdio"]),
         ):
             main_fn = self._import_main()
@@ -171,6 +174,7 @@ class TestMainFunction:
             ),
             patch("chuk_mcp_maritime_archives.server._init_artifact_store"),
             patch("chuk_mcp_maritime_archives.server.preload_reference_data", create=True),
+            patch("chuk_mcp_maritime_archives.core.warmup.start_warmup"),
             patch("sys.argv", ["server", "http", "--host", "0.0.0.0", "--port", "9000"]),
         ):
             main_fn = self._import_main()
@@ -190,6 +194,7 @@ class TestMainFunction:
             ),
             patch("chuk_mcp_maritime_archives.server._init_artifact_store"),
             patch("chuk_mcp_maritime_archives.server.preload_reference_data", create=True),
+            patch("chuk_mcp_maritime_archives.core.warmup.start_warmup"),
             patch("sys.argv", ["server"]),
             patch.dict(os.environ, {"MCP_STDIO": "1"}),
         ):
@@ -212,6 +217,7 @@ class TestMainFunction:
             ),
             patch("chuk_mcp_maritime_archives.server._init_artifact_store"),
             patch("chuk_mcp_maritime_archives.server.preload_reference_data", create=True),
+            patch("chuk_mcp_maritime_archives.core.warmup.start_warmup"),
             patch("sys.argv", ["server"]),
             patch.dict(os.environ, {}, clear=True),
             patch.object(sys, "stdin", mock_stdin),
@@ -235,6 +241,7 @@ class TestMainFunction:
             ),
             patch("chuk_mcp_maritime_archives.server._init_artifact_store"),
             patch("chuk_mcp_maritime_archives.server.preload_reference_data", create=True),
+            patch("chuk_mcp_maritime_archives.core.warmup.start_warmup"),
             patch("sys.argv", ["server"]),
             patch.dict(os.environ, {}, clear=True),
             patch.object(sys, "stdin", mock_stdin),
@@ -243,6 +250,56 @@ class TestMainFunction:
             main_fn()
             mock_mcp.run.assert_called_once_with(stdio=True)
 
+    def test_main_starts_warmup_before_run(self):
+        """main() starts the dataset and archive warm-up, then runs the transport."""
+        mock_mcp, mock_async_server = self._make_mock_async_server()
+        calls = []
+        mock_mcp.run.side_effect = lambda **kw: calls.append("run")
+        mock_async_server.manager.warm.side_effect = lambda: calls.append("archives")
+        with (
+            patch.dict(
+                "sys.modules",
+                {
+                    "chuk_mcp_server": MagicMock(),
+                    "chuk_mcp_maritime_archives.async_server": mock_async_server,
+                },
+            ),
+            patch("chuk_mcp_maritime_archives.server._init_artifact_store"),
+            patch("chuk_mcp_maritime_archives.server.preload_reference_data", create=True),
+            patch(
+                "chuk_mcp_maritime_archives.core.warmup.start_warmup",
+                side_effect=lambda: calls.append("warmup") or True,
+            ),
+            patch("sys.argv", ["server", "stdio"]),
+        ):
+            main_fn = self._import_main()
+            main_fn()
+        assert calls == ["warmup", "archives", "run"]
+
+    def test_main_help_skips_setup(self):
+        """--help exits during argument parsing, before any store or data setup."""
+        mock_mcp, mock_async_server = self._make_mock_async_server()
+        with (
+            patch.dict(
+                "sys.modules",
+                {
+                    "chuk_mcp_server": MagicMock(),
+                    "chuk_mcp_maritime_archives.async_server": mock_async_server,
+                },
+            ),
+            patch("chuk_mcp_maritime_archives.server._init_artifact_store") as mock_init,
+            patch("chuk_mcp_maritime_archives.core.warmup.start_warmup") as mock_warmup,
+            patch("sys.argv", ["server", "--help"]),
+            patch("sys.stdout"),
+        ):
+            main_fn = self._import_main()
+            with pytest.raises(SystemExit) as exc:
+                main_fn()
+            assert exc.value.code == 0
+            mock_init.assert_not_called()
+            mock_warmup.assert_not_called()
+            mock_mcp.run.assert_not_called()
+
 
 class TestAsyncServer:
     """Test async_server module-level setup."""
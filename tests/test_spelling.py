@@ -0,0 +1,137 @@
+"""Tests for spelling folding and variant-tolerant narrative search."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from chuk_mcp_maritime_archives.core.archive_manager import ArchiveManager
+from chuk_mcp_maritime_archives.core.clients.das_client import DASClient
+from chuk_mcp_maritime_archives.core.clients.spelling import fold, normalizer
+from chuk_mcp_maritime_archives.core.clients.text_index import TextIndex, tokenize
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+class TestFold:
+    def test_diacritics(self):
+        assert fold("São João, Göteborg") == "sao joao, goteborg"
+
+    def test_ligatures(self):
+        assert fold("Straße Ærø") == "strasse aero"
+
+
+class TestNormalizer:
+    @pytest.mark.parametrize(
+        "language, variants",
+        [
+            ("nl", ["Kaap", "Caap", "Cape"]),
+            ("nl", ["Wijk", "Wyk"]),
+            ("nl", ["Zeeuw", "Zeuw"]),
+            ("pt", ["Sebastião", "Sebastiam"]),
+            ("pt", ["Luiz", "Luís"]),
+            ("es", ["Reyna", "Reina"]),
+            ("es", ["México", "Mejico"]),
+            ("sv", ["Hwita", "Vita"]),
+        ],
+    )
+    def test_variants_share_a_form(self, language, variants):
+        normalize = normalizer(language)
+        assert len({normalize(token) for v in variants for token in tokenize(v)}) == 1
+
+    @pytest.mark.parametrize("token", ["captured", "refuge", "table", "rede"])
+    def test_restricted_rules_leave_other_words(self, token):
+        # c/k only word-initially, and the silent e only of short a-e words
+        assert normalizer("nl")(token) not in {"kap", "ref", "tabl", "red"}
+
+    def test_unknown_language_folds_only(self):
+        assert normalizer("en")("café") == "cafe"
+
+    def test_cached(self):
+        assert normalizer("nl") is normalizer("nl")
+
+
+class TestVariantIndex:
+    def setup_method(self):
+        self.index = TextIndex(
+            ["Captured off Westkapelle", "Anchored at the Kaap", "Took refuge on the reeff"],
+            normalizer("nl"),
+        )
+
+    def docs(self, word, variants=True):
+        return sorted(doc for _, doc, _ in self.index.search([tokenize(word)], None, variants)[1])
+
+    def test_whole_tokens_only(self):
+        assert self.docs("cape") == [1]
+        assert self.docs("reef") == [2]
+
+    def test_substrings_match_as_spelled(self):
+        assert self.docs("kap") == [0, 1]
+        assert self.docs("kap", variants=False) == [0]
+
+    def test_off_by_default(self):
+        assert self.index.search([["cape"]]) == (0, [])
+
+
+class TestFuzzyIndex:
+    def setup_method(self):
+        self.index = TextIndex(["Entrance to Gothenburg harbour", "Anchored at Batavia roads"])
+
+    def docs(self, word):
+        return [doc for _, doc, _ in self.index.search([tokenize(word)], fuzzy=True)[1]]
+
+    def test_one_edit(self):
+        assert self.docs("batvia") == [1]
+
+    def test_two_edits_for_long_words(self):
+        assert self.docs("gotenburgh") == [0]
+
+    def test_short_words_not_fuzzy(self):
+        assert self.docs("rods") == [1]  # one edit from "roads", long enough
+        assert self.docs("rod") == []
+
+    def test_exact_match_preferred(self):
+        # A word contained in a token never falls back to near misses
+        assert self.index._expand("harbour", "infix", fuzzy=True) == ["harbour"]
+
+    def test_not_fuzzy_by_default(self):
+        assert self.index.search([["batvia"]]) == (0, [])
+
+
+class TestVariantSearch:
+    def test_client_modes_share_one_index(self):
+        client = DASClient(data_dir=FIXTURES_DIR)
+        assert client.narrative_voyages(["abrolhoss"]) == (0, [])
+        total, _ = client.narrative_voyages(["abrolhoss"], variants=True, fuzzy=True)
+        assert total == 1
+        fields = ("particulars",)
+        assert client._text_index(client.VOYAGES_FILE, fields) is client._text_index(
+            client.VOYAGES_FILE, fields
+        )
+
+    @pytest.mark.asyncio
+    async def test_manager_variants(self, manager: ArchiveManager):
+        fuzzy = await manager.search_narratives(query="Gothenberg", variants=True)
+        exact = await manager.search_narratives(query="Gothenberg")
+        assert (
+            fuzzy.total_count == (await manager.search_narratives(query="Gothenburg")).total_count
+        )
+        assert exact.total_count == 0
+
+    @pytest.mark.asyncio
+    async def test_manager_default_matches_as_spelled(self, manager: ArchiveManager):
+        plain = await manager.search_narratives(query="cape", max_results=500)
+        variants = await manager.search_narratives(query="cape", max_results=500, variants=True)
+        assert {h["record_id"] for h in plain.items} <= {h["record_id"] for h in variants.items}
+
+    @pytest.mark.asyncio
+    async def test_near_misses_only_when_no_archive_matches(self, tmp_path: Path):
+        for archive, place in (("eic", "Sand Bank"), ("carreira", "Sank off the Cape")):
+            wrecks = [{"wreck_id": f"{archive}_wreck:0001", "loss_location": place}]
+            (tmp_path / f"{archive}_wrecks.json").write_text(json.dumps(wrecks))
+        manager = ArchiveManager(data_dir=tmp_path)
+
+        exact = await manager.search_narratives(query="sank", variants=True)
+        assert [h["archive"] for h in exact.items] == ["carreira"]
+        near = await manager.search_narratives(query="sanc", variants=True)
+        assert sorted(h["archive"] for h in near.items) == ["carreira", "eic"]
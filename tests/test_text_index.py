@@ -0,0 +1,161 @@
+"""Tests for the positional text index and BM25-ranked narrative search."""
+
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from chuk_mcp_maritime_archives.core.archive_manager import ArchiveManager
+from chuk_mcp_maritime_archives.core.clients.eic_client import EICClient
+from chuk_mcp_maritime_archives.core.clients.text_index import TextIndex, tokenize
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+TEXTS = [
+    "Wrecked on the Houtman Abrolhos",
+    "Sailed round the Cape of Good Hope to Batavia",
+    "",
+    "Storm off the cape; the ship was wrecked, the crew saved",
+    "Returned to Texel",
+]
+
+
+class TestTokenize:
+    def test_lowercase_words(self):
+        assert tokenize("Cape of Good-Hope, 1629!") == ["cape", "of", "good", "hope", "1629"]
+
+    def test_empty(self):
+        assert tokenize("") == []
+
+
+class TestTextIndex:
+    def setup_method(self):
+        self.index = TextIndex(TEXTS)
+
+    def docs(self, *terms):
+        return sorted(doc for _, doc, _ in self.index.search([tokenize(t) for t in terms])[1])
+
+    def test_len(self):
+        assert len(self.index) == len(TEXTS)
+
+    def test_word_matches_inside_tokens(self):
+        assert self.docs("wreck") == [0, 3]
+        assert self.docs("brolho") == [0]
+
+    def test_and(self):
+        assert self.docs("wrecked", "storm") == [3]
+        assert self.docs("wrecked", "texel") == []
+
+    def test_phrase(self):
+        assert self.docs("cape of good") == [1]
+        assert self.docs("good of cape") == []
+        # Phrase ends may be parts of words, as in a substring search
+        assert self.docs("ape of go") == [1]
+
+    def test_occurrences(self):
+        total, best = self.index.search([["the"]])
+        assert total == 3
+        assert {doc: n for _, doc, n in best}[3] == 3
+
+    def test_ranking(self):
+        # "the" three times in doc 3 outranks once in docs 0 and 1
+        _, best = self.index.search([["the"]])
+        assert best[0][1] == 3
+        scores = [score for score, _, _ in best]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_limit_keeps_best(self):
+        total, best = self.index.search([["the"]], limit=1)
+        assert total == 3
+        assert [doc for _, doc, _ in best] == [3]
+
+    def test_no_terms(self):
+        assert self.index.search([]) == (0, [])
+
+    def test_matches_substring_scan(self):
+        rng = random.Random(11)
+        words = ["ab", "abc", "bca", "cab", "c", "bb"]
+        texts = [" ".join(rng.choice(words) for _ in range(rng.randint(0, 8))) for _ in range(300)]
+        index = TextIndex(texts)
+        for _ in range(200):
+            first = rng.choice(words)
+            rest = [rng.choice(words) for _ in range(rng.randint(0, 2))]
+            needle = " ".join([first[rng.randint(0, len(first) - 1) :], *rest])
+            expected = [doc for doc, text in enumerate(texts) if needle in text]
+            total, best = index.search([tokenize(needle)])
+            assert sorted(doc for _, doc, _ in best) == expected
+            assert total == len(expected)
+
+
+class TestClientTextSearch:
+    def test_records_and_fields(self):
+        client = EICClient(data_dir=FIXTURES_DIR)
+        total, best = client.narrative_wrecks(["south africa"])
+        assert total == len(best) == 1
+        _, _, record, field = best[0]
+        assert field == "loss_location"
+        assert "South Africa" in record[field]
+
+    def test_index_built_once(self):
+        client = EICClient(data_dir=FIXTURES_DIR)
+        client.narrative_voyages(["cape"])
+        index = client._text_index(client.VOYAGES_FILE, ("particulars",))
+        client.narrative_voyages(["texel"])
+        assert client._text_index(client.VOYAGES_FILE, ("particulars",)) is index
+
+
+class TestRankedNarratives:
+    @pytest.mark.asyncio
+    async def test_best_score_first(self, manager: ArchiveManager):
+        result = await manager.search_narratives(query="the", max_results=500)
+        scores = [h["score"] for h in result.items]
+        assert scores == sorted(scores, reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_pages_follow_ranking(self, manager: ArchiveManager):
+        full = await manager.search_narratives(query="the", max_results=500)
+        paged, cursor = [], None
+        while True:
+            page = await manager.search_narratives(query="the", max_results=3, cursor=cursor)
+            paged += page.items
+            if not page.has_more:
+                break
+            cursor = page.next_cursor
+        assert paged == full.items
+        assert page.total_count == full.total_count
+
+    @pytest.mark.asyncio
+    async def test_bounded_ranking_is_prefix_of_full(self, manager: ArchiveManager):
+        total, full = await manager._rank_narratives(["the"], None, None, True, 10_000)
+        bounded_total, bounded = await manager._rank_narratives(["the"], None, None, True, 5)
+        assert bounded_total == total > 5
+        assert bounded == full[:5]
+
+    @pytest.mark.asyncio
+    async def test_tied_scores_page_once_across_archives(self, tmp_path: Path):
+        for archive in ("eic", "carreira"):
+            wrecks = [
+                {
+                    "wreck_id": f"{archive}_wreck:{i:04d}",
+                    "ship_name": f"Ship {i}",
+                    # File order is the reverse of date order
+                    "loss_date": f"{1729 - i}-01-01",
+                    "loss_location": "Table Bay",
+                }
+                for i in range(30)
+            ]
+            (tmp_path / f"{archive}_wrecks.json").write_text(json.dumps(wrecks))
+        manager = ArchiveManager(data_dir=tmp_path)
+
+        paged, cursor = [], None
+        while True:
+            page = await manager.search_narratives(
+                query="table bay", record_type="wreck", max_results=10, cursor=cursor
+            )
+            paged += [hit["record_id"] for hit in page.items]
+            if not page.has_more:
+                break
+            cursor = page.next_cursor
+        assert len(paged) == len(set(paged)) == 60
+        assert page.total_count == 60
@@ -40,8 +40,12 @@ def mock_manager() -> MagicMock:
     # Async methods — search methods return PaginatedResult
     mgr.search_voyages = AsyncMock(return_value=_paginated(SAMPLE_VOYAGES))
     mgr.get_voyage = AsyncMock(return_value=SAMPLE_VOYAGES[0])
+    mgr.count_voyages = AsyncMock(return_value={"total_count": 2, "facets": {}})
     mgr.search_wrecks = AsyncMock(return_value=_paginated(SAMPLE_WRECKS))
     mgr.get_wreck = AsyncMock(return_value=SAMPLE_WRECKS[0])
+    mgr.count_wrecks = AsyncMock(
+        return_value={"total_count": 3, "facets": {"region": {"cape": 2, "indian_ocean": 1}}}
+    )
     mgr.search_vessels = AsyncMock(return_value=_paginated(SAMPLE_VESSELS))
     mgr.get_vessel = AsyncMock(return_value=SAMPLE_VESSELS[0])
     mgr.search_crew = AsyncMock(return_value=_paginated(SAMPLE_CREW))
@@ -155,6 +159,16 @@ class TestVoyageTools:
         parsed = json.loads(result)
         assert "API down" in parsed["error"]
 
+    @pytest.mark.asyncio
+    async def test_search_voyages_count_mode(self):
+        fn = self.mcp.get_tool("maritime_search_voyages")
+        result = await fn(fate="wrecked", mode="count")
+        parsed = json.loads(result)
+        assert parsed["record_type"] == "voyage"
+        assert parsed["total_count"] == 2
+        self.mgr.search_voyages.assert_not_called()
+        assert self.mgr.count_voyages.call_args.kwargs["fate"] == "wrecked"
+
     @pytest.mark.asyncio
     async def test_get_voyage_success(self):
         fn = self.mcp.get_tool("maritime_get_voyage")
@@ -228,6 +242,38 @@ class TestWreckTools:
         parsed = json.loads(result)
         assert "oops" in parsed["error"]
 
+    @pytest.mark.asyncio
+    async def test_search_wrecks_fields(self):
+        fn = self.mcp.get_tool("maritime_search_wrecks")
+        result = await fn(fields=["region", "status", "bogus"])
+        parsed = json.loads(result)
+        assert set(parsed["wrecks"][0]) == {"wreck_id", "ship_name", "region", "status"}
+
+    @pytest.mark.asyncio
+    async def test_search_wrecks_facets(self):
+        fn = self.mcp.get_tool("maritime_search_wrecks")
+        result = await fn(region="cape", facets=["region"])
+        parsed = json.loads(result)
+        assert parsed["total_count"] == 3
+        assert parsed["facets"]["region"] == {"cape": 2, "indian_ocean": 1}
+        assert "wrecks" not in parsed
+        self.mgr.search_wrecks.assert_not_called()
+        assert self.mgr.count_wrecks.call_args.kwargs["facets"] == ["region"]
+
+    @pytest.mark.asyncio
+    async def test_search_wrecks_count_text_mode(self):
+        fn = self.mcp.get_tool("maritime_search_wrecks")
+        result = await fn(mode="count", output_mode="text")
+        assert "3 wrecks match" in result
+        assert "cape: 2" in result
+
+    @pytest.mark.asyncio
+    async def test_search_wrecks_invalid_mode(self):
+        fn = self.mcp.get_tool("maritime_search_wrecks")
+        result = await fn(mode="sum")
+        parsed = json.loads(result)
+        assert "sum" in parsed["error"]
+
     @pytest.mark.asyncio
     async def test_get_wreck_success(self):
         fn = self.mcp.get_tool("maritime_get_wreck")
@@ -279,6 +325,18 @@ class TestVesselTools:
         parsed = json.loads(result)
         assert parsed["vessel_count"] == 2
 
+    @pytest.mark.asyncio
+    async def test_search_vessels_fields(self):
+        self.mgr.search_vessels.return_value = _paginated(
+            [{"vessel_id": "das_vessel:003", "name": "Zeewijk", "ship_type": "fluit"}]
+        )
+        fn = self.mcp.get_tool("maritime_search_vessels")
+        result = await fn(fields=["type"])
+        parsed = json.loads(result)
+        assert parsed["vessels"] == [
+            {"vessel_id": "das_vessel:003", "name": "Zeewijk", "type": "fluit"}
+        ]
+
     @pytest.mark.asyncio
     async def test_search_vessels_no_results(self):
         self.mgr.search_vessels.return_value = _paginated([])
@@ -716,6 +774,9 @@ class TestDiscoveryTools:
         assert "tools" in parsed
         assert "ship_types" in parsed
         assert "regions" in parsed
+        names = {d["name"] for d in parsed["datasets"]}
+        assert {"cliwoc_tracks", "gazetteer", "routes"} <= names
+        assert all(d["state"] == "ready" for d in parsed["datasets"])
 
     @pytest.mark.asyncio
     async def test_capabilities_text_mode(self):
@@ -724,6 +785,7 @@ class TestDiscoveryTools:
         assert "chuk-mcp-maritime-archives" in result
         assert "Archives" in result
         assert "Tools" in result
+        assert "Datasets" in result
 
     @pytest.mark.asyncio
     async def test_capabilities_error(self):
@@ -840,6 +902,7 @@ class TestNarrativeTools:
             archive="das",
             max_results=50,
             cursor=None,
+            variants=False,
         )
 
     @pytest.mark.asyncio
@@ -1,16 +1,27 @@
 """Tests for the CLIWOC ship tracks module."""
 
 import json
+import random
+from collections import Counter
+from collections.abc import Sequence
+from typing import Any, ClassVar
 
 import pytest
 
 from chuk_mcp_maritime_archives.core.cliwoc_tracks import (
     _TRACKS,
     _bootstrap_did,
+    _bootstrap_means,
+    _compute_daily_speeds,
+    _haversine_from,
     _haversine_km,
+    _haversine_legs,
+    _leg_speeds,
     _mann_whitney_u,
     _month_in_range,
     _parse_period,
+    _resampler,
+    _select_segments,
     aggregate_track_speeds,
     compare_speed_groups,
     compute_track_speeds,
@@ -58,7 +69,8 @@ class TestTrackData:
             assert "voyage_id" in track
             assert "nationality" in track
             assert "positions" in track
-            assert isinstance(track["positions"], list)
+            # A list when loaded from JSON, a mapped view when loaded from the cache
+            assert isinstance(track["positions"], Sequence)
             assert track.get("position_count", 0) == len(track["positions"])
 
     def test_positions_have_required_fields(self):
@@ -168,6 +180,128 @@ class TestGetTrack:
             assert "lon" in pos
 
 
+# ---------------------------------------------------------------------------
+# Compiled track cache
+# ---------------------------------------------------------------------------
+
+
+class TestTrackCache:
+    TRACKS: ClassVar[list[dict[str, Any]]] = [
+        {
+            "voyage_id": 7,
+            "nationality": "NL",
+            "ship_name": "Amsterdam",
+            "company": "VOC",
+            "start_date": "1749-01-02",
+            "end_date": "1749-01-05",
+            "duration_days": 3,
+            "year_start": 1749,
+            "year_end": 1749,
+            "position_count": 4,
+            "logbook": {"pages": 12},
+            "positions": [
+                {"date": "1749-01-02", "lat": -34.5, "lon": 18.25, "wd": 270, "wf": 5},
+                {"date": "1749-1-3", "lat": -35, "lon": 20.0, "dist": 180.5, "anch": 0},
+                {"date": "1749-01-04", "lat": -36.0, "lon": 22.5, "note": "squall"},
+                {"lat": -36.5, "lon": 24.0},
+            ],
+        },
+        {
+            "voyage_id": 8,
+            "nationality": "UK",
+            "das_number": 1234,
+            "start_date": "1760-05-01",
+            "end_date": "1760-05-01",
+            "position_count": 1,
+            "positions": [{"date": "1760-05-01", "lat": 51.0, "lon": -1.0}],
+        },
+    ]
+
+    def _write(self, tmp_path):
+        from chuk_mcp_maritime_archives.core.cliwoc_tracks import build_track_cache
+
+        data = {"source": "test", "total_positions": 5, "tracks": self.TRACKS}
+        (tmp_path / "cliwoc_tracks.json").write_text(json.dumps(data))
+        return build_track_cache(tmp_path)
+
+    def _open(self, tmp_path):
+        from chuk_mcp_maritime_archives.core.cliwoc_tracks import _CACHE_LAYOUT
+        from chuk_mcp_maritime_archives.core.track_cache import (
+            file_sha256,
+            open_columnar_cache,
+        )
+
+        source_hash = file_sha256(tmp_path / "cliwoc_tracks.json")
+        return open_columnar_cache(tmp_path / "cliwoc_tracks.bin", source_hash, _CACHE_LAYOUT)
+
+    def test_round_trip(self, tmp_path):
+        from chuk_mcp_maritime_archives.core.cliwoc_tracks import _tracks_from_cache
+
+        self._write(tmp_path)
+        tracks, metadata, _, _, _ = _tracks_from_cache(self._open(tmp_path))
+        assert metadata == {"source": "test", "total_positions": 5}
+        assert [{**t, "positions": list(t["positions"])} for t in tracks] == self.TRACKS
+        wd = tracks[0]["positions"][0]["wd"]
+        assert wd == 270 and isinstance(wd, int)
+
+    def test_positions_view(self, tmp_path):
+        from chuk_mcp_maritime_archives.core.cliwoc_tracks import _tracks_from_cache
+
+        self._write(tmp_path)
+        tracks, *_ = _tracks_from_cache(self._open(tmp_path))
+        positions = tracks[0]["positions"]
+        assert len(positions) == 4
+        assert positions[-1] == {"lat": -36.5, "lon": 24.0}
+        assert positions[1:3] == self.TRACKS[0]["positions"][1:3]
+        with pytest.raises(IndexError):
+            positions[4]
+
+    def test_derived_tables_match_rebuild(self, tmp_path):
+        from chuk_mcp_maritime_archives.core.cliwoc_tracks import (
+            _build_date_index,
+            _build_position_grid,
+            _build_segment_table,
+            _tracks_from_cache,
+        )
+
+        self._write(tmp_path)
+        _, _, seg, grid, dates = _tracks_from_cache(self._open(tmp_path))
+        built_seg = _build_segment_table(self.TRACKS)
+        assert len(seg) == len(built_seg) > 0
+        assert list(seg.km_day) == list(built_seg.km_day)
+        assert seg.voyage_id == built_seg.voyage_id
+        assert grid.cells == _build_position_grid(self.TRACKS).cells
+        assert dates.days == _build_date_index(self.TRACKS).days
+
+    def test_stale_cache_ignored(self, tmp_path):
+        self._write(tmp_path)
+        (tmp_path / "cliwoc_tracks.json").write_text(json.dumps({"tracks": []}))
+        assert self._open(tmp_path) is None
+
+    def test_corrupt_cache_ignored(self, tmp_path):
+        self._write(tmp_path)
+        (tmp_path / "cliwoc_tracks.bin").write_bytes(b"not a cache")
+        assert self._open(tmp_path) is None
+
+    def test_layout_mismatch_ignored(self, tmp_path):
+        from chuk_mcp_maritime_archives.core.cliwoc_tracks import _CACHE_LAYOUT
+        from chuk_mcp_maritime_archives.core.track_cache import open_columnar_cache
+
+        path = self._write(tmp_path)
+        assert open_columnar_cache(path, None, _CACHE_LAYOUT + 1) is None
+        assert open_columnar_cache(path, None, _CACHE_LAYOUT) is not None
+
+    def test_get_track_materialises_positions(self, tmp_path, monkeypatch):
+        from chuk_mcp_maritime_archives.core import cliwoc_tracks
+
+        self._write(tmp_path)
+        tracks, *_ = cliwoc_tracks._tracks_from_cache(self._open(tmp_path))
+        monkeypatch.setattr(cliwoc_tracks, "_TRACK_INDEX", {t["voyage_id"]: t for t in tracks})
+        track = get_track(7)
+        assert isinstance(track["positions"], list)
+        assert track["positions"] == self.TRACKS[0]["positions"]
+
+
 # ---------------------------------------------------------------------------
 # nearby_tracks
 # ---------------------------------------------------------------------------
@@ -243,6 +377,51 @@ class TestNearbyTracks:
         hits = nearby_tracks(lat=lat, lon=lon, date=date, radius_km=50000, max_results=2)
         assert len(hits) <= 2
 
+    def test_days_window_finds_adjacent_day(self):
+        from datetime import date as date_cls
+
+        result = self._find_known_position()
+        if result is None:
+            pytest.skip("No positions with dates in data")
+        lat, lon, date, expected_vid = result
+        day_after = date_cls.fromordinal(
+            date_cls(*map(int, date.split("-"))).toordinal() + 1
+        ).isoformat()
+
+        exact = nearby_tracks(lat=lat, lon=lon, date=day_after, radius_km=1)
+        windowed = nearby_tracks(lat=lat, lon=lon, date=day_after, radius_km=1, days_window=1)
+        assert expected_vid in [h["voyage_id"] for h in windowed]
+        assert len(windowed) >= len(exact)
+
+    def test_days_window_zero_matches_exact_date(self):
+        result = self._find_known_position()
+        if result is None:
+            pytest.skip("No positions with dates in data")
+        lat, lon, date, _ = result
+
+        hits = nearby_tracks(lat=lat, lon=lon, date=date, radius_km=5000, days_window=0)
+        assert all(h["matching_position"]["date"] == date for h in hits)
+
+    def test_invalid_date_returns_empty(self):
+        assert nearby_tracks(lat=0.0, lon=0.0, date="not-a-date") == []
+
+    def test_date_index_covers_dated_positions(self):
+        from chuk_mcp_maritime_archives.core.cliwoc_tracks import _DATES, _parse_date
+
+        expected = sum(
+            1
+            for t in _TRACKS
+            for p in t.get("positions", [])
+            if p.get("lat") is not None
+            and p.get("lon") is not None
+            and _parse_date(p.get("date") or "") is not None
+        )
+        assert len(_DATES) == expected
+        for day, (start, stop) in list(_DATES.days.items())[:200]:
+            assert all(_DATES.ordinal[i] == day for i in range(start, stop))
+            lats = list(_DATES.lat[start:stop])
+            assert lats == sorted(lats)
+
 
 # ---------------------------------------------------------------------------
 # Haversine helper
@@ -269,6 +448,34 @@ class TestHaversine:
         assert 110 < dist < 112
 
 
+class TestHaversineKernel:
+    LATS = (51.5, 48.86, -33.9, 0.0, 35.0)
+    LONS = (-0.12, 2.35, 18.4, 179.9, -179.9)
+
+    def test_legs_match_scalar(self):
+        legs = _haversine_legs(self.LATS, self.LONS)
+        assert len(legs) == len(self.LATS) - 1
+        for i, dist in enumerate(legs):
+            expected = _haversine_km(self.LATS[i], self.LONS[i], self.LATS[i + 1], self.LONS[i + 1])
+            assert dist == expected
+
+    def test_legs_missing_coordinate(self):
+        legs = _haversine_legs([0.0, None, 1.0], [0.0, 1.0, 1.0])
+        assert legs == [None, None]
+
+    def test_legs_short_input(self):
+        assert _haversine_legs([10.0], [20.0]) == []
+        assert _haversine_legs([], []) == []
+
+    def test_from_matches_scalar(self):
+        dists = _haversine_from(-33.9, 18.4, self.LATS, self.LONS)
+        assert dists == [_haversine_km(-33.9, 18.4, a, b) for a, b in zip(self.LATS, self.LONS)]
+
+    def test_leg_speeds(self):
+        speeds = _leg_speeds([100.0, 50.0, None, 30.0], [10, 12, 12, None, 20])
+        assert speeds == [50.0, None, None, None]
+
+
 # ---------------------------------------------------------------------------
 # list_nationalities / helpers
 # ---------------------------------------------------------------------------
@@ -431,6 +638,24 @@ class TestTrackTools:
         )
         assert "Voyage" in result
 
+    @pytest.mark.asyncio
+    async def test_nearby_tracks_days_window(self):
+        search_fn = self.mcp.get_tool("maritime_search_tracks")
+        search_result = await search_fn(max_results=1)
+        vid = json.loads(search_result)["tracks"][0]["voyage_id"]
+
+        get_fn = self.mcp.get_tool("maritime_get_track")
+        track = json.loads(await get_fn(voyage_id=vid))["track"]
+        pos = track["positions"][0]
+
+        fn = self.mcp.get_tool("maritime_nearby_tracks")
+        result = await fn(
+            lat=pos["lat"], lon=pos["lon"], date=pos["date"], radius_km=500, days_window=2
+        )
+        parsed = json.loads(result)
+        assert parsed["days_window"] == 2
+        assert parsed["track_count"] >= 1
+
     @pytest.mark.asyncio
     async def test_search_tracks_error(self):
         from unittest.mock import patch
@@ -512,6 +737,52 @@ class TestSearchTracksBBox:
             assert r["nationality"] == "NL"
 
 
+class TestPositionGrid:
+    def test_grid_covers_every_position(self):
+        from chuk_mcp_maritime_archives.core.cliwoc_tracks import _GRID
+
+        expected = sum(
+            1
+            for t in _TRACKS
+            for p in t.get("positions", [])
+            if p.get("lat") is not None and p.get("lon") is not None
+        )
+        assert len(_GRID) == expected
+        assert sum(stop - start for start, stop in _GRID.cells.values()) == expected
+
+    def test_cells_hold_their_positions(self):
+        from chuk_mcp_maritime_archives.core.cliwoc_tracks import _GRID, _grid_cell
+
+        for (ci, cj), (start, stop) in list(_GRID.cells.items())[:200]:
+            for i in range(start, stop):
+                assert _grid_cell(_GRID.lat[i]) == ci
+                assert _grid_cell(_GRID.lon[i]) == cj
+
+    @pytest.mark.parametrize(
+        "bbox",
+        [
+            (-50.0, -30.0, 15.0, 110.0),
+            (-35.3, -33.1, 17.9, 19.5),
+            (None, 10.0, None, -20.0),
+            (40.0, None, -10.0, None),
+        ],
+    )
+    def test_bbox_matches_linear_scan(self, bbox):
+        from chuk_mcp_maritime_archives.core.cliwoc_tracks import (
+            _grid_tracks_in_bbox,
+            _track_in_bbox,
+        )
+
+        expected = {i for i, t in enumerate(_TRACKS) if _track_in_bbox(t, *bbox)}
+        assert _grid_tracks_in_bbox(*bbox) == expected
+
+    def test_search_order_preserved(self):
+        results = search_tracks(lat_min=-60, lat_max=-20, max_results=10_000)
+        ids = [r["voyage_id"] for r in results]
+        order = {t["voyage_id"]: i for i, t in enumerate(_TRACKS)}
+        assert [order[v] for v in ids] == sorted(order[v] for v in ids)
+
+
 # ---------------------------------------------------------------------------
 # Compute track speeds
 # ---------------------------------------------------------------------------
@@ -568,6 +839,73 @@ class TestComputeTrackSpeeds:
             assert s.get("direction") in ("eastbound", "westbound")
 
 
+# ---------------------------------------------------------------------------
+# Segment table
+# ---------------------------------------------------------------------------
+
+
+class TestSegmentTable:
+    def _segments(self):
+        from chuk_mcp_maritime_archives.core import cliwoc_tracks
+
+        return cliwoc_tracks._SEGMENTS
+
+    def test_table_built(self):
+        seg = self._segments()
+        assert len(seg) > 0
+        assert len(seg.voyage_id) == get_track_count()
+        assert len(seg.km_day) == len(seg.track) == len(seg.mid_lat)
+
+    def test_rows_in_track_order(self):
+        seg = self._segments()
+        tracks = list(seg.track[:5000])
+        assert tracks == sorted(tracks)
+
+    def test_rows_match_daily_speeds(self):
+        """Unfiltered rows reproduce _compute_daily_speeds track by track."""
+        seg = self._segments()
+        rows = _select_segments(min_speed=0, max_speed=float("inf"))
+        by_track: dict[int, list[int]] = {}
+        for i in rows:
+            by_track.setdefault(seg.track[i], []).append(i)
+        for ti, track in enumerate(_TRACKS[:100]):
+            expected = _compute_daily_speeds(track, min_speed=0, max_speed=float("inf"))
+            got = by_track.get(ti, [])
+            assert len(got) == len(expected)
+            for i, obs in zip(got, expected):
+                assert seg.km_day[i] == obs["km_day"]
+                assert track["positions"][seg.pos[i]]["date"] == obs["date"]
+                assert ("eastbound" if seg.eastbound[i] else "westbound") == obs["direction"]
+
+    def test_bbox_filters_on_midpoint(self):
+        seg = self._segments()
+        rows = _select_segments(lat_min=-50, lat_max=-30)
+        for i in rows[:1000]:
+            assert -50 <= seg.mid_lat[i] <= -30
+
+    def test_anchored_excluded(self):
+        seg = self._segments()
+        rows = _select_segments(min_speed=0, max_speed=float("inf"))
+        assert not any(seg.anchored[i] for i in rows)
+
+    def test_unknown_direction_selects_nothing(self):
+        assert _select_segments(direction="northbound") == []
+
+    def test_empty_period_selects_nothing(self):
+        assert _select_segments(years=frozenset()) == []
+
+    def test_aggregate_matches_per_track_scan(self):
+        expected = sum(
+            len(_compute_daily_speeds(t, lat_min=-50, lat_max=-30))
+            for t in _TRACKS
+            if t.get("nationality") == "NL"
+        )
+        result = aggregate_track_speeds(
+            group_by="direction", nationality="NL", lat_min=-50, lat_max=-30
+        )
+        assert result["total_observations"] == expected
+
+
 # ---------------------------------------------------------------------------
 # Aggregate track speeds
 # ---------------------------------------------------------------------------
@@ -939,6 +1277,71 @@ class TestBootstrapDiD:
         r2 = _bootstrap_did(*args, n_bootstrap=1000, seed=123)
         assert r1 == r2
 
+    def test_workers_do_not_change_result(self):
+        args = ([100.0, 110.0, 104.0], [90.0, 95.0], [120.0, 130.0, 125.0], [92.0, 98.0])
+        r1 = _bootstrap_did(*args, n_bootstrap=1200, seed=7, workers=1)
+        r2 = _bootstrap_did(*args, n_bootstrap=1200, seed=7, workers=2)
+        assert r1 == r2
+
+
+class TestBootstrapEngine:
+    def test_shape(self):
+        means = _bootstrap_means([[1.0, 2.0, 3.0], [4.0, 5.0]], n_bootstrap=1234, seed=1)
+        assert len(means) == 2
+        assert all(len(m) == 1234 for m in means)
+
+    def test_means_within_sample_range(self):
+        (means,) = _bootstrap_means([[10.0, 20.0, 30.0]], n_bootstrap=600, seed=3)
+        assert all(10.0 <= m <= 30.0 for m in means)
+
+    def test_constant_sample(self):
+        (means,) = _bootstrap_means([[5.0, 5.0, 5.0, 5.0]], n_bootstrap=100, seed=3)
+        assert means == [5.0] * 100
+
+    def test_seeds_differ(self):
+        sample = [float(v) for v in range(50)]
+        (m1,) = _bootstrap_means([sample], n_bootstrap=200, seed=1)
+        (m2,) = _bootstrap_means([sample], n_bootstrap=200, seed=2)
+        assert m1 != m2
+
+    def test_prefix_stable(self):
+        """Replicate i does not depend on how many replicates are drawn."""
+        sample = [float(v) for v in range(30)]
+        (short,) = _bootstrap_means([sample], n_bootstrap=700, seed=9)
+        (long,) = _bootstrap_means([sample], n_bootstrap=1500, seed=9)
+        assert long[:700] == short
+
+    def test_row_chunking_keeps_stream(self, monkeypatch):
+        from chuk_mcp_maritime_archives.core import cliwoc_tracks
+
+        samples = [[float(v) for v in range(40)], [1.0, 2.0, 4.0]]
+        expected = _bootstrap_means(samples, n_bootstrap=900, seed=5)
+        monkeypatch.setattr(cliwoc_tracks, "_BOOTSTRAP_MAX_CELLS", 100)
+        assert _bootstrap_means(samples, n_bootstrap=900, seed=5) == expected
+
+    @pytest.mark.parametrize("k", [1, 7, 256, 300])
+    def test_resampler_split_calls_keep_stream(self, k):
+        xs = [float(v) for v in range(k)]
+        whole = _resampler(random.Random(1), xs)(70000)
+        draw = _resampler(random.Random(1), xs)
+        assert [*draw(1), *draw(12345), *draw(57654)] == list(whole)
+
+    def test_resampler_indices_uniform(self):
+        xs = [float(v) for v in range(7)]
+        counts = Counter(_resampler(random.Random(2), xs)(70000))
+        assert set(counts) == set(xs)
+        assert all(abs(n - 10000) < 400 for n in counts.values())
+
+    def test_workers_from_env(self, monkeypatch):
+        from chuk_mcp_maritime_archives.core.cliwoc_tracks import _bootstrap_workers_from_env
+
+        monkeypatch.setenv("MARITIME_BOOTSTRAP_WORKERS", "4")
+        assert _bootstrap_workers_from_env() == 4
+        monkeypatch.setenv("MARITIME_BOOTSTRAP_WORKERS", "lots")
+        assert _bootstrap_workers_from_env() == 1
+        monkeypatch.delenv("MARITIME_BOOTSTRAP_WORKERS")
+        assert _bootstrap_workers_from_env() == 1
+
 
 # ---------------------------------------------------------------------------
 # DiD speed test
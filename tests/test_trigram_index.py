@@ -0,0 +1,84 @@
+"""Tests for the trigram substring index and its use in client searches."""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from chuk_mcp_maritime_archives.core.clients.das_client import DASClient
+from chuk_mcp_maritime_archives.core.clients.trigram_index import TrigramIndex, trigrams
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+NAMES = ["batavia", "nieuw batavia", "amsterdam", "", "ba", "zeewijk", "hollandia", "avia"]
+
+
+class TestTrigrams:
+    def test_distinct_grams(self):
+        assert trigrams("aaaa") == {"aaa"}
+        assert trigrams("abcd") == {"abc", "bcd"}
+
+    def test_short_text(self):
+        assert trigrams("ab") == set()
+
+
+class TestTrigramIndex:
+    def setup_method(self):
+        self.index = TrigramIndex(NAMES)
+
+    def test_len(self):
+        assert len(self.index) == len(NAMES)
+
+    def test_candidates_include_every_match(self):
+        assert self.index.candidates("batav") == [0, 1]
+
+    def test_candidates_sorted(self):
+        assert self.index.candidates("via") == [0, 1, 7]
+
+    def test_unknown_gram(self):
+        assert self.index.candidates("xyz") == []
+
+    def test_short_needle_not_narrowed(self):
+        assert self.index.candidates("ba") is None
+
+    def test_candidates_need_verification(self):
+        # "abcxbca" holds both trigrams of "abca" without containing it
+        index = TrigramIndex(["abcxbca", "abca"])
+        assert index.candidates("abca") == [0, 1]
+
+    def test_matches_brute_force(self):
+        rng = random.Random(7)
+        texts = ["".join(rng.choice("abc ") for _ in range(rng.randint(0, 12))) for _ in range(500)]
+        index = TrigramIndex(texts)
+        for _ in range(200):
+            needle = "".join(rng.choice("abc ") for _ in range(rng.randint(3, 5)))
+            expected = [row for row, text in enumerate(texts) if needle in text]
+            candidates = index.candidates(needle)
+            assert set(expected) <= set(candidates)
+            assert candidates == sorted(candidates)
+
+
+class TestIndexedSearch:
+    def setup_method(self):
+        self.client = DASClient(data_dir=FIXTURES_DIR)
+
+    @pytest.mark.asyncio
+    async def test_indexed_search_matches_scan(self):
+        voyages = self.client._get_voyages()
+        for needle in ("bat", "Batavia", "RIDDER", "texel", "zz"):
+            expected = [v for v in voyages if needle.lower() in (v.get("ship_name") or "").lower()]
+            assert await self.client.search(ship_name=needle, max_results=1000) == expected
+
+    @pytest.mark.asyncio
+    async def test_route_searches_every_field(self):
+        voyages = self.client._get_voyages()
+        fields = ("departure_port", "destination_port", "particulars")
+        expected = [v for v in voyages if any("tex" in (v.get(f) or "").lower() for f in fields)]
+        assert await self.client.search(route="Tex", max_results=1000) == expected
+
+    @pytest.mark.asyncio
+    async def test_index_built_once(self):
+        await self.client.search(ship_name="batavia")
+        index = self.client._trigram_index(self.client.VOYAGES_FILE, "ship_name")
+        await self.client.search(ship_name="amsterdam")
+        assert self.client._trigram_index(self.client.VOYAGES_FILE, "ship_name") is index
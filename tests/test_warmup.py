@@ -0,0 +1,124 @@
+"""Tests for lazy dataset loading and the background warm-up scheduler."""
+
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from chuk_mcp_maritime_archives.constants import DatasetState
+from chuk_mcp_maritime_archives.core import speed_profiles, warmup
+
+
+@pytest.fixture
+def fresh_status(monkeypatch):
+    """Isolate the warm-up bookkeeping from other tests."""
+    monkeypatch.setattr(warmup, "_STATUS", {})
+    monkeypatch.setattr(warmup, "_THREADS", {})
+
+
+# ---------------------------------------------------------------------------
+# Lazy loading
+# ---------------------------------------------------------------------------
+
+
+class TestLazyLoading:
+    def test_import_does_not_load(self):
+        """Importing the server's tool modules leaves every dataset unloaded."""
+        code = (
+            "import chuk_mcp_maritime_archives.tools.analytics.api, "
+            "chuk_mcp_maritime_archives.tools.location.api, "
+            "chuk_mcp_maritime_archives.tools.routes.api, "
+            "chuk_mcp_maritime_archives.tools.speed.api, "
+            "chuk_mcp_maritime_archives.tools.tracks.api\n"
+            "from chuk_mcp_maritime_archives.core.warmup import dataset_status\n"
+            "print(sorted({s['state'] for s in dataset_status().values()}))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert out.strip() == "['pending']"
+
+    def test_concurrent_loads_run_once(self):
+        """Threads racing into a loader share one load: no duplicated index rows."""
+        original_profiles = speed_profiles._PROFILES.copy()
+        original_index = speed_profiles._PROFILES_BY_ROUTE.copy()
+        try:
+            speed_profiles._PROFILES.clear()
+            speed_profiles._PROFILES_BY_ROUTE.clear()
+            barrier = threading.Barrier(8)
+
+            def load():
+                barrier.wait()
+                speed_profiles._load_speed_profiles()
+
+            threads = [threading.Thread(target=load) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            assert len(speed_profiles._PROFILES) == len(original_profiles)
+            assert sum(len(v) for v in speed_profiles._PROFILES_BY_ROUTE.values()) == len(
+                original_profiles
+            )
+        finally:
+            speed_profiles._PROFILES.clear()
+            speed_profiles._PROFILES_BY_ROUTE.clear()
+            speed_profiles._PROFILES.extend(original_profiles)
+            speed_profiles._PROFILES_BY_ROUTE.update(original_index)
+
+
+# ---------------------------------------------------------------------------
+# Warm-up scheduler
+# ---------------------------------------------------------------------------
+
+
+class TestWarmup:
+    def test_start_and_wait(self, fresh_status):
+        assert warmup.start_warmup() is True
+        assert warmup.wait_for(timeout=120)
+        status = warmup.dataset_status()
+        assert set(status) == set(warmup._DATASETS)
+        for entry in status.values():
+            assert entry["state"] == "ready"
+            assert entry["seconds"] is not None
+            assert entry["error"] is None
+
+    def test_start_subset(self, fresh_status):
+        warmup.start_warmup(["routes"])
+        assert warmup.wait_for(["routes"], timeout=30)
+        assert set(warmup._THREADS) == {"routes"}
+        assert warmup.dataset_status()["routes"]["seconds"] is not None
+
+    def test_disabled_by_env(self, fresh_status, monkeypatch):
+        monkeypatch.setenv("MARITIME_WARMUP", "0")
+        assert warmup.start_warmup() is False
+        assert warmup._THREADS == {}
+
+    def test_unknown_dataset(self, fresh_status):
+        with pytest.raises(ValueError, match="Unknown dataset"):
+            warmup.start_warmup(["atlantis"])
+        with pytest.raises(ValueError, match="Unknown dataset"):
+            warmup.load_dataset("atlantis")
+
+    def test_loaded_on_demand_reports_ready(self, fresh_status):
+        """Datasets loaded by a request, not the warm-up, still report ready."""
+        status = warmup.dataset_status()["gazetteer"]
+        assert status == {"state": "ready", "seconds": None, "error": None}
+
+    def test_failed_load(self, fresh_status, monkeypatch):
+        def boom():
+            raise RuntimeError("disk on fire")
+
+        monkeypatch.setattr(speed_profiles, "_load_speed_profiles", boom)
+        assert warmup.load_dataset("speed_profiles") is DatasetState.FAILED
+        status = warmup.dataset_status()["speed_profiles"]
+        assert status["state"] == "failed"
+        assert "disk on fire" in status["error"]
+
+    def test_missing_data_is_unavailable(self, fresh_status, monkeypatch):
+        monkeypatch.setattr(speed_profiles, "_PROFILES", [])
+        monkeypatch.setattr(speed_profiles, "_load_speed_profiles", lambda: None)
+        assert warmup.load_dataset("speed_profiles") is DatasetState.UNAVAILABLE
+        assert warmup.dataset_status()["speed_profiles"]["state"] == "unavailable"